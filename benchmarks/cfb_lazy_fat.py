@@ -0,0 +1,107 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks time-to-first-stream for eager and lazy FAT decoding."""
+
+# stdlib imports
+import os
+import tempfile
+from optparse import OptionParser
+from time import perf_counter
+
+# local imports
+from lf.dec import RawIStream, SEEK_SET
+from lf.win.ole.cfb import CompoundFile
+
+from synth import make_cfb
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "time_to_first_stream", "main"
+]
+
+def time_to_first_stream(path, lazy_fat, sid):
+    """Opens a compound file and reads a single stream.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+
+    stream = RawIStream(path)
+    cfb = CompoundFile(stream, lazy_fat=lazy_fat)
+    data_stream = cfb.get_stream(sid)
+    data_stream.seek(0, SEEK_SET)
+    data_stream.read()
+    elapsed = perf_counter() - start
+
+    stream.close()
+    return elapsed
+# end def time_to_first_stream
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-s",
+        dest="size_mb",
+        type="int",
+        default=1024,
+        help="Size (in MB) of the large stream (default 1024)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=5,
+        help="Number of repetitions (default 5)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    streams = [
+        ("\x05SummaryInformation", b"\x00" * 512),
+        ("Data", bytes(options.size_mb * 1048576))
+    ]
+
+    (fd, path) = tempfile.mkstemp(suffix=".cfb")
+    try:
+        with os.fdopen(fd, "wb") as ofile:
+            ofile.write(make_cfb(streams))
+        # end with
+
+        print("compound file: {0} MB".format(os.path.getsize(path) >> 20))
+
+        for lazy_fat in (False, True):
+            times = [
+                time_to_first_stream(path, lazy_fat, 1)
+                for counter in range(options.repeat)
+            ]
+
+            print("lazy_fat={0}: best {1:.4f}s, mean {2:.4f}s".format(
+                lazy_fat, min(times), sum(times) / len(times)
+            ))
+        # end for
+    finally:
+        os.remove(path)
+    # end try
+# end def main
+
+if __name__ == "__main__":
+    main()
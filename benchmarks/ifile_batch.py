@@ -0,0 +1,188 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks reading $I files one at a time and in threaded batches."""
+
+# stdlib imports
+import os
+from optparse import OptionParser
+from tempfile import mkdtemp
+from shutil import rmtree
+from time import perf_counter
+
+# local imports
+from lf.dec import RawIStream
+from lf.win.shell.recyclebin import IFile
+from lf.win.shell.recyclebin.batch import find_files, iter_rows, ingest
+
+from synth import make_ifile
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "make_recycle_bin", "per_file", "batched", "ingested", "measure", "main"
+]
+
+def make_recycle_bin(directory, count):
+    """Writes a recycle bin with :attr:`count` $I files (and half as many $R
+    files) to a directory.
+
+    :rtype: ``str``
+    :returns: The name of the recycle bin directory.
+
+    """
+    sid_dir = os.path.join(directory, "$Recycle.Bin", "S-1-5-21-1001")
+    os.makedirs(sid_dir)
+
+    for index in range(count):
+        name = "{0:06X}.docx".format(index)
+        with open(os.path.join(sid_dir, "$I" + name), "wb") as ofile:
+            ofile.write(make_ifile(index, (index % 2) + 1))
+        # end with
+
+        if index % 2:
+            with open(os.path.join(sid_dir, "$R" + name), "wb") as ofile:
+                ofile.write(b"x")
+            # end with
+        # end if
+    # end for
+
+    return sid_dir
+# end def make_recycle_bin
+
+def per_file(paths):
+    """Opens and parses each $I file on its own.
+
+    :rtype: ``int``
+    :returns: The number of files.
+
+    """
+    count = 0
+    for path in paths:
+        stream = RawIStream(path)
+        try:
+            IFile.from_stream(stream, 0)
+        finally:
+            stream.close()
+        # end try
+
+        (dir_name, base_name) = os.path.split(path)
+        os.path.exists(os.path.join(dir_name, "$R" + base_name[2:]))
+        count += 1
+    # end for
+
+    return count
+# end def per_file
+
+def batched(paths, workers):
+    """Reads the $I files in batches with :func:`iter_rows`.
+
+    :rtype: ``int``
+    :returns: The number of files.
+
+    """
+    count = 0
+    for row in iter_rows(paths, workers):
+        count += 1
+    # end for
+
+    return count
+# end def batched
+
+def ingested(paths, workers):
+    """Reads the $I files with :func:`ingest`, discarding the JSON lines.
+
+    :rtype: ``int``
+    :returns: The number of files.
+
+    """
+    with open(os.devnull, "w") as ofile:
+        return ingest(paths, ofile, workers).file_count
+    # end with
+# end def ingested
+
+def measure(func, *args):
+    """Runs a reader once.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds) and the number of files.
+
+    """
+    start = perf_counter()
+    count = func(*args)
+
+    return (perf_counter() - start, count)
+# end def measure
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=20000,
+        help="Number of $I files (default 20000)"
+    )
+
+    parser.add_option(
+        "-w",
+        dest="workers",
+        type="int",
+        default=None,
+        help="Number of worker threads (default as iter_rows)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    directory = mkdtemp()
+    try:
+        make_recycle_bin(directory, options.count)
+        paths = list(find_files([directory]))
+
+        tests = [
+            ("per file", per_file, (paths,)),
+            ("batched, 0 workers", batched, (paths, 0)),
+            ("batched, threads", batched, (paths, options.workers)),
+            ("ingest (JSON lines), threads", ingested,
+                (paths, options.workers))
+        ]
+
+        for (name, func, func_args) in tests:
+            results = [
+                measure(func, *func_args) for counter in range(options.repeat)
+            ]
+            best = min([elapsed for (elapsed, count) in results])
+
+            print("{0}: best {1:.4f}s ({2:.0f} files/s)".format(
+                name, best, results[0][1] / best
+            ))
+        # end for
+    finally:
+        rmtree(directory)
+    # end try
+# end def main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks decoding INFO2 items one at a time, in bulk and in batches."""
+
+# stdlib imports
+from optparse import OptionParser
+from time import perf_counter
+import tracemalloc
+
+# local imports
+from lf.dec import ByteIStream, SEEK_SET
+from lf.win.shell.recyclebin import INFO2, INFO2Header, INFO2Item
+
+from synth import make_info2
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "per_item", "bulk", "batched", "measure", "main"
+]
+
+def per_item(stream):
+    """Reads, pads and decodes each item on its own.
+
+    :rtype: ``int``
+    :returns: The number of items.
+
+    """
+    header = INFO2Header.from_stream(stream, 0)
+    item_size = header.item_size
+    pad = b"\x00" * max(800 - item_size, 0)
+    offset = 20
+
+    items = list()
+    stream.seek(offset, SEEK_SET)
+    data = stream.read(item_size)
+
+    while data:
+        data = b"".join([data, pad])
+        items.append(INFO2Item.from_bytes(data[:800]))
+
+        offset += item_size
+        stream.seek(offset, SEEK_SET)
+        data = stream.read(item_size)
+    # end while
+
+    return len(items)
+# end def per_item
+
+def bulk(stream):
+    """Reads the whole item table and decodes it at once with :class:`INFO2`.
+
+    :rtype: ``int``
+    :returns: The number of items.
+
+    """
+    return len(INFO2(stream, 0).items)
+# end def bulk
+
+def batched(stream):
+    """Reads and decodes the items in batches with :meth:`INFO2.iter_items`.
+
+    :rtype: ``int``
+    :returns: The number of items.
+
+    """
+    count = 0
+    for item in INFO2.iter_items(stream, 0):
+        count += 1
+    # end for
+
+    return count
+# end def batched
+
+def measure(data, func):
+    """Decodes the items of an INFO2 file.
+
+    The time and the memory are measured in separate runs, since tracing
+    the allocations slows the decoding down.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds), the peak memory allocated (in
+              bytes), and the number of items.
+
+    """
+    start = perf_counter()
+    count = func(ByteIStream(data))
+    elapsed = perf_counter() - start
+
+    tracemalloc.start()
+    func(ByteIStream(data))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return (elapsed, peak, count)
+# end def measure
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=50000,
+        help="Number of items (default 50000)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    data = make_info2(options.count)
+    tests = [
+        ("per item", per_item),
+        ("bulk", bulk),
+        ("batched iterator", batched)
+    ]
+
+    for (name, func) in tests:
+        results = [measure(data, func) for counter in range(options.repeat)]
+        best = min([elapsed for (elapsed, peak, count) in results])
+        peak = min([peak for (elapsed, peak, count) in results])
+
+        print("{0}: best {1:.4f}s ({2:.0f} items/s), peak {3:.1f} MiB".format(
+            name, best, results[0][2] / best, peak / 1048576
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks jump list parsing with and without the embedded links."""
+
+# stdlib imports
+from optparse import OptionParser
+from time import perf_counter
+
+# local imports
+from lf.dec import ByteIStream
+from lf.win.ole.cfb import CompoundFile
+from lf.win.shell.jumplist import JumpList
+
+from lnk_parse import StreamShellLink, load_samples
+from synth import make_jump_list
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "make_corpus", "parse_dest_lists", "parse_stream_links",
+    "parse_buffer_links", "main"
+]
+
+def make_corpus(count, entries, version):
+    """Creates :attr:`count` jump lists with :attr:`entries` entries each.
+
+    :rtype: ``list``
+    :returns: The contents of each jump list.
+
+    """
+    samples = load_samples()
+    links = [samples[index % len(samples)] for index in range(entries)]
+
+    return [
+        make_jump_list(links, version, seed) for seed in range(count)
+    ]
+# end def make_corpus
+
+def parse_dest_lists(corpus):
+    """Parses the DestList stream of each jump list.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds) and the number of entries.
+
+    """
+    start = perf_counter()
+    count = 0
+
+    for data in corpus:
+        jump_list = JumpList(CompoundFile(ByteIStream(data)))
+        count += len(jump_list.dest_list.entries)
+    # end for
+
+    return (perf_counter() - start, count)
+# end def parse_dest_lists
+
+def parse_stream_links(corpus):
+    """Parses each entry's link one structure at a time from its stream.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds) and the number of entries.
+
+    """
+    start = perf_counter()
+    count = 0
+
+    for data in corpus:
+        cfb = CompoundFile(ByteIStream(data))
+        jump_list = JumpList(cfb)
+        sids = dict([
+            (entry.name, sid) for (sid, entry) in cfb.dir_entries.items()
+        ])
+
+        for entry in jump_list.dest_list.entries:
+            StreamShellLink(cfb.get_stream(sids[entry.stream_name]))
+            count += 1
+        # end for
+    # end for
+
+    return (perf_counter() - start, count)
+# end def parse_stream_links
+
+def parse_buffer_links(corpus):
+    """Parses each entry's link with :meth:`JumpList.iter_links`.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds) and the number of entries.
+
+    """
+    start = perf_counter()
+    count = 0
+
+    for data in corpus:
+        jump_list = JumpList(CompoundFile(ByteIStream(data)))
+        for (entry, link) in jump_list.iter_links():
+            count += 1
+        # end for
+    # end for
+
+    return (perf_counter() - start, count)
+# end def parse_buffer_links
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=10000,
+        help="Number of jump lists in the corpus (default 10000)"
+    )
+
+    parser.add_option(
+        "-e",
+        dest="entries",
+        type="int",
+        default=10,
+        help="Number of entries per jump list (default 10)"
+    )
+
+    parser.add_option(
+        "-v",
+        dest="version",
+        type="int",
+        default=1,
+        help="DestList format version (default 1)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    corpus = make_corpus(options.count, options.entries, options.version)
+
+    tests = [
+        ("DestList only", parse_dest_lists),
+        ("links (per structure)", parse_stream_links),
+        ("links (iter_links)", parse_buffer_links)
+    ]
+
+    for (name, func) in tests:
+        (elapsed, count) = func(corpus)
+
+        print("{0}: {1:.4f}s, {2:.0f} files/s, {3:.0f} entries/s".format(
+            name, elapsed, options.count / elapsed, count / elapsed
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks carving shell links in one process and across processes."""
+
+# stdlib imports
+import os
+import tempfile
+from functools import partial
+from optparse import OptionParser
+from time import perf_counter
+
+# local imports
+from lf.dec import RawIStream
+from lf.win.shell.link.carver import carve, carve_parallel
+
+from lnk_parse import load_samples
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "make_image", "carve_serial", "carve_processes", "main"
+]
+
+def make_image(path, size, gap):
+    """Writes a raw image with a link file every :attr:`gap` bytes.
+
+    The space between the links is filled with random data.
+
+    :rtype: ``int``
+    :returns: The number of links in the image.
+
+    """
+    samples = load_samples()
+    count = 0
+
+    with open(path, "wb") as ofile:
+        written = 0
+        while written < size:
+            data = samples[count % len(samples)]
+            filler = os.urandom(max(gap - len(data), 0))
+
+            ofile.write(data)
+            ofile.write(filler)
+
+            written += len(data) + len(filler)
+            count += 1
+        # end while
+    # end with
+
+    return count
+# end def make_image
+
+def carve_serial(path):
+    """Carves :attr:`path` with :func:`carve`.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds) and the number of links found.
+
+    """
+    start = perf_counter()
+
+    stream = RawIStream(path)
+    found = sum(1 for record in carve(stream))
+    stream.close()
+
+    return (perf_counter() - start, found)
+# end def carve_serial
+
+def carve_processes(path, workers, chunk_size):
+    """Carves :attr:`path` with :func:`carve_parallel`.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds) and the number of links found.
+
+    """
+    start = perf_counter()
+
+    opener = partial(RawIStream, path)
+    results = carve_parallel(opener, chunk_size=chunk_size, workers=workers)
+    found = sum(1 for record in results)
+
+    return (perf_counter() - start, found)
+# end def carve_processes
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-s",
+        dest="size",
+        type="int",
+        default=256,
+        help="Size of the image in MiB (default 256)"
+    )
+
+    parser.add_option(
+        "-g",
+        dest="gap",
+        type="int",
+        default=65536,
+        help="Bytes between the start of each link (default 65536)"
+    )
+
+    parser.add_option(
+        "-w",
+        dest="workers",
+        type="int",
+        default=None,
+        help="Number of worker processes (default is the number of CPUs)"
+    )
+
+    parser.add_option(
+        "-k",
+        dest="chunk_size",
+        type="int",
+        default=16,
+        help="Chunk size in MiB for the process pool (default 16)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    size = options.size * 1048576
+    chunk_size = options.chunk_size * 1048576
+
+    (fd, path) = tempfile.mkstemp(suffix=".dd")
+    os.close(fd)
+
+    try:
+        count = make_image(path, size, options.gap)
+        print("image: {0} MiB, {1} links".format(options.size, count))
+
+        tests = [
+            ("carve", carve_serial, (path,)),
+            ("carve_parallel (in process)", carve_processes,
+                (path, 0, chunk_size)),
+            ("carve_parallel (processes)", carve_processes,
+                (path, options.workers, chunk_size))
+        ]
+
+        for (name, func, args) in tests:
+            (elapsed, found) = func(*args)
+
+            print("{0}: {1:.4f}s, {2:.1f} MiB/s, {3} links".format(
+                name, elapsed, options.size / elapsed, found
+            ))
+        # end for
+    finally:
+        os.remove(path)
+    # end try
+# end def main
+
+if __name__ == "__main__":
+    main()
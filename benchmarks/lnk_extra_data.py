@@ -0,0 +1,105 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks reading tracker data from links with selective block decoding."""
+
+# stdlib imports
+from optparse import OptionParser
+from time import perf_counter
+
+# local imports
+from lf.win.shell.link import ShellLink
+from lf.win.shell.link.consts import TRACKER_PROPS_SIG
+
+from lnk_parse import load_samples
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "machine_ids", "main"
+]
+
+def machine_ids(corpus, wanted_sigs=None, lazy_blocks=False):
+    """Finds the machine id of each link in :attr:`corpus`.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds) and the set of machine ids.
+
+    """
+    start = perf_counter()
+    found = set()
+
+    for data in corpus:
+        shell_link = ShellLink.from_buffer(data, 0, wanted_sigs, lazy_blocks)
+
+        for block in shell_link.extra_data:
+            if block.sig == TRACKER_PROPS_SIG:
+                found.add(block.machine_id)
+            # end if
+        # end for
+    # end for
+
+    return (perf_counter() - start, found)
+# end def machine_ids
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=100000,
+        help="Number of links in the corpus (default 100000)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    samples = load_samples()
+    corpus = [
+        samples[index % len(samples)] for index in range(options.count)
+    ]
+
+    wanted_sigs = set([TRACKER_PROPS_SIG])
+    tests = [
+        ("all blocks", None, False),
+        ("lazy blocks", None, True),
+        ("wanted_sigs", wanted_sigs, False)
+    ]
+
+    for (name, sigs, lazy_blocks) in tests:
+        results = [
+            machine_ids(corpus, sigs, lazy_blocks)
+            for counter in range(options.repeat)
+        ]
+        best = min([elapsed for (elapsed, found) in results])
+
+        print("{0}: best {1:.4f}s, {2:.0f} links/s, {3} machine ids".format(
+            name, best, options.count / best, len(results[0][1])
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
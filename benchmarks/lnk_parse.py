@@ -0,0 +1,195 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks shell link parsing with one read per structure and per file."""
+
+# stdlib imports
+import os
+import shutil
+import tempfile
+from optparse import OptionParser
+from os.path import join, dirname
+from time import perf_counter
+
+# local imports
+from lf.dec import ByteIStream, RawIStream
+from lf.win.shell.link import ShellLink
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "StreamShellLink", "load_samples", "parse_streams", "parse_buffers",
+    "parse_files", "main"
+]
+
+_sample_dir = join(dirname(__file__), "..", "unittests", "data", "lnk")
+
+class StreamShellLink(ShellLink):
+    """A :class:`ShellLink` that always reads one structure at a time."""
+
+    max_buffer_size = 0
+# end class StreamShellLink
+
+def load_samples(path=_sample_dir):
+    """Reads the sample link files.
+
+    :rtype: ``list``
+    :returns: The contents of each ``.lnk`` file in :attr:`path`.
+
+    """
+    samples = list()
+    for name in sorted(os.listdir(path)):
+        if name.lower().endswith(".lnk"):
+            with open(join(path, name), "rb") as ifile:
+                samples.append(ifile.read())
+            # end with
+        # end if
+    # end for
+
+    return samples
+# end def load_samples
+
+def parse_streams(corpus, shell_link_class):
+    """Parses each link in :attr:`corpus` from a :class:`ByteIStream`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+
+    for data in corpus:
+        shell_link_class(ByteIStream(data))
+    # end for
+
+    return perf_counter() - start
+# end def parse_streams
+
+def parse_buffers(corpus, shell_link_class):
+    """Parses each link in :attr:`corpus` with :meth:`ShellLink.from_buffer`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+
+    for data in corpus:
+        shell_link_class.from_buffer(data)
+    # end for
+
+    return perf_counter() - start
+# end def parse_buffers
+
+def parse_files(paths, shell_link_class):
+    """Opens and parses each link file in :attr:`paths`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+
+    for path in paths:
+        stream = RawIStream(path)
+        shell_link_class(stream)
+        stream.close()
+    # end for
+
+    return perf_counter() - start
+# end def parse_files
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=100000,
+        help="Number of links in the corpus (default 100000)"
+    )
+
+    parser.add_option(
+        "-f",
+        dest="files",
+        action="store_true",
+        default=False,
+        help="Also write the corpus to disk and parse the files"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    samples = load_samples()
+    corpus = [
+        samples[index % len(samples)] for index in range(options.count)
+    ]
+
+    tests = [
+        ("streams (per structure)", parse_streams, corpus, StreamShellLink),
+        ("streams (single read)", parse_streams, corpus, ShellLink),
+        ("from_buffer", parse_buffers, corpus, ShellLink)
+    ]
+
+    temp_dir = None
+    if options.files:
+        temp_dir = tempfile.mkdtemp()
+
+        paths = list()
+        for (index, data) in enumerate(corpus):
+            path = join(temp_dir, "{0}.lnk".format(index))
+            with open(path, "wb") as ofile:
+                ofile.write(data)
+            # end with
+
+            paths.append(path)
+        # end for
+
+        tests.extend([
+            ("files (per structure)", parse_files, paths, StreamShellLink),
+            ("files (single read)", parse_files, paths, ShellLink)
+        ])
+    # end if
+
+    try:
+        for (name, func, items, shell_link_class) in tests:
+            times = [
+                func(items, shell_link_class)
+                for counter in range(options.repeat)
+            ]
+            best = min(times)
+
+            print("{0}: best {1:.4f}s, {2:.0f} links/s".format(
+                name, best, options.count / best
+            ))
+        # end for
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir)
+        # end if
+    # end try
+# end def main
+
+if __name__ == "__main__":
+    main()
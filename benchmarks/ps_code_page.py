@@ -0,0 +1,173 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks code page decoders for property set strings."""
+
+# stdlib imports
+import codecs
+from optparse import OptionParser
+from time import perf_counter
+
+# local imports
+from lf.dec import ByteIStream
+from lf.win.codepage import add_codecs, get_decoder
+from lf.win.codepage.consts import code_page_names
+from lf.apps.msoffice.shared import Builder, SummaryInfo
+
+from synth import make_summary_info
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "decode_with_lookup", "decode_with_cache", "decode_strings", "main"
+]
+
+def decode_with_lookup(streams, code_page):
+    """Decodes each stream with a decoder from :func:`codecs.getdecoder`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    name = code_page_names[code_page]
+    start = perf_counter()
+
+    for stream in streams:
+        property_set_stream = \
+            Builder.build(stream, 0, codecs.getdecoder(name))
+        SummaryInfo.from_properties(
+            property_set_stream.property_set_0.properties
+        )
+    # end for
+
+    return perf_counter() - start
+# end def decode_with_lookup
+
+def decode_with_cache(streams, code_page):
+    """Decodes each stream with the decoder from :func:`get_decoder`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+
+    for stream in streams:
+        property_set_stream = Builder.build(stream, 0)
+        SummaryInfo.from_properties(
+            property_set_stream.property_set_0.properties
+        )
+    # end for
+
+    return perf_counter() - start
+# end def decode_with_cache
+
+def decode_strings(strings, decoder):
+    """Decodes a list of strings with :attr:`decoder`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+
+    for string in strings:
+        decoder(string, "ignore")
+    # end for
+
+    return perf_counter() - start
+# end def decode_strings
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=5000,
+        help="Number of SummaryInformation streams (default 5000)"
+    )
+
+    parser.add_option(
+        "-p",
+        dest="code_page",
+        type="int",
+        default=1252,
+        help="Value of the CodePage property (default 1252)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=5,
+        help="Number of repetitions (default 5)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    add_codecs()
+    get_decoder(options.code_page)
+
+    streams = [
+        ByteIStream(make_summary_info(seed, code_page=options.code_page))
+        for seed in range(options.count)
+    ]
+
+    for (name, func) in [
+        ("lookup", decode_with_lookup),
+        ("cache", decode_with_cache)
+    ]:
+        times = [
+            func(streams, options.code_page)
+            for counter in range(options.repeat)
+        ]
+        best = min(times)
+
+        print("{0}: best {1:.4f}s, {2:.0f} streams/s".format(
+            name, best, options.count / best
+        ))
+    # end for
+
+    # The strings alone, without the rest of the property set.
+    strings = list()
+    for seed in range(options.count):
+        properties = Builder.build(streams[seed], 0, False).property_set_0
+        strings.extend([
+            value.value for value in properties.properties.values()
+            if isinstance(value.value, bytes)
+        ])
+    # end for
+
+    for (name, decoder) in [
+        ("strings lookup", codecs.getdecoder(code_page_names[options.code_page])),
+        ("strings cache", get_decoder(options.code_page))
+    ]:
+        times = [
+            decode_strings(strings, decoder)
+            for counter in range(options.repeat)
+        ]
+        best = min(times)
+
+        print("{0}: best {1:.4f}s, {2:.0f} strings/s".format(
+            name, best, len(strings) / best
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
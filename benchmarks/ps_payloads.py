@@ -0,0 +1,109 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks building SummaryInformation streams with large thumbnails."""
+
+# stdlib imports
+import hashlib
+import tracemalloc
+from optparse import OptionParser
+from time import perf_counter
+
+# local imports
+from lf.dec import ByteIStream
+from lf.apps.msoffice.shared import Builder, SummaryInfo
+
+from synth import make_summary_info
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "build_all", "main"
+]
+
+def build_all(streams, lazy_payloads):
+    """Builds each stream, and hashes the thumbnails.
+
+    :rtype: ``tuple``
+    :returns: A tuple of the elapsed time (in seconds), the memory (in bytes)
+              held by the built objects, and the peak memory (in bytes).
+
+    """
+    tracemalloc.start()
+    start = perf_counter()
+
+    infos = list()
+    for stream in streams:
+        property_set_stream = \
+            Builder.build(stream, 0, lazy_payloads=lazy_payloads)
+        infos.append(SummaryInfo.from_properties(
+            property_set_stream.property_set_0.properties
+        ))
+    # end for
+
+    for info in infos:
+        data = info.thumbnail.data
+        if lazy_payloads:
+            data.hashes(["sha1"])
+        else:
+            hashlib.sha1(data).hexdigest()
+        # end if
+    # end for
+
+    elapsed = perf_counter() - start
+    (current, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (elapsed, current, peak)
+# end def build_all
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=20,
+        help="Number of SummaryInformation streams (default 20)"
+    )
+
+    parser.add_option(
+        "-t",
+        dest="thumbnail_size",
+        type="int",
+        default=4 << 20,
+        help="Size of each thumbnail in bytes (default 4 MiB)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    streams = [
+        ByteIStream(make_summary_info(seed, options.thumbnail_size))
+        for seed in range(options.count)
+    ]
+
+    for (name, lazy_payloads) in [("eager", False), ("lazy", True)]:
+        (elapsed, current, peak) = build_all(streams, lazy_payloads)
+
+        print("{0}: {1:.4f}s, held {2:.1f} MiB, peak {3:.1f} MiB".format(
+            name, elapsed, current / 1048576, peak / 1048576
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
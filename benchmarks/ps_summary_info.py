@@ -0,0 +1,133 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks SummaryInformation property set decoding."""
+
+# stdlib imports
+import codecs
+from optparse import OptionParser
+from time import perf_counter
+
+# local imports
+from lf.dec import ByteIStream
+from lf.apps.msoffice.shared import (
+    Builder, PropertyFactory, SummaryInfo
+)
+
+from synth import make_summary_info
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "decode_per_property", "decode_with_builder", "main"
+]
+
+def decode_per_property(streams):
+    """Decodes each property with a separate :meth:`PropertyFactory.make`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    make = PropertyFactory.make
+    decoder = codecs.getdecoder("cp1252")
+    start = perf_counter()
+
+    for stream in streams:
+        header = Builder.build_property_set_stream_header(stream, 0)
+        property_set = Builder.build_property_set_header(
+            stream, header.offset0, header.fmtid0
+        )
+
+        properties = dict()
+        for (pid, offset) in property_set.pids_offsets.items():
+            properties[pid] = make(stream, header.offset0 + offset, decoder)
+        # end for
+
+        SummaryInfo.from_properties(properties)
+    # end for
+
+    return perf_counter() - start
+# end def decode_per_property
+
+def decode_with_builder(streams):
+    """Decodes each property set stream with :meth:`Builder.build`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+
+    for stream in streams:
+        property_set_stream = Builder.build(stream, 0)
+        SummaryInfo.from_properties(
+            property_set_stream.property_set_0.properties
+        )
+    # end for
+
+    return perf_counter() - start
+# end def decode_with_builder
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=5000,
+        help="Number of SummaryInformation streams (default 5000)"
+    )
+
+    parser.add_option(
+        "-t",
+        dest="thumbnail_size",
+        type="int",
+        default=0,
+        help="Size (in bytes) of the thumbnail property (default 0)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=5,
+        help="Number of repetitions (default 5)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    streams = [
+        ByteIStream(make_summary_info(seed, options.thumbnail_size))
+        for seed in range(options.count)
+    ]
+
+    for (name, func) in [
+        ("per property", decode_per_property),
+        ("builder", decode_with_builder)
+    ]:
+        times = [func(streams) for counter in range(options.repeat)]
+        best = min(times)
+
+        print("{0}: best {1:.4f}s, {2:.0f} streams/s".format(
+            name, best, options.count / best
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
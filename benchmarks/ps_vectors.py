@@ -0,0 +1,131 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks decoding of large vector properties."""
+
+# stdlib imports
+import codecs
+from optparse import OptionParser
+from struct import pack
+from time import perf_counter
+
+# local imports
+from lf.win.ole.ps import Sequence
+from lf.win.ole.ps.consts import PropertyType
+from lf.apps.msoffice.shared.objects import (
+    Lpwstr, VtHeadingPair, VtVecLpwstrValue, VtVecHeadingPairValue
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "make_lpwstr_vector", "make_heading_pair_vector", "make_i4_vector",
+    "main"
+]
+
+def make_lpwstr_vector(count):
+    """Makes a VtVecLpwstrValue with :attr:`count` strings."""
+
+    data = bytearray(pack("<I", count))
+    for counter in range(count):
+        value = "Part {0}\x00".format(counter).encode("utf_16_le")
+        data.extend(pack("<I", len(value) // 2))
+        data.extend(value)
+        data.extend(b"\x00" * (-len(value) % 4))
+    # end for
+
+    return bytes(data)
+# end def make_lpwstr_vector
+
+def make_heading_pair_vector(count):
+    """Makes a VtVecHeadingPairValue with :attr:`count` pairs."""
+
+    data = bytearray(pack("<I", count * 2))
+    for counter in range(count):
+        value = "Heading {0}\x00".format(counter).encode("cp1252")
+        data.extend(pack("<HHI", PropertyType.VT_LPSTR, 0, len(value)))
+        data.extend(value)
+        data.extend(pack("<HHi", PropertyType.VT_I4, 0, counter))
+    # end for
+
+    return bytes(data)
+# end def make_heading_pair_vector
+
+def make_i4_vector(count):
+    """Makes the elements of a VT_VECTOR | VT_I4 with :attr:`count` values."""
+
+    return pack("<{0}i".format(count), *range(count))
+# end def make_i4_vector
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=10000,
+        help="Number of elements in each vector (default 10000)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=5,
+        help="Number of repetitions (default 5)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    count = options.count
+    decoder = codecs.getdecoder("cp1252")
+    lpwstrs = make_lpwstr_vector(count)
+    heading_pairs = make_heading_pair_vector(count)
+    i4s = make_i4_vector(count)
+    from_buffer_factory = Sequence.from_buffer_factory
+
+    for (name, func) in [
+        ("lpwstr per element", lambda: from_buffer_factory(
+            lpwstrs, Lpwstr.from_buffer, count, 4
+        )),
+        ("lpwstr vectorised", lambda: VtVecLpwstrValue.from_buffer(lpwstrs)),
+        ("heading pair per element", lambda: from_buffer_factory(
+            heading_pairs, VtHeadingPair.from_buffer, count, 4, decoder
+        )),
+        ("heading pair vectorised", lambda: VtVecHeadingPairValue.from_buffer(
+            heading_pairs, 0, decoder
+        )),
+        ("i4 vectorised", lambda: Sequence.from_buffer(
+            i4s, PropertyType.VT_I4, count
+        ))
+    ]:
+        times = list()
+        for counter in range(options.repeat):
+            start = perf_counter()
+            func()
+            times.append(perf_counter() - start)
+        # end for
+        best = min(times)
+
+        print("{0}: best {1:.4f}s, {2:.0f} elements/s".format(
+            name, best, count / best
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks decoding shell items with and without interning."""
+
+# stdlib imports
+from optparse import OptionParser
+from time import perf_counter
+
+# local imports
+from lf.win.shell.link import ShellLink
+from lf.win.shell.objects import ShellItemFactory
+
+from lnk_parse import load_samples
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "item_names", "main"
+]
+
+def item_names(id_lists, interned=True):
+    """Decodes each ID list in :attr:`id_lists` and collects the item names.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds) and the set of names.
+
+    """
+    make_items = ShellItemFactory.make_items
+    clear_cache = ShellItemFactory.clear_cache
+
+    clear_cache()
+    start = perf_counter()
+    found = set()
+
+    for id_list in id_lists:
+        if not interned:
+            clear_cache()
+        # end if
+
+        for item in make_items(id_list):
+            name = getattr(item, "name", None)
+            if name is not None:
+                found.add(name)
+            # end if
+        # end for
+    # end for
+
+    return (perf_counter() - start, found)
+# end def item_names
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=100000,
+        help="Number of ID lists in the corpus (default 100000)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    id_lists = [
+        shell_link.idlist for shell_link in [
+            ShellLink.from_buffer(data) for data in load_samples()
+        ] if shell_link.idlist is not None
+    ]
+    corpus = [
+        id_lists[index % len(id_lists)] for index in range(options.count)
+    ]
+
+    for (name, interned) in (("decoded", False), ("interned", True)):
+        results = [
+            item_names(corpus, interned) for counter in range(options.repeat)
+        ]
+        best = min([elapsed for (elapsed, found) in results])
+
+        print("{0}: best {1:.4f}s, {2:.0f} ID lists/s, {3} names".format(
+            name, best, options.count / best, len(results[0][1])
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
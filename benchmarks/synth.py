@@ -0,0 +1,717 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Builders for synthetic evidence files, used by the benchmarks."""
+
+# stdlib imports
+from struct import pack
+from uuid import UUID
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "make_cfb", "typed_value", "make_property_set_stream",
+    "make_summary_info", "make_dest_list", "make_jump_list",
+    "make_thumbs_db", "make_thumbcache", "make_info2", "make_ifile",
+    "FMTID_SummaryInformation"
+]
+
+FMTID_SummaryInformation = UUID("f29f85e0-4ff9-1068-ab91-08002b27b3d9")
+
+_FREESECT = 0xFFFFFFFF
+_ENDOFCHAIN = 0xFFFFFFFE
+_FATSECT = 0xFFFFFFFD
+_DIFSECT = 0xFFFFFFFC
+_NOSTREAM = 0xFFFFFFFF
+
+_HEADER_SIG = b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"
+
+def _ceil_div(a, b):
+    return (a + b - 1) // b
+# end def _ceil_div
+
+def _dir_entry(name, type, child, right, start, size):
+    name_bytes = "".join([name, "\x00"]).encode("utf_16_le")
+
+    return b"".join([
+        name_bytes.ljust(64, b"\x00"),
+        pack("<HBB", len(name_bytes), type, 1),
+        pack("<III", _NOSTREAM, right, child),
+        bytes(16),  # clsid
+        pack("<I", 0),  # state
+        pack("<QQ", 0x01C295C491150E00, 0x01C5695100AECB90),
+        pack("<IQ", start, size)
+    ])
+# end def _dir_entry
+
+def make_cfb(streams, sect_shift=9, mini_stream_cutoff=4096):
+    """Creates a version 3 compound file with streams in the root storage.
+
+    Streams smaller than :attr:`mini_stream_cutoff` are placed in the mini
+    stream.
+
+    :type streams: list of (``str``, ``bytes``) tuples
+    :param streams: The names and contents of the streams.
+
+    :rtype: ``bytes``
+    :returns: The contents of the compound file.
+
+    """
+    sect_size = 1 << sect_shift
+    mini_sect_size = 64
+    entries_per_sect = sect_size // 4
+
+    mini_streams = [
+        (index, data) for (index, (name, data)) in enumerate(streams)
+        if len(data) < mini_stream_cutoff
+    ]
+    big_streams = [
+        (index, data) for (index, (name, data)) in enumerate(streams)
+        if len(data) >= mini_stream_cutoff
+    ]
+
+    # Lay out the mini stream
+    mini_fat = list()
+    mini_starts = dict()
+    mini_stream = bytearray()
+    for (index, data) in mini_streams:
+        count = _ceil_div(len(data), mini_sect_size)
+        if not count:
+            mini_starts[index] = _ENDOFCHAIN
+            continue
+        # end if
+
+        first = len(mini_fat)
+        mini_starts[index] = first
+        mini_fat.extend(range(first + 1, first + count))
+        mini_fat.append(_ENDOFCHAIN)
+        mini_stream.extend(data.ljust(count * mini_sect_size, b"\x00"))
+    # end for
+
+    dir_sect_count = _ceil_div((len(streams) + 1) * 128, sect_size)
+    mini_fat_sect_count = _ceil_div(len(mini_fat) * 4, sect_size)
+    mini_stream_sect_count = _ceil_div(len(mini_stream), sect_size)
+    data_sect_count = sum([
+        _ceil_div(len(data), sect_size) for (index, data) in big_streams
+    ])
+
+    other_sect_count = (
+        dir_sect_count + mini_fat_sect_count + mini_stream_sect_count +
+        data_sect_count
+    )
+
+    # Find the number of FAT and DIFAT sectors needed
+    fat_sect_count = 1
+    while 1:
+        if fat_sect_count > 109:
+            difat_sect_count = _ceil_div(fat_sect_count - 109,
+                entries_per_sect - 1)
+        else:
+            difat_sect_count = 0
+        # end if
+
+        total = fat_sect_count + difat_sect_count + other_sect_count
+        if total <= (fat_sect_count * entries_per_sect):
+            break
+        # end if
+
+        fat_sect_count = _ceil_div(total, entries_per_sect)
+    # end while
+
+    fat = [_FATSECT] * fat_sect_count
+    fat.extend([_DIFSECT] * difat_sect_count)
+
+    def allocate(count):
+        if not count:
+            return _ENDOFCHAIN
+        # end if
+
+        first = len(fat)
+        fat.extend(range(first + 1, first + count))
+        fat.append(_ENDOFCHAIN)
+        return first
+    # end def allocate
+
+    dir_start = allocate(dir_sect_count)
+    mini_fat_start = allocate(mini_fat_sect_count)
+    mini_stream_start = allocate(mini_stream_sect_count)
+
+    big_starts = dict()
+    for (index, data) in big_streams:
+        big_starts[index] = allocate(_ceil_div(len(data), sect_size))
+    # end for
+
+    fat.extend([_FREESECT] * ((fat_sect_count * entries_per_sect) - len(fat)))
+
+    # Directory
+    entries = [_dir_entry(
+        "Root Entry", 5, 1 if streams else _NOSTREAM, _NOSTREAM,
+        mini_stream_start, len(mini_stream)
+    )]
+
+    for (index, (name, data)) in enumerate(streams):
+        if (index + 1) < len(streams):
+            right = index + 2
+        else:
+            right = _NOSTREAM
+        # end if
+
+        if index in mini_starts:
+            start = mini_starts[index]
+        else:
+            start = big_starts[index]
+        # end if
+
+        entries.append(_dir_entry(name, 2, _NOSTREAM, right, start, len(data)))
+    # end for
+
+    dir_data = b"".join(entries).ljust(dir_sect_count * sect_size, b"\x00")
+
+    # DIFAT
+    difat = list(range(fat_sect_count))
+    header_difat = difat[:109]
+    header_difat.extend([_FREESECT] * (109 - len(header_difat)))
+
+    difat_sects = list()
+    remaining = difat[109:]
+    for counter in range(difat_sect_count):
+        values = remaining[:entries_per_sect - 1]
+        remaining = remaining[entries_per_sect - 1:]
+        values.extend([_FREESECT] * (entries_per_sect - 1 - len(values)))
+
+        if (counter + 1) < difat_sect_count:
+            values.append(fat_sect_count + counter + 1)
+        else:
+            values.append(_ENDOFCHAIN)
+        # end if
+
+        difat_sects.append(pack("<{0}I".format(entries_per_sect), *values))
+    # end for
+
+    if difat_sect_count:
+        difat_start = fat_sect_count
+    else:
+        difat_start = _ENDOFCHAIN
+    # end if
+
+    header = b"".join([
+        _HEADER_SIG, bytes(16), pack("<HHHHH", 0x3E, 3, 0xFFFE, sect_shift, 6),
+        bytes(6), pack("<II", 0, fat_sect_count), pack("<II", dir_start, 0),
+        pack("<III", mini_stream_cutoff, mini_fat_start, mini_fat_sect_count),
+        pack("<II", difat_start, difat_sect_count),
+        pack("<109I", *header_difat)
+    ]).ljust(sect_size, b"\x00")
+
+    parts = [header, pack("<{0}I".format(len(fat)), *fat)]
+    parts.extend(difat_sects)
+    parts.append(dir_data)
+
+    mini_fat.extend([_FREESECT] * (
+        (mini_fat_sect_count * entries_per_sect) - len(mini_fat)
+    ))
+    parts.append(pack("<{0}I".format(len(mini_fat)), *mini_fat))
+    parts.append(
+        bytes(mini_stream).ljust(mini_stream_sect_count * sect_size, b"\x00")
+    )
+
+    for (index, data) in big_streams:
+        count = _ceil_div(len(data), sect_size)
+        parts.append(data.ljust(count * sect_size, b"\x00"))
+    # end for
+
+    return b"".join(parts)
+# end def make_cfb
+
+# Property types with fixed size values: type -> struct format
+_fixed_formats = {
+    0x02: "<hxx",  # VT_I2
+    0x03: "<i",  # VT_I4
+    0x04: "<f",  # VT_R4
+    0x05: "<d",  # VT_R8
+    0x06: "<q",  # VT_CY
+    0x07: "<d",  # VT_DATE
+    0x0A: "<I",  # VT_ERROR
+    0x0B: "<Hxx",  # VT_BOOL
+    0x10: "<bxxx",  # VT_I1
+    0x11: "<Bxxx",  # VT_UI1
+    0x12: "<Hxx",  # VT_UI2
+    0x13: "<I",  # VT_UI4
+    0x14: "<q",  # VT_I8
+    0x15: "<Q",  # VT_UI8
+    0x16: "<i",  # VT_INT
+    0x17: "<I",  # VT_UINT
+    0x40: "<Q",  # VT_FILETIME
+}
+
+# Element sizes of fixed size types, when packed in a vector or array
+_packed_formats = {
+    0x02: "h", 0x03: "i", 0x04: "f", 0x05: "d", 0x0B: "H", 0x10: "b",
+    0x11: "B", 0x12: "H", 0x13: "I", 0x14: "q", 0x15: "Q", 0x16: "i",
+    0x17: "I"
+}
+
+def _pad4(data):
+    return data.ljust((len(data) + 3) & ~0x3, b"\x00")
+# end def _pad4
+
+def _encode_value(ptype, value):
+    """Encodes the value (without the type field) of a property."""
+
+    if ptype & 0x1000:  # VT_VECTOR
+        scalar_type = ptype & 0x0FFF
+
+        if scalar_type in _packed_formats:
+            format = "<{0}{1}".format(len(value), _packed_formats[scalar_type])
+            return b"".join([
+                pack("<I", len(value)), _pad4(pack(format, *value))
+            ])
+        # end if
+
+        parts = [pack("<I", len(value))]
+        parts.extend([_encode_value(scalar_type, x) for x in value])
+        return b"".join(parts)
+
+    elif ptype & 0x2000:  # VT_ARRAY
+        (dims, values) = value
+        scalar_type = ptype & 0x0FFF
+        parts = [pack("<II", scalar_type, len(dims))]
+        parts.extend([pack("<Ii", size, index) for (size, index) in dims])
+
+        if scalar_type in _packed_formats:
+            format = "<{0}{1}".format(len(values), _packed_formats[scalar_type])
+            parts.append(_pad4(pack(format, *values)))
+        else:
+            parts.extend([_encode_value(scalar_type, x) for x in values])
+        # end if
+
+        return b"".join(parts)
+
+    elif ptype in _fixed_formats:
+        return pack(_fixed_formats[ptype], value)
+
+    elif ptype in (0x00, 0x01):  # VT_EMPTY, VT_NULL
+        return b""
+
+    elif ptype == 0x0C:  # VT_VARIANT
+        return typed_value(*value)
+
+    elif ptype == 0x0E:  # VT_DECIMAL
+        return bytes(value)
+
+    elif ptype in (0x08, 0x1E, 0x42, 0x43, 0x44, 0x45):  # CodePageString
+        if isinstance(value, str):
+            value = "".join([value, "\x00"]).encode("cp1252")
+        # end if
+
+        return b"".join([pack("<I", len(value)), _pad4(value)])
+
+    elif ptype == 0x1F:  # VT_LPWSTR
+        data = "".join([value, "\x00"]).encode("utf_16_le")
+        return b"".join([pack("<I", len(data) // 2), _pad4(data)])
+
+    elif ptype in (0x41, 0x46):  # VT_BLOB, VT_BLOB_OBJECT
+        return b"".join([pack("<I", len(value)), _pad4(value)])
+
+    elif ptype == 0x47:  # VT_CF
+        (format, data) = value
+        return b"".join([pack("<Ii", len(data) + 4, format), _pad4(data)])
+
+    elif ptype == 0x48:  # VT_CLSID
+        return value.bytes_le
+
+    elif ptype == 0x49:  # VT_VERSIONED_STREAM
+        (guid, name) = value
+        return b"".join([guid.bytes_le, _encode_value(0x1E, name)])
+    # end if
+
+    raise ValueError("Unsupported property type 0x{0:X}".format(ptype))
+# end def _encode_value
+
+def typed_value(ptype, value=None):
+    """Encodes a TypedPropertyValue structure.
+
+    :type ptype: ``int``
+    :param ptype: The property type.
+
+    :param value: The value of the property.  Strings are encoded with code
+                  page 1252 (or UTF-16 for VT_LPWSTR), VT_CF values are
+                  (format, data) tuples, VT_ARRAY values are (dimensions,
+                  values) tuples and VT_VARIANT values are (type, value)
+                  tuples.
+
+    :rtype: ``bytes``
+    :returns: The encoded property.
+
+    """
+    return b"".join([pack("<Hxx", ptype), _encode_value(ptype, value)])
+# end def typed_value
+
+def _make_property_set(properties):
+    pair_count = len(properties)
+    offset = 8 + (pair_count * 8)
+    pairs = list()
+    values = list()
+
+    for (pid, data) in properties:
+        pairs.append(pack("<II", pid, offset))
+        values.append(data)
+        offset += len(data)
+    # end for
+
+    return b"".join([pack("<II", offset, pair_count)] + pairs + values)
+# end def _make_property_set
+
+def make_property_set_stream(property_sets, clsid=None):
+    """Creates a property set stream.
+
+    :type property_sets: list of (``UUID``, list) tuples
+    :param property_sets: The FMTID and properties of each property set.  The
+                          properties are a list of (property identifier,
+                          encoded property) tuples (see :func:`typed_value`).
+
+    :type clsid: ``UUID``
+    :param clsid: The CLSID of the property set stream.
+
+    :rtype: ``bytes``
+    :returns: The contents of the property set stream.
+
+    """
+    if clsid is None:
+        clsid = UUID(int=0)
+    # end if
+
+    count = len(property_sets)
+    offset = 28 + (count * 20)
+
+    header = [pack("<HH", 0xFFFE, 0), pack("<HH", 0x0A00, 2), clsid.bytes_le]
+    header.append(pack("<I", count))
+    sets = list()
+
+    for (fmtid, properties) in property_sets:
+        data = _make_property_set(properties)
+        header.append(b"".join([fmtid.bytes_le, pack("<I", offset)]))
+        sets.append(data)
+        offset += len(data)
+    # end for
+
+    return b"".join(header + sets)
+# end def make_property_set_stream
+
+def make_summary_info(seed=0, thumbnail_size=0, code_page=1252):
+    """Creates a SummaryInformation property set stream.
+
+    :type seed: ``int``
+    :param seed: A number used to vary the contents of the stream.
+
+    :type thumbnail_size: ``int``
+    :param thumbnail_size: The number of bytes of thumbnail data.  If this is
+                           0, no thumbnail property is included.
+
+    :type code_page: ``int``
+    :param code_page: The value of the CodePage property.
+
+    :rtype: ``bytes``
+    :returns: The contents of the property set stream.
+
+    """
+    filetime = 0x01C295C491150E00 + (seed * 10000000)
+    strings = [
+        (0x02, "Title of document {0}".format(seed)),
+        (0x03, "Subject {0}".format(seed)),
+        (0x04, "Author {0}".format(seed % 97)),
+        (0x05, "keyword{0} keyword{1}".format(seed, seed + 1)),
+        (0x06, "Comments about document {0}".format(seed)),
+        (0x07, "Normal.dot"),
+        (0x08, "Last Author {0}".format(seed % 89)),
+        (0x09, str(seed % 50)),
+        (0x12, "Microsoft Office Word")
+    ]
+
+    if code_page > 0x7FFF:
+        code_page -= 0x10000
+    # end if
+
+    properties = [(0x01, typed_value(0x02, code_page))]
+    properties.extend([
+        (pid, typed_value(0x1E, value)) for (pid, value) in strings
+    ])
+    properties.extend([
+        (0x0A, typed_value(0x40, seed * 600000000)),
+        (0x0B, typed_value(0x40, filetime)),
+        (0x0C, typed_value(0x40, filetime + 1)),
+        (0x0D, typed_value(0x40, filetime + 2)),
+        (0x0E, typed_value(0x03, seed % 300)),
+        (0x0F, typed_value(0x03, seed * 7)),
+        (0x10, typed_value(0x03, seed * 41)),
+        (0x13, typed_value(0x03, 0))
+    ])
+
+    if thumbnail_size:
+        data = pack("<I", 3) + bytes(thumbnail_size)
+        properties.append((0x11, typed_value(0x47, (-1, data))))
+    # end if
+
+    return make_property_set_stream([(FMTID_SummaryInformation, properties)])
+# end def make_summary_info
+
+def make_dest_list(entries, version=1):
+    """Creates the DestList stream of a jump list.
+
+    :type entries: list of (``int``, ``str``, ``int``, ``int``) tuples
+    :param entries: The entry number, path, FILETIME and pin status of each
+                    entry.
+
+    :type version: ``int``
+    :param version: The format version (1 for Windows 7, 3 or 4 for Windows
+                    10).
+
+    :rtype: ``bytes``
+    :returns: The contents of the DestList stream.
+
+    """
+    pinned_count = len([entry for entry in entries if entry[3] >= 0])
+    if entries:
+        last_entry_number = max([entry[0] for entry in entries])
+    else:
+        last_entry_number = 0
+    # end if
+
+    parts = [pack(
+        "<IIIfIIII", version, len(entries), pinned_count, 1.0,
+        last_entry_number, 0, len(entries), 0
+    )]
+
+    for (entry_number, path, filetime, pin_status) in entries:
+        droids = [
+            UUID(int=((entry_number * 4) + index) * 0x9E3779B97F4A7C15)
+            for index in range(4)
+        ]
+
+        parts.append(b"".join([
+            pack("<Q", entry_number * 0x10001),
+            b"".join([droid.bytes_le for droid in droids]),
+            b"workstation".ljust(16, b"\x00"),
+            pack("<IIfQi", entry_number, 0, entry_number / 4, filetime,
+                pin_status)
+        ]))
+
+        if version >= 3:
+            parts.append(pack("<IIQH", 0, entry_number, 0, len(path)))
+        else:
+            parts.append(pack("<H", len(path)))
+        # end if
+
+        parts.append(path.encode("utf_16_le"))
+
+        if version >= 3:
+            parts.append(bytes(4))
+        # end if
+    # end for
+
+    return b"".join(parts)
+# end def make_dest_list
+
+def make_jump_list(links, version=1, seed=0):
+    """Creates a jump list (AutomaticDestinations-ms) file.
+
+    :type links: list of ``bytes``
+    :param links: The contents of the shell link for each entry.
+
+    :type version: ``int``
+    :param version: Passed on to :func:`make_dest_list`.
+
+    :type seed: ``int``
+    :param seed: Used to vary the paths and timestamps.
+
+    :rtype: ``bytes``
+    :returns: The contents of the jump list file.
+
+    """
+    entries = [
+        (
+            index + 1,
+            "C:\\Users\\user\\Documents\\file{0}_{1}.txt".format(seed, index),
+            0x01CAB1D2E3F40000 + (seed * 600000000) + (index * 10000000),
+            index if index < 2 else -1
+        )
+        for index in range(len(links))
+    ]
+
+    streams = [("DestList", make_dest_list(entries, version))]
+    streams.extend([
+        ("{0:x}".format(entry[0]), data)
+        for (entry, data) in zip(entries, links)
+    ])
+
+    return make_cfb(streams)
+# end def make_jump_list
+
+def make_thumbs_db(count, thumbnail_size=8192, seed=0):
+    """Creates a thumbs.db file.
+
+    :type count: ``int``
+    :param count: The number of thumbnails.
+
+    :type thumbnail_size: ``int``
+    :param thumbnail_size: The size of each thumbnail (in bytes).
+
+    :type seed: ``int``
+    :param seed: Used to vary the file names and timestamps.
+
+    :rtype: ``bytes``
+    :returns: The contents of the thumbs.db file.
+
+    """
+    catalog = [pack("<HHIII", 0x10, 7, count, 96, 96)]
+    streams = list()
+
+    for index in range(1, count + 1):
+        name = "image{0}_{1}.jpg\x00".format(seed, index).encode("utf_16_le")
+        mtime = 0x01CAB1D2E3F40000 + (seed * 600000000) + (index * 10000000)
+        catalog.append(pack("<IIQ", 16 + len(name) + 2, index, mtime))
+        catalog.append(name + b"\x00\x00")
+
+        thumbnail = b"\xFF\xD8" + bytes([index & 0xFF]) * (thumbnail_size - 2)
+        streams.append((
+            str(index)[::-1],
+            pack("<III", 12, 1, thumbnail_size) + thumbnail
+        ))
+    # end for
+
+    streams.insert(0, ("Catalog", b"".join(catalog)))
+
+    return make_cfb(streams)
+# end def make_thumbs_db
+
+def make_thumbcache(count, data_size=8192, cache_type=1, seed=0):
+    """Creates a Windows 7 thumbnail cache file and its index file.
+
+    :type count: ``int``
+    :param count: The number of cache entries.
+
+    :type data_size: ``int``
+    :param data_size: The size of the data of each cache entry (in bytes).
+
+    :type cache_type: ``int``
+    :param cache_type: The cache type of the cache file (0 to 4).
+
+    :type seed: ``int``
+    :param seed: Used to vary the entry hashes.
+
+    :rtype: ``tuple``
+    :returns: A tuple of the contents of the cache file and index file.
+
+    """
+    first_entry = 24
+    entries = list()
+    index_entries = list()
+    offset = first_entry
+
+    for index in range(count):
+        entry_hash = ((seed + 1) * 0x9E3779B97F4A7C15 + index) & (2 ** 64 - 1)
+        identifier = "{0:016x}".format(entry_hash).encode("utf_16_le")
+        data = b"\xFF\xD8" + bytes([index & 0xFF]) * (data_size - 2)
+        padding = (-(48 + len(identifier) + data_size)) % 8
+        size = 48 + len(identifier) + padding + data_size
+
+        entries.append(pack(
+            "<4sIQIIIIQQ", b"CMMM", size, entry_hash, len(identifier),
+            padding, data_size, 0, 0, 0
+        ))
+        entries.append(identifier + (b"\x00" * padding) + data)
+
+        offsets = [0xFFFFFFFF] * 5
+        offsets[cache_type] = offset
+        index_entries.append(pack("<QI5I", entry_hash, 0, *offsets))
+
+        offset += size
+    # end for
+
+    cache = pack(
+        "<4sIIIII", b"CMMM", 0x15, cache_type, first_entry, offset, count
+    )
+    cache = cache + b"".join(entries)
+
+    # Leave as many empty slots as used ones, like a half full hash table.
+    slot_count = count * 2
+    index_entries.extend([bytes(32)] * count)
+    index = pack(
+        "<4sI4sII4s", b"IMMM", 0x15, bytes(4), count, slot_count, bytes(4)
+    )
+    index = index + b"".join(index_entries)
+
+    return (cache, index)
+# end def make_thumbcache
+
+def make_info2(count, seed=0):
+    """Creates a (Windows XP) recycle bin INFO2 file.
+
+    :type count: ``int``
+    :param count: The number of items.
+
+    :type seed: ``int``
+    :param seed: Used to vary the file names and timestamps.
+
+    :rtype: ``bytes``
+    :returns: The contents of the INFO2 file.
+
+    """
+    data = [pack("<IIIII", 5, 0, count, 800, 0)]
+
+    for index in range(count):
+        name = "C:\\Users\\user{0}\\file{1}.txt".format(seed, index)
+        dtime = 0x01CAB1D2E3F40000 + (seed * 600000000) + (index * 10000000)
+        data.append(pack(
+            "<260sIIQI520s", name.encode("ascii"), index + 1, 2, dtime,
+            index * 100, name.encode("utf_16_le")
+        ))
+    # end for
+
+    return b"".join(data)
+# end def make_info2
+
+def make_ifile(index, version=2, seed=0):
+    """Creates a (Windows Vista and later) recycle bin $I file.
+
+    :type index: ``int``
+    :param index: Used to vary the file name, size and timestamp.
+
+    :type version: ``int``
+    :param version: The version of the $I file (1 or 2).
+
+    :type seed: ``int``
+    :param seed: Used to vary the file names and timestamps.
+
+    :rtype: ``bytes``
+    :returns: The contents of the $I file.
+
+    """
+    name = "C:\\Users\\user{0}\\Documents\\file{1}.docx\x00".format(
+        seed, index
+    )
+    name = name.encode("utf_16_le")
+    dtime = 0x01D3B1D2E3F40000 + (seed * 600000000) + (index * 10000000)
+    data = [pack("<QQQ", version, index * 1000, dtime)]
+
+    if version == 1:
+        data.append(name.ljust(520, b"\x00"))
+    else:
+        data.append(pack("<I", len(name) // 2))
+        data.append(name)
+    # end if
+
+    return b"".join(data)
+# end def make_ifile
@@ -0,0 +1,197 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks finding thumbcache entries by hash, with and without an index."""
+
+# stdlib imports
+import os
+from optparse import OptionParser
+from random import Random
+from tempfile import mkstemp
+from time import perf_counter
+import tracemalloc
+
+# local imports
+from lf.dec import RawIStream, MappedIStream
+from lf.win.shell.thumbcache import CacheFile, IndexFile
+
+from synth import make_thumbcache
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "scan_lookup", "scan_index_lookup", "idx_lookup", "measure", "main"
+]
+
+def scan_lookup(cache, index_name, hashes):
+    """Finds each entry by walking the cache entries from the start.
+
+    :rtype: ``int``
+    :returns: The total size of the thumbnail data.
+
+    """
+    total = 0
+    for entry_hash in hashes:
+        for entry in cache.iter_entries():
+            if entry.hash == entry_hash:
+                total += len(entry.data.data)
+                break
+            # end if
+        # end for
+    # end for
+
+    return total
+# end def scan_lookup
+
+def scan_index_lookup(cache, index_name, hashes):
+    """Finds each entry with a hash index built from the entry headers.
+
+    :rtype: ``int``
+    :returns: The total size of the thumbnail data.
+
+    """
+    get_entry = cache.get_entry
+    return sum([len(get_entry(entry_hash).data.data) for entry_hash in hashes])
+# end def scan_index_lookup
+
+def idx_lookup(cache, index_name, hashes):
+    """Finds each entry with the hash index from thumbcache_idx.db.
+
+    :rtype: ``int``
+    :returns: The total size of the thumbnail data.
+
+    """
+    index_stream = RawIStream(index_name)
+    try:
+        cache.use_index(IndexFile(index_stream))
+    finally:
+        index_stream.close()
+    # end try
+
+    get_entry = cache.get_entry
+    return sum([len(get_entry(entry_hash).data.data) for entry_hash in hashes])
+# end def idx_lookup
+
+def measure(cache_name, index_name, stream_class, func, hashes):
+    """Opens the cache file and finds the entries.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds), the peak memory allocated (in
+              bytes), and the total size of the thumbnail data.
+
+    """
+    tracemalloc.start()
+    start = perf_counter()
+
+    stream = stream_class(cache_name)
+    try:
+        total = func(CacheFile(stream), index_name, hashes)
+    finally:
+        stream.close()
+    # end try
+
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return (elapsed, peak, total)
+# end def measure
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=2000,
+        help="Number of cache entries (default 2000)"
+    )
+
+    parser.add_option(
+        "-s",
+        dest="size",
+        type="int",
+        default=16384,
+        help="Size of each thumbnail in bytes (default 16384)"
+    )
+
+    parser.add_option(
+        "-l",
+        dest="lookups",
+        type="int",
+        default=50,
+        help="Number of lookups (default 50)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    (cache_data, index_data) = make_thumbcache(options.count, options.size)
+
+    (cache_fd, cache_name) = mkstemp(suffix=".db")
+    (index_fd, index_name) = mkstemp(suffix=".db")
+    try:
+        with os.fdopen(cache_fd, "wb") as ofile:
+            ofile.write(cache_data)
+        # end with
+
+        with os.fdopen(index_fd, "wb") as ofile:
+            ofile.write(index_data)
+        # end with
+
+        del cache_data, index_data
+
+        stream = MappedIStream(cache_name)
+        hashes = list(CacheFile(stream).hash_index.keys())
+        stream.close()
+        hashes = Random(0).sample(hashes, min(options.lookups, len(hashes)))
+
+        tests = [
+            ("scan, raw", RawIStream, scan_lookup),
+            ("header index, raw", RawIStream, scan_index_lookup),
+            ("header index, mmap", MappedIStream, scan_index_lookup),
+            ("idx index, raw", RawIStream, idx_lookup),
+            ("idx index, mmap", MappedIStream, idx_lookup)
+        ]
+
+        for (name, stream_class, func) in tests:
+            results = [
+                measure(cache_name, index_name, stream_class, func, hashes)
+                for counter in range(options.repeat)
+            ]
+            best = min([elapsed for (elapsed, peak, total) in results])
+            peak = min([peak for (elapsed, peak, total) in results])
+
+            print("{0}: best {1:.4f}s, peak {2:.1f} MiB, {3} bytes".format(
+                name, best, peak / 1048576, results[0][2]
+            ))
+        # end for
+    finally:
+        os.remove(cache_name)
+        os.remove(index_name)
+    # end try
+# end def main
+
+if __name__ == "__main__":
+    main()
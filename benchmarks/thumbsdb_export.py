@@ -0,0 +1,211 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks exporting the thumbnails from many thumbs.db files."""
+
+# stdlib imports
+import os
+from optparse import OptionParser
+from tempfile import mkdtemp
+from shutil import rmtree
+from time import perf_counter
+
+# local imports
+from lf.dec import RawIStream
+from lf.win.ole.cfb import CompoundFile
+from lf.win.shell.thumbsdb import ThumbsDb
+from lf.win.shell.thumbsdb.batch import export
+
+from synth import make_thumbs_db
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "make_corpus", "export_per_entry", "export_batch", "main"
+]
+
+class _NullFile():
+    """A text file that discards what is written to it."""
+
+    def write(self, data):
+        pass
+    # end def write
+# end class _NullFile
+
+def make_corpus(directory, count, thumbnails, size):
+    """Writes :attr:`count` thumbs.db files to :attr:`directory`.
+
+    Thumbnails with the same index are identical in every file.
+
+    :rtype: ``list``
+    :returns: The names of the thumbs.db files.
+
+    """
+    paths = list()
+
+    for seed in range(count):
+        path = os.path.join(directory, "thumbs{0}.db".format(seed))
+        with open(path, "wb") as ofile:
+            ofile.write(make_thumbs_db(thumbnails, size, seed))
+        # end with
+
+        paths.append(path)
+    # end for
+
+    return paths
+# end def make_corpus
+
+def export_per_entry(paths, directory):
+    """Writes every thumbnail as ``bytes``, one file per entry (like tdbcat).
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds), the number of thumbnails, and
+              the number of bytes.
+
+    """
+    start = perf_counter()
+    image_count = 0
+    byte_count = 0
+
+    for (index, path) in enumerate(paths):
+        stream = RawIStream(path)
+        tdb = ThumbsDb(CompoundFile(stream))
+
+        for (entry_id, thumbnail) in tdb.thumbnails.items():
+            name = "{0}_{1}.jpg".format(index, entry_id)
+            data = thumbnail.data
+
+            with open(os.path.join(directory, name), "wb") as ofile:
+                ofile.write(data)
+            # end with
+
+            image_count += 1
+            byte_count += len(data)
+        # end for
+
+        stream.close()
+    # end for
+
+    return (perf_counter() - start, image_count, byte_count)
+# end def export_per_entry
+
+def export_batch(paths, directory, workers, threads):
+    """Exports the thumbnails with :func:`export`.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds), the number of thumbnails, and
+              the number of bytes.
+
+    """
+    stats = export(paths, directory, _NullFile(), workers, threads)
+    return (stats.elapsed, stats.image_count, stats.byte_count)
+# end def export_batch
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-f",
+        dest="files",
+        type="int",
+        default=50,
+        help="Number of thumbs.db files (default 50)"
+    )
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=200,
+        help="Number of thumbnails per file (default 200)"
+    )
+
+    parser.add_option(
+        "-s",
+        dest="size",
+        type="int",
+        default=16384,
+        help="Size of each thumbnail in bytes (default 16384)"
+    )
+
+    parser.add_option(
+        "-t",
+        dest="threads",
+        type="int",
+        default=4,
+        help="Number of threads per file (default 4)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    corpus_dir = mkdtemp()
+    try:
+        paths = make_corpus(
+            corpus_dir, options.files, options.count, options.size
+        )
+
+        tests = [
+            ("per entry (bytes)", None),
+            ("export", (0, 0)),
+            ("export, threads", (0, options.threads)),
+            ("export, processes", (None, 0)),
+            ("export, processes + threads", (None, options.threads))
+        ]
+
+        for (name, args) in tests:
+            results = list()
+
+            for counter in range(options.repeat):
+                output_dir = mkdtemp()
+                try:
+                    if args is None:
+                        result = export_per_entry(paths, output_dir)
+                    else:
+                        result = export_batch(paths, output_dir, *args)
+                    # end if
+
+                    result = result + (len(os.listdir(output_dir)),)
+                finally:
+                    rmtree(output_dir)
+                # end try
+
+                results.append(result)
+            # end for
+
+            (best, images, size, files) = min(results)
+
+            print(
+                "{0}: best {1:.4f}s, {2:.0f} images/s, {3:.1f} MB/s, "
+                "{4} files written".format(
+                    name, best, images / best, size / best / 1000000, files
+                )
+            )
+        # end for
+    finally:
+        rmtree(corpus_dir)
+    # end try
+# end def main
+
+if __name__ == "__main__":
+    main()
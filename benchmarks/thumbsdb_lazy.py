@@ -0,0 +1,150 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks listing a thumbs.db file with eager and lazy thumbnails."""
+
+# stdlib imports
+from optparse import OptionParser
+from time import perf_counter
+import tracemalloc
+
+# local imports
+from lf.dec import ByteIStream
+from lf.win.ole.cfb import CompoundFile
+from lf.win.shell.thumbsdb import ThumbsDb, Thumbnail, Catalog
+
+from synth import make_thumbs_db
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "eager_thumbnails", "lazy_thumbnails", "measure", "main"
+]
+
+def eager_thumbnails(cfb):
+    """Reads every thumbnail, finding each stream with a directory scan.
+
+    :rtype: ``dict``
+    :returns: A dictionary of :class:`Thumbnail` objects.
+
+    """
+    catalog_sid = None
+    entry_map = dict()
+    for (sid, entry) in cfb.dir_entries.items():
+        if entry.name == "Catalog":
+            catalog_sid = sid
+        else:
+            entry_map[entry.name] = sid
+        # end if
+    # end for
+
+    catalog = Catalog.from_stream(cfb.get_stream(catalog_sid))
+
+    return dict([
+        (
+            entry.id,
+            Thumbnail.from_stream(cfb.get_stream(entry_map[entry.stream_name]))
+        )
+        for entry in catalog.entries
+    ])
+# end def eager_thumbnails
+
+def lazy_thumbnails(cfb):
+    """Creates lazy handles for every thumbnail with :class:`ThumbsDb`.
+
+    :rtype: ``dict``
+    :returns: A dictionary of :class:`LazyThumbnail` objects.
+
+    """
+    return ThumbsDb(cfb).thumbnails
+# end def lazy_thumbnails
+
+def measure(data, func, fetch=None):
+    """Lists the sizes of the thumbnails, and optionally reads one.
+
+    :rtype: ``tuple``
+    :returns: The elapsed time (in seconds), the peak memory allocated (in
+              bytes), and the total size of the thumbnails.
+
+    """
+    tracemalloc.start()
+    start = perf_counter()
+
+    thumbnails = func(CompoundFile(ByteIStream(data)))
+    total = sum([thumbnail.size for thumbnail in thumbnails.values()])
+
+    if fetch is not None:
+        thumbnails[fetch].data
+    # end if
+
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return (elapsed, peak, total)
+# end def measure
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=2000,
+        help="Number of thumbnails (default 2000)"
+    )
+
+    parser.add_option(
+        "-s",
+        dest="size",
+        type="int",
+        default=32768,
+        help="Size of each thumbnail in bytes (default 32768)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    data = make_thumbs_db(options.count, options.size)
+    tests = [
+        ("eager", eager_thumbnails, None),
+        ("lazy (list)", lazy_thumbnails, None),
+        ("lazy (list + 1 read)", lazy_thumbnails, options.count // 2)
+    ]
+
+    for (name, func, fetch) in tests:
+        results = [
+            measure(data, func, fetch) for counter in range(options.repeat)
+        ]
+        best = min([elapsed for (elapsed, peak, total) in results])
+        peak = min([peak for (elapsed, peak, total) in results])
+
+        print("{0}: best {1:.4f}s, peak {2:.1f} MiB, {3} bytes".format(
+            name, best, peak / 1048576, results[0][2]
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks DOS date and time decoding with and without lookup tables."""
+
+# stdlib imports
+from array import array
+from datetime import datetime
+from optparse import OptionParser
+from random import Random
+from time import perf_counter
+
+# local imports
+from lf.time import DOSDateTimeTodatetime
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "make_words", "arithmetic_from_ints", "decode_arithmetic",
+    "decode_from_ints", "decode_from_int_pairs", "decode_dates", "main"
+]
+
+def make_words(count, seed=0):
+    """Makes arrays of random (valid) DOS dates and times.
+
+    :rtype: ``tuple``
+    :returns: A ``(dos_dates, dos_times)`` tuple of ``array("H")`` objects.
+
+    """
+    random = Random(seed)
+    randrange = random.randrange
+
+    dos_dates = array("H", [
+        (randrange(50) << 9) | (randrange(1, 13) << 5) | randrange(1, 29)
+        for x in range(count)
+    ])
+
+    dos_times = array("H", [
+        (randrange(24) << 11) | (randrange(60) << 5) | randrange(30)
+        for x in range(count)
+    ])
+
+    return (dos_dates, dos_times)
+# end def make_words
+
+def arithmetic_from_ints(dos_date, dos_time):
+    """Decodes a DOS date and time with bit arithmetic (the old from_ints).
+
+    :rtype: ``datetime``
+    :returns: The corresponding ``datetime`` object.
+
+    """
+    secs = (dos_time & 0x1F) * 2
+    mins = (dos_time & 0x7E0) >> 5
+    hours = (dos_time & 0xF800) >> 11
+
+    day = dos_date & 0x1F
+    month = (dos_date & 0x1E0) >> 5
+    year = ((dos_date & 0xFE00) >> 9) + 1980
+
+    return datetime(year, month, day, hours, mins, secs)
+# end def arithmetic_from_ints
+
+def decode_arithmetic(dos_dates, dos_times):
+    """Decodes each pair with :func:`arithmetic_from_ints`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+
+    for (dos_date, dos_time) in zip(dos_dates, dos_times):
+        arithmetic_from_ints(dos_date, dos_time)
+    # end for
+
+    return perf_counter() - start
+# end def decode_arithmetic
+
+def decode_from_ints(dos_dates, dos_times):
+    """Decodes each pair with :meth:`DOSDateTimeTodatetime.from_ints`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    from_ints = DOSDateTimeTodatetime.from_ints
+    start = perf_counter()
+
+    for (dos_date, dos_time) in zip(dos_dates, dos_times):
+        from_ints(dos_date, dos_time)
+    # end for
+
+    return perf_counter() - start
+# end def decode_from_ints
+
+def decode_from_int_pairs(dos_dates, dos_times):
+    """Decodes all pairs with :meth:`DOSDateTimeTodatetime.from_int_pairs`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+    DOSDateTimeTodatetime.from_int_pairs(dos_dates, dos_times)
+    return perf_counter() - start
+# end def decode_from_int_pairs
+
+def decode_dates(dos_dates, dos_times):
+    """Decodes the dates alone with :meth:`dates_from_ints`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    start = perf_counter()
+    DOSDateTimeTodatetime.dates_from_ints(dos_dates)
+    return perf_counter() - start
+# end def decode_dates
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=1000000,
+        help="Number of date/time pairs (default 1000000)"
+    )
+
+    parser.add_option(
+        "-n",
+        dest="repeat",
+        type="int",
+        default=3,
+        help="Number of repetitions (default 3)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    (dos_dates, dos_times) = make_words(options.count)
+
+    start = perf_counter()
+    DOSDateTimeTodatetime.dates_from_ints([0x21])
+    DOSDateTimeTodatetime.times_from_ints([0])
+    print("tables: built in {0:.4f}s".format(perf_counter() - start))
+
+    for (name, func) in [
+        ("arithmetic", decode_arithmetic),
+        ("from_ints", decode_from_ints),
+        ("from_int_pairs", decode_from_int_pairs),
+        ("dates_from_ints", decode_dates)
+    ]:
+        times = [
+            func(dos_dates, dos_times) for counter in range(options.repeat)
+        ]
+        best = min(times)
+
+        print("{0}: best {1:.4f}s, {2:.0f} values/s".format(
+            name, best, options.count / best
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
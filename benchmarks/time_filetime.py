@@ -0,0 +1,123 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Benchmarks FILETIME to datetime conversion over many timestamps."""
+
+# stdlib imports
+from array import array
+from optparse import OptionParser
+from random import Random
+from time import perf_counter
+
+# local imports
+from lf.time import FILETIMETodatetime, numpy
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "make_timestamps", "convert_from_int", "convert_from_ints", "main"
+]
+
+# 1980-01-01 and 2030-01-01, as FILETIME timestamps.
+_FIRST = 119600064000000000
+_LAST = 135379296000000000
+
+def make_timestamps(count, seed=0):
+    """Makes an array of random FILETIME timestamps.
+
+    :rtype: ``array``
+    :returns: :attr:`count` timestamps between 1980 and 2030.
+
+    """
+    random = Random(seed)
+    randrange = random.randrange
+
+    return array("Q", [randrange(_FIRST, _LAST) for x in range(count)])
+# end def make_timestamps
+
+def convert_from_int(timestamps, chunk_size):
+    """Converts each timestamp with :meth:`FILETIMETodatetime.from_int`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    from_int = FILETIMETodatetime.from_int
+    start = perf_counter()
+
+    for timestamp in timestamps:
+        from_int(timestamp)
+    # end for
+
+    return perf_counter() - start
+# end def convert_from_int
+
+def convert_from_ints(timestamps, chunk_size):
+    """Converts the timestamps in chunks with :meth:`from_ints`.
+
+    :rtype: ``float``
+    :returns: The elapsed time, in seconds.
+
+    """
+    from_ints = FILETIMETodatetime.from_ints
+    start = perf_counter()
+
+    for offset in range(0, len(timestamps), chunk_size):
+        from_ints(timestamps[offset:offset + chunk_size])
+    # end for
+
+    return perf_counter() - start
+# end def convert_from_ints
+
+def main():
+    parser = OptionParser(usage="%prog [options]")
+
+    parser.add_option(
+        "-c",
+        dest="count",
+        type="int",
+        default=10000000,
+        help="Number of timestamps (default 10000000)"
+    )
+
+    parser.add_option(
+        "-k",
+        dest="chunk_size",
+        type="int",
+        default=1000000,
+        help="Number of timestamps per from_ints call (default 1000000)"
+    )
+
+    (options, args) = parser.parse_args()
+
+    timestamps = make_timestamps(options.count)
+    print("numpy: {0}".format("yes" if numpy is not None else "no"))
+
+    count = len(timestamps)
+    for (name, func) in [
+        ("from_int", convert_from_int),
+        ("from_ints", convert_from_ints)
+    ]:
+        elapsed = func(timestamps, options.chunk_size)
+
+        print("{0}: {1} timestamps in {2:.4f}s, {3:.0f} timestamps/s".format(
+            name, count, elapsed, count / elapsed
+        ))
+    # end for
+# end def main
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,8 @@ from lf.apps.msoffice.shared.objects import (
     VtHeadingPair, VtVecHeadingPairValue, VtDigSigValue, VtHyperlink,
     VecVtHyperlink, VtHyperlinkValue, DigSigBlob, DigSigInfoSerialized,
     VtThumbnail, VtVecUnalignedLpstr, VtVecLpwstr, VtString, VtUnalignedString,
-    VtVecHeadingPair, VtDigSig, VtHyperlinks, PropertyFactory, Builder
+    VtVecHeadingPair, VtDigSig, VtHyperlinks, PropertyFactory, Builder,
+    register_parsers
 )
 
 from lf.apps.msoffice.shared.metadata import (
@@ -37,6 +38,7 @@ __all__ = [
     "DigSigBlob", "DigSigInfoSerialized", "VtThumbnail", "VtVecUnalignedLpstr",
     "VtVecLpwstr", "VtString", "VtUnalignedString", "VtVecHeadingPair",
     "VtDigSig", "VtHyperlinks", "PropertyFactory", "Builder",
+    "register_parsers",
 
     "SummaryInfo", "DocSummaryInfo", "UserDefinedProperties"
 ]
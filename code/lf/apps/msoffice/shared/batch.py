@@ -0,0 +1,346 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batch extraction of metadata from many Microsoft Office documents.
+
+The metadata of each document is flattened into a row, with one column per
+field of the :class:`~lf.apps.msoffice.shared.metadata.SummaryInfo`,
+:class:`~lf.apps.msoffice.shared.metadata.DocSummaryInfo` and
+:class:`~lf.apps.msoffice.shared.metadata.UserDefinedProperties` classes.
+Rows can be written as CSV or JSON lines.
+
+"""
+
+# stdlib imports
+import os
+import csv
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from time import perf_counter
+from uuid import UUID
+
+# local imports
+from lf.dec import RawIStream
+from lf.win.ole.cfb.objects import CompoundFile
+from lf.utils.batch import BatchStats, batches, iter_bounded
+from lf.win.ole.cfb.batch import find_files
+from lf.apps.msoffice.shared.objects import Builder
+from lf.apps.msoffice.shared.metadata import (
+    SummaryInfo, DocSummaryInfo, UserDefinedProperties
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "COLUMNS", "find_files", "extract", "iter_rows", "ingest"
+]
+
+# Names of the property set streams.
+_SUMMARY_INFO_NAME = "\x05SummaryInformation"
+_DOC_SUMMARY_INFO_NAME = "\x05DocumentSummaryInformation"
+
+# Columns with binary values that are too large for a table.  The
+# properties behind these are left out of SummaryInfo.metadata_pids and
+# DocSummaryInfo.metadata_pids, so they are never decoded.
+_SKIPPED_COLUMNS = frozenset(["si_thumbnail", "dsi_dig_sig", "dsi_hlinks"])
+
+# The (column prefix, metadata class) of each part of a row.
+_TABLES = (
+    ("si_", SummaryInfo),
+    ("dsi_", DocSummaryInfo),
+    ("udp_", UserDefinedProperties)
+)
+
+#: The columns of a row, in order.
+COLUMNS = ("path", "error") + tuple([
+    "".join([prefix, field])
+    for (prefix, metadata_cls) in _TABLES
+    for field in metadata_cls._fields_
+    if "".join([prefix, field]) not in _SKIPPED_COLUMNS
+])
+
+# The number of paths given to a worker at once.
+_BATCH_SIZE = 64
+
+def _to_cell(value):
+    """Converts a metadata value to something :mod:`json` can serialize."""
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, timedelta):
+        return value.total_seconds()
+    elif isinstance(value, (UUID, Decimal)):
+        return str(value)
+    elif isinstance(value, (bytes, bytearray)):
+        return bytes(value).hex()
+    elif isinstance(value, (set, frozenset)):
+        return sorted([_to_cell(item) for item in value])
+    elif isinstance(value, dict):
+        return dict([
+            (str(key), _to_cell(item)) for (key, item) in value.items()
+        ])
+    elif isinstance(value, (list, tuple)):
+        return [_to_cell(item) for item in value]
+    # end if
+
+    return value
+# end def _to_cell
+
+def _add_columns(row, prefix, metadata):
+    """Adds the fields of a metadata object to a row."""
+
+    for (field, value) in zip(metadata._fields_, metadata):
+        column = "".join([prefix, field])
+
+        if column not in _SKIPPED_COLUMNS:
+            row[column] = _to_cell(value)
+        # end if
+    # end for
+# end def _add_columns
+
+def extract(path):
+    """Extracts the metadata from a Microsoft Office document.
+
+    Only the SummaryInformation and DocumentSummaryInformation streams are
+    read, and only the properties in the ``metadata_pids`` of the metadata
+    classes (and the user defined properties) are decoded.  Any error while
+    parsing the file is caught, and reported in the row, so one bad file
+    does not stop a batch.
+
+    :type path: ``str``
+    :param path: The name of the document (an OLE compound file).
+
+    :rtype: ``dict``
+    :returns: A dictionary with a key for each column in :const:`COLUMNS`.
+              Columns of metadata that is not in the file are ``None``.  If
+              the file could not be parsed, the ``"error"`` column describes
+              the error.  Values are all serializable by :mod:`json`.
+
+    """
+    row = dict.fromkeys(COLUMNS)
+    row["path"] = path
+
+    try:
+        stream = RawIStream(path)
+    except (IOError, OSError) as err:
+        row["error"] = "{0}: {1}".format(err.__class__.__name__, err)
+        return row
+    # end try
+
+    try:
+        cfb = CompoundFile(stream, lazy_fat=True)
+
+        sids = dict([
+            (name, sid) for (sid, name) in cfb.get_paths().items()
+        ])
+
+        if _SUMMARY_INFO_NAME in sids:
+            property_set_stream = Builder.build(
+                cfb.get_stream(sids[_SUMMARY_INFO_NAME]),
+                pids=SummaryInfo.metadata_pids
+            )
+
+            properties = property_set_stream.property_set_0.properties
+            _add_columns(row, "si_", SummaryInfo.from_properties(properties))
+        # end if
+
+        if _DOC_SUMMARY_INFO_NAME in sids:
+            dsi_stream = cfb.get_stream(sids[_DOC_SUMMARY_INFO_NAME])
+            property_set_stream = Builder.build(
+                dsi_stream, pids=DocSummaryInfo.metadata_pids
+            )
+
+            properties = property_set_stream.property_set_0.properties
+            metadata = DocSummaryInfo.from_properties(properties)
+            _add_columns(row, "dsi_", metadata)
+
+            # The pids of the user defined properties are arbitrary, so the
+            # second property set is built again without a filter.
+            if property_set_stream.property_set_1 is not None:
+                fmtid = property_set_stream.fmtid1
+                offset = property_set_stream.offset1
+                property_set = Builder.build_property_set_header(
+                    dsi_stream, offset, fmtid
+                )
+                properties = Builder.build_properties(
+                    dsi_stream, property_set, offset, fmtid
+                )
+
+                metadata = UserDefinedProperties.from_properties(properties)
+                _add_columns(row, "udp_", metadata)
+            # end if
+        # end if
+    except Exception as err:
+        row = dict.fromkeys(COLUMNS)
+        row["path"] = path
+        row["error"] = "{0}: {1}".format(err.__class__.__name__, err)
+    finally:
+        stream.close()
+    # end try
+
+    return row
+# end def extract
+
+def _extract_batch(paths):
+    """Extracts the metadata from a list of documents (in a worker)."""
+
+    return [extract(path) for path in paths]
+# end def _extract_batch
+
+def iter_rows(paths, workers=None, max_pending=None, batch_size=None):
+    """Extracts the metadata from many documents, using a pool of processes.
+
+    The paths are sent to the workers in batches, and rows are generated in
+    the same order as :attr:`paths`.  At most :attr:`max_pending` batches are
+    in flight at once, so memory use is bounded no matter how many files
+    there are.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the documents.
+
+    :type workers: ``int``
+    :param workers: The number of worker processes.  If this is ``None`` the
+                    number of CPUs is used.  If this is 0, the files are
+                    processed in the current process.
+
+    :type max_pending: ``int``
+    :param max_pending: The maximum number of batches in flight.  Defaults
+                        to 4 times the number of workers.
+
+    :type batch_size: ``int``
+    :param batch_size: The number of paths sent to a worker at once.
+                       Defaults to 64.
+
+    :rtype: iterator
+    :returns: An iterator of rows (see :func:`extract`).
+
+    """
+    if workers == 0:
+        for path in paths:
+            yield extract(path)
+        # end for
+
+        return
+    # end if
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # end if
+
+    if max_pending is None:
+        max_pending = workers * 4
+    # end if
+
+    if batch_size is None:
+        batch_size = _BATCH_SIZE
+    # end if
+
+    with ProcessPoolExecutor(workers) as executor:
+        arg_lists = ((batch,) for batch in batches(paths, batch_size))
+        results = iter_bounded(
+            executor, _extract_batch, arg_lists, max_pending
+        )
+
+        for rows in results:
+            for row in rows:
+                yield row
+            # end for
+        # end for
+    # end with
+# end def iter_rows
+
+def _csv_cell(value):
+    """Converts a (JSON serializable) value to a CSV cell."""
+
+    if value is None:
+        return ""
+    elif isinstance(value, (list, dict)):
+        return json.dumps(value, sort_keys=True)
+    # end if
+
+    return value
+# end def _csv_cell
+
+def ingest(
+    paths, ofile, output_format="jsonl", workers=None, max_pending=None,
+    batch_size=None
+):
+    """Extracts the metadata from many documents, and writes it as a table.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the documents (see :func:`find_files`).
+
+    :type ofile: file object
+    :param ofile: A text file to write the rows to.  For CSV output, the file
+                  should be opened with ``newline=""``.
+
+    :type output_format: ``str``
+    :param output_format: Either ``"jsonl"`` (one JSON object per line) or
+                          ``"csv"`` (with a header row of :const:`COLUMNS`).
+
+    :type workers: ``int``
+    :param workers: Passed on to :func:`iter_rows`.
+
+    :type max_pending: ``int``
+    :param max_pending: Passed on to :func:`iter_rows`.
+
+    :type batch_size: ``int``
+    :param batch_size: Passed on to :func:`iter_rows`.
+
+    :raises ValueError: If :attr:`output_format` is not supported.
+
+    :rtype: :class:`~lf.utils.batch.BatchStats`
+    :returns: Statistics about the batch.
+
+    """
+    if output_format == "csv":
+        writer = csv.writer(ofile)
+        writer.writerow(COLUMNS)
+    elif output_format != "jsonl":
+        raise ValueError(
+            "Unsupported output format: {0}".format(output_format)
+        )
+    # end if
+
+    start_time = perf_counter()
+    file_count = 0
+    error_count = 0
+
+    for row in iter_rows(paths, workers, max_pending, batch_size):
+        file_count += 1
+        if row["error"] is not None:
+            error_count += 1
+        # end if
+
+        if output_format == "csv":
+            writer.writerow([_csv_cell(row[column]) for column in COLUMNS])
+        else:
+            ofile.write(json.dumps(row, sort_keys=True))
+            ofile.write("\n")
+        # end if
+    # end for
+
+    elapsed = perf_counter() - start_time
+    if elapsed > 0:
+        rate = file_count / elapsed
+    else:
+        rate = 0.0
+    # end if
+
+    return BatchStats((file_count, error_count, elapsed, rate))
+# end def ingest
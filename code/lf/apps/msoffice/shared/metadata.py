@@ -22,7 +22,6 @@ from codecs import getdecoder
 from uuid import UUID
 
 # local imports
-from lf.dec import ByteIStream
 from lf.dtypes import Structuple
 from lf.win.codepage.consts import code_page_names
 
@@ -175,6 +174,18 @@ class SummaryInfo(PropertiesMetadata):
 
         The document's security
 
+    .. attribute:: pids
+
+        The property identifiers used by :meth:`from_properties` (a class
+        attribute).  This can be passed as the ``pids`` argument of
+        :meth:`~lf.win.ole.ps.Builder.build`.
+
+    .. attribute:: metadata_pids
+
+        :attr:`pids` without the thumbnail property (a class attribute).
+        Use this to build the properties when only the text and numeric
+        metadata is needed.
+
     """
     _fields_ = (
         "title", "subject", "author", "keywords", "comments", "template",
@@ -183,6 +194,9 @@ class SummaryInfo(PropertiesMetadata):
         "security"
     )
 
+    pids = frozenset(_pidsi_attr_name_map)
+    metadata_pids = pids - frozenset([PIDSI.THUMBNAIL])
+
     @classmethod
     def from_properties(cls, properties):
         """Creates a :class:`SummaryInfo` from properties.
@@ -199,10 +213,9 @@ class SummaryInfo(PropertiesMetadata):
         attr_exists = set()
         properties_dict = dict()
 
-        for (pid, property) in properties.items():
-            if pid in _pidsi_attr_name_map:
-                name = _pidsi_attr_name_map[pid]
-                properties_dict[name] = property.value
+        for (pid, name) in _pidsi_attr_name_map.items():
+            if pid in properties:
+                properties_dict[name] = properties[pid].value
                 attr_exists.add(name)
             # end if
         # end for
@@ -329,6 +342,18 @@ class DocSummaryInfo(PropertiesMetadata):
 
         The version of the document.
 
+    .. attribute:: pids
+
+        The property identifiers used by :meth:`from_properties` (a class
+        attribute).  This can be passed as the ``pids`` argument of
+        :meth:`~lf.win.ole.ps.Builder.build`.
+
+    .. attribute:: metadata_pids
+
+        :attr:`pids` without the digital signature and hyperlink properties
+        (a class attribute).  Use this to build the properties when only the
+        text and numeric metadata is needed.
+
     """
     _fields_ = (
         "category", "pres_format", "byte_count", "para_count", "slide_count",
@@ -339,6 +364,9 @@ class DocSummaryInfo(PropertiesMetadata):
         "doc_version"
     )
 
+    pids = frozenset(list(_piddsi_attr_name_map) + [PIDDSI.VERSION])
+    metadata_pids = pids - frozenset([PIDDSI.DIGSIG, PIDDSI.HLINKS])
+
     @classmethod
     def from_properties(cls, properties):
         """Creates a :class:`DocSummaryInfo` from properties.
@@ -356,20 +384,18 @@ class DocSummaryInfo(PropertiesMetadata):
         properties_dict = dict()
         PIDDSI_VERSION = PIDDSI.VERSION
 
-        for (pid, property) in properties.items():
-            if pid == PIDDSI_VERSION:
-                version = property.value
-                properties_dict["ver_major"] = (version >> 16)
-                properties_dict["ver_minor"] = (version & 0xFFFF)
-                attr_exists.add("ver_major")
-                attr_exists.add("ver_minor")
-            else:
-                if pid in _piddsi_attr_name_map:
-                    name = _piddsi_attr_name_map[pid]
+        if PIDDSI_VERSION in properties:
+            version = properties[PIDDSI_VERSION].value
+            properties_dict["ver_major"] = (version >> 16)
+            properties_dict["ver_minor"] = (version & 0xFFFF)
+            attr_exists.add("ver_major")
+            attr_exists.add("ver_minor")
+        # end if
 
-                    properties_dict[name] = property.value
-                    attr_exists.add(name)
-                # end if
+        for (pid, name) in _piddsi_attr_name_map.items():
+            if pid in properties:
+                properties_dict[name] = properties[pid].value
+                attr_exists.add(name)
             # end if
         # end for
 
@@ -418,8 +444,19 @@ class UserDefinedProperties(PropertiesMetadata):
 
         The _PID_HLINKS property.
 
+    .. attribute:: pids
+
+        ``None``, since :meth:`from_properties` uses every property (a class
+        attribute).
+
+    .. attribute:: metadata_pids
+
+        ``None``, for the same reason as :attr:`pids` (a class attribute).
+
     """
     _fields_ = ("linked", "guid", "link_base", "hlinks")
+    pids = None
+    metadata_pids = None
 
     @classmethod
     def from_properties(cls, properties, decoder=None):
@@ -468,7 +505,7 @@ class UserDefinedProperties(PropertiesMetadata):
             # end if
 
             if (name == "_PID_GUID") and (property.type == VT_BLOB):
-                guid = property.value
+                guid = bytes(property.value)
                 new_guid = _utf_16_le_decoder(guid, "ignore")[0]
 
                 if new_guid:
@@ -485,7 +522,7 @@ class UserDefinedProperties(PropertiesMetadata):
                 attr_exists.add("guid")
 
             elif (name == "_PID_LINKBASE") and (property.type == VT_BLOB):
-                link_base = property.value
+                link_base = bytes(property.value)
                 new_link_base = _utf_16_le_decoder(link_base, "ignore")[0]
 
                 if new_link_base:
@@ -495,8 +532,8 @@ class UserDefinedProperties(PropertiesMetadata):
                 attr_exists.add("link_base")
 
             elif (name == "_PID_HLINKS") and (property.type == VT_BLOB):
-                data = ByteIStream(property.value)
-                hlinks = VecVtHyperlink.from_stream(data).value
+                data = bytes(property.value)
+                hlinks = VecVtHyperlink.from_buffer(data).value
                 hlinks = [
                     (
                         hlink.hash.value,
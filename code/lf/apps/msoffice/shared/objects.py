@@ -25,15 +25,16 @@ from lf.dec import SEEK_SET
 from lf.dtypes import ActiveStructuple
 from lf.dtypes.ctypes import uint32_le
 
-from lf.win.codepage.consts import CP_WINUNICODE, code_page_names
-
 from lf.win.ole.ps.consts import (
-    PropertyType, FMTID_SummaryInformation, FMTID_DocSummaryInformation,
-    CODEPAGE_PROPERTY_IDENTIFIER, DICTIONARY_PROPERTY_IDENTIFIER
+    PropertyType, FMTID_SummaryInformation, FMTID_DocSummaryInformation
 )
 from lf.win.ole.ps import (
     ClipboardData, VT_CF, CodePageString, ValuePacket, UnicodeString,
-    TypedPropertyValue, Sequence, VT_I4, Dictionary, Vector, BLOB
+    TypedPropertyValue, Sequence, VT_I4, Vector, BLOB, Payload
+)
+from lf.win.ole.ps.objects import (
+    _type_from_buffer, _unpack_from, _uint32_le_struct, _utf16_le_decoder,
+    _split_strings, _decode_strings
 )
 from lf.win.ole.ps import (
     PropertySetStreamHeader as _oleps_PropertySetStreamHeader,
@@ -56,12 +57,36 @@ __all__ = [
     "VtVecHeadingPair", "VtDigSigValue", "VtDigSig", "VtHyperlink",
     "VtHyperlinkValue", "VecVtHyperlink", "VtHyperlinkValue", "VtHyperlinks",
     "DigSigBlob", "DigSigInfoSerialized", "PropertySetStreamHeader",
-    "PropertyFactory", "Builder"
+    "PropertyFactory", "Builder", "register_parsers"
 ]
 
 # module globals
 _utf16_le_decoder = getdecoder("utf_16_le")
 
+def _split_format_id(data):
+    """Splits the format identifier from the data of a thumbnail.
+
+    :type data: ``bytes`` or :class:`~lf.win.ole.ps.Payload`
+    :param data: The data of the ClipboardData structure.
+
+    :rtype: ``tuple``
+    :returns: A tuple of the format identifier, and the rest of the data.
+
+    """
+    if isinstance(data, Payload):
+        source = data.source
+        offset = data.offset
+        head = Payload(source, offset, 4).data
+        format_id = uint32_le.from_buffer_copy(head).value
+        data = Payload(source, offset + 4, data.size - 4)
+    else:
+        format_id = uint32_le.from_buffer_copy(data[:4]).value
+        data = data[4:]
+    # end if
+
+    return (format_id, data)
+# end def _split_format_id
+
 class PropertySetSystemIdentifier(ActiveStructuple):
     """Represents a PropertySetSystemIdentifier structure.
 
@@ -153,7 +178,7 @@ class VtThumbnailValue(ClipboardData):
     _takes_stream = True
 
     @classmethod
-    def from_stream(cls, stream, offset=None):
+    def from_stream(cls, stream, offset=None, decoder=None, lazy=False):
         """Creates a :class:`VtThumbnailValue` from a stream.
 
         :type stream: :class:`~lf.dec.IStream`
@@ -162,26 +187,69 @@ class VtThumbnailValue(ClipboardData):
         :type offset: ``int``
         :param offset: The start of the structure in :attr:`stream`.
 
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, :attr:`data` is a
+                     :class:`~lf.win.ole.ps.Payload` that refers to
+                     :attr:`stream`, instead of a copy of the data.
+
         :rtype: :class:`VtThumbnailValue`
         :returns: The corresponding :class:`VtThumbnailValue` object.
 
         """
-        cd = super(VtThumbnailValue, cls).from_stream(stream, offset)
+        cd = super(VtThumbnailValue, cls).from_stream(
+            stream, offset, lazy=lazy
+        )
 
         format = uint32_le.from_buffer_copy(cd.format).value
 
         if format != 0:
-            format_id = uint32_le.from_buffer_copy(cd.data[:4]).value
-            data = cd.data[4:]
+            (format_id, data) = _split_format_id(cd.data)
         else:
             format_id = None
             data = cd.data
         # end if
 
+        return cls((cd.size, data, format, format_id))
+    # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, lazy=False):
+        """Creates a :class:`VtThumbnailValue` from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, :attr:`data` is a
+                     :class:`~lf.win.ole.ps.Payload` that refers to
+                     :attr:`buf`, instead of a copy of the data.
+
+        :rtype: :class:`VtThumbnailValue`
+        :returns: The corresponding :class:`VtThumbnailValue` object.
+
+        """
+        cd = super(VtThumbnailValue, cls).from_buffer(buf, offset, lazy=lazy)
+
         format = uint32_le.from_buffer_copy(cd.format).value
 
+        if format != 0:
+            (format_id, data) = _split_format_id(cd.data)
+        else:
+            format_id = None
+            data = cd.data
+        # end if
+
         return cls((cd.size, data, format, format_id))
-    # end def from_stream
+    # end def from_buffer
 # end class VtThumbnailValue
 
 class VtThumbnail(VT_CF):
@@ -194,7 +262,7 @@ class VtThumbnail(VT_CF):
     """
 
     @classmethod
-    def from_stream(cls, stream, offset=None, decoder=None):
+    def from_stream(cls, stream, offset=None, decoder=None, lazy=False):
         """Creates a :class:`VtThumbnail` from a stream.
 
         :type stream: :class:`~lf.dec.IStream`
@@ -206,6 +274,11 @@ class VtThumbnail(VT_CF):
         :type decoder: ``None``
         :param decoder: This parameter is not used.
 
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the thumbnail data is a
+                     :class:`~lf.win.ole.ps.Payload` that refers to
+                     :attr:`stream`, instead of a copy of the data.
+
         :rtype: :class:`VtThumbnail`
         :returns: The corresponding :class:`VtThumbnail` object.
 
@@ -214,11 +287,50 @@ class VtThumbnail(VT_CF):
             offset = stream.tell()
         # end if
 
-        vt_cf = super(VtThumbnail, cls).from_stream(stream, offset)
-        vttv = VtThumbnailValue.from_stream(stream, offset+4)
+        vt_cf = super(VtThumbnail, cls).from_stream(stream, offset, lazy=lazy)
+        vttv = VtThumbnailValue.from_stream(stream, offset + 4, lazy=lazy)
 
         return cls((vt_cf.type, vttv.size + 4, vttv))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(
+        cls, buf, offset=0, decoder=None, ptype=None, lazy=False
+    ):
+        """Creates a VtThumbnail object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the thumbnail data is a
+                     :class:`~lf.win.ole.ps.Payload` that refers to
+                     :attr:`buf`, instead of a copy of the data.
+
+        :rtype: :class:`VtThumbnail`
+        :returns: The corresponding :class:`VtThumbnail` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        vttv = VtThumbnailValue.from_buffer(buf, offset + 4, lazy=lazy)
+
+        return cls((ptype, vttv.size + 4, vttv))
+    # end def from_buffer
 # end class VtThumbnail
 
 class Lpstr(CodePageString):
@@ -258,6 +370,34 @@ class Lpstr(CodePageString):
 
         return cls((cps.size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`Lpstr` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`Lpstr`
+        :returns: The corresponding :class:`Lpstr` object.
+
+        """
+        cps = super(Lpstr, cls).from_buffer(buf, offset, decoder)
+
+        if isinstance(cps.value, str):
+            value = cps.value.split("\x00", 1)[0]
+        else:
+            value = cps.value
+        # end if
+
+        return cls((cps.size, value))
+    # end def from_buffer
 # end class Lpstr
 
 class UnalignedLpstr(CodePageString):
@@ -303,6 +443,38 @@ class UnalignedLpstr(CodePageString):
 
         return cls((size + 4, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`UnalignedLpstr` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`UnalignedLpstr`
+        :returns: The corresponding :class:`UnalignedLpstr` object.
+
+        """
+        size = _unpack_from(_uint32_le_struct, buf, offset)[0]
+
+        start = offset + 4
+        value = bytes(buf[start:start + size])
+
+        if decoder:
+            new_value = decoder(value, "ignore")[0]
+            if new_value:
+                value = new_value.split("\x00", 1)[0]
+            # end if
+        # end if
+
+        return cls((size + 4, value))
+    # end def from_buffer
 # end class UnalignedLpstr
 
 
@@ -355,6 +527,40 @@ class VtVecUnalignedLpstrValue(Vector):
 
         return cls((seq.size + 4, count, seq.value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`VtVecUnalignedLpstrValue` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`VtVecUnalignedLpstrValue`
+        :returns: The corresponding :class:`VtVecUnalignedLpstrValue` object.
+
+        """
+        count = _unpack_from(_uint32_le_struct, buf, offset)[0]
+        (chunks, sizes) = _split_strings(buf, offset + 4, count, 1, False)
+
+        if decoder:
+            values = [
+                value.split("\x00", 1)[0] if isinstance(value, str) else value
+                for value in _decode_strings(chunks, decoder)
+            ]
+        else:
+            values = chunks
+        # end if
+
+        values = [UnalignedLpstr(pair) for pair in zip(sizes, values)]
+
+        return cls((sum(sizes) + 4, count, values))
+    # end def from_buffer
 # end class VtVecUnalignedLpstrValue
 
 class VtVecUnalignedLpstr(TypedPropertyValue):
@@ -404,6 +610,49 @@ class VtVecUnalignedLpstr(TypedPropertyValue):
 
         return cls((tpv.type, size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VtVecUnalignedLpstr object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VtVecUnalignedLpstr`
+        :returns: The corresponding :class:`VtVecUnalignedLpstr` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        if ptype == 0x101E:  # VT_VECTOR | VT_LPSTR
+            value = VtVecUnalignedLpstrValue.from_buffer(
+                buf, offset + 4, decoder
+            )
+            size = value.size + 4
+        else:
+            tpv = super(VtVecUnalignedLpstr, cls).from_buffer(
+                buf, offset, decoder, ptype
+            )
+            size = tpv.size
+            value = tpv.value
+        # end if
+
+        return cls((ptype, size, value))
+    # end def from_buffer
 # end class VtVecUnalignedLpstr:
 
 
@@ -460,6 +709,39 @@ class VtVecLpwstrValue(Vector):
 
         return cls((seq.size + 4, count, values))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`VtVecLpwstrValue` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`VtVecLpwstrValue`
+        :returns: The corresponding :class:`VtVecLpwstrValue` object.
+
+        """
+        count = _unpack_from(_uint32_le_struct, buf, offset)[0]
+        (chunks, sizes) = _split_strings(buf, offset + 4, count, 2)
+
+        if decoder is None:
+            decoder = _utf16_le_decoder
+        # end if
+
+        if decoder:
+            values = _decode_strings(chunks, decoder)
+        else:
+            values = chunks
+        # end if
+
+        return cls((sum(sizes) + 4, count, values))
+    # end def from_buffer
 # end class VtVecLpwstrValue
 
 class VtVecLpwstr(TypedPropertyValue):
@@ -510,6 +792,47 @@ class VtVecLpwstr(TypedPropertyValue):
 
         return cls((tpv.type, size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VtVecLpwstr object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VtVecLpwstr`
+        :returns: The corresponding :class:`VtVecLpwstr` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        if ptype == 0x101F:  # VT_VECTOR | VT_LPWSTR
+            value = VtVecLpwstrValue.from_buffer(buf, offset + 4, decoder)
+            size = value.size + 4
+        else:
+            tpv = super(VtVecLpwstr, cls).from_buffer(
+                buf, offset, decoder, ptype
+            )
+            value = tpv.value
+            size = tpv.size
+        # end if
+
+        return cls((ptype, size, value))
+    # end def from_buffer
 # end class VtVecLpwstr:
 
 class VtString(TypedPropertyValue):
@@ -560,6 +883,49 @@ class VtString(TypedPropertyValue):
 
         return cls((tpv.type, size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VtString object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VtString`
+        :returns: The corresponding :class:`VtString` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        if ptype == PropertyType.VT_LPSTR:
+            string = Lpstr.from_buffer(buf, offset + 4, decoder)
+            size = string.size + 4
+            value = string.value
+        elif ptype == PropertyType.VT_LPWSTR:
+            string = Lpwstr.from_buffer(buf, offset + 4, decoder)
+            size = string.size + 4
+            value = string.value
+        else:
+            size = 4
+            value = None
+        # end if
+
+        return cls((ptype, size, value))
+    # end def from_buffer
 # end class VtString
 
 class VtUnalignedString(TypedPropertyValue):
@@ -619,6 +985,49 @@ class VtUnalignedString(TypedPropertyValue):
 
         return cls((tpv.type, size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VtUnalignedString object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VtUnalignedString`
+        :returns: The corresponding :class:`VtUnalignedString` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        if ptype == PropertyType.VT_LPSTR:
+            string = UnalignedLpstr.from_buffer(buf, offset + 4, decoder)
+            size = string.size + 4
+            value = string.value
+        elif ptype == PropertyType.VT_LPWSTR:
+            string = Lpwstr.from_buffer(buf, offset + 4, decoder)
+            size = string.size + 4
+            value = string.value
+        else:
+            size = 4
+            value = None
+        # end if
+
+        return cls((ptype, size, value))
+    # end def from_buffer
 # end class VtUnalignedString
 
 class VtHeadingPair(ValuePacket):
@@ -669,6 +1078,29 @@ class VtHeadingPair(ValuePacket):
 
         return cls((vtus.size + 8, vtus, vt_i4))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`VtHeadingPair` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`VtHeadingPair`
+        :returns: The corresponding :class:`VtHeadingPair` object.
+
+        """
+        vtus = VtUnalignedString.from_buffer(buf, offset, decoder)
+        vt_i4 = VT_I4.from_buffer(buf, offset + vtus.size)
+
+        return cls((vtus.size + 8, vtus, vt_i4))
+    # end def from_buffer
 # end class VtHeadingPair
 
 
@@ -714,6 +1146,94 @@ class VtVecHeadingPairValue(Vector):
 
         return cls((seq.size + 4, count, seq.value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`VtVecHeadingPairValue` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`VtVecHeadingPairValue`
+        :returns: The corresponding :class:`VtVecHeadingPairValue` object.
+
+        """
+        count = _unpack_from(_uint32_le_struct, buf, offset)[0]
+        seq_count = count // 2
+        buf_size = len(buf)
+        offset += 4
+
+        # Split the strings out in one pass, then decode them in batches.
+        lpstr_type = PropertyType.VT_LPSTR
+        lpwstr_type = PropertyType.VT_LPWSTR
+        pairs = list()
+        try:
+            while (len(pairs) < seq_count) and (offset < buf_size):
+                ptype = _type_from_buffer(buf, offset)
+                start = offset + 8
+
+                if ptype == lpstr_type:
+                    length = _unpack_from(_uint32_le_struct, buf, start - 4)[0]
+                    size = length + 8
+                elif ptype == lpwstr_type:
+                    length = _unpack_from(_uint32_le_struct, buf, start - 4)[0]
+                    length *= 2
+                    size = ((length + 3) & ~0x3) + 8
+                else:
+                    length = 0
+                    size = 4
+                # end if
+
+                vt_i4 = VT_I4.from_buffer(buf, offset + size)
+                chunk = bytes(buf[start:start + length])
+                pairs.append((ptype, size, chunk, vt_i4))
+                offset += size + 8
+            # end while
+        except ValueError:
+            pass
+        # end try
+
+        lpstr_values = [pair[2] for pair in pairs if pair[0] == lpstr_type]
+        if lpstr_values and decoder:
+            lpstr_values = [
+                value.split("\x00", 1)[0] if isinstance(value, str) else value
+                for value in _decode_strings(lpstr_values, decoder)
+            ]
+        # end if
+
+        lpwstr_values = [pair[2] for pair in pairs if pair[0] == lpwstr_type]
+        lpwstr_decoder = _utf16_le_decoder if decoder is None else decoder
+        if lpwstr_values and lpwstr_decoder:
+            lpwstr_values = _decode_strings(lpwstr_values, lpwstr_decoder)
+        # end if
+
+        lpstr_values = iter(lpstr_values)
+        lpwstr_values = iter(lpwstr_values)
+        values = list()
+        tot_size = 0
+
+        for (ptype, size, chunk, vt_i4) in pairs:
+            if ptype == lpstr_type:
+                value = next(lpstr_values)
+            elif ptype == lpwstr_type:
+                value = next(lpwstr_values)
+            else:
+                value = None
+            # end if
+
+            vtus = VtUnalignedString((ptype, size, value))
+            values.append(VtHeadingPair((size + 8, vtus, vt_i4)))
+            tot_size += size + 8
+        # end for
+
+        return cls((tot_size + 4, count, values))
+    # end def from_buffer
 # end class VtVecHeadingPairValue
 
 class VtVecHeadingPair(TypedPropertyValue):
@@ -762,6 +1282,49 @@ class VtVecHeadingPair(TypedPropertyValue):
 
         return cls((tpv.type, size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VtVecHeadingPair object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VtVecHeadingPair`
+        :returns: The corresponding :class:`VtVecHeadingPair` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        if ptype == 0x100C:  # VT_VECTOR | VT_VARIANT
+            value = VtVecHeadingPairValue.from_buffer(
+                buf, offset + 4, decoder
+            )
+            size = value.size + 4
+        else:
+            tpv = super(VtVecHeadingPair, cls).from_buffer(
+                buf, offset, decoder, ptype
+            )
+            size = tpv.size
+            value = tpv.value
+        # end if
+
+        return cls((ptype, size, value))
+    # end def from_buffer
 # end class VtVecHeadingPair:
 
 class VtDigSigValue(ValuePacket):
@@ -899,17 +1462,37 @@ class VtHyperlink(ValuePacket):
         """
         if offset is not None:
             stream.seek(offset, SEEK_SET)
-        else:
-            offset = stream.tell()
         # end if
 
-        header = vt_hyperlink_header.from_buffer_copy(stream.read(32))
+        return cls.from_buffer(stream.read(), 0, decoder)
+    # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`VtHyperlink` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`VtHyperlink`
+        :returns: The corresponding :class:`VtHyperlink` object.
+
+        """
+        make = PropertyFactory.make_from_buffer
+
+        header = vt_hyperlink_header.from_buffer_copy(buf[offset:offset + 32])
         offset += 32
 
-        hlink1 = PropertyFactory.make(stream, offset, decoder)
+        hlink1 = make(buf, offset, decoder)
         offset += hlink1.size
 
-        hlink2 = PropertyFactory.make(stream, offset, decoder)
+        hlink2 = make(buf, offset, decoder)
 
         hash = VT_I4((3, 8, header.hash.value))
         app = VT_I4((3, 8, header.app.value))
@@ -925,7 +1508,7 @@ class VtHyperlink(ValuePacket):
             hlink1,
             hlink2
         ))
-    # end def from_stream
+    # end def from_buffer
 # end class VtHyperlink
 
 class VecVtHyperlink(Vector):
@@ -968,20 +1551,44 @@ class VecVtHyperlink(Vector):
         """
         if offset is not None:
             stream.seek(offset, SEEK_SET)
-        else:
-            offset = stream.tell()
         # end if
 
-        count = uint32_le.from_buffer_copy(stream.read(4)).value
+        return cls.from_buffer(stream.read(), 0, decoder)
+    # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`VecVtHyperlink` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`VecVtHyperlink`
+        :returns: The corresponding :class:`VecVtHyperlink` object.
+
+        """
+        count = _unpack_from(_uint32_le_struct, buf, offset)[0]
         offset += 4
 
-        seq_count = count // 6
-        seq = Sequence.from_factory(
-            stream, VtHyperlink.from_stream, seq_count, offset, decoder
-        )
+        from_buffer = VtHyperlink.from_buffer
+        hyperlinks = list()
+        size = 4
 
-        return cls((seq.size + 4, count, seq.value))
-    # end def from_stream
+        for counter in range(count // 6):
+            hyperlink = from_buffer(buf, offset, decoder)
+            hyperlinks.append(hyperlink)
+            offset += hyperlink.size
+            size += hyperlink.size
+        # end for
+
+        return cls((size, count, hyperlinks))
+    # end def from_buffer
 # end class VecVtHyperlink
 
 class VtHyperlinkValue(BLOB):
@@ -1018,17 +1625,33 @@ class VtHyperlinkValue(BLOB):
         """
         if offset is not None:
             stream.seek(offset, SEEK_SET)
-        else:
-            offset = stream.tell()
         # end if
 
-        size = uint32_le.from_buffer_copy(stream.read(4)).value
-        offset += 4
+        return cls.from_buffer(stream.read(), 0, decoder)
+    # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`VtHyperlinkValue` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
 
-        value = VecVtHyperlink.from_stream(stream, offset, decoder)
+        :rtype: :class:`VtHyperlinkValue`
+        :returns: The corresponding :class:`VtHyperlinkValue` object.
+
+        """
+        size = _unpack_from(_uint32_le_struct, buf, offset)[0]
+        value = VecVtHyperlink.from_buffer(buf, offset + 4, decoder)
 
         return cls((size + 4, value))
-    # end def from_stream
+    # end def from_buffer
 # end class VtHyperlinkValue
 
 class VtHyperlinks(TypedPropertyValue):
@@ -1057,15 +1680,41 @@ class VtHyperlinks(TypedPropertyValue):
         :returns: The corresponding :class:`VtHyperlinks` object.
 
         """
-        if offset is None:
-            offset = stream.tell()
+        if offset is not None:
+            stream.seek(offset, SEEK_SET)
         # end if
 
-        tpv = super(VtHyperlinks, cls).from_stream(stream, offset, decoder)
-        value = VtHyperlinkValue.from_stream(stream, offset + 4, decoder)
-
-        return cls((tpv.type, value.size + 4, value))
+        return cls.from_buffer(stream.read(), 0, decoder)
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a :class:`VtHyperlinks` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it is already known.
+
+        :rtype: :class:`VtHyperlinks`
+        :returns: The corresponding :class:`VtHyperlinks` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        value = VtHyperlinkValue.from_buffer(buf, offset + 4, decoder)
+
+        return cls((ptype, value.size + 4, value))
+    # end def from_buffer
 # end class VtHyperlinks
 
 class DigSigBlob(ValuePacket):
@@ -1377,44 +2026,22 @@ class PropertySetStreamHeader(_oleps_PropertySetStreamHeader):
 # end class PropertySetStreamHeader
 
 class PropertyFactory(_oleps_PropertyFactory):
-    """Makes various property objects"""
-
-    @classmethod
-    def make(cls, stream, offset=None, decoder=None):
-        """Makes a :class:`~lf.win.ole.ps.Packet` object.
-
-        :type stream: :class:`~lf.dec.IStream`
-        :param stream: A stream that contains the structure.
+    """Makes various property objects.
 
-        :type offset: ``int``
-        :param offset: The start of the structure in :attr:`stream`.
+    String properties are made as :class:`VtString` objects, and a few
+    properties of the SummaryInformation and DocumentSummaryInformation
+    property sets have their own parsers (see :func:`register_parsers`).
 
-        :type decoder: ``codecs.codec``
-        :param decoder: An optional codec to decode the string.
-
-        :rtype: :class:`~lf.win.ole.ps.Packet`
-        :returns: The corresponding :class:`~lf.win.ole.ps.Packet` (or
-                  subclass) object.
-
-        """
-        if offset is None:
-            offset = stream.tell()
-        # end if
-
-        property = TypedPropertyValue.from_stream(stream, offset)
-        pt = property.type
-
-        if (pt == PropertyType.VT_LPSTR) or (pt == PropertyType.VT_LPWSTR):
-            return VtString.from_stream(stream, offset, decoder)
-        # end if
+    """
 
-        return super(PropertyFactory, cls).make(stream, offset, decoder)
-    # end def make
+    pass
 # end class PropertyFactory
 
 class Builder(_oleps_Builder):
     """Builds property set streams, property sets, and properties."""
 
+    _factory = PropertyFactory
+
     @classmethod
     def build_property_set_stream_header(cls, stream, offset=None):
         """Builds a :class:`PropertySetStreamHeader` from a stream.
@@ -1434,10 +2061,14 @@ class Builder(_oleps_Builder):
     # end def build_property_set_stream_header
 
     @classmethod
-    def build_properties(
-        cls, stream, property_set, offset=None, fmtid=None, decoder=None
+    def build_summary_info_properties(
+        cls, stream, property_set, offset=None, fmtid=None, decoder=None,
+        pids=None, lazy=False, lazy_payloads=False
     ):
-        """Builds a dictionary of :class:`~lf.win.ole.ps.PropertyPacket`
+        """Builds a dictionary of :class:`PropertyPacket` objects.
+
+        The properties are built as if they are from a SummaryInformation
+        property set, regardless of :attr:`fmtid`.
 
         :type stream: :class:`~lf.dec.IStream`
         :param stream: A stream that contains the property structures.
@@ -1455,79 +2086,19 @@ class Builder(_oleps_Builder):
         :type decoder: :class:`codecs.codec`
         :param decoder: A codec to decode string properties.
 
-        :rtype: ``dict``
-        :returns: A dictionary of property identifiers (keys) and the
-                  corresponding :class:`~lf.win.ole.ps.PropertyPacket` objects
-                  (values).
-
-        """
-        pids_offsets = property_set.pids_offsets
-        make = PropertyFactory.make
-        properties = dict()
-
-        if fmtid == FMTID_SummaryInformation:
-            return cls.build_summary_info_properties(
-                stream, property_set, offset, fmtid, decoder
-            )
-        elif fmtid == FMTID_DocSummaryInformation:
-            return cls.build_doc_summary_info_properties(
-                stream, property_set, offset, fmtid, decoder
-            )
-        # end if
-
-        code_page = None
-        if CODEPAGE_PROPERTY_IDENTIFIER in pids_offsets:
-            property_offset = pids_offsets[CODEPAGE_PROPERTY_IDENTIFIER]
-            code_page = make(stream, property_offset + offset)
-            code_page = code_page.value
-
-            if code_page < 0:  # Not sure why this isn't type VT_UI2
-                code_page = 0xFFFF + code_page + 1
-            # end if
-
-            if (code_page in code_page_names) and (decoder is None):
-                decoder = getdecoder(code_page_names[code_page])
-            # end if
-        # end if
-
-        for (pid, property_offset) in pids_offsets.items():
-            property_offset += offset
-
-            if pid == DICTIONARY_PROPERTY_IDENTIFIER:
-                property = Dictionary.from_stream(
-                    stream, property_offset, code_page, decoder
-                )
-            else:
-                property = make(stream, property_offset, decoder)
-            # end if
-
-            properties[pid] = property
-        # end for
-
-        return properties
-    # end def build_properties
-
-    @classmethod
-    def build_summary_info_properties(
-        cls, stream, property_set, offset=None, fmtid=None, decoder=None
-    ):
-        """Builds a dictionary of :class:`PropertyPacket` objects.
-
-        :type stream: :class:`~lf.dec.IStream`
-        :param stream: A stream that contains the property structures.
+        :type pids: ``iterable``
+        :param pids: An optional collection of property identifiers.  If this
+                     is not ``None``, only these properties are built.
 
-        :type property_set: :class:`PropertySetHeader`
-        :param property_set: A :class:`PropertySetHeader` object that describes
-                             the properties in the property set.
+        :type lazy: ``bool``
+        :param lazy: If ``True``, a :class:`~lf.win.ole.ps.LazyProperties`
+                     object is returned, and each property is decoded when it
+                     is first accessed.
 
-        :type offset: ``int``
-        :param offset: The start of the structures in :attr:`stream`.
-
-        :type fmtid: :class:`UUID`
-        :param fmtid: The FMTID of the property set.
-
-        :type decoder: :class:`codecs.codec`
-        :param decoder: A codec to decode string properties.
+        :type lazy_payloads: ``bool``
+        :param lazy_payloads: If ``True``, the payloads of BLOB and
+                              ClipboardData properties (such as the thumbnail)
+                              are :class:`~lf.win.ole.ps.Payload` objects.
 
         :rtype: ``dict``
         :returns: A dictionary of property identifiers (keys) and the
@@ -1535,65 +2106,22 @@ class Builder(_oleps_Builder):
                   (values).
 
         """
-        pids_offsets = property_set.pids_offsets
-        make = PropertyFactory.make
-        properties = dict()
-
-        VT_LPSTR = PropertyType.VT_LPSTR
-        VT_LPWSTR = PropertyType.VT_LPWSTR
-        VT_CF = PropertyType.VT_CF
-        PIDSI_THUMBNAIL = PIDSI.THUMBNAIL
-
-        code_page = None
-        if CODEPAGE_PROPERTY_IDENTIFIER in pids_offsets:
-            property_offset = pids_offsets[CODEPAGE_PROPERTY_IDENTIFIER]
-            code_page = make(stream, property_offset + offset)
-            code_page = code_page.value
-
-            if code_page < 0:  # Not sure why this isn't type VT_UI2
-                code_page = 0xFFFF + code_page + 1
-            # end if
-
-            if (code_page in code_page_names) and (decoder is None):
-                decoder = getdecoder(code_page_names[code_page])
-            # end if
-        # end if
-
-        for (pid, property_offset) in pids_offsets.items():
-            property_offset += offset
-
-            if pid == DICTIONARY_PROPERTY_IDENTIFIER:
-                property = Dictionary.from_stream(
-                    stream, property_offset, code_page, decoder
-                )
-            elif pid == PIDSI_THUMBNAIL:
-                tpv = TypedPropertyValue.from_stream(
-                    stream, property_offset, decoder
-                )
-
-                if tpv.type == VT_CF:
-                    property = VtThumbnail.from_stream(
-                        stream, property_offset, decoder
-                    )
-                else:
-                    property = make(stream, property_offset, decoder)
-                # end if
-            else:
-                property = make(stream, property_offset, decoder)
-            # end if
-
-            properties[pid] = property
-        # end for
-
-        return properties
+        return cls.build_properties(
+            stream, property_set, offset, FMTID_SummaryInformation, decoder, pids,
+            lazy, lazy_payloads
+        )
     # end def build_summary_info_properties
 
     @classmethod
     def build_doc_summary_info_properties(
-        cls, stream, property_set, offset=None, fmtid=None, decoder=None
+        cls, stream, property_set, offset=None, fmtid=None, decoder=None,
+        pids=None, lazy=False, lazy_payloads=False
     ):
         """Builds a dictionary of :class:`PropertyPacket` objects.
 
+        The properties are built as if they are from a
+        DocumentSummaryInformation property set, regardless of :attr:`fmtid`.
+
         :type stream: :class:`~lf.dec.IStream`
         :param stream: A stream that contains the property structures.
 
@@ -1610,87 +2138,72 @@ class Builder(_oleps_Builder):
         :type decoder: :class:`codecs.codec`
         :param decoder: A codec to decode string properties.
 
+        :type pids: ``iterable``
+        :param pids: An optional collection of property identifiers.  If this
+                     is not ``None``, only these properties are built.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, a :class:`~lf.win.ole.ps.LazyProperties`
+                     object is returned, and each property is decoded when it
+                     is first accessed.
+
+        :type lazy_payloads: ``bool``
+        :param lazy_payloads: If ``True``, the payloads of BLOB and
+                              ClipboardData properties (such as the thumbnail)
+                              are :class:`~lf.win.ole.ps.Payload` objects.
+
         :rtype: ``dict``
         :returns: A dictionary of property identifiers (keys) and the
                   corresponding :class:`~lf.win.ole.ps.PropertyPacket` objects
                   (values).
 
         """
-        pids_offsets = property_set.pids_offsets
-        make = PropertyFactory.make
-        properties = dict()
-
-
-        VT_LPSTR = PropertyType.VT_LPSTR
-        VT_LPWSTR = PropertyType.VT_LPWSTR
-        VT_VECTOR = PropertyType.VT_VECTOR
-        VT_VARIANT = PropertyType.VT_VARIANT
-        PIDDSI_DOCPARTS = PIDDSI.DOCPARTS
-        PIDDSI_HEADINGPAIR = PIDDSI.HEADINGPAIR
-
-        code_page = None
-        if CODEPAGE_PROPERTY_IDENTIFIER in pids_offsets:
-            property_offset = pids_offsets[CODEPAGE_PROPERTY_IDENTIFIER]
-            code_page = make(stream, property_offset + offset)
-            code_page = code_page.value
-
-            if code_page < 0:  # Not sure why this isn't type VT_UI2
-                code_page = 0xFFFF + code_page + 1
-            # end if
-
-            if (code_page in code_page_names) and (decoder is None):
-                decoder = getdecoder(code_page_names[code_page])
-            # end if
-        # end if
-
-        for (pid, property_offset) in pids_offsets.items():
-            property_offset += offset
+        return cls.build_properties(
+            stream, property_set, offset, FMTID_DocSummaryInformation,
+            decoder, pids, lazy, lazy_payloads
+        )
+    # end def build_doc_summary_info_properties
+# end class Builder
 
-            if pid == DICTIONARY_PROPERTY_IDENTIFIER:
-                property = Dictionary.from_stream(
-                    stream, property_offset, code_page, decoder
-                )
+def register_parsers(factory):
+    """Registers the Microsoft Office parsers with a property factory.
 
-            elif pid == PIDDSI_HEADINGPAIR:
-                tpv = TypedPropertyValue.from_stream(
-                    stream, property_offset, decoder
-                )
+    :type factory: :class:`~lf.win.ole.ps.PropertyFactory`
+    :param factory: The property factory (class) to register the parsers
+                    with.
 
-                if tpv.type == (VT_VECTOR | VT_VARIANT):
-                    property = VtVecHeadingPair.from_stream(
-                        stream, property_offset, decoder
-                    )
-                else:
-                    property = make(stream, property_offset, decoder)
-                # end if
+    """
+    VT_LPSTR = PropertyType.VT_LPSTR
+    VT_LPWSTR = PropertyType.VT_LPWSTR
+    VT_VECTOR = PropertyType.VT_VECTOR
+    VT_VARIANT = PropertyType.VT_VARIANT
+    VT_CF = PropertyType.VT_CF
+
+    factory.register(VT_LPSTR, VtString.from_buffer)
+    factory.register(VT_LPWSTR, VtString.from_buffer)
+
+    factory.register(
+        VT_CF, VtThumbnail.from_buffer, FMTID_SummaryInformation,
+        PIDSI.THUMBNAIL
+    )
 
-            elif pid == PIDDSI_DOCPARTS:
-                tpv = TypedPropertyValue.from_stream(
-                    stream, property_offset, decoder
-                )
-
-                if tpv.type == (VT_VECTOR | VT_LPSTR):
-                    property = VtVecUnalignedLpstr.from_stream(
-                        stream, property_offset, decoder
-                    )
-                elif tpv.type == (VT_VECTOR | VT_LPWSTR):
-                    property = VtVecLpwstr.from_stream(
-                        stream, property_offset, decoder
-                    )
-                else:
-                    property = make(stream, property_offset, decoder)
-                # end if
+    factory.register(
+        VT_VECTOR | VT_VARIANT, VtVecHeadingPair.from_buffer,
+        FMTID_DocSummaryInformation, PIDDSI.HEADINGPAIR
+    )
 
-            else:
-                property = make(stream, property_offset, decoder)
-            # end if
+    factory.register(
+        VT_VECTOR | VT_LPSTR, VtVecUnalignedLpstr.from_buffer,
+        FMTID_DocSummaryInformation, PIDDSI.DOCPARTS
+    )
 
-            properties[pid] = property
-        # end for
+    factory.register(
+        VT_VECTOR | VT_LPWSTR, VtVecLpwstr.from_buffer,
+        FMTID_DocSummaryInformation, PIDDSI.DOCPARTS
+    )
+# end def register_parsers
 
-        return properties
-    # end def build_doc_summary_info_properties
-# end class Builder
+register_parsers(PropertyFactory)
 
 # Property Identifiers of properties that should be a VtString instance...
 _vt_string_pidsi = [
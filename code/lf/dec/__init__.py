@@ -25,12 +25,13 @@ from lf.dec.composite import Composite, CompositeIStream
 from lf.dec.raw import Raw, RawIStream
 from lf.dec.splitraw import SplitRaw, SplitRawIStream
 from lf.dec.byte import Byte, ByteIStream
+from lf.dec.mapped import Mapped, MappedIStream
 
 __docformat__ = "restructuredtext en"
 __all__ = [
     "Container", "SingleStreamContainer", "StreamInfo",
-    "Subset", "Composite", "Raw", "SplitRaw", "Byte",
+    "Subset", "Composite", "Raw", "SplitRaw", "Byte", "Mapped",
     "SubsetIStream", "CompositeIStream", "RawIStream", "SplitRawIStream",
-    "ByteIStream",
+    "ByteIStream", "MappedIStream",
     "SEEK_SET", "SEEK_CUR", "SEEK_END"
 ]
@@ -0,0 +1,181 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Digital Evidence Container for memory mapped files."""
+
+# stdlib imports
+import io
+import os
+import mmap
+
+# local imports
+from lf.dec.base import SingleStreamContainer, ManagedIStream
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "Mapped", "MappedIStream"
+]
+
+class Mapped(SingleStreamContainer):
+    """A container for files that are memory mapped."""
+
+    def __init__(self, name):
+        """Initializes a Mapped object.
+
+        :type name: str
+        :param name: The name of the file.
+
+        """
+        super(Mapped, self).__init__()
+        self.stream = MappedIStream(name)
+    # end def __init__
+# end class Mapped
+
+class MappedIStream(ManagedIStream):
+    """A stream for a file that is memory mapped.
+
+    Reads are copied from the map, without a system call, and the operating
+    system only loads the pages that are used.  This makes random access to
+    very large files cheap.
+
+    .. attribute:: name
+
+        The name of the file.
+
+    .. attribute:: buffer
+
+        A read-only ``memoryview`` of the contents of the file.
+
+    """
+
+    def __init__(self, name):
+        """Initializes a MappedIStream object.
+
+        :type name: str
+        :param name: The name of the file.
+
+        """
+        super(MappedIStream, self).__init__()
+
+        with io.open(name, "rb") as ifile:
+            size = os.fstat(ifile.fileno()).st_size
+
+            if size:
+                self._map = mmap.mmap(
+                    ifile.fileno(), 0, access=mmap.ACCESS_READ
+                )
+                self.buffer = memoryview(self._map)
+            else:
+                # Empty files can not be mapped
+                self._map = None
+                self.buffer = memoryview(b"")
+            # end if
+        # end with
+
+        self.size = size
+        self.name = name
+    # end def __init__
+
+    def close(self):
+        """Closes the stream, and unmaps the file."""
+
+        if not self.closed:
+            self.buffer.release()
+
+            if self._map is not None:
+                try:
+                    self._map.close()
+                except BufferError:
+                    # Views of the map are still in use, the map is closed
+                    # when they are garbage collected.
+                    pass
+                # end try
+            # end if
+        # end if
+
+        super(MappedIStream, self).close()
+    # end def close
+
+    def read(self, n=-1):
+        """Reads up to ``n`` bytes.
+
+        :type n: int
+        :param n: The number of bytes to read.  If this is -1, all bytes from
+        the current position to EOF are read.
+
+        :except ValueError: If the stream is closed.
+
+        :rtype: bytes
+        :returns: The bytes read.
+
+        """
+        if self.closed:
+            raise ValueError("read on closed stream")
+        # end if
+
+        position = self._position
+        if (n is None) or (n < 0):
+            end = self.size
+        else:
+            end = min(position + n, self.size)
+        # end if
+
+        if position >= end:
+            return b""
+        # end if
+
+        self._position = end
+        return self.buffer[position:end].tobytes()
+    # end def read
+
+    def readall(self):
+        """Read and return all bytes in the stream, until EOF.
+
+        :rtype: bytes
+        :returns: The bytes read.
+
+        """
+        return self.read()
+    # end def readall
+
+    def readinto(self, b):
+        """Reads up to len(b) bytes into b.
+
+        :type b: bytearray
+        :param b: A bytearray to hold the bytes read from the stream.
+
+        :except ValueError: If the stream is closed.
+
+        :rtype: int
+        :returns: The number of bytes read.
+
+        """
+        if self.closed:
+            raise ValueError("readinto on closed stream")
+        # end if
+
+        position = self._position
+        read_size = max(min(len(b), self.size - position), 0)
+
+        if read_size:
+            b[:read_size] = self.buffer[position:position + read_size]
+            self._position = position + read_size
+        # end if
+
+        return read_size
+    # end def readinto
+# end class MappedIStream
@@ -20,7 +20,7 @@
 # stdlib imports
 from ctypes import (
     c_uint8, c_int8, c_uint16, c_int16, c_uint32, c_int32, c_uint64, c_int64,
-    c_float, c_double
+    c_float, c_double, sizeof, Array
 )
 
 __docformat__ = "restructuredtext en"
@@ -29,7 +29,7 @@ __all__ = [
     "int16_le", "int16_be", "uint16_le", "uint16_be",
     "int32_le", "int32_be", "uint32_le", "uint32_be",
     "int64_le", "int64_be", "uint64_le", "uint64_be",
-    "float32_le", "float32_be", "float64_le", "float64_be"
+    "float32_le", "float32_be", "float64_le", "float64_be", "struct_format"
 ]
 
 int8 = c_int8
@@ -54,3 +54,43 @@ float32_le = c_float.__ctype_le__
 float32_be = c_float.__ctype_be__
 float64_le = c_double.__ctype_le__
 float64_be = c_double.__ctype_be__
+
+def struct_format(ctype):
+    """Makes a :mod:`struct` format for a (little endian) record ctype.
+
+    Raw (array) fields are skipped, as padding.  Every other field, including
+    composite fields such as a FILETIME, is unpacked as an unsigned integer
+    of the same size.
+
+    :type ctype: :class:`ctypes.Structure`
+    :param ctype: The ctype of the record (e.g. :attr:`Record._ctype_`).
+
+    :rtype: ``str``
+    :returns: The format, starting with ``"<"``.
+
+    """
+    codes = {1: "B", 2: "H", 4: "I", 8: "Q"}
+    format = ["<"]
+    position = 0
+
+    for (name, field_type) in ctype._fields_:
+        field = getattr(ctype, name)
+        if field.offset > position:
+            format.append("{0}x".format(field.offset - position))
+        # end if
+
+        if issubclass(field_type, Array):
+            format.append("{0}x".format(field.size))
+        else:
+            format.append(codes[field.size])
+        # end if
+
+        position = field.offset + field.size
+    # end for
+
+    if sizeof(ctype) > position:
+        format.append("{0}x".format(sizeof(ctype) - position))
+    # end if
+
+    return "".join(format)
+# end def struct_format
@@ -18,10 +18,15 @@
 """Converters for various time formats"""
 
 # stdlib imports
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
 from math import ceil, floor
 from calendar import isleap
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# end try
 
 # local imports
 from lf.dec import SEEK_SET
@@ -51,6 +56,15 @@ DAYS_PER_NORMAL_YEAR = 365
 DAYS_PER_LEAP_YEAR = 366
 MONTHS_PER_YEAR = 12
 
+# The start of the FILETIME epoch, and the last millisecond (relative to it)
+# that a ``datetime`` can represent.
+_FILETIME_EPOCH = datetime(EPOCH_YEAR, 1, 1)
+_FILETIME_MAX_MSEC = (datetime.max - _FILETIME_EPOCH) // timedelta(0, 0, 0, 1)
+
+# The smallest number of timestamps that FILETIMETodatetime.from_ints hands
+# off to NumPy.
+_numpy_threshold = 64
+
 _YearLengths = [ DAYS_PER_NORMAL_YEAR, DAYS_PER_LEAP_YEAR ]
 _MonthLengths = [
     [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
@@ -187,81 +201,215 @@ class FILETIMETodatetime(StdLibConverter):
         :returns: The corresponding ``datetime`` object.
 
         """
-        # This algorithm was adapted from ReactOS's FileTimeToSystemTime
-        # function so it's a bit more precise than just doing
-        # utcfromtimestamp(timestamp_to_unix_time(timestamp)).
+        # Like ReactOS's FileTimeToSystemTime, this truncates to whole
+        # milliseconds, which keeps it a bit more precise than going
+        # through utcfromtimestamp(timestamp_to_unix_time(timestamp)).
 
-        if timestamp & 0x8000000000000000:
+        if (timestamp < 0) or (timestamp & 0x8000000000000000):
             raise ValueError("invalid timestamp {0}".format(timestamp))
         # end if
 
-        # RtlTimeToFileFields
-        milli_secs =  0xFFFF & ((timestamp % TICKS_PER_SEC) // TICKS_PER_MSEC)
-        timestamp = timestamp // TICKS_PER_SEC
+        try:
+            return _FILETIME_EPOCH + \
+                timedelta(0, 0, (timestamp // TICKS_PER_MSEC) * 1000)
+        except OverflowError:
+            raise ValueError("invalid timestamp {0}".format(timestamp))
+        # end try
+    # end def from_int
 
-        days = timestamp // SECS_PER_DAY
-        seconds_in_day = timestamp % SECS_PER_DAY
+    @classmethod
+    def from_ints(cls, timestamps, strict=True):
+        """Converts a sequence of FILETIME timestamps to ``datetime`` objects.
 
-        while seconds_in_day < 0:
-            seconds_in_day += SECS_PER_DAY
-            days -= 1
-        # end while
+        If NumPy is available and :attr:`timestamps` is large enough, the
+        conversion is vectorised with ``datetime64``.  Otherwise each
+        timestamp goes through :meth:`from_int`.
 
-        while seconds_in_day >= SECS_PER_DAY:
-            seconds_in_day -= SECS_PER_DAY
-            days += 1
-        # end while
+        :type timestamps: iterable of ``int``
+        :param timestamps: The timestamps (e.g. a ``list``, an
+                           ``array("Q")`` or a NumPy array).
 
-        hours = 0xFFFF & (seconds_in_day // SECS_PER_HOUR)
-        seconds_in_day = seconds_in_day % SECS_PER_HOUR
-        mins = 0xFFFF & (seconds_in_day // SECS_PER_MIN)
-        secs = 0xFF & (seconds_in_day % SECS_PER_MIN)
+        :type strict: ``bool``
+        :param strict: If ``False``, invalid timestamps are returned as the
+                       original ``int`` instead of raising an exception.
 
-        year = EPOCH_YEAR
-        year += days // DAYS_PER_LEAP_YEAR
+        :raises ValueError: If :attr:`strict` is ``True`` and a timestamp is
+                            invalid.
 
-        year_temp = year - 1
-        days_since_epoch = (
-            (year_temp * DAYS_PER_NORMAL_YEAR) + (year_temp // 4) -
-            (year_temp // 100) + (year_temp // 400)
-        )
+        :rtype: ``list``
+        :returns: The corresponding ``datetime`` objects, in order.
 
-        epoch_temp = EPOCH_YEAR - 1
-        days_since_epoch -= (
-            (epoch_temp * DAYS_PER_NORMAL_YEAR) + (epoch_temp // 4) -
-            (epoch_temp // 100) + (epoch_temp // 400)
-        )
+        """
+        if (numpy is not None) and hasattr(timestamps, "__len__") and \
+            (len(timestamps) >= _numpy_threshold):
+            # The array keeps the type of the input, so negative values are
+            # not wrapped around to large unsigned ones.
+            try:
+                ticks = numpy.asarray(timestamps)
+            except (OverflowError, ValueError, TypeError):
+                ticks = None
+            # end try
+
+            if (ticks is not None) and (ticks.ndim == 1) and \
+                (ticks.dtype.kind in "iu"):
+                return _filetimes_to_datetimes_numpy(ticks, strict)
+            # end if
+        # end if
 
-        days -= days_since_epoch
-        while 1:
-            leap_year = isleap(year)
-            if days < _YearLengths[leap_year]:
-                break
+        if strict:
+            # Anything with bit 63 set overflows the year, so only negative
+            # values need the second look in from_int.
+            epoch = _FILETIME_EPOCH
+            timestamps = list(timestamps)
+            try:
+                values = [
+                    epoch + timedelta(
+                        0, 0, (timestamp // TICKS_PER_MSEC) * 1000
+                    )
+                    for timestamp in timestamps
+                ]
+            except OverflowError:
+                values = None
+            # end try
+
+            if (values is not None) and \
+                ((not values) or (min(values) >= epoch)):
+                return values
             # end if
 
-            year += 1
-            days -= _YearLengths[leap_year]
-        # end while
+            return [cls.from_int(timestamp) for timestamp in timestamps]
+        # end if
 
-        leap_year = isleap(year)
-        months = _MonthLengths[leap_year]
-        month = 0
-        while days >= months[month]:
-            days -= months[month]
-            month += 1
-        # end while
+        from_int = cls.from_int
 
-        month += 1
-        days += 1
+        values = list()
+        append = values.append
+        for timestamp in timestamps:
+            try:
+                append(from_int(timestamp))
+            except ValueError:
+                append(timestamp)
+            # end try
+        # end for
 
-        return datetime(
-            year, month, days, hours, mins, secs, milli_secs * 1000
-        )
-    # end def from_int
+        return values
+    # end def from_ints
 # end class FILETIMETodatetime
 
+def _filetimes_to_datetimes_numpy(ticks, strict):
+    """Vectorised implementation of :meth:`FILETIMETodatetime.from_ints`.
+
+    :type ticks: ``numpy.ndarray``
+    :param ticks: A one dimensional (signed or unsigned) integer array of
+                  timestamps.
+
+    :type strict: ``bool``
+    :param strict: Whether to raise ``ValueError`` on invalid timestamps.
+
+    :rtype: ``list``
+    :returns: The corresponding ``datetime`` objects.  Invalid timestamps
+              are the original values when :attr:`strict` is ``False``.
+
+    """
+    if ticks.dtype.kind == "i":
+        valid = (ticks >= 0)
+        unsigned = numpy.where(valid, ticks, 0).astype(numpy.uint64)
+    else:
+        valid = numpy.ones(len(ticks), dtype=bool)
+        unsigned = ticks.astype(numpy.uint64)
+    # end if
+
+    millis = unsigned // numpy.uint64(TICKS_PER_MSEC)
+    valid &= (unsigned < numpy.uint64(0x8000000000000000)) & \
+        (millis <= numpy.uint64(_FILETIME_MAX_MSEC))
+    millis = numpy.where(valid, millis, 0).astype(numpy.int64)
+
+    values = numpy.datetime64("1601-01-01T00:00:00", "ms") + \
+        millis.astype("timedelta64[ms]")
+    values = values.astype(object).tolist()
+
+    if not valid.all():
+        invalid = numpy.flatnonzero(~valid).tolist()
+        if strict:
+            timestamp = int(ticks[invalid[0]])
+            raise ValueError("invalid timestamp {0}".format(timestamp))
+        # end if
+
+        for index in invalid:
+            values[index] = int(ticks[index])
+        # end for
+    # end if
+
+    return values
+# end def _filetimes_to_datetimes_numpy
+
 class DOSDateTimeTodatetime(StdLibConverter):
-    """Converts DOS date and times to a ``datetime``."""
+    """Converts DOS date and times to a ``datetime``.
+
+    Each DOS date and time is a 16 bit word, so the conversions are done with
+    two 65,536 entry lookup tables.  The tables are built the first time they
+    are needed, and map each word to a ``date`` or ``time`` object, or to
+    ``None`` if the word is not a valid date or time.
+
+    """
+
+    _date_table = None
+    _time_table = None
+
+    @classmethod
+    def _get_date_table(cls):
+        """Returns (and builds if necessary) the DOS date lookup table.
+
+        :rtype: ``list``
+        :returns: A ``date`` object (or ``None``) for each 16 bit word.
+
+        """
+        table = cls._date_table
+        if table is not None:
+            return table
+        # end if
+
+        table = [None] * 0x10000
+        for year in range(128):
+            month_lengths = _MonthLengths[isleap(year + 1980)]
+            for month in range(1, 13):
+                word = (year << 9) | (month << 5)
+                for day in range(1, month_lengths[month - 1] + 1):
+                    table[word | day] = date(year + 1980, month, day)
+                # end for
+            # end for
+        # end for
+
+        cls._date_table = table
+        return table
+    # end def _get_date_table
+
+    @classmethod
+    def _get_time_table(cls):
+        """Returns (and builds if necessary) the DOS time lookup table.
+
+        :rtype: ``list``
+        :returns: A ``time`` object (or ``None``) for each 16 bit word.
+
+        """
+        table = cls._time_table
+        if table is not None:
+            return table
+        # end if
+
+        table = [None] * 0x10000
+        for hours in range(HOURS_PER_DAY):
+            for mins in range(MINS_PER_HOUR):
+                word = (hours << 11) | (mins << 5)
+                for secs in range(SECS_PER_MIN // 2):
+                    table[word | secs] = time(hours, mins, secs * 2)
+                # end for
+            # end for
+        # end for
+
+        cls._time_table = table
+        return table
+    # end def _get_time_table
 
     @classmethod
     def from_ints(cls, dos_date=None, dos_time=None):
@@ -274,40 +422,237 @@ class DOSDateTimeTodatetime(StdLibConverter):
         :param dos_time: An MS-DOS time.
 
         :raises ValueError: if both :attr:`dos_date` and :attr:`dos_time` are
-                            ``None``.
+                            ``None``, or if either is invalid.
 
         :rtype: ``datetime``
         :returns: The corresponding ``datetime`` object.
 
         """
+        # The common case is two valid words and built tables.  Anything else
+        # (a missing value, an unbuilt table or an invalid word) ends up as a
+        # TypeError and takes the slower path below.
+        try:
+            return datetime.combine(
+                cls._date_table[dos_date & 0xFFFF],
+                cls._time_table[dos_time & 0xFFFF]
+            )
+        except TypeError:
+            pass
+        # end try
+
         if (dos_date is None) and (dos_time is None):
             raise ValueError("dos_date and dos_time are both None")
         # end if
 
         if dos_time is not None:
-            secs = (dos_time & 0x1F) * 2
-            mins = (dos_time & 0x7E0) >> 5
-            hours = (dos_time & 0xF800) >> 11
+            table = cls._time_table or cls._get_time_table()
+            dos_time_value = table[dos_time & 0xFFFF]
+            if dos_time_value is None:
+                raise ValueError("invalid DOS time {0:#x}".format(dos_time))
+            # end if
         else:
-            secs = 0
-            mins = 0
-            hours = 0
+            dos_time_value = _midnight
         # end if
 
         if dos_date is not None:
-            day = dos_date & 0x1F
-            month = (dos_date & 0x1E0) >> 5
-            year = ((dos_date & 0xFE00) >> 9) + 1980
+            table = cls._date_table or cls._get_date_table()
+            dos_date_value = table[dos_date & 0xFFFF]
+            if dos_date_value is None:
+                raise ValueError("invalid DOS date {0:#x}".format(dos_date))
+            # end if
         else:
-            day = 1
-            month = 1
-            year = 1
+            dos_date_value = _first_date
         # end if
 
-        return datetime(year, month, day, hours, mins, secs)
+        return datetime.combine(dos_date_value, dos_time_value)
     # end def from_ints
+
+    @classmethod
+    def date_from_int(cls, dos_date):
+        """Converts a DOS date to a ``date``.
+
+        :type dos_date: ``int``
+        :param dos_date: An MS-DOS date.
+
+        :raises ValueError: If :attr:`dos_date` is invalid.
+
+        :rtype: ``date``
+        :returns: The corresponding ``date`` object.
+
+        """
+        value = (cls._date_table or cls._get_date_table())[dos_date & 0xFFFF]
+        if value is None:
+            raise ValueError("invalid DOS date {0:#x}".format(dos_date))
+        # end if
+
+        return value
+    # end def date_from_int
+
+    @classmethod
+    def time_from_int(cls, dos_time):
+        """Converts a DOS time to a ``time``.
+
+        :type dos_time: ``int``
+        :param dos_time: An MS-DOS time.
+
+        :raises ValueError: If :attr:`dos_time` is invalid.
+
+        :rtype: ``time``
+        :returns: The corresponding ``time`` object.
+
+        """
+        value = (cls._time_table or cls._get_time_table())[dos_time & 0xFFFF]
+        if value is None:
+            raise ValueError("invalid DOS time {0:#x}".format(dos_time))
+        # end if
+
+        return value
+    # end def time_from_int
+
+    @classmethod
+    def dates_from_ints(cls, dos_dates, strict=True):
+        """Converts a sequence of DOS dates to ``date`` objects.
+
+        :type dos_dates: iterable of ``int``
+        :param dos_dates: The MS-DOS dates.
+
+        :type strict: ``bool``
+        :param strict: If ``False``, invalid dates are returned as the
+                       original ``int`` instead of raising an exception.
+
+        :raises ValueError: If :attr:`strict` is ``True`` and a date is
+                            invalid.
+
+        :rtype: ``list``
+        :returns: The corresponding ``date`` objects, in order.
+
+        """
+        return _lookup_words(
+            cls._date_table or cls._get_date_table(), dos_dates, strict,
+            "invalid DOS date {0:#x}"
+        )
+    # end def dates_from_ints
+
+    @classmethod
+    def times_from_ints(cls, dos_times, strict=True):
+        """Converts a sequence of DOS times to ``time`` objects.
+
+        :type dos_times: iterable of ``int``
+        :param dos_times: The MS-DOS times.
+
+        :type strict: ``bool``
+        :param strict: If ``False``, invalid times are returned as the
+                       original ``int`` instead of raising an exception.
+
+        :raises ValueError: If :attr:`strict` is ``True`` and a time is
+                            invalid.
+
+        :rtype: ``list``
+        :returns: The corresponding ``time`` objects, in order.
+
+        """
+        return _lookup_words(
+            cls._time_table or cls._get_time_table(), dos_times, strict,
+            "invalid DOS time {0:#x}"
+        )
+    # end def times_from_ints
+
+    @classmethod
+    def from_int_pairs(cls, dos_dates, dos_times, strict=True):
+        """Converts parallel sequences of DOS dates and times.
+
+        :type dos_dates: iterable of ``int``
+        :param dos_dates: The MS-DOS dates.
+
+        :type dos_times: iterable of ``int``
+        :param dos_times: The MS-DOS times, one for each date.
+
+        :type strict: ``bool``
+        :param strict: If ``False``, an invalid date or time is returned as
+                       the original ``(dos_date, dos_time)`` tuple instead of
+                       raising an exception.
+
+        :raises ValueError: If :attr:`strict` is ``True`` and a date or time
+                            is invalid.
+
+        :rtype: ``list``
+        :returns: The corresponding ``datetime`` objects, in order.
+
+        """
+        date_table = cls._date_table or cls._get_date_table()
+        time_table = cls._time_table or cls._get_time_table()
+        combine = datetime.combine
+
+        values = list()
+        append = values.append
+        for (dos_date, dos_time) in zip(dos_dates, dos_times):
+            dos_date_value = date_table[dos_date & 0xFFFF]
+            dos_time_value = time_table[dos_time & 0xFFFF]
+
+            if (dos_date_value is None) or (dos_time_value is None):
+                if strict:
+                    raise ValueError(
+                        "invalid DOS date/time {0:#x}/{1:#x}".format(
+                            dos_date, dos_time
+                        )
+                    )
+                # end if
+
+                append((dos_date, dos_time))
+            else:
+                append(combine(dos_date_value, dos_time_value))
+            # end if
+        # end for
+
+        return values
+    # end def from_int_pairs
 # end class DOSDateTimeTodatetime
 
+# The date and time DOSDateTimeTodatetime.from_ints uses for a missing value.
+_first_date = date(1, 1, 1)
+_midnight = time(0, 0, 0)
+
+def _lookup_words(table, words, strict, err_msg):
+    """Maps 16 bit words through a lookup table.
+
+    :type table: ``list``
+    :param table: The lookup table, with ``None`` for invalid words.
+
+    :type words: iterable of ``int``
+    :param words: The words to look up.
+
+    :type strict: ``bool``
+    :param strict: Whether to raise ``ValueError`` on invalid words.
+
+    :type err_msg: ``str``
+    :param err_msg: A format string for the exception message.
+
+    :rtype: ``list``
+    :returns: The looked up values (or the original word if invalid and
+              :attr:`strict` is ``False``).
+
+    """
+    if not hasattr(words, "__getitem__"):
+        words = list(words)
+    # end if
+
+    values = [table[word & 0xFFFF] for word in words]
+
+    if None in values:
+        for (index, value) in enumerate(values):
+            if value is None:
+                if strict:
+                    raise ValueError(err_msg.format(words[index]))
+                # end if
+
+                values[index] = words[index]
+            # end if
+        # end for
+    # end if
+
+    return values
+# end def _lookup_words
+
 class VariantTimeTodatetime(StdLibConverter):
     """Converts variant timestamp (OLE date) to a ``datetime``."""
 
@@ -0,0 +1,119 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Helpers shared by the batch processing modules."""
+
+# stdlib imports
+from collections import deque
+
+# local imports
+from lf.dtypes import Structuple
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "BatchStats", "batches", "iter_bounded"
+]
+
+class BatchStats(Structuple):
+    """Statistics from a batch of files.
+
+    .. attribute:: file_count
+
+        The number of files that were processed.
+
+    .. attribute:: error_count
+
+        The number of files that could not be processed.
+
+    .. attribute:: elapsed
+
+        The time (in seconds) the batch took.
+
+    .. attribute:: rate
+
+        The throughput of the batch, in files per second.
+
+    """
+    _fields_ = ("file_count", "error_count", "elapsed", "rate")
+    __slots__ = ()
+# end class BatchStats
+
+def batches(items, batch_size):
+    """Groups an iterable into lists of :attr:`batch_size` items.
+
+    :type items: iterable
+    :param items: The items to group.
+
+    :type batch_size: ``int``
+    :param batch_size: The number of items in each list.  The last list may
+                       be shorter.
+
+    :rtype: iterator
+    :returns: An iterator of lists.
+
+    """
+    batch = list()
+    for item in items:
+        batch.append(item)
+
+        if len(batch) >= batch_size:
+            yield batch
+            batch = list()
+        # end if
+    # end for
+
+    if batch:
+        yield batch
+    # end if
+# end def batches
+
+def iter_bounded(executor, func, arg_lists, max_pending):
+    """Calls a function in an executor, bounding the calls in flight.
+
+    Results are generated in the same order as :attr:`arg_lists`.  At most
+    :attr:`max_pending` calls are submitted but not yet consumed, so memory
+    use is bounded no matter how many calls there are.
+
+    :type executor: :class:`concurrent.futures.Executor`
+    :param executor: The executor to submit the calls to.
+
+    :type func: callable
+    :param func: The function to call.
+
+    :type arg_lists: iterable of ``tuple``
+    :param arg_lists: The positional arguments of each call.
+
+    :type max_pending: ``int``
+    :param max_pending: The maximum number of calls in flight.
+
+    :rtype: iterator
+    :returns: An iterator of the return values of :attr:`func`.
+
+    """
+    pending = deque()
+    for args in arg_lists:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        # end if
+
+        pending.append(executor.submit(func, *args))
+    # end for
+
+    while pending:
+        yield pending.popleft().result()
+    # end while
+# end def iter_bounded
@@ -127,15 +127,7 @@ def dos_datetime_to_datetime(date_time):
     :rtype: datetime
     :returns: The date and time in a datetime object.
     """
-    secs = (date_time & 0x1F) * 2
-    mins = (date_time & 0x7E0) >> 5
-    hours = (date_time & 0xF800) >> 11
-
-    day = (date_time & 0x1F0000) >> 16
-    month = (date_time & 0x1E00000) >> 21
-    year = ((date_time & 0xFE000000) >> 25) + 1980
-
-    return datetime(year, month, day, hours, mins, secs)
+    return DOSDateTimeTodatetime.from_ints(date_time >> 16, date_time)
 # end def dos_datetime_to_datetime
 
 def dos_date_to_date(dos_date):
@@ -150,7 +142,7 @@ def dos_date_to_date(dos_date):
     :returns: The date in a datetime.date object.
     """
 
-    return DOSDateTimeTodatetime.from_ints(dos_date).date()
+    return DOSDateTimeTodatetime.date_from_int(dos_date)
 # end def dos_date_to_date
 
 def dos_time_to_time(dos_time):
@@ -165,5 +157,5 @@ def dos_time_to_time(dos_time):
     :returns The date in a datetime.time object.
     """
 
-    return DOSDateTimeTodatetime.from_ints(dos_time=dos_time).time()
+    return DOSDateTimeTodatetime.time_from_int(dos_time)
 # end def dos_time_to_time
@@ -26,6 +26,9 @@ code pages 720 and 858.  This package adds supports for these two code pages.
     the global (system) :mod:`codec` registry.  To do this, call the
     :func:`add_codecs` function.
 
+The :func:`get_decoder` function returns a (cached) decoder for a Windows code
+page identifier, including code pages 720 and 858.
+
 """
 
 # stdlib imports
@@ -33,11 +36,23 @@ import codecs
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "add_codecs"
+    "add_codecs", "get_decoder"
 ]
 
-import codecs
 from lf.win.codepage import cp720, cp858
+from lf.win.codepage.consts import code_page_names
+
+_ascii_chars = bytes(range(0x80)).decode("ascii")
+_latin_1_chars = bytes(range(0x100)).decode("latin_1")
+
+# Codecs that already skip ahead over ASCII input.
+_ascii_codec_names = frozenset(["utf_8"])
+
+# CodecInfo objects for the codecs in this package, by name.
+_codec_infos = dict()
+
+# Decoders returned by get_decoder, by code page.
+_decoders = dict()
 
 def search_function(encoding_name):
     """Passed to :func:`codecs.register` to locate cp720 and cp858 codecs.
@@ -49,15 +64,91 @@ def search_function(encoding_name):
     :returns: A :class:`CodecInfo` object describing code pages 720 or 858.
 
     """
-    if encoding_name == "cp720":
-        return cp720.getregentry()
+    if encoding_name in _codec_infos:
+        return _codec_infos[encoding_name]
+    elif encoding_name == "cp720":
+        codec_info = cp720.getregentry()
     elif encoding_name == "cp858":
-        return cp858.getregentry()
+        codec_info = cp858.getregentry()
+    else:
+        return None
     # end if
 
-    return None
+    _codec_infos[encoding_name] = codec_info
+    return codec_info
 # end def search_function
 
+def _make_ascii_decoder(decode):
+    """Wraps a decoder with a fast path for (7-bit) ASCII input."""
+
+    def ascii_decode(input, errors="strict"):
+        try:
+            if input.isascii():
+                return (input.decode("ascii"), len(input))
+            # end if
+        except AttributeError:
+            pass
+        # end try
+
+        return decode(input, errors)
+    # end def ascii_decode
+
+    return ascii_decode
+# end def _make_ascii_decoder
+
+def get_decoder(code_page):
+    """Gets a decoder for a Windows code page.
+
+    Decoders are looked up once per code page, and cached for the life of the
+    process.  Code pages 720 and 858 fall back to the codecs in this package,
+    if the global codec registry doesn't have them.
+
+    If the code page maps bytes 0x00-0x7F to ASCII, the decoder skips the
+    codec when every byte of the input is below 0x80.  If the code page is
+    ISO 8859-1, the builtin ``latin_1`` decoder is used.
+
+    :type code_page: ``int``
+    :param code_page: The code page identifier.
+
+    :raises LookupError: If there is no codec for :attr:`code_page`.
+
+    :rtype: ``function``
+    :returns: A decoder, with the same signature as
+              :func:`codecs.getdecoder`.
+
+    """
+    if code_page in _decoders:
+        return _decoders[code_page]
+    elif code_page not in code_page_names:
+        raise LookupError("unknown code page: {0}".format(code_page))
+    # end if
+
+    name = code_page_names[code_page]
+    try:
+        decode = codecs.getdecoder(name)
+    except LookupError:
+        codec_info = search_function(name)
+        if codec_info is None:
+            raise
+        # end if
+
+        decode = codec_info.decode
+    # end try
+
+    if decode(bytes(range(0x100)), "ignore")[0] == _latin_1_chars:
+        decoder = codecs.latin_1_decode
+    elif name in _ascii_codec_names:
+        decoder = decode
+    elif decode(bytes(range(0x80)), "ignore")[0] == _ascii_chars:
+        decoder = _make_ascii_decoder(decode)
+    else:
+        decoder = decode
+    # end if
+
+    _decoders[code_page] = decoder
+    return decoder
+# end def get_decoder
+
 def add_codecs():
     """Adds the cp720 and cp858 codecs to the global codec registry."""
 
@@ -20,14 +20,15 @@
 # stdlib imports
 from uuid import UUID
 from decimal import Decimal
+from functools import lru_cache
 
 # local imports
 from lf.dec import SEEK_SET
 from lf.dtypes import LITTLE_ENDIAN, ActiveStructuple, StdLibConverter
 from lf.dtypes.ctypes import uint64_le, uint64_be, int64_le, int64_be
 from lf.win.ctypes import (
-    guid_le, lcid_le, hresult_le, decimal_le,
-    guid_be, lcid_be, hresult_be, decimal_be,
+    guid_le, lcid_le, hresult_le, decimal_le, clsid_le,
+    guid_be, lcid_be, hresult_be, decimal_be, clsid_be
 )
 
 __docformat__ = "restructuredtext en"
@@ -36,9 +37,37 @@ __all__ = [
     "CURRENCYToDecimal"
 ]
 
+# The maximum number of distinct GUIDs to keep UUID objects for.  The same
+# CLSIDs and FMTIDs occur over and over, so the cache hit rate is high.
+_UUID_CACHE_SIZE = 4096
+
+# ctypes whose raw bytes are a GUID in little/big endian byte order
+_guid_le_ctypes = frozenset([guid_le, clsid_le])
+_guid_be_ctypes = frozenset([guid_be, clsid_be])
+
+@lru_cache(maxsize=_UUID_CACHE_SIZE)
+def _uuid_from_bytes_le(data):
+    """Makes a (shared) ``UUID`` from the little endian bytes of a GUID."""
+
+    return UUID(bytes_le=data)
+# end def _uuid_from_bytes_le
+
+@lru_cache(maxsize=_UUID_CACHE_SIZE)
+def _uuid_from_bytes_be(data):
+    """Makes a (shared) ``UUID`` from the big endian bytes of a GUID."""
+
+    return UUID(bytes=data)
+# end def _uuid_from_bytes_be
+
 
 class GUIDToUUID(StdLibConverter):
-    """Converts a GUID to a ``UUID``."""
+    """Converts a GUID to a ``UUID``.
+
+    ``UUID`` objects are immutable, so conversions from raw bytes (streams,
+    buffers, and GUID ctypes) go through a bounded cache keyed by the 16
+    bytes of the GUID, and the same GUID yields the same ``UUID`` object.
+
+    """
 
     _takes_stream = True
     _takes_ctype = True
@@ -67,12 +96,40 @@ class GUIDToUUID(StdLibConverter):
         data = stream.read(16)
 
         if byte_order == LITTLE_ENDIAN:
-            return UUID(bytes_le=data)
+            return _uuid_from_bytes_le(data)
         else:
-            return UUID(bytes=data)
+            return _uuid_from_bytes_be(data)
         # end if
     # end def from_stream
 
+    @classmethod
+    def from_buffer(cls, buf, offset=0, byte_order=LITTLE_ENDIAN):
+        """Creates a ``UUID`` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the GUID structure.
+
+        :type offset: ``int``
+        :param offset: The start of the GUID structure in :attr:`buf`.
+
+        :type byte_order: constant
+        :param byte_order: The byte order to use (from :mod:`lf.dtypes`)
+
+        :raises ValueError: If :attr:`buf` is too small.
+
+        :rtype: ``UUID``
+        :returns: The corresponding ``UUID`` object.
+
+        """
+        data = bytes(buf[offset:offset + 16])
+
+        if byte_order == LITTLE_ENDIAN:
+            return _uuid_from_bytes_le(data)
+        else:
+            return _uuid_from_bytes_be(data)
+        # end if
+    # end def from_buffer
+
     @classmethod
     def from_ctype(cls, ctype):
         """Creates a ``UUID`` object from a ctype.
@@ -85,6 +142,14 @@ class GUIDToUUID(StdLibConverter):
         :returns: The corresponding ``UUID`` object.
 
         """
+        ctype_type = type(ctype)
+
+        if ctype_type in _guid_le_ctypes:
+            return _uuid_from_bytes_le(bytes(ctype))
+        elif ctype_type in _guid_be_ctypes:
+            return _uuid_from_bytes_be(bytes(ctype))
+        # end if
+
         return cls.from_guid(
             ctype.data1, ctype.data2, ctype.data3, ctype.data4
         )
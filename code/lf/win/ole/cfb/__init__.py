@@ -16,9 +16,13 @@
 # along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
 
 # local imports
-from lf.win.ole.cfb.objects import CompoundFile, Header, DirEntry
+from lf.win.ole.cfb.objects import (
+    CompoundFile, Header, DirEntry, ExtractionStats, LazyFAT, Limits,
+    DEFAULT_LIMITS
+)
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "CompoundFile", "Header", "DirEntry"
+    "CompoundFile", "Header", "DirEntry", "ExtractionStats", "LazyFAT",
+    "Limits", "DEFAULT_LIMITS"
 ]
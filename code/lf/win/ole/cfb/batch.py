@@ -0,0 +1,243 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batch processing of many OLE structured storage files."""
+
+# stdlib imports
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from time import perf_counter
+from uuid import UUID
+
+# local imports
+from lf.dec import RawIStream
+from lf.utils.batch import BatchStats, iter_bounded
+from lf.win.ole.cfb.objects import CompoundFile
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "BatchStats", "find_files", "describe", "iter_descriptions", "ingest"
+]
+
+# Fields of the header that are not included in a description.
+_SKIPPED_HEADER_FIELDS = ("di_fat", "rsvd")
+
+def _to_json(value):
+    """Converts a value to something :mod:`json` can serialize."""
+
+    if isinstance(value, datetime):
+        return value.isoformat()
+    elif isinstance(value, UUID):
+        return str(value)
+    elif isinstance(value, (bytes, bytearray)):
+        return bytes(value).hex()
+    # end if
+
+    return value
+# end def _to_json
+
+def find_files(paths):
+    """Generates the names of files, walking any directories.
+
+    :type paths: iterable of ``str``
+    :param paths: Names of files and/or directories.  Directories are walked
+                  recursively.
+
+    :rtype: iterator
+    :returns: An iterator of file names.
+
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for (dir_path, dir_names, file_names) in os.walk(path):
+                dir_names.sort()
+                file_names.sort()
+
+                for file_name in file_names:
+                    yield os.path.join(dir_path, file_name)
+                # end for
+            # end for
+        else:
+            yield path
+        # end if
+    # end for
+# end def find_files
+
+def describe(path, lazy_fat=True):
+    """Describes the contents of a compound file.
+
+    Any error while parsing the file is caught, and reported in the
+    description, so one bad file does not stop a batch.
+
+    :type path: ``str``
+    :param path: The name of the compound file.
+
+    :type lazy_fat: ``bool``
+    :param lazy_fat: Passed on to :class:`CompoundFile`.
+
+    :rtype: ``dict``
+    :returns: A dictionary with the keys ``"path"``, ``"header"`` and
+              ``"entries"``, or ``"path"`` and ``"error"`` if the file could
+              not be parsed.  Values are all serializable by :mod:`json`.
+
+    """
+    try:
+        stream = RawIStream(path)
+    except (IOError, OSError) as err:
+        return {"path": path, "error": "{0}: {1}".format(
+            err.__class__.__name__, err
+        )}
+    # end try
+
+    try:
+        cfb = CompoundFile(stream, lazy_fat=lazy_fat)
+        header = cfb.header
+
+        header_desc = dict([
+            (field, _to_json(getattr(header, field)))
+            for field in header._fields_
+            if field not in _SKIPPED_HEADER_FIELDS
+        ])
+
+        dir_entries = cfb.dir_entries
+        paths = cfb.get_paths()
+        paths[0] = ""
+
+        entries = list()
+        for sid in sorted(paths.keys()):
+            entry = dir_entries[sid]
+
+            stream_size = entry.stream_size
+            if cfb.ver_major == 0x3:
+                stream_size = stream_size & 0x00000000FFFFFFFF
+            # end if
+
+            entries.append({
+                "sid": sid,
+                "path": paths[sid],
+                "type": entry.type,
+                "size": stream_size,
+                "clsid": _to_json(entry.clsid),
+                "btime": _to_json(entry.btime),
+                "mtime": _to_json(entry.mtime)
+            })
+        # end for
+
+        return {"path": path, "header": header_desc, "entries": entries}
+    except Exception as err:
+        return {"path": path, "error": "{0}: {1}".format(
+            err.__class__.__name__, err
+        )}
+    finally:
+        stream.close()
+    # end try
+# end def describe
+
+def iter_descriptions(paths, workers=None, max_pending=None):
+    """Describes many compound files, using a pool of processes.
+
+    Descriptions are generated in the same order as :attr:`paths`.  At most
+    :attr:`max_pending` files are in flight at once, so memory use is bounded
+    no matter how many files there are.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the compound files.
+
+    :type workers: ``int``
+    :param workers: The number of worker processes.  If this is ``None`` the
+                    number of CPUs is used.  If this is 0, the files are
+                    processed in the current process.
+
+    :type max_pending: ``int``
+    :param max_pending: The maximum number of files in flight.  Defaults to 4
+                        times the number of workers.
+
+    :rtype: iterator
+    :returns: An iterator of descriptions (see :func:`describe`).
+
+    """
+    if workers == 0:
+        for path in paths:
+            yield describe(path)
+        # end for
+
+        return
+    # end if
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # end if
+
+    if max_pending is None:
+        max_pending = workers * 4
+    # end if
+
+    with ProcessPoolExecutor(workers) as executor:
+        arg_lists = ((path,) for path in paths)
+        for desc in iter_bounded(executor, describe, arg_lists, max_pending):
+            yield desc
+        # end for
+    # end with
+# end def iter_descriptions
+
+def ingest(paths, ofile, workers=None, max_pending=None):
+    """Describes many compound files, writing the results as JSON lines.
+
+    Each line of :attr:`ofile` is the JSON encoding of a description from
+    :func:`describe`.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the compound files (see :func:`find_files`).
+
+    :type ofile: file object
+    :param ofile: A text file to write the JSON lines to.
+
+    :type workers: ``int``
+    :param workers: Passed on to :func:`iter_descriptions`.
+
+    :type max_pending: ``int``
+    :param max_pending: Passed on to :func:`iter_descriptions`.
+
+    :rtype: :class:`BatchStats`
+    :returns: Statistics about the batch.
+
+    """
+    start_time = perf_counter()
+    file_count = 0
+    error_count = 0
+
+    for desc in iter_descriptions(paths, workers, max_pending):
+        file_count += 1
+        if "error" in desc:
+            error_count += 1
+        # end if
+
+        ofile.write(json.dumps(desc, sort_keys=True))
+        ofile.write("\n")
+    # end for
+
+    elapsed = perf_counter() - start_time
+    if elapsed > 0:
+        rate = file_count / elapsed
+    else:
+        rate = 0.0
+    # end if
+
+    return BatchStats((file_count, error_count, elapsed, rate))
+# end def ingest
@@ -17,15 +17,21 @@
 
 """Objects to work with OLE structured storage files."""
 
+# stdlib imports
+import os.path
+import hashlib
+from collections import OrderedDict
+from time import perf_counter
+
 # local imports
 from lf.dec import CompositeIStream, ByteIStream, SubsetIStream, SEEK_SET
 from lf.time import FILETIMETodatetime
 from lf.win.objects import CLSIDToUUID
-from lf.dtypes import ActiveStructuple
+from lf.dtypes import ActiveStructuple, Structuple
 
 from lf.win.ole.cfb.consts import (
     STREAM_ID_MAX, STREAM_ID_NONE, FAT_EOC, FAT_UNALLOC, FAT_FAT_SECT,
-    FAT_DIF_SECT, MAX_REG_SECT
+    FAT_DIF_SECT, MAX_REG_SECT, STGTY_INVALID, STGTY_STREAM
 )
 from lf.win.ole.cfb.ctypes import (
     header, dir_entry, fat_entry, mini_fat_entry, di_fat_entry
@@ -33,11 +39,39 @@ from lf.win.ole.cfb.ctypes import (
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "CompoundFile", "DirEntry", "Header"
+    "CompoundFile", "DirEntry", "Header", "ExtractionStats", "LazyFAT",
+    "Limits", "DEFAULT_LIMITS"
 ]
 
 _invalid_name_chars = set("/\:!")
 
+# The default upper bound on the number of bytes read (and held) at once by
+# CompoundFile.extract_all.
+_EXTRACT_BUFFER_SIZE = 1048576
+
+# The maximum number of output files CompoundFile.extract_all keeps open.
+_EXTRACT_MAX_OPEN_FILES = 64
+
+# The number of bytes CompoundFile.hash_streams feeds the hashers at once.
+_HASH_CHUNK_SIZE = 65536
+
+# The default number of decoded sectors a LazyFAT keeps in memory.
+_FAT_CACHE_SIZE = 64
+
+# The maximum number of metadata sectors (DIFAT, FAT, mini FAT, directory)
+# read while parsing, when not in strict mode.
+_DEFAULT_MAX_SECTORS = 1 << 20
+
+# The maximum length of a sector chain, when not in strict mode.
+_DEFAULT_MAX_CHAIN_LENGTH = 1 << 23
+
+# The maximum number of directory entries, when not in strict mode.
+_DEFAULT_MAX_DIR_ENTRIES = 1 << 16
+
+# The maximum number of metadata bytes read while parsing, when not in strict
+# mode.
+_DEFAULT_MAX_BYTES = 1 << 28
+
 class CompoundFile():
     """Represents an OLE structured storage file (compound file binary).
 
@@ -72,11 +106,13 @@ class CompoundFile():
 
     .. attribute:: fat
 
-        A list of entries from the FAT.
+        A list of entries from the FAT.  If the compound file was opened with
+        ``lazy_fat=True`` this is a :class:`LazyFAT` object instead.
 
     .. attribute:: mini_fat
 
-        A list of entries from the mini FAT.
+        A list of entries from the mini FAT.  If the compound file was opened
+        with ``lazy_fat=True`` this is a :class:`LazyFAT` object instead.
 
     .. attribute:: mini_stream
 
@@ -97,13 +133,39 @@ class CompoundFile():
 
         A dictionary of directory entries, found by traversing the RB tree.
 
+    .. attribute:: name_index
+
+        A dictionary mapping the names of the (valid) directory entries to
+        their stream identifiers.  If a name is used more than once, the
+        last directory entry with that name is used.
+
     .. attribute:: cfb_stream
 
         A stream covering the contents of the file.
 
+    .. attribute:: strict
+
+        ``True`` if an exception is raised when a limit is exceeded or a
+        structure is damaged.
+
+    .. attribute:: limits
+
+        A :class:`Limits` object describing the most work to do while
+        parsing.
+
+    .. attribute:: truncated
+
+        A list of (structure, reason) tuples describing what was cut short
+        while parsing (only when :attr:`strict` is ``False``).  The reason is
+        the name of the exceeded limit (e.g. ``"max_sectors"``), or one of
+        ``"cycle"``, ``"missing"`` or ``"short_read"``.
+
     """
 
-    def __init__(self, stream, offset=None):
+    def __init__(
+        self, stream, offset=None, lazy_fat=False,
+        fat_cache_size=_FAT_CACHE_SIZE, strict=True, limits=None
+    ):
         """Initializes a :class:`CompoundFile` object.
 
         :type stream: :class:`lf.dec.IStream`
@@ -112,7 +174,47 @@ class CompoundFile():
         :type offset: ``int``
         :param offset: The start of the compound file in the stream.
 
+        :type lazy_fat: ``bool``
+        :param lazy_fat: If ``True``, sectors of the FAT and mini FAT are only
+                         read (and decoded) the first time an entry in them is
+                         needed, instead of all at once.
+
+        :type fat_cache_size: ``int``
+        :param fat_cache_size: The maximum number of decoded FAT (and mini
+                               FAT) sectors to keep in memory, when
+                               :attr:`lazy_fat` is ``True``.
+
+        :type strict: ``bool``
+        :param strict: If ``False``, parsing stops early (instead of raising
+                       an exception) when a limit is exceeded, or a structure
+                       is damaged.  What was cut short is recorded in
+                       :attr:`truncated`.
+
+        :type limits: :class:`Limits`
+        :param limits: The most work to do while parsing.  If this is ``None``
+                       and :attr:`strict` is ``False``,
+                       :const:`DEFAULT_LIMITS` is used.  If this is ``None``
+                       and :attr:`strict` is ``True``, there are no limits.
+
+        :raises ValueError: If :attr:`strict` is ``True`` and a limit is
+                            exceeded, or a cycle is found in a chain.
+
         """
+        if limits is None:
+            if strict:
+                limits = Limits()
+            else:
+                limits = DEFAULT_LIMITS
+            # end if
+        # end if
+
+        truncated = list()
+        budget = _Budget(limits, strict, truncated)
+        self.truncated = truncated
+        self.limits = limits
+        self.strict = strict
+        self._budget = budget
+
         byte_offset = self.byte_offset
         fat = list()
         mini_fat = list()
@@ -133,6 +235,7 @@ class CompoundFile():
         self.fat = fat
         self.mini_fat = mini_fat
         self.cfb_stream = stream
+        self._mini_extents = None
         stream_len = stream.size
 
         entries_per_sect = sect_size // 4
@@ -146,13 +249,22 @@ class CompoundFile():
         if header.di_fat_sect_count and (header.di_fat_sect_offset < max_sect):
             di_fat_entries = di_fat_entry * entries_per_sect
             next_sect = header.di_fat_sect_offset
+            seen_sects = set()
 
             while (next_sect <= MAX_REG_SECT) and (next_sect < max_sect):
+                if next_sect in seen_sects:
+                    budget.exceeded("di_fat", "cycle")
+                    break
+                elif not budget.spend("di_fat", 1, sect_size):
+                    break
+                # end if
+
+                seen_sects.add(next_sect)
                 offset = (next_sect + 1) * sect_size
                 stream.seek(offset, SEEK_SET)
 
-                values = \
-                    di_fat_entries.from_buffer_copy(stream.read(sect_size))
+                data = budget.pad("di_fat", stream.read(sect_size), sect_size)
+                values = di_fat_entries.from_buffer_copy(data)
                 di_fat.extend(values[:-1])  # Don't include next_sect in di_fat
 
                 next_sect = values[-1]
@@ -191,19 +303,42 @@ class CompoundFile():
         sect_count = fat_stream.size // sect_size
         fat_entries = fat_entry * entries_per_sect
 
-        for sect_index in range(sect_count):
-            fat_stream.seek(sect_index * sect_size, SEEK_SET)
-            values = fat_entries.from_buffer_copy(fat_stream.read(sect_size))
-            fat.extend(values)
-        # end for
+        if lazy_fat:
+            fat = LazyFAT(fat_stream, sect_size, fat_cache_size)
+            self.fat = fat
+        else:
+            for sect_index in range(sect_count):
+                if not budget.spend("fat", 1, sect_size):
+                    break
+                # end if
+
+                fat_stream.seek(sect_index * sect_size, SEEK_SET)
+                data = fat_stream.read(sect_size)
+                data = budget.pad("fat", data, sect_size)
+                values = fat_entries.from_buffer_copy(data)
+                fat.extend(values)
+            # end for
+        # end if
 
 
         # Create the mini fat
         if header.mini_fat_sect_count != 0:
             # First we need the sector chain
-            mini_fat_chain = self.get_fat_chain(header.mini_fat_sect_offset)
+            try:
+                mini_fat_chain = \
+                    self.get_fat_chain(header.mini_fat_sect_offset)
+            except IndexError:
+                if strict:
+                    raise
+                # end if
 
-            if len(mini_fat_chain) == 1:
+                budget.exceeded("mini_fat", "missing")
+                mini_fat_chain = list()
+            # end try
+
+            if not mini_fat_chain:
+                mini_fat_stream = ByteIStream(b"")
+            elif len(mini_fat_chain) == 1:
                 start = byte_offset(header.mini_fat_sect_offset)
                 mini_fat_stream = SubsetIStream(stream, start, sect_size)
             else:
@@ -236,36 +371,60 @@ class CompoundFile():
             sect_count = mini_fat_stream.size // sect_size
             mini_fat_entries = mini_fat_entry * entries_per_sect
 
-            for sect_index in range(sect_count):
-                mini_fat_stream.seek(sect_index * sect_size, SEEK_SET)
-                data = mini_fat_stream.read(sect_size)
-                values = mini_fat_entries.from_buffer_copy(data)
-                mini_fat.extend(values)
-            # end for
+            if lazy_fat:
+                mini_fat = \
+                    LazyFAT(mini_fat_stream, sect_size, fat_cache_size)
+                self.mini_fat = mini_fat
+            else:
+                for sect_index in range(sect_count):
+                    if not budget.spend("mini_fat", 1, sect_size):
+                        break
+                    # end if
+
+                    mini_fat_stream.seek(sect_index * sect_size, SEEK_SET)
+                    data = mini_fat_stream.read(sect_size)
+                    data = budget.pad("mini_fat", data, sect_size)
+                    values = mini_fat_entries.from_buffer_copy(data)
+                    mini_fat.extend(values)
+                # end for
+            # end if
         # end if
 
 
         # Create the directory stream.  First we need the sector chain.
-        dir_chain = self.get_fat_chain(header.dir_sect_offset)
+        try:
+            dir_chain = self.get_fat_chain(header.dir_sect_offset)
+        except IndexError:
+            if strict:
+                raise
+            # end if
+
+            budget.exceeded("dir_stream", "missing")
+            dir_chain = list()
+        # end try
 
         # Create a list of sector runs from the directory chain
         runs = list()
-        start = byte_offset(dir_chain[0])
-        count = 1
 
-        for entry in dir_chain[1:]:
-            if (entry - prev_entry) == 1:
-                count += 1
+        if dir_chain:
+            start = byte_offset(dir_chain[0])
+            prev_entry = dir_chain[0]
+            count = 1
+
+            for entry in dir_chain[1:]:
+                if (entry - prev_entry) == 1:
+                    count += 1
+                else:
+                    runs.append((start, count * sect_size))
+                    start = byte_offset(entry)
+                    count = 1
+                # end if
+
+                prev_entry = entry
             else:
                 runs.append((start, count * sect_size))
-                start = byte_offset(entry)
-                count = 1
-            # end if
-
-            prev_entry = entry
-        else:
-            runs.append((start, count * sect_size))
-        # end for
+            # end for
+        # end if
 
         # Create the dir_stream attribute
         segments = [(stream, run[0], run[1]) for run in runs]
@@ -282,16 +441,47 @@ class CompoundFile():
 
         # Create the dir_entries attribute by traversing the rb-tree
         dir_entries = dict()
+        entries_per_dir_sect = max(sect_size // 128, 1)
         for sid in range(max_dir_entry):
-            dir_entries[sid] = DirEntry.from_stream(dir_stream, sid * 128)
+            if (sid % entries_per_dir_sect) == 0:
+                sects_spent = 1
+            else:
+                sects_spent = 0
+            # end if
+
+            if not budget.spend("dir_entries", sects_spent, 128, 1):
+                break
+            # end if
+
+            try:
+                dir_entries[sid] = DirEntry.from_stream(dir_stream, sid * 128)
+            except ValueError:
+                # The directory stream extends past the end of the file
+                if strict:
+                    raise
+                # end if
+
+                budget.exceeded("dir_entries", "short_read")
+                break
+            # end try
         # end for
 
-        self.root_dir_entry = dir_entries[0]
+        name_index = dict()
+        for (sid, entry) in dir_entries.items():
+            if entry.type == STGTY_INVALID:
+                continue
+            # end if
+
+            name_index[entry.name] = sid
+        # end for
+
+        self.root_dir_entry = dir_entries.get(0)
         self.dir_entries = dir_entries
+        self.name_index = name_index
 
 
         # Create the mini stream
-        if header.mini_fat_sect_count:
+        if header.mini_fat_sect_count and (0 in dir_entries):
             self.mini_stream = self.get_stream(0, slack=True)
         else:
             self.mini_stream = ByteIStream(b"")
@@ -333,6 +523,9 @@ class CompoundFile():
         :raises IndexError: If :attr:`first_sect` is beyond the size of the
                             file.
 
+        :raises ValueError: If the chain has a cycle, or is longer than
+                            allowed by :attr:`limits` (strict mode only).
+
         :rtype: list
         :returns: The sector chain from the FAT.
 
@@ -346,10 +539,16 @@ class CompoundFile():
 
         chain = [first_sect]
         entry = fat[first_sect]
+        max_len = self._budget.max_chain_length(fat_len)
 
         while (entry < fat_len) and (entry not in \
          (FAT_EOC, FAT_UNALLOC, FAT_FAT_SECT, FAT_DIF_SECT)):
 
+            if len(chain) >= max_len:
+                self._budget.exceeded_chain("fat_chain", len(chain), fat_len)
+                break
+            # end if
+
             chain.append(entry)
             entry = fat[entry]
         # end while
@@ -367,6 +566,9 @@ class CompoundFile():
         :raises IndexError: If :attr:`first_mini_sect` is beyond the size of
                             the mini FAT.
 
+        :raises ValueError: If the chain has a cycle, or is longer than
+                            allowed by :attr:`limits` (strict mode only).
+
         :rtype: list
         :returns: The sector chain from the mini FAT.
 
@@ -381,10 +583,18 @@ class CompoundFile():
 
         chain = [first_mini_sect]
         entry = mini_fat[first_mini_sect]
+        max_len = self._budget.max_chain_length(mini_fat_len)
 
         while (entry < mini_fat_len) and (entry not in \
          (FAT_EOC, FAT_UNALLOC, FAT_FAT_SECT, FAT_DIF_SECT)):
 
+            if len(chain) >= max_len:
+                self._budget.exceeded_chain(
+                    "mini_fat_chain", len(chain), mini_fat_len
+                )
+                break
+            # end if
+
             chain.append(entry)
             entry = mini_fat[entry]
         # end while
@@ -545,8 +755,757 @@ class CompoundFile():
 
         return SubsetIStream(CompositeIStream(segments), 0, stream_size)
     # end def get_stream
+
+    def _get_extents(self, sid, slack=False):
+        """Maps the contents of a stream to byte ranges in :attr:`cfb_stream`.
+
+        :type sid: ``int``
+        :param sid: The stream identifier for the directory entry associated
+                    with the stream.
+
+        :type slack: ``bool``
+        :param slack: If ``True``, the extents cover the entire stream
+                      (including slack), otherwise they are truncated at the
+                      size specified by the associated directory entry.
+
+        :raises IndexError: If :attr:`sid` is out of range.
+
+        :rtype: ``list``
+        :returns: A list of (physical offset, size, logical offset) tuples, in
+                  logical order.
+
+        """
+        dir_entry = self.get_dir_entry(sid)
+
+        is_mini = (sid != 0) and \
+            (dir_entry.stream_size < self.mini_stream_cutoff)
+
+        if is_mini:
+            get_chain = self.get_mini_fat_chain
+            byte_offset = self.mini_byte_offset
+            sect_size = self.mini_sect_size
+        else:
+            get_chain = self.get_fat_chain
+            byte_offset = self.byte_offset
+            sect_size = self.sect_size
+        # end if
+
+        try:
+            chain = get_chain(dir_entry.stream_sect_offset)
+        except IndexError:
+            return list()
+        # end try
+
+        if slack:
+            bytes_left = len(chain) * sect_size
+        else:
+            bytes_left = dir_entry.stream_size
+            if self.ver_major == 0x3:
+                bytes_left = bytes_left & 0x00000000FFFFFFFF
+            # end if
+        # end if
+
+        # Coalesce the chain into runs of contiguous sectors.
+        runs = list()
+        start = byte_offset(chain[0])
+        prev_entry = chain[0]
+        count = 1
+
+        for entry in chain[1:]:
+            if (entry - prev_entry) == 1:
+                count += 1
+            else:
+                runs.append((start, count * sect_size))
+                start = byte_offset(entry)
+                count = 1
+            # end if
+
+            prev_entry = entry
+        else:
+            runs.append((start, count * sect_size))
+        # end for
+
+        extents = list()
+        logical = 0
+        for (start, size) in runs:
+            if bytes_left <= 0:
+                break
+            # end if
+
+            size = min(size, bytes_left)
+            extents.append((start, size, logical))
+            logical += size
+            bytes_left -= size
+        # end for
+
+        if not is_mini:
+            return extents
+        # end if
+
+        # Extents in the mini stream have to be translated through the extents
+        # of the mini stream itself (which lives in the root entry's chain).
+        mini_extents = self._mini_extents
+        if mini_extents is None:
+            mini_extents = self._get_extents(0, slack=True)
+            self._mini_extents = mini_extents
+        # end if
+
+        phys_extents = list()
+
+        for (start, size, logical) in extents:
+            for (mini_phys, mini_size, mini_logical) in mini_extents:
+                if size <= 0:
+                    break
+                # end if
+
+                mini_stop = mini_logical + mini_size
+                if start >= mini_stop:
+                    continue
+                # end if
+
+                piece_size = min(size, mini_stop - start)
+                phys_extents.append((
+                    mini_phys + (start - mini_logical), piece_size, logical
+                ))
+
+                start += piece_size
+                logical += piece_size
+                size -= piece_size
+            # end for
+        # end for
+
+        return phys_extents
+    # end def _get_extents
+
+    def extract_all(
+        self, output, slack=False, sids=None,
+        buffer_size=_EXTRACT_BUFFER_SIZE
+    ):
+        """Extracts the contents of many streams in one (mostly) sequential
+        pass over the compound file.
+
+        The sectors of every stream are sorted by their physical location, and
+        read in order, so the underlying file is swept from start to end
+        instead of once per stream.  At most :attr:`buffer_size` bytes are
+        read (and held in memory) at once.
+
+        If :attr:`output` is a ``str``, it is the name of an (existing)
+        directory, and the contents of each stream are written to a file
+        named after the stream identifier.  Otherwise :attr:`output` is
+        called as ``output(sid, offset, data)`` for each piece of each stream,
+        where ``offset`` is the position of ``data`` within the stream.
+        Pieces are *not* delivered in stream order.
+
+        :type output: ``str`` or callable
+        :param output: The output directory, or a callback.
+
+        :type slack: ``bool``
+        :param slack: If ``True``, the slack space of each stream is also
+                      extracted.
+
+        :type sids: iterable of ``int``
+        :param sids: The stream identifiers of the streams to extract.  If
+                     this is ``None``, all streams (entries of type
+                     :const:`STGTY_STREAM`) are extracted.
+
+        :type buffer_size: ``int``
+        :param buffer_size: The maximum number of bytes to read at once.
+
+        :raises IndexError: If an element of :attr:`sids` is out of range.
+
+        :rtype: :class:`ExtractionStats`
+        :returns: Statistics about the extraction.
+
+        """
+        start_time = perf_counter()
+
+        if sids is None:
+            sids = [
+                sid for (sid, entry) in self.dir_entries.items()
+                if entry.type == STGTY_STREAM
+            ]
+        # end if
+
+        pieces = list()
+        for sid in sids:
+            for (phys, size, logical) in self._get_extents(sid, slack):
+                # Break up extents so no single read exceeds buffer_size
+                while size > buffer_size:
+                    pieces.append((phys, buffer_size, sid, logical))
+                    phys += buffer_size
+                    logical += buffer_size
+                    size -= buffer_size
+                # end while
+
+                pieces.append((phys, size, sid, logical))
+            # end for
+        # end for
+        pieces.sort()
+
+        if isinstance(output, str):
+            writer = _DirectoryWriter(output, sids)
+            callback = writer.write
+        else:
+            writer = None
+            callback = output
+        # end if
+
+        stream = self.cfb_stream
+        sect_size = self.sect_size
+        byte_count = 0
+        index = 0
+        pieces_len = len(pieces)
+
+        try:
+            while index < pieces_len:
+                # Group pieces that are (nearly) adjacent into a single read.
+                window_start = pieces[index][0]
+                window_stop = window_start + pieces[index][1]
+                next_index = index + 1
+
+                while next_index < pieces_len:
+                    (phys, size) = pieces[next_index][:2]
+                    if ((phys - window_stop) > sect_size) or \
+                        ((phys + size - window_start) > buffer_size):
+                        break
+                    # end if
+
+                    window_stop = max(window_stop, phys + size)
+                    next_index += 1
+                # end while
+
+                stream.seek(window_start, SEEK_SET)
+                window = memoryview(stream.read(window_stop - window_start))
+
+                for (phys, size, sid, logical) in pieces[index:next_index]:
+                    rel_start = phys - window_start
+                    data = bytes(window[rel_start:rel_start + size])
+                    if data:
+                        callback(sid, logical, data)
+                        byte_count += len(data)
+                    # end if
+                # end for
+
+                index = next_index
+            # end while
+        finally:
+            if writer is not None:
+                writer.close()
+            # end if
+        # end try
+
+        elapsed = perf_counter() - start_time
+        if elapsed > 0:
+            rate = (byte_count / 1048576.0) / elapsed
+        else:
+            rate = 0.0
+        # end if
+
+        return ExtractionStats((len(sids), byte_count, elapsed, rate))
+    # end def extract_all
+
+    def get_paths(self):
+        """Calculates the storage path of each reachable directory entry.
+
+        The paths are found by traversing the red-black trees, starting at the
+        child of the root directory entry.  Path components are separated by
+        ``"/"`` and the root directory entry is not included, so a stream
+        named ``WordDocument`` in the root storage has the path
+        ``"WordDocument"``.
+
+        :rtype: ``dict``
+        :returns: A dictionary of paths, keyed by stream identifier.
+
+        """
+        dir_entries = self.dir_entries
+        paths = dict()
+        seen_sids = set([0])
+
+        if self.root_dir_entry is None:
+            return paths
+        # end if
+
+        # A stack of (sid, parent path) tuples still to be visited.
+        stack = [(self.root_dir_entry.child_sid, "")]
+
+        while stack:
+            (sid, parent_path) = stack.pop()
+
+            if (sid not in dir_entries) or (sid in seen_sids):
+                continue
+            # end if
+
+            seen_sids.add(sid)
+            entry = dir_entries[sid]
+
+            name = entry.name
+            if not isinstance(name, str):
+                name = repr(name)
+            # end if
+
+            path = "".join([parent_path, name])
+            paths[sid] = path
+
+            stack.append((entry.right_sid, parent_path))
+            stack.append((entry.left_sid, parent_path))
+            stack.append((entry.child_sid, "".join([path, "/"])))
+        # end while
+
+        return paths
+    # end def get_paths
+
+    def hash_streams(
+        self, algorithms=("md5", "sha1", "sha256"), slack=False,
+        chunk_size=_HASH_CHUNK_SIZE
+    ):
+        """Hashes the contents of every stream in the compound file.
+
+        Each stream is read in chunks of at most :attr:`chunk_size` bytes,
+        and every chunk is fed to all of the requested hash algorithms, so
+        memory use does not depend on the size of the streams.  Streams are
+        visited in the order of their first sector in the file.
+
+        :type algorithms: iterable of ``str``
+        :param algorithms: The names of the hash algorithms to use (as
+                           accepted by :func:`hashlib.new`).
+
+        :type slack: ``bool``
+        :param slack: If ``True``, the slack space of each stream is included
+                      in the hash (the same contents as
+                      ``get_stream(sid, slack=True)``).
+
+        :type chunk_size: ``int``
+        :param chunk_size: The maximum number of bytes to read at once.
+
+        :raises ValueError: If an algorithm is not supported by
+                            :mod:`hashlib`.
+
+        :rtype: ``dict``
+        :returns: A dictionary keyed by storage path (see :meth:`get_paths`).
+                  The values are dictionaries of hex digests, keyed by
+                  algorithm name.
+
+        """
+        algorithms = tuple(algorithms)
+        dir_entries = self.dir_entries
+        stream = self.cfb_stream
+
+        # Check the algorithms before doing any work
+        for algorithm in algorithms:
+            hashlib.new(algorithm)
+        # end for
+
+        plan = list()
+        for (sid, path) in self.get_paths().items():
+            if dir_entries[sid].type != STGTY_STREAM:
+                continue
+            # end if
+
+            extents = self._get_extents(sid, slack)
+            if extents:
+                plan.append((extents[0][0], sid, path, extents))
+            else:
+                plan.append((0, sid, path, extents))
+            # end if
+        # end for
+        plan.sort()
+
+        manifest = dict()
+        for (first_offset, sid, path, extents) in plan:
+            hashers = [hashlib.new(algorithm) for algorithm in algorithms]
+
+            for (phys, size, logical) in extents:
+                stream.seek(phys, SEEK_SET)
+
+                while size > 0:
+                    data = stream.read(min(size, chunk_size))
+                    if not data:
+                        break
+                    # end if
+
+                    for hasher in hashers:
+                        hasher.update(data)
+                    # end for
+
+                    size -= len(data)
+                # end while
+            # end for
+
+            manifest[path] = dict(zip(
+                algorithms, [hasher.hexdigest() for hasher in hashers]
+            ))
+        # end for
+
+        return manifest
+    # end def hash_streams
 # end class CompoundFile
 
+class ExtractionStats(Structuple):
+    """Statistics from :meth:`CompoundFile.extract_all`.
+
+    .. attribute:: stream_count
+
+        The number of streams that were extracted.
+
+    .. attribute:: byte_count
+
+        The total number of bytes that were extracted.
+
+    .. attribute:: elapsed
+
+        The time (in seconds) the extraction took.
+
+    .. attribute:: rate
+
+        The throughput of the extraction, in MB/s.
+
+    """
+    _fields_ = ("stream_count", "byte_count", "elapsed", "rate")
+    __slots__ = ()
+# end class ExtractionStats
+
+class Limits():
+    """Describes the most work to do while parsing a compound file.
+
+    A value of ``None`` means there is no limit.
+
+    .. attribute:: max_sectors
+
+        The maximum number of metadata (DIFAT, FAT, mini FAT and directory)
+        sectors to read while parsing.
+
+    .. attribute:: max_chain_length
+
+        The maximum number of sectors in a chain from the FAT or mini FAT.
+
+    .. attribute:: max_dir_entries
+
+        The maximum number of directory entries to read.
+
+    .. attribute:: max_bytes
+
+        The maximum number of metadata bytes to read while parsing.
+
+    """
+
+    def __init__(
+        self, max_sectors=None, max_chain_length=None, max_dir_entries=None,
+        max_bytes=None
+    ):
+        """Initializes a :class:`Limits` object.
+
+        :type max_sectors: ``int``
+        :param max_sectors: The maximum number of metadata sectors to read.
+
+        :type max_chain_length: ``int``
+        :param max_chain_length: The maximum number of sectors in a chain.
+
+        :type max_dir_entries: ``int``
+        :param max_dir_entries: The maximum number of directory entries.
+
+        :type max_bytes: ``int``
+        :param max_bytes: The maximum number of metadata bytes to read.
+
+        """
+        self.max_sectors = max_sectors
+        self.max_chain_length = max_chain_length
+        self.max_dir_entries = max_dir_entries
+        self.max_bytes = max_bytes
+    # end def __init__
+# end class Limits
+
+DEFAULT_LIMITS = Limits(
+    _DEFAULT_MAX_SECTORS, _DEFAULT_MAX_CHAIN_LENGTH, _DEFAULT_MAX_DIR_ENTRIES,
+    _DEFAULT_MAX_BYTES
+)
+
+class _Budget():
+    """Keeps track of the work done while parsing a compound file.
+
+    .. attribute:: sectors
+
+        The number of metadata sectors read so far.
+
+    .. attribute:: bytes
+
+        The number of metadata bytes read so far.
+
+    .. attribute:: dir_entries
+
+        The number of directory entries read so far.
+
+    """
+
+    def __init__(self, limits, strict, truncated):
+        """Initializes a :class:`_Budget` object.
+
+        :type limits: :class:`Limits`
+        :param limits: The limits to enforce.
+
+        :type strict: ``bool``
+        :param strict: If ``True``, exceeding a limit raises a ``ValueError``.
+
+        :type truncated: ``list``
+        :param truncated: A list to record what was truncated in.
+
+        """
+        self.limits = limits
+        self.strict = strict
+        self.truncated = truncated
+        self.sectors = 0
+        self.bytes = 0
+        self.dir_entries = 0
+    # end def __init__
+
+    def exceeded(self, what, reason):
+        """Records that parsing of a structure was cut short.
+
+        :raises ValueError: If in strict mode.
+
+        """
+        if self.strict:
+            raise ValueError("{0}: {1}".format(what, reason))
+        # end if
+
+        if (what, reason) not in self.truncated:
+            self.truncated.append((what, reason))
+        # end if
+    # end def exceeded
+
+    def spend(self, what, sectors=0, bytes_=0, dir_entries=0):
+        """Accounts for work, if it fits in the limits.
+
+        :rtype: ``bool``
+        :returns: ``True`` if the work fits in the limits.
+
+        """
+        limits = self.limits
+        new_sectors = self.sectors + sectors
+        new_bytes = self.bytes + bytes_
+        new_dir_entries = self.dir_entries + dir_entries
+
+        if (limits.max_sectors is not None) and \
+            (new_sectors > limits.max_sectors):
+
+            self.exceeded(what, "max_sectors")
+            return False
+        elif (limits.max_bytes is not None) and \
+            (new_bytes > limits.max_bytes):
+
+            self.exceeded(what, "max_bytes")
+            return False
+        elif (limits.max_dir_entries is not None) and \
+            (new_dir_entries > limits.max_dir_entries):
+
+            self.exceeded(what, "max_dir_entries")
+            return False
+        # end if
+
+        self.sectors = new_sectors
+        self.bytes = new_bytes
+        self.dir_entries = new_dir_entries
+
+        return True
+    # end def spend
+
+    def pad(self, what, data, size):
+        """Pads a short read with unallocated (0xFF) bytes.
+
+        In strict mode :attr:`data` is returned unchanged.
+
+        """
+        if self.strict or (len(data) >= size):
+            return data
+        # end if
+
+        self.exceeded(what, "short_read")
+        return b"".join([data, b"\xFF" * (size - len(data))])
+    # end def pad
+
+    def max_chain_length(self, table_len):
+        """Calculates the maximum length of a chain in a FAT.
+
+        A chain with more entries than the FAT has must have a cycle.
+
+        """
+        max_len = self.limits.max_chain_length
+        if (max_len is None) or (max_len > table_len):
+            return table_len
+        # end if
+
+        return max_len
+    # end def max_chain_length
+
+    def exceeded_chain(self, what, chain_len, table_len):
+        """Records that a chain was cut short."""
+
+        if chain_len >= table_len:
+            self.exceeded(what, "cycle")
+        else:
+            self.exceeded(what, "max_chain_length")
+        # end if
+    # end def exceeded_chain
+# end class _Budget
+
+class LazyFAT():
+    """A read-only sequence of FAT (or mini FAT) entries, that are decoded on
+    demand.
+
+    Sectors of the FAT are read and decoded the first time an entry in them is
+    accessed.  A bounded number of decoded sectors are cached, with the least
+    recently used sector discarded first.
+
+    .. attribute:: sect_size
+
+        The number of bytes in a sector.
+
+    .. attribute:: cache_size
+
+        The maximum number of decoded sectors to keep in memory.
+
+    """
+
+    def __init__(self, stream, sect_size, cache_size=_FAT_CACHE_SIZE):
+        """Initializes a :class:`LazyFAT` object.
+
+        :type stream: :class:`lf.dec.IStream`
+        :param stream: A stream covering the contents of the FAT.
+
+        :type sect_size: ``int``
+        :param sect_size: The number of bytes in a sector.
+
+        :type cache_size: ``int``
+        :param cache_size: The maximum number of decoded sectors to keep in
+                           memory.
+
+        """
+        entries_per_sect = sect_size // 4
+
+        self.sect_size = sect_size
+        self.cache_size = max(cache_size, 1)
+        self._stream = stream
+        self._entries_per_sect = entries_per_sect
+        self._sect_entries = fat_entry * entries_per_sect
+        self._len = (stream.size // sect_size) * entries_per_sect
+        self._cache = OrderedDict()
+    # end def __init__
+
+    def __len__(self):
+        """len(self)"""
+
+        return self._len
+    # end def __len__
+
+    def __getitem__(self, index):
+        """self[index]"""
+
+        if index < 0:
+            index += self._len
+        # end if
+
+        if (index < 0) or (index >= self._len):
+            raise IndexError("FAT index {0} out of range".format(index))
+        # end if
+
+        (sect_index, entry_index) = divmod(index, self._entries_per_sect)
+        cache = self._cache
+
+        if sect_index in cache:
+            values = cache.pop(sect_index)
+        else:
+            if len(cache) >= self.cache_size:
+                cache.popitem(last=False)
+            # end if
+
+            sect_size = self.sect_size
+            stream = self._stream
+            stream.seek(sect_index * sect_size, SEEK_SET)
+            data = stream.read(sect_size)
+
+            # Treat a truncated sector as unallocated entries
+            if len(data) < sect_size:
+                data = b"".join([data, b"\xFF" * (sect_size - len(data))])
+            # end if
+
+            values = self._sect_entries.from_buffer_copy(data)
+        # end if
+
+        cache[sect_index] = values
+        return values[entry_index]
+    # end def __getitem__
+
+    def __iter__(self):
+        """iter(self)"""
+
+        for index in range(self._len):
+            yield self[index]
+        # end for
+    # end def __iter__
+# end class LazyFAT
+
+class _DirectoryWriter():
+    """Writes pieces of streams to files in a directory.
+
+    Only a bounded number of files are kept open at once.
+
+    """
+
+    def __init__(self, directory, sids):
+        """Initializes a :class:`_DirectoryWriter` object.
+
+        :type directory: ``str``
+        :param directory: The directory to write the files to.
+
+        :type sids: iterable of ``int``
+        :param sids: The stream identifiers that will be written.  The
+                     corresponding files are created (and truncated).
+
+        """
+        self.directory = directory
+        self.open_files = OrderedDict()
+
+        for sid in sids:
+            open(self.get_path(sid), "wb").close()
+        # end for
+    # end def __init__
+
+    def get_path(self, sid):
+        """Calculates the name of the file for a stream identifier."""
+
+        return os.path.join(self.directory, str(sid))
+    # end def get_path
+
+    def write(self, sid, offset, data):
+        """Writes data to the file for a stream at a specific offset."""
+
+        open_files = self.open_files
+
+        if sid in open_files:
+            ofile = open_files.pop(sid)
+        else:
+            if len(open_files) >= _EXTRACT_MAX_OPEN_FILES:
+                open_files.popitem(last=False)[1].close()
+            # end if
+
+            ofile = open(self.get_path(sid), "r+b")
+        # end if
+
+        open_files[sid] = ofile
+        ofile.seek(offset)
+        ofile.write(data)
+    # end def write
+
+    def close(self):
+        """Closes all open files."""
+
+        for ofile in self.open_files.values():
+            ofile.close()
+        # end for
+
+        self.open_files.clear()
+    # end def close
+# end class _DirectoryWriter
+
 class Header(ActiveStructuple):
     """Represents the header from a compound file binary.
 
@@ -651,10 +1610,9 @@ class Header(ActiveStructuple):
             stream.seek(offset, SEEK_SET)
         # end if
 
-        head = header.from_buffer_copy(stream.read(512))
-
-        clsid = head.clsid
-        clsid = CLSIDToUUID.from_ctype(clsid)
+        data = stream.read(512)
+        head = header.from_buffer_copy(data)
+        clsid = CLSIDToUUID.from_buffer(data, 8)
 
         return Header((
             bytes(head.sig), clsid, head.ver_minor, head.ver_major,
@@ -754,7 +1712,8 @@ class DirEntry(ActiveStructuple):
             stream.seek(offset, SEEK_SET)
         # end if
 
-        values = dir_entry.from_buffer_copy(stream.read(128))
+        data = stream.read(128)
+        values = dir_entry.from_buffer_copy(data)
 
         name = bytes(values.name)
         if values.name_size <= 64:
@@ -766,7 +1725,7 @@ class DirEntry(ActiveStructuple):
             name = new_name.split("\x00", 1)[0]
         # end if
 
-        clsid = CLSIDToUUID.from_ctype(values.clsid)
+        clsid = CLSIDToUUID.from_buffer(data, 80)
 
         btime = values.btime
         try:
@@ -19,15 +19,15 @@
 from lf.win.ole.ps.objects import (
     Packet, ActivePacket, PropertyPacket, ValuePacket, PropertySetStreamHeader,
     PropertySetHeader, Dictionary, DictionaryEntry, CURRENCY, DATE,
-    CodePageString, DECIMAL, UnicodeString, FILETIME, BLOB,
+    CodePageString, DECIMAL, UnicodeString, FILETIME, Payload, BLOB,
     IndirectPropertyName, ClipboardData, GUID, VersionedStream, HRESULT, Array,
     Vector, Sequence, TypedPropertyValue, VT_EMPTY, VT_NULL, VT_I2, VT_I4,
     VT_R4, VT_R8, VT_CY, VT_DATE, VT_LPSTR, VT_ERROR, VT_BOOL, VT_DECIMAL,
     VT_I1, VT_UI1, VT_UI2, VT_UI4, VT_I8, VT_UI8, VT_INT, VT_UINT, VT_BSTR,
     VT_LPWSTR, VT_FILETIME, VT_BLOB, VT_STREAM, VT_STORAGE, VT_STREAMED_OBJECT,
     VT_STORED_OBJECT, VT_BLOB_OBJECT, VT_CF, VT_CLSID, VT_VERSIONED_STREAM,
-    VT_ARRAY, VT_VECTOR, PropertyFactory, PropertySet, PropertySetStream,
-    Builder
+    VT_ARRAY, VT_VECTOR, PropertyFactory, LazyProperties, PropertySet,
+    PropertySetStream, Builder
 )
 from lf.win.ole.ps.metadata import PropertySetMetadata, PropertiesMetadata
 
@@ -35,7 +35,7 @@ __all__ = [
     "Packet", "ActivePacket", "PropertyPacket", "ValuePacket",
     "PropertySetStreamHeader", "PropertySetHeader", "Dictionary",
     "DictionaryEntry", "CURRENCY", "DATE", "CodePageString", "DECIMAL",
-    "UnicodeString", "FILETIME", "BLOB", "IndirectPropertyName",
+    "UnicodeString", "FILETIME", "Payload", "BLOB", "IndirectPropertyName",
     "ClipboardData", "GUID", "VersionedStream", "HRESULT", "Array", "Vector",
     "Sequence", "TypedPropertyValue", "VT_EMPTY", "VT_NULL", "VT_I2", "VT_I4",
     "VT_R4", "VT_R8", "VT_CY", "VT_DATE", "VT_LPSTR", "VT_ERROR", "VT_BOOL",
@@ -43,6 +43,7 @@ __all__ = [
     "VT_INT", "VT_UINT", "VT_BSTR", "VT_LPWSTR", "VT_FILETIME", "VT_BLOB",
     "VT_STREAM", "VT_STORAGE", "VT_STREAMED_OBJECT", "VT_STORED_OBJECT",
     "VT_BLOB_OBJECT", "VT_CF", "VT_CLSID", "VT_VERSIONED_STREAM", "VT_ARRAY",
-    "VT_VECTOR", "PropertyFactory", "PropertySet", "PropertySetStream",
+    "VT_VECTOR", "PropertyFactory", "LazyProperties", "PropertySet",
+    "PropertySetStream",
     "Builder", "PropertySetMetadata", "PropertiesMetadata"
 ]
@@ -111,6 +111,12 @@ class PropertiesMetadata(Structuple):
 
         A set of the attribute names that were found in the property set.
 
+    .. attribute:: pids
+
+        The property identifiers used by :meth:`from_properties` (a class
+        attribute).  This can be passed as the ``pids`` argument of
+        :meth:`~lf.win.ole.ps.Builder.build`.
+
     """
 
     _fields_ = (
@@ -118,6 +124,8 @@ class PropertiesMetadata(Structuple):
     )
     _auto_slots_ = True
 
+    pids = frozenset(_pid_attr_map)
+
     @classmethod
     def from_properties(cls, properties):
         """Creates a :class:`PropertiesMetadata` object from properties.
@@ -133,10 +141,9 @@ class PropertiesMetadata(Structuple):
         attr_exists = set()
         properties_dict = dict()
 
-        for (pid, property) in properties.items():
-            if pid in _pid_attr_map:
-                attr_name = _pid_attr_map[pid]
-                properties_dict[attr_name] = property.value
+        for (pid, attr_name) in _pid_attr_map.items():
+            if pid in properties:
+                properties_dict[attr_name] = properties[pid].value
                 attr_exists.add(attr_name)
             # end if
         # end for
@@ -18,26 +18,33 @@
 """Objects for OLE property sets."""
 
 # stdlib imports
+import hashlib
+from mmap import mmap
+from array import array
 from codecs import getdecoder
+from collections.abc import Mapping
 from decimal import Decimal
 from ctypes import sizeof
 from functools import reduce
+from itertools import accumulate
 from operator import mul
+from struct import Struct, error as struct_error
+from sys import byteorder
 
 # local imports
-from lf.dec import SEEK_SET
+from lf.dec import SEEK_SET, SEEK_END, ByteIStream, SubsetIStream
 from lf.dtypes import Structuple, ActiveStructuple
 from lf.dtypes.ctypes import (
-    int8, uint8, uint16_le, int16_le, int32_le, uint32_le, int64_le,
-    uint64_le, float32_le, float64_le
+    uint32_le, uint64_le, float64_le
 )
 from lf.time import VariantTimeTodatetime, FILETIMETodatetime
 from lf.win.objects import (
     GUIDToUUID, DECIMALToDecimal, CURRENCYToDecimal, CLSIDToUUID
 )
 from lf.win.objects import HRESULT as HRESULT_
-from lf.win.ctypes import guid_le
-from lf.win.codepage.consts import CP_WINUNICODE, code_page_names
+from lf.win.ctypes import guid_le, hresult_le, decimal_le
+from lf.win.codepage import get_decoder
+from lf.win.codepage.consts import CP_WINUNICODE
 from lf.win.ole import varenum
 from lf.win.ole.ps.consts import (
     CODEPAGE_PROPERTY_IDENTIFIER, DICTIONARY_PROPERTY_IDENTIFIER
@@ -69,14 +76,174 @@ __all__ = [
     "VT_STREAM", "VT_STORAGE", "VT_STREAMED_OBJECT", "VT_BLOB_OBJECT", "VT_CF",
     "VT_CLSID", "VT_VERSIONED_STREAM", "VT_ARRAY", "VT_VECTOR", "Dictionary",
 
-    "CodePageString", "UnicodeString", "DictionaryEntry",
+    "CodePageString", "UnicodeString", "DictionaryEntry", "Payload",
 
-    "PropertyFactory", "Builder"
+    "PropertyFactory", "LazyProperties", "Builder"
 
 ]
 
 _utf16_le_decoder = getdecoder("utf_16_le")
 
+_tpv_header_struct = Struct("<H2x")
+_int64_le_struct = Struct("<q")
+_uint32_le_struct = Struct("<I")
+_uint64_le_struct = Struct("<Q")
+_float64_le_struct = Struct("<d")
+_property_set_header_struct = Struct("<II")
+_pid_offset_struct = Struct("<II")
+_dictionary_entry_header_struct = Struct("<II")
+_property_set_stream_header_struct = Struct("<HH4s16sI16sI")
+_fmtid_offset_struct = Struct("<16sI")
+_byteswap = (byteorder != "little")
+_payload_chunk_size = 65536
+
+# The bytes of a payload property read by Builder.build when the payload
+# itself is skipped: the type, the size, the ClipboardData format and the
+# first field of the data.
+_payload_header_size = 16
+
+def _unpack_from(struct, buf, offset=0):
+    """Unpacks a :class:`struct.Struct` from a buffer.
+
+    :raises ValueError: If :attr:`buf` is too small.
+
+    """
+
+    try:
+        return struct.unpack_from(buf, offset)
+    except struct_error as err:
+        raise ValueError(str(err))
+    # end try
+# end def _unpack_from
+
+def _type_from_buffer(buf, offset):
+    """Reads the property type of a TypedPropertyValue from a buffer."""
+
+    return _unpack_from(_tpv_header_struct, buf, offset)[0]
+# end def _type_from_buffer
+
+def _unpack_array(typecode, buf, offset, count):
+    """Unpacks a run of little endian values of the same type from a buffer.
+
+    :type typecode: ``str``
+    :param typecode: The :mod:`array` typecode of the values.
+
+    :raises ValueError: If :attr:`count` is negative or :attr:`buf` is too
+                        small.
+
+    :rtype: ``list``
+    :returns: A list of the unpacked values.
+
+    """
+
+    if count < 0:
+        raise ValueError("Array length must be >= 0")
+    # end if
+
+    values = array(typecode)
+    size = values.itemsize * count
+    data = memoryview(buf)[offset:offset + size]
+    if len(data) != size:
+        raise ValueError(
+            "Buffer too small ({0} < {1})".format(len(data), size)
+        )
+    # end if
+
+    values.frombytes(data)
+    if _byteswap:
+        values.byteswap()
+    # end if
+
+    return values.tolist()
+# end def _unpack_array
+
+def _split_strings(buf, offset, count, width=1, aligned=True):
+    """Splits a run of length prefixed strings from a buffer, in one pass.
+
+    Each string is a 32-bit length (in units of :attr:`width` bytes) followed
+    by the characters.  Splitting stops after :attr:`count` strings, at the
+    end of :attr:`buf`, or at the first truncated length field.
+
+    :type width: ``int``
+    :param width: The size of a character in bytes.
+
+    :type aligned: ``bool``
+    :param aligned: Whether each string is padded to a multiple of 4 bytes.
+
+    :rtype: ``tuple``
+    :returns: A (chunks, sizes) pair of lists, with the raw characters and the
+              size (in bytes, including the length field) of each string.
+
+    """
+
+    chunks = list()
+    sizes = list()
+    last = len(buf) - 4
+    unpack_from = _uint32_le_struct.unpack_from
+    pad = 3 if aligned else 0
+
+    while count and (offset <= last):
+        length = unpack_from(buf, offset)[0] * width
+        start = offset + 4
+        chunks.append(bytes(buf[start:start + length]))
+
+        size = ((length + pad) & ~pad) + 4
+        sizes.append(size)
+        offset += size
+        count -= 1
+    # end while
+
+    return (chunks, sizes)
+# end def _split_strings
+
+def _decode_strings(chunks, decoder):
+    """Decodes a list of strings, calling the codec once where possible.
+
+    The chunks are joined and decoded as a single batch.  If the batch can't
+    be split back along the chunk boundaries (e.g. a multi-byte character or
+    malformed input), each chunk is decoded on its own.  As with the
+    individual string parsers, a chunk that decodes to an empty string is
+    kept as ``bytes``.
+
+    :type chunks: ``list``
+    :param chunks: The raw bytes of each string.
+
+    :type decoder: :class:`codecs.codec`
+    :param decoder: The codec to decode the strings.
+
+    :rtype: ``list``
+    :returns: A list of the decoded strings.
+
+    """
+
+    if not chunks:
+        return list()
+    # end if
+
+    # The batch can only be split if every character came from exactly one
+    # code unit.
+    width = 2 if decoder is _utf16_le_decoder else 1
+
+    lengths = [len(chunk) for chunk in chunks]
+
+    if (width == 1) or not any([length % width for length in lengths]):
+        data = b"".join(chunks)
+        text = decoder(data, "ignore")[0]
+
+        if (len(text) * width) == len(data):
+            stops = list(accumulate([length // width for length in lengths]))
+            starts = [0] + stops[:-1]
+
+            return [
+                text[start:stop] or chunk
+                for (start, stop, chunk) in zip(starts, stops, chunks)
+            ]
+        # end if
+    # end if
+
+    return [decoder(chunk, "ignore")[0] or chunk for chunk in chunks]
+# end def _decode_strings
+
 class Packet():
     """Base class for packet types."""
 
@@ -220,6 +387,47 @@ class PropertySetStreamHeader(ActivePacket):
             offset1
         ))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`PropertySetStreamHeader` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the PropertySetStreamHeader
+                    structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :raises ValueError: If :attr:`buf` is too small.
+
+        :rtype: :class:`PropertySetStreamHeader`
+        :returns: The corresponding :class:`PropertySetStreamHeader` object.
+
+        """
+        (
+            byte_order, version, sys_id, clsid, property_set_count, fmtid0,
+            offset0
+        ) = _unpack_from(_property_set_stream_header_struct, buf, offset)
+
+        if property_set_count > 1:
+            (fmtid1, offset1) = _unpack_from(
+                _fmtid_offset_struct, buf,
+                offset + _property_set_stream_header_struct.size
+            )
+
+            fmtid1 = GUIDToUUID.from_buffer(fmtid1)
+        else:
+            fmtid1 = None
+            offset1 = None
+        # end if
+
+        return cls((
+            byte_order, version, sys_id, CLSIDToUUID.from_buffer(clsid),
+            property_set_count, GUIDToUUID.from_buffer(fmtid0), offset0,
+            fmtid1, offset1
+        ))
+    # end def from_buffer
 # end class PropertySetStreamHeader
 
 class PropertySetHeader(ActivePacket):
@@ -275,6 +483,37 @@ class PropertySetHeader(ActivePacket):
 
         return cls((header.size, count, pids_offsets))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`PropertySetHeader` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the PropertySetHeader structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :raises ValueError: If :attr:`buf` is too small.
+
+        :rtype: :class:`PropertySetHeader`
+        :returns: The corresponding :class:`PropertySetHeader` object.
+
+        """
+        (size, count) = _unpack_from(_property_set_header_struct, buf, offset)
+
+        offset += 8
+        end = offset + (count * 8)
+        if end > len(buf):
+            raise ValueError("buffer is too small for {0} pairs".format(count))
+        # end if
+
+        pids_offsets = dict(
+            _pid_offset_struct.iter_unpack(memoryview(buf)[offset:end])
+        )
+
+        return cls((size, count, pids_offsets))
+    # end def from_buffer
 # end class PropertySetHeader
 
 class PropertyPacket(ActivePacket):
@@ -377,6 +616,49 @@ class Dictionary(PropertyPacket):
 
         return cls((tot_size + 4, entries, count))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, code_page=None, decoder=None):
+        """Creates a :class:`Dictionary` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the Dictionary property.
+
+        :type offset: ``int``
+        :param offset: The start of the property in :attr:`buf`.
+
+        :type code_page: ``int``
+        :param code_page: The value of the CodePage property.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the names.
+
+        :raises ValueError: If :attr:`buf` is too small.
+
+        :rtype: :class:`Dictionary`
+        :returns: The corresponding :class:`Dictionary` object.
+
+        """
+        count = _unpack_from(_uint32_le_struct, buf, offset)[0]
+        offset += 4
+
+        entries = dict()
+        counter = 0
+        tot_size = 0
+        buf_size = len(buf)
+        from_buffer = DictionaryEntry.from_buffer
+        while (counter < count) and (offset < buf_size):
+            entry = from_buffer(buf, offset, code_page, decoder)
+            entries[entry.pid] = entry.value
+            offset += entry.size
+            tot_size += entry.size
+            counter += 1
+        # end while
+
+        tot_size = (tot_size + 3) & ~0x3
+
+        return cls((tot_size + 4, entries, count))
+    # end def from_buffer
 # end class Dictionary
 
 class DictionaryEntry(ValuePacket):
@@ -448,6 +730,56 @@ class DictionaryEntry(ValuePacket):
 
         return cls((name_size + 8, name, header.pid))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, code_page=None, decoder=None):
+        """Creates a :class:`DictionaryEntry` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the DictionaryEntry property.
+
+        :type offset: ``int``
+        :param offset: The start of the property in :attr:`buf`.
+
+        :type code_page: ``int``
+        :param code_page: The value of the CodePage property.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the names.
+
+        :raises ValueError: If :attr:`buf` is too small.
+
+        :rtype: :class:`DictionaryEntry`
+        :returns: The corresponding :class:`DictionaryEntry` object.
+
+        """
+        (pid, length) = \
+            _unpack_from(_dictionary_entry_header_struct, buf, offset)
+        offset += 8
+
+        if code_page == CP_WINUNICODE:
+            name_size = length * 2
+            name = bytes(buf[offset:offset + name_size])
+            name_size = (name_size + 3) & ~0x3
+        else:
+            name_size = length
+            name = bytes(buf[offset:offset + name_size])
+        # end if
+
+        if decoder:
+            new_name = decoder(name, "ignore")[0]
+            if new_name:
+                name = new_name
+
+                stop = name.find("\x00")
+                if stop != -1:
+                    name = name[:stop]
+                # end if
+            # end if
+        # end if
+
+        return cls((name_size + 8, name, pid))
+    # end def from_buffer
 # end class DictionaryEntry
 
 class CURRENCY(ValuePacket):
@@ -474,6 +806,29 @@ class CURRENCY(ValuePacket):
 
         return cls((8, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`CURRENCY` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :rtype: :class:`CURRENCY`
+        :returns: The corresponding :class:`CURRENCY` object.
+
+        """
+        value = _unpack_from(_int64_le_struct, buf, offset)[0]
+        value = CURRENCYToDecimal.from_int(value)
+
+        return cls((8, value))
+    # end def from_buffer
 # end class CURRENCY
 
 class DATE(ValuePacket):
@@ -510,6 +865,34 @@ class DATE(ValuePacket):
 
         return cls((8, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`DATE` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :rtype: :class:`DATE`
+        :returns: The corresponding :class:`DATE` object.
+
+        """
+        value = _unpack_from(_float64_le_struct, buf, offset)[0]
+
+        try:
+            value = VariantTimeTodatetime.from_float(value)
+        except ValueError:
+            pass
+        # end try
+
+        return cls((8, value))
+    # end def from_buffer
 # end class DATE
 
 class CodePageString(ValuePacket):
@@ -550,6 +933,39 @@ class CodePageString(ValuePacket):
 
         return cls((size + 4, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`CodePageString` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`CodePageString`
+        :returns: The corresponding :class:`CodePageString` object.
+
+        """
+        size = _unpack_from(_uint32_le_struct, buf, offset)[0]
+
+        start = offset + 4
+        value = bytes(buf[start:start + size])
+        size = (size + 3) & ~0x3
+
+        if decoder:
+            new_value = decoder(value, "ignore")[0]
+            if new_value:
+                value = new_value
+            # end if
+        # end if
+
+        return cls((size + 4, value))
+    # end def from_buffer
 # end class CodePageString
 
 class DECIMAL(ValuePacket):
@@ -576,6 +992,30 @@ class DECIMAL(ValuePacket):
 
         return cls((16, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`DECIMAL` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :rtype: :class:`DECIMAL`
+        :returns: The corresponding :class:`DECIMAL` object.
+
+        """
+        value = DECIMALToDecimal.from_ctype(
+            decimal_le.from_buffer_copy(buf, offset)
+        )
+
+        return cls((16, value))
+    # end def from_buffer
 # end class DECIMAL
 
 class UnicodeString(ValuePacket):
@@ -621,6 +1061,44 @@ class UnicodeString(ValuePacket):
 
         return cls((size + 4, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`UnicodeString` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the string.
+
+        :rtype: :class:`UnicodeString`
+        :returns: The corresponding :class:`UnicodeString` object.
+
+        """
+        count = _unpack_from(_uint32_le_struct, buf, offset)[0]
+        size = count * 2
+
+        start = offset + 4
+        value = bytes(buf[start:start + size])
+        size = (size + 3) & ~0x3
+
+        if decoder is None:
+            decoder = _utf16_le_decoder
+        # end if
+
+        if decoder:
+            new_value = decoder(value, "ignore")[0]
+            if new_value:
+                value = new_value
+            # end if
+        # end if
+
+        return cls((size + 4, value))
+    # end def from_buffer
 # end class UnicodeString
 
 class FILETIME(ValuePacket):
@@ -656,17 +1134,256 @@ class FILETIME(ValuePacket):
 
         return cls((8, filetime))
     # end def from_stream
-# end class FILETIME
-
-class BLOB(ValuePacket):
-    """Represents a BLOB structure (packet)."""
 
     @classmethod
-    def from_stream(cls, stream, offset=None, decoder=None):
-        """Creates a :class:`BLOB` object from a stream.
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`FILETIME` object from a buffer.
 
-        :type stream: :class:`~lf.dec.IStream`
-        :param stream: A stream that contains the BLOB structure.
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :rtype: :class:`FILETIME`
+        :returns: The corresponding :class:`FILETIME` object.
+
+        """
+        filetime = _unpack_from(_uint64_le_struct, buf, offset)[0]
+        try:
+            filetime = FILETIMETodatetime.from_int(filetime)
+        except (TypeError, ValueError):
+            pass
+        # end try
+
+        return cls((8, filetime))
+    # end def from_buffer
+# end class FILETIME
+
+class Payload():
+    """A lazy handle to the payload of a BLOB or ClipboardData structure.
+
+    The payload is not read until it is needed, so the size of a (possibly
+    very large) payload is known without holding it in memory.  The
+    :meth:`hashes` and :meth:`copy_to` methods read the payload in chunks.
+
+    A :class:`Payload` compares equal to a ``bytes`` object with the same
+    contents.
+
+    .. attribute:: source
+
+        The stream (:class:`~lf.dec.IStream`) or buffer that contains the
+        payload.
+
+    .. attribute:: offset
+
+        The start of the payload in :attr:`source`.
+
+    .. attribute:: size
+
+        The size of the payload in bytes.
+
+    """
+
+    __slots__ = ("source", "offset", "size")
+
+    def __init__(self, source, offset, size):
+        """Initializes a :class:`Payload` object.
+
+        :type source: :class:`~lf.dec.IStream` or ``bytes``
+        :param source: A stream or buffer that contains the payload.
+
+        :type offset: ``int``
+        :param offset: The start of the payload in :attr:`source`.
+
+        :type size: ``int``
+        :param size: The size of the payload in bytes.  This is truncated to
+                     the end of :attr:`source`, if it is known.
+
+        """
+        if hasattr(source, "read"):
+            available = source.size
+        else:
+            available = len(source)
+        # end if
+
+        if available is not None:
+            size = max(min(size, available - offset), 0)
+        # end if
+
+        self.source = source
+        self.offset = offset
+        self.size = size
+    # end def __init__
+
+    @property
+    def data(self):
+        """The contents of the payload, as ``bytes``.
+
+        The payload is read (or copied) every time this is accessed.
+
+        """
+        source = self.source
+        offset = self.offset
+
+        if hasattr(source, "read"):
+            source.seek(offset, SEEK_SET)
+            return source.read(self.size)
+        # end if
+
+        return bytes(source[offset:offset + self.size])
+    # end def data
+
+    @property
+    def stream(self):
+        """A new :class:`~lf.dec.IStream` over the payload."""
+
+        if hasattr(self.source, "read"):
+            return SubsetIStream(self.source, self.offset, self.size)
+        # end if
+
+        return ByteIStream(self.data)
+    # end def stream
+
+    def iter_chunks(self, chunk_size=_payload_chunk_size):
+        """Iterates over the payload in chunks.
+
+        :type chunk_size: ``int``
+        :param chunk_size: The maximum number of bytes to read at once.
+
+        :rtype: iterator
+        :returns: An iterator of ``bytes`` objects.
+
+        """
+        source = self.source
+        offset = self.offset
+        end = offset + self.size
+        is_stream = hasattr(source, "read")
+
+        while offset < end:
+            size = min(end - offset, chunk_size)
+
+            if is_stream:
+                source.seek(offset, SEEK_SET)
+                chunk = source.read(size)
+                if not chunk:
+                    break
+                # end if
+            else:
+                chunk = bytes(source[offset:offset + size])
+            # end if
+
+            yield chunk
+            offset += len(chunk)
+        # end while
+    # end def iter_chunks
+
+    def hashes(
+        self, algorithms=("md5", "sha1", "sha256"),
+        chunk_size=_payload_chunk_size
+    ):
+        """Hashes the payload without reading all of it at once.
+
+        :type algorithms: iterable of ``str``
+        :param algorithms: The names of the hash algorithms to use (as
+                           accepted by :func:`hashlib.new`).
+
+        :type chunk_size: ``int``
+        :param chunk_size: The maximum number of bytes to read at once.
+
+        :raises ValueError: If an algorithm is not supported by
+                            :mod:`hashlib`.
+
+        :rtype: ``dict``
+        :returns: A dictionary of hex digests, keyed by algorithm name.
+
+        """
+        algorithms = tuple(algorithms)
+        hashers = [hashlib.new(algorithm) for algorithm in algorithms]
+
+        for chunk in self.iter_chunks(chunk_size):
+            for hasher in hashers:
+                hasher.update(chunk)
+            # end for
+        # end for
+
+        return dict([
+            (algorithm, hasher.hexdigest())
+            for (algorithm, hasher) in zip(algorithms, hashers)
+        ])
+    # end def hashes
+
+    def copy_to(self, ofile, chunk_size=_payload_chunk_size):
+        """Writes the payload to a file, in chunks.
+
+        :type ofile: file-like object
+        :param ofile: The (binary) file to write to.
+
+        :type chunk_size: ``int``
+        :param chunk_size: The maximum number of bytes to read at once.
+
+        :rtype: ``int``
+        :returns: The number of bytes written.
+
+        """
+        written = 0
+
+        for chunk in self.iter_chunks(chunk_size):
+            ofile.write(chunk)
+            written += len(chunk)
+        # end for
+
+        return written
+    # end def copy_to
+
+    def _rebind(self, source, offset):
+        """Points the payload at a different source (used by Builder)."""
+
+        self.source = source
+        self.offset = offset
+    # end def _rebind
+
+    def __len__(self):
+        return self.size
+    # end def __len__
+
+    def __bytes__(self):
+        return self.data
+    # end def __bytes__
+
+    def __eq__(self, other):
+        if isinstance(other, Payload):
+            other = other.data
+        elif not isinstance(other, (bytes, bytearray, memoryview)):
+            return NotImplemented
+        # end if
+
+        return self.data == other
+    # end def __eq__
+
+    def __hash__(self):
+        return hash(self.data)
+    # end def __hash__
+
+    def __repr__(self):
+        return "{0}(offset={1!r}, size={2!r})".format(
+            self.__class__.__name__, self.offset, self.size
+        )
+    # end def __repr__
+# end class Payload
+
+class BLOB(ValuePacket):
+    """Represents a BLOB structure (packet)."""
+
+    @classmethod
+    def from_stream(cls, stream, offset=None, decoder=None, lazy=False):
+        """Creates a :class:`BLOB` object from a stream.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the BLOB structure.
 
         :type offset: ``int``
         :param offset: The start of the structure in :attr:`stream`.
@@ -674,6 +1391,10 @@ class BLOB(ValuePacket):
         :type decoder: ``None``
         :param decoder: This parameter is not used.
 
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the value is a :class:`Payload` that
+                     refers to :attr:`stream`, instead of a copy of the data.
+
         :rtype: :class:`BLOB`
         :returns: The corresponding :class:`BLOB` object.
 
@@ -683,11 +1404,53 @@ class BLOB(ValuePacket):
         # end if
 
         size = uint32_le.from_buffer_copy(stream.read(4)).value
-        value = stream.read(size)
+
+        if lazy:
+            value = Payload(stream, stream.tell(), size)
+        else:
+            value = stream.read(size)
+        # end if
+
         size = (size + 3) & ~0x3
 
         return cls((size + 4, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, lazy=False):
+        """Creates a :class:`BLOB` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the value is a :class:`Payload` that
+                     refers to :attr:`buf`, instead of a copy of the data.
+
+        :rtype: :class:`BLOB`
+        :returns: The corresponding :class:`BLOB` object.
+
+        """
+        size = _unpack_from(_uint32_le_struct, buf, offset)[0]
+
+        start = offset + 4
+
+        if lazy:
+            value = Payload(buf, start, size)
+        else:
+            value = bytes(buf[start:start + size])
+        # end if
+
+        size = (size + 3) & ~0x3
+
+        return cls((size + 4, value))
+    # end def from_buffer
 # end class BLOB
 
 class IndirectPropertyName(CodePageString):
@@ -717,7 +1480,7 @@ class ClipboardData(ValuePacket):
     _aliases_ = {"value": "data"}
 
     @classmethod
-    def from_stream(cls, stream, offset=None, decoder=None):
+    def from_stream(cls, stream, offset=None, decoder=None, lazy=False):
         """Creates a :class:`ClipboardData` object from a stream.
 
         :type stream: :class:`~lf.dec.IStream`
@@ -729,6 +1492,10 @@ class ClipboardData(ValuePacket):
         :type decoder: ``None``
         :param decoder: This parameter is not used.
 
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the data is a :class:`Payload` that refers to
+                     :attr:`stream`, instead of a copy of the data.
+
         :rtype: :class:`ClipboardData`
         :returns: The corresponding :class:`ClipboardData` object.
 
@@ -739,11 +1506,63 @@ class ClipboardData(ValuePacket):
 
         size = uint32_le.from_buffer_copy(stream.read(4)).value
         format = stream.read(4)
-        data = stream.read(size - 4)
+
+        if not lazy:
+            data = stream.read(size - 4)
+        elif size >= 4:
+            data = Payload(stream, stream.tell(), size - 4)
+        else:
+            start = stream.tell()
+            data = Payload(stream, start, stream.seek(0, SEEK_END) - start)
+        # end if
+
         size = (size + 3) & ~0x3
 
         return cls((size + 4, data, format))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, lazy=False):
+        """Creates a :class:`ClipboardData` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the data is a :class:`Payload` that refers to
+                     :attr:`buf`, instead of a copy of the data.
+
+        :rtype: :class:`ClipboardData`
+        :returns: The corresponding :class:`ClipboardData` object.
+
+        """
+        size = _unpack_from(_uint32_le_struct, buf, offset)[0]
+
+        start = offset + 4
+        format = bytes(buf[start:start + 4])
+
+        if size >= 4:
+            end = start + size
+        else:
+            end = len(buf)
+        # end if
+
+        if lazy:
+            data = Payload(buf, start + 4, end - start - 4)
+        else:
+            data = bytes(buf[start + 4:end])
+        # end if
+
+        size = (size + 3) & ~0x3
+
+        return cls((size + 4, data, format))
+    # end def from_buffer
 # end class ClipboardData
 
 class GUID(ValuePacket):
@@ -770,6 +1589,28 @@ class GUID(ValuePacket):
 
         return cls((16, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`GUID` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :rtype: :class:`GUID`
+        :returns: The corresponding :class:`GUID` object.
+
+        """
+        value = GUIDToUUID.from_buffer(buf, offset)
+
+        return cls((16, value))
+    # end def from_buffer
 # end class GUID
 
 class VersionedStream(ValuePacket):
@@ -818,6 +1659,29 @@ class VersionedStream(ValuePacket):
 
         return cls((stream_name.size + 16, stream_name.value, guid))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`VersionedStream` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the stream name.
+
+        :rtype: :class:`VersionedStream`
+        :returns: The corresponding :class:`VersionedStream` object.
+
+        """
+        guid = GUIDToUUID.from_buffer(buf, offset)
+        stream_name = CodePageString.from_buffer(buf, offset + 16, decoder)
+
+        return cls((stream_name.size + 16, stream_name.value, guid))
+    # end def from_buffer
 # end class VersionedStream
 
 class HRESULT(ValuePacket):
@@ -870,6 +1734,28 @@ class HRESULT(ValuePacket):
 
         return cls((4, value))
     # end def from_ctype
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`HRESULT` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: ``None``
+        :param decoder: This parameter is not used.
+
+        :rtype: :class:`HRESULT`
+        :returns: The corresponding :class:`HRESULT` object.
+
+        """
+        value = HRESULT_.from_ctype(hresult_le.from_buffer_copy(buf, offset))
+
+        return cls((4, value))
+    # end def from_buffer
 # end class HRESULT
 
 class Array(ValuePacket):
@@ -936,6 +1822,44 @@ class Array(ValuePacket):
 
         return cls((size, scalar_type, dim_count, dims, seq.value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None):
+        """Creates a :class:`Array` object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+
+        :raises ValueError: If the extracted scalar type is an invalid property
+                            type.
+        :param decoder: An optional codec to decode the string properties.
+
+        :rtype: :class:`Array`
+        :returns: The corresponding :class:`Array` object.
+
+        """
+        header = array_header.from_buffer_copy(buf, offset)
+        scalar_type = header.scalar_type
+        dim_count = header.dimension_count
+
+        dims_ctype = array_dimension * dim_count
+        dims_list = dims_ctype.from_buffer_copy(buf, offset + 8)
+
+        dims = [(dim.size, dim.index_offset) for dim in dims_list]
+        dim_sizes = [dim.size for dim in dims_list if dim.size != 0]
+        count = reduce(mul, dim_sizes)
+
+        seq_offset = offset + 8 + (dim_count * 8)
+        seq = Sequence.from_buffer(buf, scalar_type, count, seq_offset, decoder)
+        size = seq.size + (dim_count * 8) + 8
+
+        return cls((size, scalar_type, dim_count, dims, seq.value))
+    # end def from_buffer
 # end class Array
 
 class Vector(ValuePacket):
@@ -987,6 +1911,36 @@ class Vector(ValuePacket):
 
         return cls((seq.size + 4, count, seq.value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, scalar_type, offset=0, decoder=None):
+        """Creates a :class:`Vector` object from a buffer.
+
+        :type scalar_type: :const:`lf.win.ole.ps.consts.PropertyType`
+        :param scalar_type: The type of the properties in the Vector structure.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+
+        :raises ValueError: If :attr:`scalar_type` is an invalid property type.
+        :param decoder: An optional codec to decode the string properties.
+
+        :rtype: :class:`Vector`
+        :returns: The corresponding :class:`Vector` object.
+
+        """
+        count = _unpack_from(_uint32_le_struct, buf, offset)[0]
+        seq = Sequence.from_buffer(
+            buf, scalar_type, count, offset + 4, decoder
+        )
+
+        return cls((seq.size + 4, count, seq.value))
+    # end def from_buffer
 # end class Vector
 
 class Sequence(ValuePacket):
@@ -1034,7 +1988,7 @@ class Sequence(ValuePacket):
         is_lpstr = False
 
         if ptype in _simple_property_types:
-            (size, _ctype) = _simple_property_types[ptype]
+            (size, typecode) = _simple_property_types[ptype]
 
             if offset is not None:
                 stream.seek(offset, SEEK_SET)
@@ -1049,8 +2003,7 @@ class Sequence(ValuePacket):
                 seq_size = count * size
             # end if
 
-            _ctype = _ctype * count
-            values = list(_ctype.from_buffer_copy(stream.read(seq_size)))
+            values = _unpack_array(typecode, stream.read(seq_size), 0, count)
             seq_size = (seq_size + 3) & ~0x3
             return cls((seq_size, values))
 
@@ -1213,7 +2166,208 @@ class Sequence(ValuePacket):
         # end try
 
         return cls((tot_size, values))
-    # end def from_factory
+    # end def from_factory
+
+    @classmethod
+    def from_buffer(cls, buf, ptype, count, offset=0, decoder=None):
+        """Creates a sequence of various properties from a buffer.
+
+        .. note::
+
+            This method will round the size up to the nearest multiple of 4.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the sequence.
+
+        :type ptype: :const:`lf.win.ole.ps.consts.PropertyType`
+        :param ptype: The property type of the elements in the Sequence.
+
+        :type count: ``int``
+        :param count: The number of elements in the sequence.
+
+        :type offset: ``int``
+        :param offset: The start of the sequence in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode string properties.
+
+        :raises ValueError: If :attr:`ptype` is an invalid property type.
+
+        :rtype: :class:`Sequence`
+        :returns: The corresponding :class:`Sequence` object.
+
+        """
+        buf_size = len(buf)
+
+        if ptype in _simple_property_types:
+            (size, typecode) = _simple_property_types[ptype]
+
+            seq_size = count * size
+            if seq_size > (buf_size - offset):
+                count = (buf_size - offset) // size
+                seq_size = count * size
+            # end if
+
+            values = _unpack_array(typecode, buf, offset, count)
+            seq_size = (seq_size + 3) & ~0x3
+            return cls((seq_size, values))
+        elif ptype in _string_property_types:
+            return cls.from_buffer_strings(buf, ptype, count, offset, decoder)
+        elif ptype not in _sequence_parsers:
+            raise ValueError("Invalid property type 0x{0:X}".format(ptype))
+        # end if
+
+        factory_func = _sequence_parsers[ptype]
+        is_lpstr = (ptype == varenum.VT_LPSTR)
+
+        if (ptype == varenum.VT_LPWSTR) and (decoder is False):
+            decoder = _utf16_le_decoder
+        # end if
+
+        values = list()
+        counter = 0
+        tot_size = 0
+
+        try:
+            while (counter < count) and (offset < buf_size):
+                element = factory_func(buf, offset, decoder)
+                offset += element.size
+                tot_size += element.size
+
+                if is_lpstr and isinstance(element.value, str):
+                    element = CodePageString((
+                        element.size, element.value.split("\x00", 1)[0]
+                    ))
+                # end if
+
+                values.append(element)
+                counter += 1
+            # end while
+        except ValueError:
+            pass
+        # end try
+
+        tot_size = (tot_size + 3) & ~0x3
+
+        return cls((tot_size, values))
+    # end def from_buffer
+
+    @classmethod
+    def from_buffer_strings(cls, buf, ptype, count, offset=0, decoder=None):
+        """Creates a sequence of string properties from a buffer.
+
+        The strings are split from :attr:`buf` in a single pass, and decoded
+        in one call to the codec (see :func:`_decode_strings`).  The result is
+        the same as :meth:`from_buffer` calling the individual string parsers
+        for each element.
+
+        .. note::
+
+            This method will round the size up to the nearest multiple of 4.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the sequence.
+
+        :type ptype: :const:`lf.win.ole.ps.consts.PropertyType`
+        :param ptype: One of VT_BSTR, VT_LPSTR, or VT_LPWSTR.
+
+        :type count: ``int``
+        :param count: The number of elements in the sequence.
+
+        :type offset: ``int``
+        :param offset: The start of the sequence in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode the strings.
+
+        :raises ValueError: If :attr:`ptype` is not a string property type.
+
+        :rtype: :class:`Sequence`
+        :returns: The corresponding :class:`Sequence` object.
+
+        """
+        if ptype not in _string_property_types:
+            raise ValueError("Invalid property type 0x{0:X}".format(ptype))
+        # end if
+
+        (element_cls, width) = _string_property_types[ptype]
+
+        if (ptype == varenum.VT_LPWSTR) and (not decoder):
+            decoder = _utf16_le_decoder
+        # end if
+
+        (chunks, sizes) = _split_strings(buf, offset, count, width)
+
+        if decoder:
+            values = _decode_strings(chunks, decoder)
+        else:
+            values = chunks
+        # end if
+
+        if ptype == varenum.VT_LPSTR:
+            values = [
+                value.split("\x00", 1)[0] if isinstance(value, str) else value
+                for value in values
+            ]
+        # end if
+
+        values = [element_cls(pair) for pair in zip(sizes, values)]
+        tot_size = (sum(sizes) + 3) & ~0x3
+
+        return cls((tot_size, values))
+    # end def from_buffer_strings
+
+    @classmethod
+    def from_buffer_factory(cls, buf, factory, count, offset=0, decoder=None):
+        """Creates a sequence of various properties from a buffer, given a
+        factory.
+
+        .. note::
+
+            It is up to the calling function to round the size up to the
+            nearest multiple of 4 (if necessary).
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the sequence.
+
+        :type factory: ``function``
+        :param factory: A factory function to create the properties.  This
+                        function must accept the same arguments as
+                        :func:`TypedPropertyValue.from_buffer`.
+
+        :type count: ``int``
+        :param count: The number of elements in the sequence.
+
+        :type offset: ``int``
+        :param offset: The start of the sequence in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode string properties.
+
+        :rtype: :class:`Sequence`
+        :returns: The corresponding :class:`Sequence` object.
+
+        """
+        values = list()
+        counter = 0
+        tot_size = 0
+        buf_size = len(buf)
+
+        try:
+            while (counter < count) and (offset < buf_size):
+                element = factory(buf, offset, decoder)
+                offset += element.size
+                tot_size += element.size
+
+                values.append(element)
+                counter += 1
+            # end while
+        except ValueError:
+            pass
+        # end try
+
+        return cls((tot_size, values))
+    # end def from_buffer_factory
 # end class Sequence
 
 class TypedPropertyValue(PropertyPacket):
@@ -1227,12 +2381,19 @@ class TypedPropertyValue(PropertyPacket):
 
         A :class:`ctypes` ctype used to extract the various properties.
 
+    .. attribute:: _struct
+
+        An optional :class:`struct.Struct` with the same layout as
+        :attr:`_ctype`, used by :meth:`from_buffer` for properties whose value
+        is a plain number.
+
     """
 
     _fields_ = ("type", "size", "value")
 
     _takes_stream = True
     _ctype = typed_property_value_header
+    _struct = None
 
     @classmethod
     def from_stream(cls, stream, offset=None, decoder=None):
@@ -1267,48 +2428,100 @@ class TypedPropertyValue(PropertyPacket):
 
         return cls((header.type, size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a TypedPropertyValue object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`TypedPropertyValue`
+        :returns: The corresponding :class:`TypedPropertyValue` object.
+
+        """
+        struct = cls._struct
+        if struct is not None:
+            values = _unpack_from(struct, buf, offset)
+
+            if len(values) > 1:
+                value = values[1]
+            else:
+                value = None
+            # end if
+
+            return cls((values[0], struct.size, value))
+        # end if
+
+        header = cls._ctype.from_buffer_copy(buf, offset)
+
+        if hasattr(header, "value"):
+            value = header.value
+        else:
+            value = None
+        # end if
+
+        return cls((header.type, sizeof(cls._ctype), value))
+    # end def from_buffer
 # end class TypedPropertyValue
 
 class VT_EMPTY(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_EMPTY`."""
 
-    pass
+    _struct = _tpv_header_struct
 # end class VT_EMPTY
 
 class VT_NULL(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_NULL`."""
 
-    pass
+    _struct = _tpv_header_struct
 # end class VT_NULL
 
 class VT_I2(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_I2`."""
 
     _ctype = typed_property_value_vt_i2
+    _struct = Struct("<H2xh2x")
 # end class VT_I2
 
 class VT_I4(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_I4`."""
 
     _ctype = typed_property_value_vt_i4
+    _struct = Struct("<H2xi")
 # end class VT_I4
 
 class VT_R4(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_R4`."""
 
     _ctype = typed_property_value_vt_r4
+    _struct = Struct("<H2xf")
 # end class VT_R4
 
 class VT_R8(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_R8`."""
 
     _ctype = typed_property_value_vt_r8
+    _struct = Struct("<H2xd")
 # end class VT_R8
 
 class VT_CY(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_CY`."""
 
     _ctype = typed_property_value_vt_cy
+    _struct = Struct("<H2xq")
 
     @classmethod
     def from_stream(cls, stream, offset=None, decoder=None):
@@ -1333,12 +2546,42 @@ class VT_CY(TypedPropertyValue):
         value = Decimal(tpv.value) / Decimal(10000)
         return cls((tpv.type, tpv.size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_CY object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_CY`
+        :returns: The corresponding :class:`VT_CY` object.
+
+        """
+        tpv = super(VT_CY, cls).from_buffer(buf, offset, decoder, ptype)
+
+        value = Decimal(tpv.value) / Decimal(10000)
+        return cls((tpv.type, tpv.size, value))
+    # end def from_buffer
 # end class VT_CY
 
 class VT_DATE(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_DATE`."""
 
     _ctype = typed_property_value_vt_date
+    _struct = Struct("<H2xd")
 
     @classmethod
     def from_stream(cls, stream, offset=None, decoder=None):
@@ -1368,6 +2611,40 @@ class VT_DATE(TypedPropertyValue):
 
         return cls((tpv.type, tpv.size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_DATE object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_DATE`
+        :returns: The corresponding :class:`VT_DATE` object.
+
+        """
+        tpv = super(VT_DATE, cls).from_buffer(buf, offset, decoder, ptype)
+
+        try:
+            value = VariantTimeTodatetime.from_float(tpv.value)
+        except (ValueError, TypeError):
+            value = tpv.value
+        # end try
+
+        return cls((tpv.type, tpv.size, value))
+    # end def from_buffer
 # end class VT_DATE
 
 class VT_LPSTR(TypedPropertyValue):
@@ -1417,6 +2694,43 @@ class VT_LPSTR(TypedPropertyValue):
 
         return cls((tpv.type, cps.size + 4, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_LPSTR object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_LPSTR`
+        :returns: The corresponding :class:`VT_LPSTR` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        cps = CodePageString.from_buffer(buf, offset + 4, decoder)
+        value = cps.value
+
+        if isinstance(value, str):
+            value = value.split("\x00", 1)[0]
+        # end if
+
+        return cls((ptype, cps.size + 4, value))
+    # end def from_buffer
 # end class VT_LPSTR
 
 class VT_ERROR(TypedPropertyValue):
@@ -1453,12 +2767,42 @@ class VT_ERROR(TypedPropertyValue):
 
         return cls((tpv.type, tpv.size, hresult.value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_ERROR object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_ERROR`
+        :returns: The corresponding :class:`VT_ERROR` object.
+
+        """
+        tpv = super(VT_ERROR, cls).from_buffer(buf, offset, decoder, ptype)
+        hresult = HRESULT.from_ctype(tpv.value)
+
+        return cls((tpv.type, tpv.size, hresult.value))
+    # end def from_buffer
 # end class VT_ERROR
 
 class VT_BOOL(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_BOOL`."""
 
     _ctype = typed_property_value_vt_ui2
+    _struct = Struct("<H2xH2x")
 # end class VT_BOOL
 
 class VT_DECIMAL(TypedPropertyValue):
@@ -1489,42 +2833,77 @@ class VT_DECIMAL(TypedPropertyValue):
 
         return cls((tpv.type, tpv.size, decimal))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_DECIMAL object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_DECIMAL`
+        :returns: The corresponding :class:`VT_DECIMAL` object.
+
+        """
+        tpv = super(VT_DECIMAL, cls).from_buffer(buf, offset, decoder, ptype)
+        decimal = DECIMALToDecimal.from_ctype(tpv.value)
+
+        return cls((tpv.type, tpv.size, decimal))
+    # end def from_buffer
 # end class VT_DECIMAL
 
 class VT_I1(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_I1`."""
 
     _ctype = typed_property_value_vt_i1
+    _struct = Struct("<H2xb3x")
 # end class VT_I1
 
 class VT_UI1(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_UI1`."""
 
     _ctype = typed_property_value_vt_ui1
+    _struct = Struct("<H2xB3x")
 # end class VT_UI1
 
 class VT_UI2(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_UI2`."""
 
     _ctype = typed_property_value_vt_ui2
+    _struct = Struct("<H2xH2x")
 # end class VT_UI2
 
 class VT_UI4(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_UI4`."""
 
     _ctype = typed_property_value_vt_ui4
+    _struct = Struct("<H2xI")
 # end class VT_UI4
 
 class VT_I8(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_I8`."""
 
     _ctype = typed_property_value_vt_i8
+    _struct = Struct("<H2xq")
 # end class VT_I8
 
 class VT_UI8(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_UI8`."""
 
     _ctype = typed_property_value_vt_ui8
+    _struct = Struct("<H2xQ")
 # end class VT_UI8
 
 class VT_INT(VT_I4):
@@ -1581,6 +2960,38 @@ class VT_BSTR(TypedPropertyValue):
 
         return cls((tpv.type, cps.size + 4, cps.value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_BSTR object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_BSTR`
+        :returns: The corresponding :class:`VT_BSTR` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        cps = CodePageString.from_buffer(buf, offset + 4, decoder)
+
+        return cls((ptype, cps.size + 4, cps.value))
+    # end def from_buffer
 # end class VT_BSTR
 
 class VT_LPWSTR(TypedPropertyValue):
@@ -1613,12 +3024,45 @@ class VT_LPWSTR(TypedPropertyValue):
 
         return cls((tpv.type, uni_str.size + 4, uni_str.value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=_utf16_le_decoder, ptype=None):
+        """Creates a VT_LPWSTR object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_LPWSTR`
+        :returns: The corresponding :class:`VT_LPWSTR` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        uni_str = UnicodeString.from_buffer(buf, offset + 4, decoder)
+
+        return cls((ptype, uni_str.size + 4, uni_str.value))
+    # end def from_buffer
 # end class VT_LPWSTR
 
 class VT_FILETIME(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_FILETIME`."""
 
     _ctype = typed_property_value_vt_filetime
+    _struct = Struct("<H2xQ")
 
     @classmethod
     def from_stream(cls, stream, offset=None, decoder=None):
@@ -1647,13 +3091,47 @@ class VT_FILETIME(TypedPropertyValue):
 
         return cls((tpv.type, tpv.size, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_FILETIME object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_FILETIME`
+        :returns: The corresponding :class:`VT_FILETIME` object.
+
+        """
+        tpv = super(VT_FILETIME, cls).from_buffer(buf, offset, decoder, ptype)
+
+        try:
+            value = FILETIMETodatetime.from_int(tpv.value)
+        except (ValueError, TypeError):
+            value = tpv.value
+        # end try
+
+        return cls((tpv.type, tpv.size, value))
+    # end def from_buffer
 # end class VT_FILETIME
 
 class VT_BLOB(TypedPropertyValue):
     """Typed value :const:`~lf.win.ole.varenum.VT_BLOB`."""
 
     @classmethod
-    def from_stream(cls, stream, offset=None, decoder=None):
+    def from_stream(cls, stream, offset=None, decoder=None, lazy=False):
         """Creates a VT_BLOB object from a stream.
 
         :type stream: :class:`~lf.dec.IStream`
@@ -1665,6 +3143,10 @@ class VT_BLOB(TypedPropertyValue):
         :type decoder: ``None``
         :param decoder: This parameter is not used.
 
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the payload is a :class:`Payload` that
+                     refers to :attr:`stream`, instead of a copy of the data.
+
         :rtype: :class:`VT_BLOB`
         :returns: The corresponding :class:`VT_BLOB` object.
 
@@ -1674,10 +3156,48 @@ class VT_BLOB(TypedPropertyValue):
         # end if
 
         tpv = super(VT_BLOB, cls).from_stream(stream, offset)
-        blob = BLOB.from_stream(stream, offset + 4)
+        blob = BLOB.from_stream(stream, offset + 4, lazy=lazy)
 
         return cls((tpv.type, blob.size + 4, blob.value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(
+        cls, buf, offset=0, decoder=None, ptype=None, lazy=False
+    ):
+        """Creates a VT_BLOB object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the payload is a :class:`Payload` that
+                     refers to :attr:`buf`, instead of a copy of the data.
+
+        :rtype: :class:`VT_BLOB`
+        :returns: The corresponding :class:`VT_BLOB` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        blob = BLOB.from_buffer(buf, offset + 4, lazy=lazy)
+
+        return cls((ptype, blob.size + 4, blob.value))
+    # end def from_buffer
 # end class VT_BLOB
 
 class VT_STREAM(VT_BSTR):
@@ -1720,7 +3240,7 @@ class VT_CF(TypedPropertyValue):
     """
 
     @classmethod
-    def from_stream(cls, stream, offset=None, decoder=None):
+    def from_stream(cls, stream, offset=None, decoder=None, lazy=False):
         """Creates a VT_CF object from a stream.
 
         :type stream: :class:`~lf.dec.IStream`
@@ -1732,6 +3252,10 @@ class VT_CF(TypedPropertyValue):
         :type decoder: ``None``
         :param decoder: This parameter is not used.
 
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the payload is a :class:`Payload` that
+                     refers to :attr:`stream`, instead of a copy of the data.
+
         :rtype: :class:`VT_CF`
         :returns: The corresponding :class:`VT_CF` object.
 
@@ -1741,10 +3265,48 @@ class VT_CF(TypedPropertyValue):
         # end if
 
         tpv = super(VT_CF, cls).from_stream(stream, offset)
-        cd = ClipboardData.from_stream(stream, offset + 4)
+        cd = ClipboardData.from_stream(stream, offset + 4, lazy=lazy)
 
         return cls((tpv.type, cd.size + 4, cd))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(
+        cls, buf, offset=0, decoder=None, ptype=None, lazy=False
+    ):
+        """Creates a VT_CF object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the payload is a :class:`Payload` that
+                     refers to :attr:`buf`, instead of a copy of the data.
+
+        :rtype: :class:`VT_CF`
+        :returns: The corresponding :class:`VT_CF` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        cd = ClipboardData.from_buffer(buf, offset + 4, lazy=lazy)
+
+        return cls((ptype, cd.size + 4, cd))
+    # end def from_buffer
 # end class VT_CF
 
 class VT_CLSID(TypedPropertyValue):
@@ -1772,8 +3334,40 @@ class VT_CLSID(TypedPropertyValue):
         tpv = super(VT_CLSID, cls).from_stream(stream, offset)
         guid = GUIDToUUID.from_ctype(tpv.value)
 
-        return cls((tpv.type, tpv.size, guid))
-    # end def from_stream
+        return cls((tpv.type, tpv.size, guid))
+    # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_CLSID object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_CLSID`
+        :returns: The corresponding :class:`VT_CLSID` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        guid = GUIDToUUID.from_buffer(buf, offset + 4)
+
+        return cls((ptype, 20, guid))
+    # end def from_buffer
 # end class VT_CLSID
 
 class VT_VERSIONED_STREAM(TypedPropertyValue):
@@ -1811,6 +3405,38 @@ class VT_VERSIONED_STREAM(TypedPropertyValue):
 
         return cls((tpv.type, vs.size + 4, vs))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_VERSIONED_STREAM object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_VERSIONED_STREAM`
+        :returns: The corresponding :class:`VT_VERSIONED_STREAM` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        vs = VersionedStream.from_buffer(buf, offset + 4, decoder)
+
+        return cls((ptype, vs.size + 4, vs))
+    # end def from_buffer
 # end class VT_VERSIONED_STREAM
 
 class VT_ARRAY(TypedPropertyValue):
@@ -1848,6 +3474,38 @@ class VT_ARRAY(TypedPropertyValue):
 
         return cls((tpv.type, value.size + 4, value))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_ARRAY object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_ARRAY`
+        :returns: The corresponding :class:`VT_ARRAY` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        value = Array.from_buffer(buf, offset + 4, decoder)
+
+        return cls((ptype, value.size + 4, value))
+    # end def from_buffer
 # end class VT_ARRAY
 
 class VT_VECTOR(TypedPropertyValue):
@@ -1886,15 +3544,224 @@ class VT_VECTOR(TypedPropertyValue):
 
         return cls((tpv.type, (vector.size + 4), vector))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, decoder=None, ptype=None):
+        """Creates a VT_VECTOR object from a buffer.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec, used only if the property requires a
+                        decoder.
+
+        :type ptype: ``int``
+        :param ptype: The property type, if it has already been read from
+                      :attr:`buf`.  If this is ``None``, the type is read
+                      from :attr:`buf`.
+
+        :rtype: :class:`VT_VECTOR`
+        :returns: The corresponding :class:`VT_VECTOR` object.
+
+        """
+        if ptype is None:
+            ptype = _type_from_buffer(buf, offset)
+        # end if
+
+        scalar_type = ptype & (~varenum.VT_VECTOR)
+        vector = Vector.from_buffer(buf, scalar_type, offset + 4, decoder)
+
+        return cls((ptype, (vector.size + 4), vector))
+    # end def from_buffer
 # end class VT_VECTOR
 
 class PropertyFactory():
-    """A class that makes properties."""
+    """A class that makes properties.
+
+    Properties are decoded by a parser that is looked up (by the property
+    type) in a table.  Parsers for specific properties of a property set can
+    be registered with :meth:`register`, and are used instead of the parser
+    for the property type.  Subclasses that register parsers get their own
+    copy of the tables, so the parsers of the parent class are not changed.
+
+    .. attribute:: _payload_types
+
+        The property types whose parsers accept a ``lazy`` keyword argument,
+        to make the payload a :class:`Payload` instead of ``bytes``.
+
+    """
+
+    # Property types with (possibly large) payloads
+    _payload_types = frozenset([
+        varenum.VT_BLOB, varenum.VT_BLOB_OBJECT, varenum.VT_CF
+    ])
+
+    # Parsers for property types: property type -> parser
+    _parsers = {
+        varenum.VT_EMPTY: VT_EMPTY.from_buffer,
+        varenum.VT_NULL: VT_NULL.from_buffer,
+        varenum.VT_I2: VT_I2.from_buffer,
+        varenum.VT_I4: VT_I4.from_buffer,
+        varenum.VT_R4: VT_R4.from_buffer,
+        varenum.VT_R8: VT_R8.from_buffer,
+        varenum.VT_CY: VT_CY.from_buffer,
+        varenum.VT_DATE: VT_DATE.from_buffer,
+        varenum.VT_BSTR: VT_BSTR.from_buffer,
+        varenum.VT_ERROR: VT_ERROR.from_buffer,
+        varenum.VT_BOOL: VT_BOOL.from_buffer,
+        varenum.VT_DECIMAL: VT_DECIMAL.from_buffer,
+        varenum.VT_I1: VT_I1.from_buffer,
+        varenum.VT_UI1: VT_UI1.from_buffer,
+        varenum.VT_UI2: VT_UI2.from_buffer,
+        varenum.VT_UI4: VT_UI4.from_buffer,
+        varenum.VT_I8: VT_I8.from_buffer,
+        varenum.VT_UI8: VT_UI8.from_buffer,
+        varenum.VT_INT: VT_INT.from_buffer,
+        varenum.VT_UINT: VT_UINT.from_buffer,
+        varenum.VT_LPSTR: VT_LPSTR.from_buffer,
+        varenum.VT_LPWSTR: VT_LPWSTR.from_buffer,
+        varenum.VT_FILETIME: VT_FILETIME.from_buffer,
+        varenum.VT_BLOB: VT_BLOB.from_buffer,
+        varenum.VT_STREAM: VT_STREAM.from_buffer,
+        varenum.VT_STORAGE: VT_STORAGE.from_buffer,
+        varenum.VT_STREAMED_OBJECT: VT_STREAMED_OBJECT.from_buffer,
+        varenum.VT_STORED_OBJECT: VT_STORED_OBJECT.from_buffer,
+        varenum.VT_BLOB_OBJECT: VT_BLOB_OBJECT.from_buffer,
+        varenum.VT_CF: VT_CF.from_buffer,
+        varenum.VT_CLSID: VT_CLSID.from_buffer,
+        varenum.VT_VERSIONED_STREAM: VT_VERSIONED_STREAM.from_buffer,
+
+        # Used for any vector or array type without a parser of its own
+        varenum.VT_VECTOR: VT_VECTOR.from_buffer,
+        varenum.VT_ARRAY: VT_ARRAY.from_buffer
+    }
+
+    # Parsers for specific properties: (fmtid, pid, property type) -> parser
+    _pid_parsers = dict()
+
+    # Stream versions of the built in parsers, used by make: parser ->
+    # stream parser
+    _stream_parsers = {
+        VT_EMPTY.from_buffer: VT_EMPTY.from_stream,
+        VT_NULL.from_buffer: VT_NULL.from_stream,
+        VT_I2.from_buffer: VT_I2.from_stream,
+        VT_I4.from_buffer: VT_I4.from_stream,
+        VT_R4.from_buffer: VT_R4.from_stream,
+        VT_R8.from_buffer: VT_R8.from_stream,
+        VT_CY.from_buffer: VT_CY.from_stream,
+        VT_DATE.from_buffer: VT_DATE.from_stream,
+        VT_BSTR.from_buffer: VT_BSTR.from_stream,
+        VT_ERROR.from_buffer: VT_ERROR.from_stream,
+        VT_BOOL.from_buffer: VT_BOOL.from_stream,
+        VT_DECIMAL.from_buffer: VT_DECIMAL.from_stream,
+        VT_I1.from_buffer: VT_I1.from_stream,
+        VT_UI1.from_buffer: VT_UI1.from_stream,
+        VT_UI2.from_buffer: VT_UI2.from_stream,
+        VT_UI4.from_buffer: VT_UI4.from_stream,
+        VT_I8.from_buffer: VT_I8.from_stream,
+        VT_UI8.from_buffer: VT_UI8.from_stream,
+        VT_INT.from_buffer: VT_INT.from_stream,
+        VT_UINT.from_buffer: VT_UINT.from_stream,
+        VT_LPSTR.from_buffer: VT_LPSTR.from_stream,
+        VT_LPWSTR.from_buffer: VT_LPWSTR.from_stream,
+        VT_FILETIME.from_buffer: VT_FILETIME.from_stream,
+        VT_BLOB.from_buffer: VT_BLOB.from_stream,
+        VT_STREAM.from_buffer: VT_STREAM.from_stream,
+        VT_STORAGE.from_buffer: VT_STORAGE.from_stream,
+        VT_STREAMED_OBJECT.from_buffer: VT_STREAMED_OBJECT.from_stream,
+        VT_STORED_OBJECT.from_buffer: VT_STORED_OBJECT.from_stream,
+        VT_BLOB_OBJECT.from_buffer: VT_BLOB_OBJECT.from_stream,
+        VT_CF.from_buffer: VT_CF.from_stream,
+        VT_CLSID.from_buffer: VT_CLSID.from_stream,
+        VT_VERSIONED_STREAM.from_buffer: VT_VERSIONED_STREAM.from_stream,
+        VT_VECTOR.from_buffer: VT_VECTOR.from_stream,
+        VT_ARRAY.from_buffer: VT_ARRAY.from_stream,
+        TypedPropertyValue.from_buffer: TypedPropertyValue.from_stream
+    }
+
+    @classmethod
+    def register(cls, ptype, parser, fmtid=None, pid=None):
+        """Registers a parser for a property type.
+
+        :type ptype: ``int``
+        :param ptype: The property type the parser decodes.
+
+        :type parser: ``function``
+        :param parser: The parser.  This function must accept the same
+                       arguments as :meth:`TypedPropertyValue.from_buffer`.
+                       Parsers for the types in :attr:`_payload_types` must
+                       also accept a ``lazy`` keyword argument (see
+                       :meth:`VT_BLOB.from_buffer`).
+
+        :type fmtid: :class:`UUID`
+        :param fmtid: The FMTID of the property set, if the parser is only for
+                      a specific property.
+
+        :type pid: ``int``
+        :param pid: The property identifier, if the parser is only for a
+                    specific property.
+
+        """
+        if "_parsers" not in cls.__dict__:
+            cls._parsers = dict(cls._parsers)
+            cls._pid_parsers = dict(cls._pid_parsers)
+        # end if
+
+        if pid is None:
+            cls._parsers[ptype] = parser
+        else:
+            cls._pid_parsers[(fmtid, pid, ptype)] = parser
+        # end if
+    # end def register
+
+    @classmethod
+    def get_parser(cls, ptype, fmtid=None, pid=None):
+        """Looks up the parser for a property.
+
+        :type ptype: ``int``
+        :param ptype: The property type.
+
+        :type fmtid: :class:`UUID`
+        :param fmtid: The FMTID of the property set.
+
+        :type pid: ``int``
+        :param pid: The property identifier.
+
+        :rtype: ``function``
+        :returns: The parser for the property.
+
+        """
+        if pid is not None:
+            parser = cls._pid_parsers.get((fmtid, pid, ptype))
+            if parser is not None:
+                return parser
+            # end if
+        # end if
+
+        parsers = cls._parsers
+        if ptype in parsers:
+            return parsers[ptype]
+        elif ptype & varenum.VT_VECTOR:
+            return parsers[varenum.VT_VECTOR]
+        elif ptype & varenum.VT_ARRAY:
+            return parsers[varenum.VT_ARRAY]
+        # end if
+
+        return TypedPropertyValue.from_buffer
+    # end def get_parser
 
     @classmethod
     def make(cls, stream, offset=None, decoder=None):
         """Makes a property object from a stream.
 
+        Only the bytes of the property are read from :attr:`stream`, unless
+        the property is decoded by a parser from :meth:`register`.  Those
+        parsers decode buffers, so the rest of the stream is read for them.
+
         :type stream: :class:`~lf.dec.IStream`
         :param stream: A stream that contains the property structure.
 
@@ -1911,25 +3778,132 @@ class PropertyFactory():
         """
         if offset is None:
             offset = stream.tell()
+        else:
+            stream.seek(offset, SEEK_SET)
         # end if
 
-        property = TypedPropertyValue.from_stream(stream, offset)
-        ptype = property.type
+        ptype = _type_from_buffer(stream.read(4), 0)
+        parser = cls.get_parser(ptype)
 
-        if ptype & varenum.VT_VECTOR:
-            property = VT_VECTOR.from_stream(stream, offset, decoder)
-        elif ptype & varenum.VT_ARRAY:
-            property = VT_ARRAY.from_stream(stream, offset, decoder)
-        elif ptype in _property_dispatcher:
-            factory_func = _property_dispatcher[ptype]
-            property = factory_func(stream, offset, decoder)
+        stream_parser = cls._stream_parsers.get(parser)
+        if stream_parser is not None:
+            return stream_parser(stream, offset, decoder)
         # end if
 
-        return property
+        # A registered parser only decodes buffers.
+        stream.seek(offset, SEEK_SET)
+        return parser(stream.read(), 0, decoder, ptype)
     # end def make
+
+    @classmethod
+    def make_from_buffer(
+        cls, buf, offset=0, decoder=None, fmtid=None, pid=None,
+        lazy_payloads=False
+    ):
+        """Makes a property object from a buffer.
+
+        The property type is read once, and the property is decoded by the
+        parser from :meth:`get_parser`.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the property structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: An optional codec to decode string properties.
+
+        :type fmtid: :class:`UUID`
+        :param fmtid: The FMTID of the property set that contains the
+                      property.
+
+        :type pid: ``int``
+        :param pid: The property identifier of the property.
+
+        :type lazy_payloads: ``bool``
+        :param lazy_payloads: If ``True``, the payloads of BLOB and
+                              ClipboardData properties are :class:`Payload`
+                              objects that refer to :attr:`buf`.
+
+        :rtype: :class:`PropertyPacket`
+        :returns: The corresponding :class:`PropertyPacket` (or subclass)
+                  object.
+
+        """
+        ptype = _type_from_buffer(buf, offset)
+        parser = cls.get_parser(ptype, fmtid, pid)
+
+        if lazy_payloads and (ptype in cls._payload_types):
+            return parser(buf, offset, decoder, ptype, lazy=True)
+        # end if
+
+        return parser(buf, offset, decoder, ptype)
+    # end def make_from_buffer
 # end class PropertyFactory
 
 # Class used by Builder
+class LazyProperties(Mapping):
+    """A read-only dictionary of properties that are decoded when accessed.
+
+    Each property is decoded the first time it is accessed, and the result
+    is cached.  Iterating over the keys does not decode any properties.
+
+    .. attribute:: pids_offsets
+
+        A dictionary of property identifiers (keys) and the offsets of the
+        corresponding properties (values).
+
+    """
+
+    def __init__(self, pids_offsets, make_property):
+        """Initializes a :class:`LazyProperties` object.
+
+        :type pids_offsets: ``dict``
+        :param pids_offsets: A dictionary of property identifiers (keys) and
+                             the offsets of the corresponding properties.
+
+        :type make_property: ``callable``
+        :param make_property: A callable that takes a property identifier and
+                              an offset, and returns the corresponding
+                              :class:`PropertyPacket` object.
+
+        """
+        self.pids_offsets = pids_offsets
+        self._make_property = make_property
+        self._properties = dict()
+    # end def __init__
+
+    def __getitem__(self, pid):
+        properties = self._properties
+
+        if pid in properties:
+            return properties[pid]
+        # end if
+
+        property = self._make_property(pid, self.pids_offsets[pid])
+        properties[pid] = property
+
+        return property
+    # end def __getitem__
+
+    def __contains__(self, pid):
+        return pid in self.pids_offsets
+    # end def __contains__
+
+    def __iter__(self):
+        return iter(self.pids_offsets)
+    # end def __iter__
+
+    def __len__(self):
+        return len(self.pids_offsets)
+    # end def __len__
+
+    def __repr__(self):
+        return "{0}({1!r})".format(self.__class__.__name__, dict(self))
+    # end def __repr__
+# end class LazyProperties
+
 class PropertySet(Packet, Structuple):
     """Represents a PropertySet structure (packet).
 
@@ -1949,6 +3923,8 @@ class PropertySet(Packet, Structuple):
     .. attribute:: properties
 
         A dictionary of property identifiers and the corresponding properties.
+        If the property set was built lazily, this is a
+        :class:`LazyProperties` object.
 
     """
 
@@ -2020,10 +3996,21 @@ class PropertySetStream(Packet, Structuple):
 # end class PropertySetStream
 
 class Builder():
-    """Builds property set streams."""
+    """Builds property set streams.
+
+    .. attribute:: _factory
+
+        The :class:`PropertyFactory` (or subclass) used to make properties.
+
+    """
+
+    _factory = PropertyFactory
 
     @classmethod
-    def build(cls, stream, offset=None, decoder=None):
+    def build(
+        cls, stream, offset=None, decoder=None, pids=None, lazy=False,
+        lazy_payloads=False
+    ):
         """Builds property set streams from a stream.
 
         :type stream: :class:`~lf.dec.IStream`
@@ -2038,6 +4025,25 @@ class Builder():
                         value is ``None``, one is guessed by using the CodePage
                         property.
 
+        :type pids: ``iterable``
+        :param pids: An optional collection of property identifiers.  If this
+                     is not ``None``, only these properties are built.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the properties are :class:`LazyProperties`
+                     objects, and each property is decoded when it is first
+                     accessed.
+
+        :type lazy_payloads: ``bool``
+        :param lazy_payloads: If ``True``, the payloads of BLOB and
+                              ClipboardData properties (such as thumbnails)
+                              are :class:`Payload` objects that read from
+                              :attr:`stream` when accessed, so they are not
+                              held in memory.  The payloads are not read
+                              while building, only the headers of the
+                              properties.  :attr:`stream` must stay open
+                              while the payloads are used.
+
         :rtype: :class:`PropertySetStream`
         :returns: The corresponding :class:`PropertySetStream` object.
 
@@ -2048,19 +4054,47 @@ class Builder():
         property_sets = list()
         properties = list()
 
-        if offset is None:
-            offset = stream.tell()
+        if offset is not None:
+            stream.seek(offset, SEEK_SET)
+        # end if
+
+        # Property set streams are small, so the whole stream is read once
+        # and the structures are decoded from memory.  Lazy payloads read
+        # from the original stream instead, so they are not read here at all
+        # (see _read_structures).
+        start = stream.tell()
+        size = stream.size
+
+        if lazy_payloads and (size is not None) and (size > start):
+            stream = SubsetIStream(stream, start, size - start)
+            payload_stream = stream
+            buf = None
+        else:
+            data = stream.read()
+            buf = memoryview(data)
+
+            if lazy_payloads:
+                payload_stream = SubsetIStream(stream, start, len(data))
+            else:
+                payload_stream = None
+            # end if
+
+            stream = ByteIStream(data)
+        # end if
+
+        if pids is not None:
+            pids = set(pids)
         # end if
 
-        header = cls.build_property_set_stream_header(stream, offset)
+        header = cls.build_property_set_stream_header(stream, 0)
 
         if header.property_set_count:
             fmtids.append(header.fmtid0)
-            property_set_offsets.append(offset + header.offset0)
+            property_set_offsets.append(header.offset0)
 
             if header.property_set_count > 1:
                 fmtids.append(header.fmtid1)
-                property_set_offsets.append(offset + header.offset1)
+                property_set_offsets.append(header.offset1)
             # end if
         # end if
 
@@ -2070,12 +4104,19 @@ class Builder():
             ))
         # end for
 
+        if buf is None:
+            buf = cls._read_structures(
+                stream, property_set_headers, property_set_offsets, pids
+            )
+        # end if
+
         iter = zip(property_set_headers, fmtids)
         for (index, (property_set, fmtid)) in enumerate(iter):
             property_set_offset = property_set_offsets[index]
 
-            properties.append(cls.build_properties(
-                stream, property_set, property_set_offset, fmtid, decoder
+            properties.append(cls.build_properties_from_buffer(
+                buf, property_set, property_set_offset, fmtid, decoder, pids,
+                lazy, lazy_payloads, payload_stream
             ))
         # end for
 
@@ -2110,6 +4151,92 @@ class Builder():
         ))
     # end def build
 
+    @classmethod
+    def _read_structures(cls, stream, property_sets, offsets, pids=None):
+        """Reads the properties of a stream, without their payloads.
+
+        The properties are copied to a buffer the size of :attr:`stream`, at
+        the same offsets.  Only the headers of properties with a type in the
+        factory's :attr:`~PropertyFactory._payload_types` are read, and the
+        rest of the buffer is never written.  The buffer is an anonymous
+        memory map, so the unwritten pages do not use any memory.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the property set stream.
+
+        :type property_sets: ``list``
+        :param property_sets: The :class:`PropertySetHeader` objects of the
+                              property sets.
+
+        :type offsets: ``list``
+        :param offsets: The offsets of the property sets.
+
+        :type pids: ``set``
+        :param pids: An optional collection of property identifiers.  If this
+                     is not ``None``, only these properties are read.
+
+        :rtype: ``memoryview``
+        :returns: The buffer.
+
+        """
+        size = stream.size
+        data = mmap(-1, size)
+        payload_types = cls._factory._payload_types
+
+        def copy(offset, count):
+            end = min(offset + count, size)
+            if offset >= end:
+                return 0
+            # end if
+
+            stream.seek(offset, SEEK_SET)
+            chunk = stream.read(end - offset)
+            data[offset:offset + len(chunk)] = chunk
+
+            return len(chunk)
+        # end def copy
+
+        for (property_set, set_offset) in zip(property_sets, offsets):
+            pids_offsets = property_set.pids_offsets
+            starts = sorted(set(pids_offsets.values()))
+
+            # A property ends where the next one starts (or at the end of
+            # the property set).
+            set_size = property_set.size
+            if (not starts) or (set_size <= starts[-1]):
+                set_size = size - set_offset
+            # end if
+            ends = dict(zip(starts, starts[1:] + [set_size]))
+
+            for (pid, property_offset) in pids_offsets.items():
+                if pid == CODEPAGE_PROPERTY_IDENTIFIER:
+                    pass
+                elif (pids is not None) and (pid not in pids):
+                    continue
+                # end if
+
+                start = set_offset + property_offset
+                count = ends[property_offset] - property_offset
+
+                if pid == DICTIONARY_PROPERTY_IDENTIFIER:
+                    copy(start, count)
+                    continue
+                # end if
+
+                read = copy(start, min(count, _payload_header_size))
+                if read < 4:
+                    continue
+                # end if
+
+                if _type_from_buffer(data, start) not in payload_types:
+                    copy(start + read, count - read)
+                # end if
+            # end for
+        # end for
+
+        return memoryview(data)
+    # end def _read_structures
+
     @classmethod
     def build_property_set_stream_header(cls, stream, offset=None):
         """Builds a :class:`PropertySetStreamHeader` object.
@@ -2152,7 +4279,8 @@ class Builder():
 
     @classmethod
     def build_properties(
-        cls, stream, property_set, offset=None, fmtid=None, decoder=None
+        cls, stream, property_set, offset=None, fmtid=None, decoder=None,
+        pids=None, lazy=False, lazy_payloads=False
     ):
         """Builds a dictionary of :class:`PropertyPacket` objects.
 
@@ -2172,109 +4300,234 @@ class Builder():
         :type decoder: :class:`codecs.codec`
         :param decoder: A codec to decode string properties.
 
+        :type pids: ``iterable``
+        :param pids: An optional collection of property identifiers.  If this
+                     is not ``None``, only these properties are built.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the properties are :class:`LazyProperties`
+                     objects, and each property is decoded when it is first
+                     accessed.
+
+        :type lazy_payloads: ``bool``
+        :param lazy_payloads: If ``True``, the payloads of BLOB and
+                              ClipboardData properties (such as thumbnails)
+                              are :class:`Payload` objects that read from
+                              :attr:`stream` when accessed, so they are not
+                              held in memory.  :attr:`stream` must stay open
+                              while the payloads are used.
+
         :rtype: ``dict``
         :returns: A dictionary of property identifiers (keys) and the
                   corresponding :class:`PropertyPacket` objects (values).
 
         """
+        if offset is not None:
+            stream.seek(offset, SEEK_SET)
+        # end if
 
-        pids_offsets = property_set.pids_offsets
-        make = PropertyFactory.make
-        properties = dict()
+        start = stream.tell()
+        buf = memoryview(stream.read())
 
-        if offset is None:
-            offset = stream.tell()
+        if lazy_payloads:
+            payload_stream = SubsetIStream(stream, start, len(buf))
+        else:
+            payload_stream = None
         # end if
 
+        return cls.build_properties_from_buffer(
+            buf, property_set, 0, fmtid, decoder, pids, lazy, lazy_payloads,
+            payload_stream
+        )
+    # end def build_properties
+
+    @classmethod
+    def build_properties_from_buffer(
+        cls, buf, property_set, offset=0, fmtid=None, decoder=None, pids=None,
+        lazy=False, lazy_payloads=False, payload_stream=None
+    ):
+        """Builds a dictionary of :class:`PropertyPacket` objects.
+
+        This is used by :meth:`build`.
+
+        :type buf: ``bytes``
+        :param buf: A buffer that contains the property structures.
+
+        :type property_set: :class:`PropertySetHeader`
+        :param property_set: A :class:`PropertySetHeader` object that describes
+                             the properties in the property set.
+
+        :type offset: ``int``
+        :param offset: The start of the property set in :attr:`buf`.
+
+        :type fmtid: :class:`UUID`
+        :param fmtid: The FMTID of the property set.
+
+        :type decoder: :class:`codecs.codec`
+        :param decoder: A codec to decode string properties.
+
+        :type pids: ``iterable``
+        :param pids: An optional collection of property identifiers.  If this
+                     is not ``None``, only these properties are built.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, the properties are :class:`LazyProperties`
+                     objects, and each property is decoded when it is first
+                     accessed.
+
+        :type lazy_payloads: ``bool``
+        :param lazy_payloads: If ``True``, the payloads of BLOB and
+                              ClipboardData properties are :class:`Payload`
+                              objects, instead of ``bytes``.
+
+        :type payload_stream: :class:`~lf.dec.IStream`
+        :param payload_stream: An optional stream with the same contents as
+                               :attr:`buf`.  If this is given, lazy payloads
+                               read from it instead of :attr:`buf`.
+
+        :rtype: ``dict`` or :class:`LazyProperties`
+        :returns: A dictionary of property identifiers (keys) and the
+                  corresponding :class:`PropertyPacket` objects (values).
+
+        """
+        pids_offsets = property_set.pids_offsets
+        make = cls._factory.make_from_buffer
+
         code_page = None
+        code_page_property = None
         if CODEPAGE_PROPERTY_IDENTIFIER in pids_offsets:
             property_offset = pids_offsets[CODEPAGE_PROPERTY_IDENTIFIER]
-            code_page = make(stream, property_offset + offset)
-            code_page = code_page.value
+            code_page_property = make(
+                buf, property_offset + offset, decoder, fmtid,
+                CODEPAGE_PROPERTY_IDENTIFIER
+            )
+            code_page = code_page_property.value
 
             if code_page < 0:  # Not sure why this isn't type VT_UI2
                 code_page = 0xFFFF + code_page + 1
             # end if
 
-            if (code_page in code_page_names) and (decoder is None):
+            if decoder is None:
                 try:
-                    decoder = getdecoder(code_page_names[code_page])
+                    decoder = get_decoder(code_page)
                 except LookupError:
                     pass
                 # end try
             # end if
         # end if
 
-        for (pid, property_offset) in pids_offsets.items():
-            property_offset += offset
+        def make_property(pid, property_offset):
+            if pid == CODEPAGE_PROPERTY_IDENTIFIER:
+                return code_page_property
+            elif pid == DICTIONARY_PROPERTY_IDENTIFIER:
+                return Dictionary.from_buffer(
+                    buf, property_offset + offset, code_page, decoder
+                )
+            # end if
 
-            if pid == DICTIONARY_PROPERTY_IDENTIFIER:
-                property = Dictionary.from_stream(
-                    stream, property_offset, code_page, decoder
+            if not lazy_payloads:
+                return make(
+                    buf, property_offset + offset, decoder, fmtid, pid
                 )
-            else:
-                property = make(stream, property_offset, decoder)
             # end if
 
-            properties[pid] = property
+            property = make(
+                buf, property_offset + offset, decoder, fmtid, pid, True
+            )
+
+            if payload_stream is not None:
+                _rebind_payloads(property, payload_stream)
+            # end if
+
+            return property
+        # end def make_property
+
+        if pids is not None:
+            pids = set(pids)
+            pids_offsets = dict([
+                (pid, property_offset)
+                for (pid, property_offset) in pids_offsets.items()
+                if pid in pids
+            ])
+        # end if
+
+        if lazy:
+            return LazyProperties(pids_offsets, make_property)
+        # end if
+
+        properties = dict()
+        for (pid, property_offset) in pids_offsets.items():
+            properties[pid] = make_property(pid, property_offset)
         # end for
 
         return properties
-    # end def build_properties
+    # end def build_properties_from_buffer
 # end class Builder
 
-# Dispatcher: property type -> class
-_property_dispatcher = {
-    varenum.VT_EMPTY: VT_EMPTY.from_stream,
-    varenum.VT_NULL: VT_NULL.from_stream,
-    varenum.VT_I2: VT_I2.from_stream,
-    varenum.VT_I4: VT_I4.from_stream,
-    varenum.VT_R4: VT_R4.from_stream,
-    varenum.VT_R8: VT_R8.from_stream,
-    varenum.VT_CY: VT_CY.from_stream,
-    varenum.VT_DATE: VT_DATE.from_stream,
-    varenum.VT_BSTR: VT_BSTR.from_stream,
-    varenum.VT_ERROR: VT_ERROR.from_stream,
-    varenum.VT_BOOL: VT_BOOL.from_stream,
-    varenum.VT_DECIMAL: VT_DECIMAL.from_stream,
-    varenum.VT_I1: VT_I1.from_stream,
-    varenum.VT_UI1: VT_UI1.from_stream,
-    varenum.VT_UI2: VT_UI2.from_stream,
-    varenum.VT_UI4: VT_UI4.from_stream,
-    varenum.VT_I8: VT_I8.from_stream,
-    varenum.VT_UI8: VT_UI8.from_stream,
-    varenum.VT_INT: VT_INT.from_stream,
-    varenum.VT_UINT: VT_UINT.from_stream,
-    varenum.VT_LPSTR: VT_LPSTR.from_stream,
-    varenum.VT_LPWSTR: VT_LPWSTR.from_stream,
-    varenum.VT_FILETIME: VT_FILETIME.from_stream,
-    varenum.VT_BLOB: VT_BLOB.from_stream,
-    varenum.VT_STREAM: VT_STREAM.from_stream,
-    varenum.VT_STORAGE: VT_STORAGE.from_stream,
-    varenum.VT_STREAMED_OBJECT: VT_STREAMED_OBJECT.from_stream,
-    varenum.VT_STORED_OBJECT: VT_STORED_OBJECT.from_stream,
-    varenum.VT_BLOB_OBJECT: VT_BLOB_OBJECT.from_stream,
-    varenum.VT_CF: VT_CF.from_stream,
-    varenum.VT_CLSID: VT_CLSID.from_stream,
-    varenum.VT_VERSIONED_STREAM: VT_VERSIONED_STREAM.from_stream,
-    varenum.VT_VARIANT: PropertyFactory.make
+def _rebind_payloads(value, stream):
+    """Points the :class:`Payload` objects in a value at a stream.
+
+    The stream must have the same contents as the buffer the payloads were
+    made from.
+
+    """
+    if isinstance(value, Payload):
+        value._rebind(stream, value.offset)
+    elif isinstance(value, tuple):
+        for item in value:
+            _rebind_payloads(item, stream)
+        # end for
+    # end if
+# end def _rebind_payloads
+
+# Parsers for the elements of sequences (vectors and arrays): type -> parser
+_sequence_parsers = {
+    varenum.VT_EMPTY: VT_EMPTY.from_buffer,
+    varenum.VT_NULL: VT_NULL.from_buffer,
+    varenum.VT_CY: CURRENCY.from_buffer,
+    varenum.VT_DATE: DATE.from_buffer,
+    varenum.VT_BSTR: CodePageString.from_buffer,
+    varenum.VT_DECIMAL: DECIMAL.from_buffer,
+    varenum.VT_ERROR: HRESULT.from_buffer,
+    varenum.VT_LPSTR: CodePageString.from_buffer,
+    varenum.VT_LPWSTR: UnicodeString.from_buffer,
+    varenum.VT_FILETIME: FILETIME.from_buffer,
+    varenum.VT_BLOB: BLOB.from_buffer,
+    varenum.VT_STREAM: IndirectPropertyName.from_buffer,
+    varenum.VT_STORAGE: IndirectPropertyName.from_buffer,
+    varenum.VT_STREAMED_OBJECT: IndirectPropertyName.from_buffer,
+    varenum.VT_STORED_OBJECT: IndirectPropertyName.from_buffer,
+    varenum.VT_BLOB_OBJECT: BLOB.from_buffer,
+    varenum.VT_CF: ClipboardData.from_buffer,
+    varenum.VT_CLSID: GUID.from_buffer,
+    varenum.VT_VERSIONED_STREAM: VersionedStream.from_buffer,
+    varenum.VT_VARIANT: PropertyFactory.make_from_buffer
 }
 
 # Property types that don't require special handling, when dealing with
 # sequences.
 _simple_property_types = {
-    # type: (size in bytes, ctype)
-    varenum.VT_I2: (2, int16_le),
-    varenum.VT_I4: (4, int32_le),
-    varenum.VT_R4: (4, float32_le),
-    varenum.VT_R8: (8, float64_le),
-    varenum.VT_BOOL: (2, uint16_le),
-    varenum.VT_I1: (1, int8),
-    varenum.VT_UI1: (1, uint8),
-    varenum.VT_UI2: (2, uint16_le),
-    varenum.VT_UI4: (4, uint32_le),
-    varenum.VT_I8: (8, int64_le),
-    varenum.VT_UI8: (8, uint64_le),
-    varenum.VT_INT: (4, int32_le),
-    varenum.VT_UINT: (4, uint32_le)
+    # type: (size in bytes, array typecode)
+    varenum.VT_I2: (2, "h"),
+    varenum.VT_I4: (4, "i"),
+    varenum.VT_R4: (4, "f"),
+    varenum.VT_R8: (8, "d"),
+    varenum.VT_BOOL: (2, "H"),
+    varenum.VT_I1: (1, "b"),
+    varenum.VT_UI1: (1, "B"),
+    varenum.VT_UI2: (2, "H"),
+    varenum.VT_UI4: (4, "I"),
+    varenum.VT_I8: (8, "q"),
+    varenum.VT_UI8: (8, "Q"),
+    varenum.VT_INT: (4, "i"),
+    varenum.VT_UINT: (4, "I")
+}
+
+# String property types that are split and decoded in batches, when dealing
+# with sequences.
+_string_property_types = {
+    # type: (element class, character size in bytes)
+    varenum.VT_BSTR: (CodePageString, 1),
+    varenum.VT_LPSTR: (CodePageString, 1),
+    varenum.VT_LPWSTR: (UnicodeString, 2)
 }
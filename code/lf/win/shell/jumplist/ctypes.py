@@ -0,0 +1,35 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Jump list ctypes"""
+
+# local imports
+from lf.win.shell.jumplist.dtypes import (
+    DestListHeader, DestListEntryHeader, DestListEntryFooter,
+    DestListEntryFooterV3
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "dest_list_header", "dest_list_entry_header", "dest_list_entry_footer",
+    "dest_list_entry_footer_v3"
+]
+
+dest_list_header = DestListHeader._ctype_
+dest_list_entry_header = DestListEntryHeader._ctype_
+dest_list_entry_footer = DestListEntryFooter._ctype_
+dest_list_entry_footer_v3 = DestListEntryFooterV3._ctype_
@@ -0,0 +1,65 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Data types to read jump list files."""
+
+# local imports
+from lf.dtypes import raw, LERecord
+from lf.win.dtypes import UINT16, UINT32, UINT64, INT32, REAL32, FILETIME
+from lf.win.shell.link.dtypes import DomainRelativeObjId
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "DestListHeader", "DestListEntryHeader", "DestListEntryFooter",
+    "DestListEntryFooterV3"
+]
+
+class DestListHeader(LERecord):
+    version = UINT32
+    entry_count = UINT32
+    pinned_count = UINT32
+    counter = REAL32
+    last_entry_number = UINT32
+    unknown1 = raw(4)
+    action_count = UINT32
+    unknown2 = raw(4)
+# end class DestListHeader
+
+class DestListEntryHeader(LERecord):
+    checksum = UINT64
+    droid = DomainRelativeObjId
+    droid_birth = DomainRelativeObjId
+    hostname = raw(16)
+    entry_number = UINT32
+    unknown1 = raw(4)
+    access_score = REAL32
+    mtime = FILETIME
+    pin_status = INT32
+# end class DestListEntryHeader
+
+# Windows 7 (version 1) entries
+class DestListEntryFooter(LERecord):
+    path_size = UINT16  # In characters
+# end class DestListEntryFooter
+
+# Windows 10 (version 3 and later) entries
+class DestListEntryFooterV3(LERecord):
+    unknown2 = raw(4)
+    access_count = UINT32
+    unknown3 = raw(8)
+    path_size = UINT16  # In characters
+# end class DestListEntryFooterV3
@@ -0,0 +1,457 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Objects to work with jump list (AutomaticDestinations-ms) files."""
+
+# stdlib imports
+from ctypes import sizeof
+from codecs import getdecoder
+
+# local imports
+from lf.dec import SEEK_SET, RawIStream
+from lf.dtypes import ActiveStructuple
+from lf.time import FILETIMETodatetime
+from lf.win.ole.cfb import CompoundFile
+from lf.win.shell.link.objects import ShellLink, DomainRelativeObjId
+
+from lf.win.shell.jumplist.ctypes import (
+    dest_list_header, dest_list_entry_header, dest_list_entry_footer,
+    dest_list_entry_footer_v3
+)
+
+# module globals
+_utf16_le_decoder = getdecoder("utf_16_le")
+
+_header_size = sizeof(dest_list_header)
+_entry_header_size = sizeof(dest_list_entry_header)
+_entry_footer_size = sizeof(dest_list_entry_footer)
+_entry_footer_v3_size = sizeof(dest_list_entry_footer_v3)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "JumpList", "DestList", "DestListEntry", "iter_timeline"
+]
+
+class JumpList():
+    """Represents a jump list (AutomaticDestinations-ms) file.
+
+    The embedded shell links are only read and parsed when they are asked
+    for, with :meth:`get_link`, :meth:`iter_links` or :meth:`iter_items`.
+
+    .. attribute:: cfb
+
+        The :class:`~lf.win.ole.cfb.CompoundFile` of the jump list.
+
+    .. attribute:: dest_list
+
+        An instance of a :class:`DestList` object.
+
+    """
+
+    def __init__(self, cfb, dest_list_name="DestList"):
+        """Initializes a :class:`JumpList` object.
+
+        :type cfb: :class:`~lf.win.ole.cfb.CompoundFile`
+        :param cfb: An OLE compound file that represents the jump list.
+
+        :type dest_list_name: ``str``
+        :param dest_list_name: The name of the DestList OLE stream.
+
+        :raises KeyError: If :attr:`dest_list_name` is not found in
+                          :attr:`cfb`.
+
+        """
+        name_index = cfb.name_index
+
+        if dest_list_name not in name_index:
+            raise KeyError("DestList {0} not found".format(dest_list_name))
+        # end if
+
+        self.cfb = cfb
+        self.dest_list = DestList.from_stream(
+            cfb.get_stream(name_index[dest_list_name])
+        )
+    # end def __init__
+
+    def get_link(self, entry):
+        """Reads and parses the shell link for an entry.
+
+        :type entry: :class:`DestListEntry`
+        :param entry: An entry from :attr:`dest_list`.
+
+        :raises KeyError: If the stream for :attr:`entry` is not found.
+
+        :rtype: :class:`~lf.win.shell.link.ShellLink`
+        :returns: The shell link for :attr:`entry`.
+
+        """
+        cfb = self.cfb
+        stream = cfb.get_stream(cfb.name_index[entry.stream_name])
+        stream.seek(0, SEEK_SET)
+
+        return ShellLink.from_buffer(stream.read())
+    # end def get_link
+
+    def iter_links(self):
+        """Iterates over the entries and their shell links.
+
+        Each link is read and parsed as it is reached, so only one is in
+        memory at a time (unless the caller keeps them).
+
+        :rtype: iterator
+        :returns: An iterator of ``(entry, link)`` tuples, in the order of
+                  :attr:`dest_list`.  ``link`` is ``None`` if the stream for
+                  the entry is missing, or can not be parsed.
+
+        """
+        get_link = self.get_link
+
+        for entry in self.dest_list.entries:
+            try:
+                link = get_link(entry)
+            except Exception:
+                link = None
+            # end try
+
+            yield (entry, link)
+        # end for
+    # end def iter_links
+
+    def iter_items(self):
+        """Iterates over the entries and the shell items of their links.
+
+        The shell items are made by
+        :class:`~lf.win.shell.objects.ShellItemFactory`, so items shared by
+        many entries (e.g. the root folder and volume) are only decoded once.
+
+        :rtype: iterator
+        :returns: An iterator of ``(entry, items)`` tuples, in the order of
+                  :attr:`dest_list`.  ``items`` is ``None`` if the link for
+                  the entry is missing, or can not be parsed.
+
+        """
+        for (entry, link) in self.iter_links():
+            if link is None:
+                yield (entry, None)
+            else:
+                yield (entry, link.items)
+            # end if
+        # end for
+    # end def iter_items
+# end class JumpList
+
+class DestList(ActiveStructuple):
+    """Represents the DestList stream of a jump list.
+
+    .. attribute:: version
+
+        The version of the stream format.  1 is used by Windows 7, and 3 (or
+        later) by Windows 10.
+
+    .. attribute:: entry_count
+
+        The number of entries.
+
+    .. attribute:: pinned_count
+
+        The number of pinned entries.
+
+    .. attribute:: counter
+
+        An unknown floating point counter.
+
+    .. attribute:: last_entry_number
+
+        The last entry number that was issued.
+
+    .. attribute:: action_count
+
+        The number of times an entry was added or removed.
+
+    .. attribute:: entries
+
+        A list of :class:`DestListEntry` objects.
+
+    """
+    _takes_stream = True
+    _fields_ = (
+        "version", "entry_count", "pinned_count", "counter",
+        "last_entry_number", "action_count", "entries"
+    )
+
+    @classmethod
+    def from_stream(cls, stream, offset=None):
+        """Creates a :class:`DestList` object from a stream.
+
+        The rest of the stream is read at once, and handed to
+        :meth:`from_buffer`.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`stream`.
+
+        :rtype: :class:`DestList`
+        :returns: The corresponding :class:`DestList` object.
+
+        """
+        if offset is not None:
+            stream.seek(offset, SEEK_SET)
+        # end if
+
+        return cls.from_buffer(stream.read())
+    # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`DestList` object from a buffer.
+
+        The entries are decoded in a single pass over :attr:`buf`, and their
+        timestamps are converted together with
+        :meth:`~lf.time.FILETIMETodatetime.from_ints`.  Parsing stops early
+        (without an error) at the first entry that does not fit in
+        :attr:`buf`.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :raises ValueError: If :attr:`buf` is too small for the header.
+
+        :rtype: :class:`DestList`
+        :returns: The corresponding :class:`DestList` object.
+
+        """
+        buf_size = len(buf)
+        header = dest_list_header.from_buffer_copy(buf, offset)
+        offset += _header_size
+
+        if header.version >= 3:
+            footer_ctype = dest_list_entry_footer_v3
+            footer_size = _entry_footer_v3_size
+            tail_size = 4
+        else:
+            footer_ctype = dest_list_entry_footer
+            footer_size = _entry_footer_size
+            tail_size = 0
+        # end if
+
+        fixed_size = _entry_header_size + footer_size
+        from_droid = DomainRelativeObjId.from_buffer
+
+        fields = list()
+        mtimes = list()
+        for counter in range(header.entry_count):
+            if (offset + fixed_size) > buf_size:
+                break
+            # end if
+
+            entry = dest_list_entry_header.from_buffer_copy(buf, offset)
+            footer = footer_ctype.from_buffer_copy(
+                buf, offset + _entry_header_size
+            )
+
+            path_start = offset + fixed_size
+            path_end = path_start + (footer.path_size * 2)
+            size = (path_end + tail_size) - offset
+            if (offset + size) > buf_size:
+                break
+            # end if
+
+            path = _utf16_le_decoder(bytes(buf[path_start:path_end]))[0]
+
+            hostname = bytes(buf[offset + 72:offset + 88])
+            hostname = hostname.split(b"\x00", 1)[0].decode("latin_1")
+
+            if footer_ctype is dest_list_entry_footer_v3:
+                access_count = footer.access_count
+            else:
+                access_count = None
+            # end if
+
+            fields.append((
+                size,
+                entry.checksum,
+                from_droid(buf, offset + 8),
+                from_droid(buf, offset + 40),
+                hostname,
+                entry.entry_number,
+                entry.access_score,
+                entry.pin_status,
+                access_count,
+                path,
+                "{0:x}".format(entry.entry_number)
+            ))
+            mtimes.append(entry.mtime)
+
+            offset += size
+        # end for
+
+        mtimes = FILETIMETodatetime.from_ints(mtimes, strict=False)
+
+        entries = [
+            DestListEntry((
+                size, checksum, droid, droid_birth, hostname, entry_number,
+                access_score, mtime, pin_status, access_count, path,
+                stream_name
+            ))
+            for (
+                (
+                    size, checksum, droid, droid_birth, hostname,
+                    entry_number, access_score, pin_status, access_count,
+                    path, stream_name
+                ),
+                mtime
+            ) in zip(fields, mtimes)
+        ]
+
+        return cls((
+            header.version, header.entry_count, header.pinned_count,
+            header.counter, header.last_entry_number, header.action_count,
+            entries
+        ))
+    # end def from_buffer
+# end class DestList
+
+class DestListEntry(ActiveStructuple):
+    """Represents an entry in a :class:`DestList`.
+
+    .. attribute:: size
+
+        The total size of the entry.
+
+    .. attribute:: checksum
+
+        The checksum of the entry.
+
+    .. attribute:: droid
+
+        A :class:`~lf.win.shell.link.DomainRelativeObjId` for the target,
+        used by the Link Tracking Service.
+
+    .. attribute:: droid_birth
+
+        A :class:`~lf.win.shell.link.DomainRelativeObjId` for the target,
+        when it was created.
+
+    .. attribute:: hostname
+
+        The NetBIOS name of the machine the target was on.
+
+    .. attribute:: entry_number
+
+        The number of the entry.
+
+    .. attribute:: access_score
+
+        A floating point value, that increases as the target is used.
+
+    .. attribute:: mtime
+
+        The time the entry was last modified (i.e. the target was last
+        used).  If this can not be converted to a ``datetime``, it is the
+        raw ``int``.
+
+    .. attribute:: pin_status
+
+        The position of the entry in the pinned list, or -1 if the entry is
+        not pinned.
+
+    .. attribute:: access_count
+
+        The number of times the target was used.  This is ``None`` for
+        version 1 (Windows 7) entries.
+
+    .. attribute:: path
+
+        The path (or URL) of the target.
+
+    .. attribute:: stream_name
+
+        The name of the OLE stream with the shell link. (computed)
+
+    """
+    _fields_ = (
+        "size", "checksum", "droid", "droid_birth", "hostname",
+        "entry_number", "access_score", "mtime", "pin_status",
+        "access_count", "path", "stream_name"
+    )
+# end class DestListEntry
+
+def iter_timeline(paths, with_links=True, strict=True):
+    """Iterates over the entries in many jump list files.
+
+    The files are opened one at a time, and each is closed before the next
+    one is opened, so this is suited to streaming the entries of many files
+    into a timeline.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the jump list files.
+
+    :type with_links: ``bool``
+    :param with_links: If ``True``, the shell link for each entry is parsed
+                       as well.
+
+    :type strict: ``bool``
+    :param strict: If ``False``, files that can not be opened or parsed are
+                   skipped, instead of raising an exception.
+
+    :rtype: iterator
+    :returns: An iterator of ``(path, entry, link)`` tuples.  ``link`` is
+              ``None`` if :attr:`with_links` is ``False``, or the link can
+              not be parsed.
+
+    """
+    for path in paths:
+        try:
+            stream = RawIStream(path)
+        except Exception:
+            if strict:
+                raise
+            # end if
+
+            continue
+        # end try
+
+        try:
+            try:
+                jump_list = JumpList(CompoundFile(stream))
+            except Exception:
+                if strict:
+                    raise
+                # end if
+
+                continue
+            # end try
+
+            if with_links:
+                for (entry, link) in jump_list.iter_links():
+                    yield (path, entry, link)
+                # end for
+            else:
+                for entry in jump_list.dest_list.entries:
+                    yield (path, entry, None)
+                # end for
+            # end if
+        finally:
+            stream.close()
+        # end try
+    # end for
+# end def iter_timeline
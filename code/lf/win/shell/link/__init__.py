@@ -23,8 +23,8 @@ from lf.win.shell.link.objects import (
     DarwinProps, ExpandableStringsDataBlock, EnvironmentProps,
     IconEnvironmentProps, KnownFolderProps, PropertyStoreProps, ShimProps,
     SpecialFolderProps, DomainRelativeObjId, TrackerProps,
-    VistaAndAboveIDListProps, TerminalBlock, ExtraDataBlockFactory,
-    StringDataSet
+    VistaAndAboveIDListProps, TerminalBlock, LazyExtraDataBlock,
+    ExtraDataBlockFactory, StringDataSet
 )
 
 __docformat__ = "restructuredtext en"
@@ -35,7 +35,7 @@ __all__ = [
     "ExpandableStringsDataBlock", "EnvironmentProps", "IconEnvironmentProps",
     "KnownFolderProps", "PropertyStoreProps", "ShimProps",
     "SpecialFolderProps", "DomainRelativeObjId", "TrackerProps",
-    "VistaAndAboveIDListProps", "TerminalBlock", "ExtraDataBlockFactory",
-    "StringDataSet"
+    "VistaAndAboveIDListProps", "TerminalBlock", "LazyExtraDataBlock",
+    "ExtraDataBlockFactory", "StringDataSet"
 ]
 
@@ -0,0 +1,415 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Carving shell link (.lnk) files from raw images and unallocated space."""
+
+# stdlib imports
+import os
+from concurrent.futures import ProcessPoolExecutor
+from struct import Struct
+
+# local imports
+from lf.dec import SEEK_SET
+from lf.utils.batch import iter_bounded
+from lf.win.shell.link.objects import ShellLink
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "is_link_header", "link_size", "scan", "scan_chunk", "carve",
+    "carve_parallel"
+]
+
+# The HeaderSize field (0x4C) followed by the LinkCLSID
+# (00021401-0000-0000-C000-000000000046) as it is stored on disk.
+_link_signature = (
+    b"\x4C\x00\x00\x00\x01\x14\x02\x00\x00\x00\x00\x00"
+    b"\xC0\x00\x00\x00\x00\x00\x00\x46"
+)
+
+_header_size = 0x4C
+_block_size = 4194304
+_chunk_size = 67108864
+_max_link_size = 65536
+
+_uint16_le = Struct("<H")
+_uint32_le = Struct("<I")
+
+# The flags in the header that decide which structures follow it.
+_HAS_IDLIST = 0x1
+_HAS_LINK_INFO = 0x2
+_HAS_STRING_FLAGS = (0x4, 0x8, 0x10, 0x20, 0x40)
+_IS_UNICODE = 0x80
+
+def is_link_header(buf, offset=0):
+    """Cheaply checks if a shell link header starts at an offset.
+
+    Besides the size and CLSID, this checks that the reserved fields are
+    zero and that none of the timestamps have their high bit set.
+
+    :type buf: ``bytes`` or ``memoryview``
+    :param buf: A buffer that may contain a shell link header.
+
+    :type offset: ``int``
+    :param offset: The start of the header in :attr:`buf`.
+
+    :rtype: ``bool``
+    :returns: True if the header passes the checks.
+
+    """
+    if (offset + _header_size) > len(buf):
+        return False
+    # end if
+
+    if buf[offset:offset + 20] != _link_signature:
+        return False
+    # end if
+
+    # The high byte of each FILETIME (btime, atime, mtime).
+    for time_offset in (35, 43, 51):
+        if buf[offset + time_offset] & 0x80:
+            return False
+        # end if
+    # end for
+
+    return not any(buf[offset + 66:offset + 76])
+# end def is_link_header
+
+def link_size(buf, offset=0):
+    """Finds the size of a shell link by walking its structures.
+
+    Only the size fields are read, so this is much cheaper than parsing the
+    link.  The walk ends at the terminal extra data block, which must be in
+    :attr:`buf`.
+
+    :type buf: ``bytes`` or ``memoryview``
+    :param buf: A buffer that contains the shell link.
+
+    :type offset: ``int``
+    :param offset: The start of the shell link in :attr:`buf`.
+
+    :rtype: ``int`` or ``None``
+    :returns: The size of the shell link (in bytes), or ``None`` if it does
+              not fit in :attr:`buf` or a size field is invalid.
+
+    """
+    buf_size = len(buf)
+    if (offset + _header_size) > buf_size:
+        return None
+    # end if
+
+    flags = _uint32_le.unpack_from(buf, offset + 20)[0]
+    pos = offset + _header_size
+
+    if flags & _HAS_IDLIST:
+        if (pos + 2) > buf_size:
+            return None
+        # end if
+
+        pos += _uint16_le.unpack_from(buf, pos)[0] + 2
+    # end if
+
+    if flags & _HAS_LINK_INFO:
+        if (pos + 4) > buf_size:
+            return None
+        # end if
+
+        link_info_size = _uint32_le.unpack_from(buf, pos)[0]
+        if link_info_size < 0x1C:
+            return None
+        # end if
+
+        pos += link_info_size
+    # end if
+
+    if flags & _IS_UNICODE:
+        char_size = 2
+    else:
+        char_size = 1
+    # end if
+
+    for string_flag in _HAS_STRING_FLAGS:
+        if flags & string_flag:
+            if (pos + 2) > buf_size:
+                return None
+            # end if
+
+            pos += (_uint16_le.unpack_from(buf, pos)[0] * char_size) + 2
+        # end if
+    # end for
+
+    while (pos + 4) <= buf_size:
+        block_size = _uint32_le.unpack_from(buf, pos)[0]
+        if block_size < 4:
+            return (pos + 4) - offset
+        # end if
+
+        pos += block_size
+    # end while
+
+    return None
+# end def link_size
+
+def scan(
+    stream, start=0, end=None, block_size=_block_size,
+    max_link_size=_max_link_size
+):
+    """Finds shell links in a stream.
+
+    The stream is read in blocks of :attr:`block_size` bytes, and each block
+    is searched for the link header signature.  Every block is read with an
+    extra :attr:`max_link_size` bytes, so a link that starts near the end of
+    a block is still seen whole.  Candidates have to pass
+    :func:`is_link_header` and :func:`link_size` to be reported.
+
+    :type stream: :class:`~lf.dec.IStream`
+    :param stream: The stream to search.
+
+    :type start: ``int``
+    :param start: The offset in :attr:`stream` to start searching at.
+
+    :type end: ``int``
+    :param end: Only links that start before this offset are reported.  If
+                this is ``None``, the size of the stream is used.
+
+    :type block_size: ``int``
+    :param block_size: The number of bytes to search per read.
+
+    :type max_link_size: ``int``
+    :param max_link_size: The largest link (in bytes) that can be found.
+
+    :rtype: iterator
+    :returns: An iterator of ``(offset, data)`` tuples, where ``data`` is the
+              ``bytes`` of the link.
+
+    """
+    if end is None:
+        end = stream.size
+    # end if
+
+    signature = _link_signature
+    search_slack = len(signature) - 1
+    pos = start
+
+    while pos < end:
+        limit = min(block_size, end - pos)
+
+        stream.seek(pos, SEEK_SET)
+        data = stream.read(limit + max_link_size)
+        if not data:
+            break
+        # end if
+
+        view = memoryview(data)
+        hit = data.find(signature, 0, limit + search_slack)
+        while hit != -1:
+            if is_link_header(data, hit):
+                size = link_size(view, hit)
+                if (size is not None) and (size <= max_link_size):
+                    yield (pos + hit, data[hit:hit + size])
+                # end if
+            # end if
+
+            hit = data.find(signature, hit + 1, limit + search_slack)
+        # end while
+
+        pos += limit
+    # end while
+# end def scan
+
+def scan_chunk(
+    opener, start, end, block_size=_block_size, max_link_size=_max_link_size
+):
+    """Finds shell links that start in one chunk of a stream.
+
+    This is the unit of work for :func:`carve_parallel`.  Only links that
+    start in the chunk are reported, but (like any block read by
+    :func:`scan`) the chunk is read with an extra :attr:`max_link_size`
+    bytes, so links that straddle the chunk boundary are found by the chunk
+    they start in (and only that chunk).
+
+    :type opener: callable
+    :param opener: A callable with no arguments that returns a new
+                   :class:`~lf.dec.IStream`.
+
+    :type start: ``int``
+    :param start: The start of the chunk.
+
+    :type end: ``int``
+    :param end: The end of the chunk.
+
+    :type block_size: ``int``
+    :param block_size: Passed on to :func:`scan`.
+
+    :type max_link_size: ``int``
+    :param max_link_size: Passed on to :func:`scan`.
+
+    :rtype: ``list``
+    :returns: A list of ``(offset, data)`` tuples, with offsets relative to
+              the start of the whole stream.
+
+    """
+    stream = opener()
+    try:
+        return list(scan(stream, start, end, block_size, max_link_size))
+    finally:
+        stream.close()
+    # end try
+# end def scan_chunk
+
+def _parse_links(records):
+    """Parses ``(offset, data)`` records into ``(offset, ShellLink)``.
+
+    Candidates that the full parser rejects are skipped.
+
+    """
+    for (offset, data) in records:
+        try:
+            shell_link = ShellLink.from_buffer(data)
+        except Exception:
+            continue
+        # end try
+
+        yield (offset, shell_link)
+    # end for
+# end def _parse_links
+
+def carve(
+    stream, start=0, end=None, block_size=_block_size,
+    max_link_size=_max_link_size
+):
+    """Carves shell links from a stream, in the current process.
+
+    :type stream: :class:`~lf.dec.IStream`
+    :param stream: The stream to carve from (e.g. a raw image).
+
+    :type start: ``int``
+    :param start: Passed on to :func:`scan`.
+
+    :type end: ``int``
+    :param end: Passed on to :func:`scan`.
+
+    :type block_size: ``int``
+    :param block_size: Passed on to :func:`scan`.
+
+    :type max_link_size: ``int``
+    :param max_link_size: Passed on to :func:`scan`.
+
+    :rtype: iterator
+    :returns: An iterator of ``(offset, ShellLink)`` tuples, in order of
+              offset.
+
+    """
+    return _parse_links(
+        scan(stream, start, end, block_size, max_link_size)
+    )
+# end def carve
+
+def carve_parallel(
+    opener, start=0, end=None, chunk_size=_chunk_size, workers=None,
+    max_pending=None, block_size=_block_size, max_link_size=_max_link_size
+):
+    """Carves shell links from a stream, using a pool of processes.
+
+    The stream is split into chunks of :attr:`chunk_size` bytes, and each
+    chunk is searched by :func:`scan_chunk` in a worker process.  The links
+    are parsed as the results come back, in order of offset.  At most
+    :attr:`max_pending` chunks are in flight at once.
+
+    :type opener: callable
+    :param opener: A callable with no arguments that returns a new
+                   :class:`~lf.dec.IStream` (e.g.
+                   ``functools.partial(RawIStream, "image.dd")``).  It is
+                   called once per chunk, in the worker, so it has to be
+                   picklable.
+
+    :type start: ``int``
+    :param start: The offset to start carving at.
+
+    :type end: ``int``
+    :param end: The offset to stop carving at.  If this is ``None``, the
+                size of the stream is used.
+
+    :type chunk_size: ``int``
+    :param chunk_size: The number of bytes per chunk.
+
+    :type workers: ``int``
+    :param workers: The number of worker processes.  If this is ``None`` the
+                    number of CPUs is used.  If this is 0, the chunks are
+                    processed in the current process.
+
+    :type max_pending: ``int``
+    :param max_pending: The maximum number of chunks in flight.  Defaults to
+                        2 times the number of workers.
+
+    :type block_size: ``int``
+    :param block_size: Passed on to :func:`scan`.
+
+    :type max_link_size: ``int``
+    :param max_link_size: Passed on to :func:`scan`.
+
+    :rtype: iterator
+    :returns: An iterator of ``(offset, ShellLink)`` tuples, in order of
+              offset.
+
+    """
+    if end is None:
+        stream = opener()
+        end = stream.size
+        stream.close()
+    # end if
+
+    chunks = [
+        (chunk_start, min(chunk_start + chunk_size, end))
+        for chunk_start in range(start, end, chunk_size)
+    ]
+
+    if workers == 0:
+        for (chunk_start, chunk_end) in chunks:
+            records = scan_chunk(
+                opener, chunk_start, chunk_end, block_size, max_link_size
+            )
+
+            for record in _parse_links(records):
+                yield record
+            # end for
+        # end for
+
+        return
+    # end if
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # end if
+
+    if max_pending is None:
+        max_pending = workers * 2
+    # end if
+
+    with ProcessPoolExecutor(workers) as executor:
+        arg_lists = (
+            (opener, chunk_start, chunk_end, block_size, max_link_size)
+            for (chunk_start, chunk_end) in chunks
+        )
+        results = iter_bounded(executor, scan_chunk, arg_lists, max_pending)
+
+        for records in results:
+            for record in _parse_links(records):
+                yield record
+            # end for
+        # end for
+    # end with
+# end def carve_parallel
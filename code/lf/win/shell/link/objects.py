@@ -19,6 +19,7 @@
 
 # stdlib imports
 from codecs import utf_16_le_decode as _utf16_le_decoder
+from functools import partial
 
 # local imports
 from lf.dec import SEEK_SET
@@ -53,13 +54,45 @@ __all__ = [
     "ExpandableStringsDataBlock", "EnvironmentProps", "IconEnvironmentProps",
     "KnownFolderProps", "PropertyStoreProps", "ShimProps",
     "SpecialFolderProps", "DomainRelativeObjId", "TrackerProps",
-    "VistaAndAboveIDListProps", "TerminalBlock", "ExtraDataBlockFactory",
-    "StringDataSet"
+    "VistaAndAboveIDListProps", "TerminalBlock", "LazyExtraDataBlock",
+    "ExtraDataBlockFactory", "StringDataSet"
 ]
 
+def _read_buffer(buf, offset, size):
+    """Reads bytes from a buffer the way a stream read would.
+
+    A negative :attr:`size` reads to the end of the buffer, and reads that
+    run past the end are truncated.
+
+    :type buf: ``memoryview``
+    :param buf: The buffer to read from.
+
+    :type offset: ``int``
+    :param offset: The start of the bytes in :attr:`buf`.
+
+    :type size: ``int``
+    :param size: The number of bytes to read.
+
+    :rtype: ``bytes``
+    :returns: The bytes read.
+
+    """
+    if size < 0:
+        return bytes(buf[offset:])
+    # end if
+
+    return bytes(buf[offset:offset + size])
+# end def _read_buffer
+
 class ShellLink():
     """Represents a shell link (.lnk) file.
 
+    Link files are small, so the constructor reads the whole link with a
+    single call and parses it from a ``memoryview`` (see
+    :meth:`from_buffer`).  If the stream holds :attr:`max_buffer_size` bytes
+    or more past :attr:`offset`, the structures are read from the stream
+    one at a time instead.
+
     .. attribute:: header
 
         A :class:`ShellLinkHeader` object.
@@ -69,6 +102,12 @@ class ShellLink():
         An :class:`~lf.win.shell.objects.ITEMIDLIST` describing the target (or
         None if not present).
 
+    .. attribute:: items
+
+        The typed (and interned) shell items of :attr:`idlist`, or an empty
+        list if there is no :attr:`idlist` (see
+        :attr:`lf.win.shell.objects.ITEMIDLIST.items`).
+
     .. attribute:: link_info
 
         A :class:`LinkInfo` object (or None if not present).
@@ -79,11 +118,22 @@ class ShellLink():
 
     .. attribute:: extra_data
 
-        A list of :class:`ExtraDataBlock` objects.
+        A list of :class:`ExtraDataBlock` objects (or
+        :class:`LazyExtraDataBlock` objects, if the link was parsed with
+        ``lazy_blocks=True``).
+
+    .. attribute:: max_buffer_size
+
+        The number of bytes the constructor reads up front.  Set this (on the
+        class or an instance) to 0 to always parse from the stream.
 
     """
 
-    def __init__(self, stream, offset=None):
+    max_buffer_size = 65536
+
+    def __init__(
+        self, stream, offset=None, wanted_sigs=None, lazy_blocks=False
+    ):
         """Initializes a ShellLink object.
 
         :type stream: :class:`~lf.dec.IStream`
@@ -92,11 +142,87 @@ class ShellLink():
         :type offset: ``int``
         :param offset: The start of the link file, in :attr:`stream`.
 
+        :type wanted_sigs: ``set``
+        :param wanted_sigs: If not ``None``, only extra data blocks with
+                            these signatures are decoded (and kept in
+                            :attr:`extra_data`).
+
+        :type lazy_blocks: ``bool``
+        :param lazy_blocks: If ``True``, the extra data blocks are only
+                            decoded when they are first used.  When the link
+                            is parsed from the stream (see
+                            :attr:`max_buffer_size`), the stream must stay
+                            open until then.
+
         """
         if offset is None:
             offset = stream.tell()
         # end if
 
+        max_buffer_size = self.max_buffer_size
+        if max_buffer_size > 0:
+            stream.seek(offset, SEEK_SET)
+            data = stream.read(max_buffer_size)
+
+            if len(data) < max_buffer_size:
+                self._parse_buffer(
+                    memoryview(data), 0, wanted_sigs, lazy_blocks
+                )
+                return
+            # end if
+        # end if
+
+        self._parse_stream(stream, offset, wanted_sigs, lazy_blocks)
+    # end def __init__
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, wanted_sigs=None, lazy_blocks=False):
+        """Creates a :class:`ShellLink` object from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the link file.
+
+        :type offset: ``int``
+        :param offset: The start of the link file in :attr:`buf`.
+
+        :type wanted_sigs: ``set``
+        :param wanted_sigs: If not ``None``, only extra data blocks with
+                            these signatures are decoded (and kept in
+                            :attr:`extra_data`).
+
+        :type lazy_blocks: ``bool``
+        :param lazy_blocks: If ``True``, the extra data blocks are only
+                            decoded when they are first used.
+
+        :rtype: :class:`ShellLink`
+        :returns: The corresponding :class:`ShellLink` object.
+
+        """
+        shell_link = cls.__new__(cls)
+        shell_link._parse_buffer(
+            memoryview(buf), offset, wanted_sigs, lazy_blocks
+        )
+        return shell_link
+    # end def from_buffer
+
+    def _parse_stream(
+        self, stream, offset, wanted_sigs=None, lazy_blocks=False
+    ):
+        """Parses the link file with one read per structure.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the link file.
+
+        :type offset: ``int``
+        :param offset: The start of the link file, in :attr:`stream`.
+
+        :type wanted_sigs: ``set``
+        :param wanted_sigs: Passed on to :class:`ExtraDataBlockFactory`.
+
+        :type lazy_blocks: ``bool``
+        :param lazy_blocks: Passed on to :class:`ExtraDataBlockFactory`.
+
+        """
         header = ShellLinkHeader.from_stream(stream, offset)
         offset += header.size
         flags = header.flags
@@ -120,53 +246,101 @@ class ShellLink():
             link_info = None
         # end if
 
-        if flags.has_name:
-            name_str = StringData.from_stream(stream, offset, is_unicode)
-            offset += name_str.size
-        else:
-            name_str = None
-        # end if
+        strings = list()
+        for has_string in (
+            flags.has_name, flags.has_relative_path, flags.has_working_dir,
+            flags.has_args, flags.has_icon_location
+        ):
+            if has_string:
+                string = StringData.from_stream(stream, offset, is_unicode)
+                offset += string.size
+            else:
+                string = None
+            # end if
 
-        if flags.has_relative_path:
-            rel_path  = StringData.from_stream(stream, offset, is_unicode)
-            offset += rel_path.size
-        else:
-            rel_path = None
-        # end if
+            strings.append(string)
+        # end for
 
-        if flags.has_working_dir:
-            working_dir = StringData.from_stream(stream, offset, is_unicode)
-            offset += working_dir.size
-        else:
-            working_dir = None
-        # end if
+        self.header = header
+        self.idlist = id_list
+        self.link_info = link_info
+        self.string_data = StringDataSet(strings)
+        self.extra_data = list(ExtraDataBlockFactory.make_blocks(
+            stream, offset, wanted_sigs, lazy_blocks
+        ))
+    # end def _parse_stream
+
+    def _parse_buffer(self, buf, offset, wanted_sigs=None, lazy_blocks=False):
+        """Parses the link file from a buffer.
+
+        :type buf: ``memoryview``
+        :param buf: A buffer that contains the link file.
+
+        :type offset: ``int``
+        :param offset: The start of the link file in :attr:`buf`.
+
+        :type wanted_sigs: ``set``
+        :param wanted_sigs: Passed on to :class:`ExtraDataBlockFactory`.
+
+        :type lazy_blocks: ``bool``
+        :param lazy_blocks: Passed on to :class:`ExtraDataBlockFactory`.
+
+        """
+        header = ShellLinkHeader.from_buffer(buf, offset)
+        offset += header.size
+        flags = header.flags
+
+        is_unicode = flags.is_unicode
 
-        if flags.has_args:
-            cmd_args = StringData.from_stream(stream, offset, is_unicode)
-            offset += cmd_args.size
+        if flags.has_idlist:
+            id_list_size = uint16_le.from_buffer_copy(buf, offset).value
+            offset += 2
+            id_list = ITEMIDLIST.from_buffer(buf, offset, id_list_size)
+            offset += id_list_size
         else:
-            cmd_args = None
+            id_list = None
         # end if
 
-        if flags.has_icon_location:
-            icon_location = StringData.from_stream(stream, offset, is_unicode)
-            offset += icon_location.size
+        if flags.has_link_info:
+            link_info = LinkInfo.from_buffer(buf, offset)
+            offset += link_info.size
         else:
-            icon_location = None
+            link_info = None
         # end if
 
-        string_data = StringDataSet((
-            name_str, rel_path, working_dir, cmd_args, icon_location
-        ))
+        strings = list()
+        for has_string in (
+            flags.has_name, flags.has_relative_path, flags.has_working_dir,
+            flags.has_args, flags.has_icon_location
+        ):
+            if has_string:
+                string = StringData.from_buffer(buf, offset, is_unicode)
+                offset += string.size
+            else:
+                string = None
+            # end if
 
-        extra_data = list(ExtraDataBlockFactory.make_blocks(stream, offset))
+            strings.append(string)
+        # end for
 
         self.header = header
         self.idlist = id_list
         self.link_info = link_info
-        self.string_data = string_data
-        self.extra_data = extra_data
-    # end def __init__
+        self.string_data = StringDataSet(strings)
+        self.extra_data = list(ExtraDataBlockFactory.make_blocks_from_buffer(
+            buf, offset, wanted_sigs, lazy_blocks
+        ))
+    # end def _parse_buffer
+
+    @property
+    def items(self):
+        idlist = self.idlist
+        if idlist is None:
+            return list()
+        # end if
+
+        return idlist.items
+    # end def items
 # end class ShellLink
 
 class StringDataSet(Structuple):
@@ -270,6 +444,45 @@ class StringData(ActiveStructuple):
 
         return cls((read_size + 2, char_count, string))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, is_unicode=True):
+        """Creates a :class:`StringData` object from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :type is_unicode: ``bool``
+        :param is_unicode: If the string is in unicode (utf16-le)
+
+        :rtype: :class:`StringData`
+        :returns: The corresponding :class:`StringData` object.
+
+        """
+        char_count = uint16_le.from_buffer_copy(buf, offset).value
+        offset += 2
+
+        if is_unicode:
+            read_size = char_count * 2
+        else:
+            read_size = char_count
+        # end if
+
+        string = bytes(buf[offset:offset + read_size])
+
+        if is_unicode:
+            new_string = _utf16_le_decoder(string, "ignore")[0]
+
+            if new_string:
+                string = new_string
+            # end if
+        # end if
+
+        return cls((read_size + 2, char_count, string))
+    # end def from_buffer
 # end class StringData
 
 class FileAttributes(CtypesWrapper):
@@ -594,6 +807,24 @@ class ShellLinkHeader(ActiveStructuple):
             ctype.hotkey.vkcode, ctype.hotkey.vkmod
         ))
     # end def from_ctype
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`ShellLinkHeader` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`ShellLinkHeader`
+        :returns: The corresponding :class:`ShellLinkHeader` object.
+
+        """
+        header = shell_link_header.from_buffer_copy(buf, offset)
+        return cls.from_ctype(header)
+    # end def from_buffer
 # end class ShellLinkHeader
 
 class LinkInfo(ActiveStructuple):
@@ -735,7 +966,7 @@ class LinkInfo(ActiveStructuple):
                 new_offset = offset + local_base_path_offset_uni
                 read_size = size - local_base_path_offset_uni
 
-                stream.seek(offset, SEEK_SET)
+                stream.seek(new_offset, SEEK_SET)
                 local_base_path_uni = stream.read(read_size)
 
                 new_local_base_path_uni = \
@@ -792,6 +1023,114 @@ class LinkInfo(ActiveStructuple):
             local_base_path, local_base_path_uni, path_suffix, path_suffix_uni
         ))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`LinkInfo` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`LinkInfo`
+        :returns: The corresponding :class:`LinkInfo` object.
+
+        """
+        decoder = _utf16_le_decoder
+
+        header = link_info_header.from_buffer_copy(buf, offset)
+
+        size = header.size
+        vol_id_offset = header.vol_id_offset
+        local_base_path_offset = header.local_base_path_offset
+        cnrl_offset = header.cnrl_offset
+        path_suffix_offset = header.path_suffix_offset
+
+        if header.header_size >= 0x24:
+            local_base_path_offset_uni = \
+                uint32_le.from_buffer_copy(buf, offset + 28).value
+            path_suffix_offset_uni = \
+                uint32_le.from_buffer_copy(buf, offset + 32).value
+        else:
+            local_base_path_offset_uni = None
+            path_suffix_offset_uni = None
+        # end if
+
+        if header.has_vol_id_and_local_base_path:
+            vol_id = VolumeID.from_buffer(buf, offset + vol_id_offset)
+
+            if local_base_path_offset:
+                local_base_path = _read_buffer(
+                    buf, offset + local_base_path_offset,
+                    size - local_base_path_offset
+                )
+                local_base_path = local_base_path.split(b"\x00", 1)[0]
+            else:
+                local_base_path = None
+            # end if
+
+            if local_base_path_offset_uni:
+                local_base_path_uni = _read_buffer(
+                    buf, offset + local_base_path_offset_uni,
+                    size - local_base_path_offset_uni
+                )
+
+                new_local_base_path_uni = \
+                    decoder(local_base_path_uni, "ignore")[0]
+
+                if new_local_base_path_uni:
+                    local_base_path_uni = \
+                        new_local_base_path_uni.split("\x00", 1)[0]
+                # end if
+            else:
+                local_base_path_uni = None
+            # end if
+        else:
+            vol_id = None
+            local_base_path = None
+            local_base_path_uni = None
+        # end if
+
+        if header.has_cnrl_and_path_suffix:
+            cnrl = CNRL.from_buffer(buf, offset + cnrl_offset)
+        else:
+            cnrl = None
+        # end if
+
+        if path_suffix_offset:
+            path_suffix = _read_buffer(
+                buf, offset + path_suffix_offset, size - path_suffix_offset
+            )
+            path_suffix = path_suffix.split(b"\x00", 1)[0]
+        else:
+            path_suffix = None
+        # end if
+
+        if path_suffix_offset_uni:
+            path_suffix_uni = _read_buffer(
+                buf, offset + path_suffix_offset_uni,
+                size - path_suffix_offset_uni
+            )
+
+            new_path_suffix_uni = decoder(path_suffix_uni, "ignore")[0]
+            if new_path_suffix_uni:
+                path_suffix_uni = new_path_suffix_uni.split("\x00", 1)[0]
+            # end if
+        else:
+            path_suffix_uni = None
+        # end if
+
+        return cls((
+            header.size, header.header_size,
+            header.has_vol_id_and_local_base_path,
+            header.has_cnrl_and_path_suffix, vol_id_offset,
+            local_base_path_offset, cnrl_offset, path_suffix_offset,
+            local_base_path_offset_uni, path_suffix_offset_uni, vol_id, cnrl,
+            local_base_path, local_base_path_uni, path_suffix, path_suffix_uni
+        ))
+    # end def from_buffer
 # end class LinkInfo
 
 class VolumeID(ActiveStructuple):
@@ -881,6 +1220,54 @@ class VolumeID(ActiveStructuple):
             header.vol_label_offset, vol_label_offset_uni, volume_label
         ))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`VolumeID` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`VolumeID`
+        :returns: The corresponding :class:`VolumeID` object.
+
+        """
+        header = volume_id_header.from_buffer_copy(buf, offset)
+        size = header.size
+        volume_label = None
+
+        if header.vol_label_offset == 0x14:
+            # Volume label is unicode
+            vol_label_offset_uni = \
+                uint32_le.from_buffer_copy(buf, offset + 16).value
+
+            if vol_label_offset_uni:
+                volume_label = _read_buffer(
+                    buf, offset + vol_label_offset_uni,
+                    size - vol_label_offset_uni
+                )
+
+                new_volume_label = _utf16_le_decoder(volume_label, "ignore")[0]
+                if new_volume_label:
+                    volume_label = new_volume_label.split("\x00", 1)[0]
+                # end if
+            # end if
+        else:
+            vol_label_offset_uni = None
+            volume_label = _read_buffer(
+                buf, offset + header.vol_label_offset, size - 16
+            )
+            volume_label = volume_label.split(b"\x00", 1)[0]
+        # end if
+
+        return cls((
+            header.size, header.type, header.serial_num,
+            header.vol_label_offset, vol_label_offset_uni, volume_label
+        ))
+    # end def from_buffer
 # end class VolumeID
 
 class CNRL(ActiveStructuple):
@@ -1039,22 +1426,112 @@ class CNRL(ActiveStructuple):
             device_name_uni
         ))
     # end def from_stream
-# end class CNRL
 
-class ExtraDataBlock(ActiveStructuple):
-    """Base class for :class:`ExtraDataBlock` subclasses.
-
-    .. attribute:: size
-
-        The size of the structure in bytes.
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`CNRL` from a buffer.
 
-    .. attribute:: sig
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
 
-        The signature field.
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
 
-    .. attribute:: data
+        :rtype: :class:`CNRL`
+        :returns: The corresponding :class:`CNRL` object.
 
-        An optional field that describes the data in the structure.
+        """
+        decoder = _utf16_le_decoder
+
+        header = cnrl_header.from_buffer_copy(buf, offset)
+        size = header.size
+        net_name_offset = header.net_name_offset
+        device_name_offset = header.device_name_offset
+        valid_device = header.valid_device
+
+        if net_name_offset > 0x14:
+            net_name_offset_uni = \
+                uint32_le.from_buffer_copy(buf, offset + 20).value
+
+            if valid_device:
+                device_name_offset_uni = \
+                    uint32_le.from_buffer_copy(buf, offset + 24).value
+            else:
+                device_name_offset_uni = None
+            # end if
+        else:
+            net_name_offset_uni = None
+            device_name_offset_uni = None
+        # end if
+
+        if net_name_offset_uni:
+            net_name_uni = _read_buffer(
+                buf, offset + net_name_offset_uni, size - net_name_offset_uni
+            )
+
+            new_net_name_uni = decoder(net_name_uni, "ignore")[0]
+            if new_net_name_uni:
+                net_name_uni = new_net_name_uni.split("\x00", 1)[0]
+            # end if
+        else:
+            net_name_uni = None
+        # end if
+
+        if device_name_offset_uni:
+            device_name_uni = _read_buffer(
+                buf, offset + device_name_offset_uni,
+                size - device_name_offset_uni
+            )
+
+            new_device_name_uni = decoder(device_name_uni, "ignore")[0]
+            if new_device_name_uni:
+                device_name_uni = new_device_name_uni.split("\x00", 1)[0]
+            # end if
+        else:
+            device_name_uni = None
+        # end if
+
+        if valid_device and device_name_offset:
+            device_name = _read_buffer(
+                buf, offset + device_name_offset, size - device_name_offset
+            )
+            device_name = device_name.split(b"\x00", 1)[0]
+        else:
+            device_name = None
+        # end if
+
+        if net_name_offset:
+            net_name = _read_buffer(
+                buf, offset + net_name_offset, size - net_name_offset
+            )
+            net_name = net_name.split(b"\x00", 1)[0]
+        else:
+            net_name = None
+        # end if
+
+        return cls((
+            size, valid_device, header.valid_net_type, net_name_offset,
+            device_name_offset, header.net_type, net_name_offset_uni,
+            device_name_offset_uni, net_name, device_name, net_name_uni,
+            device_name_uni
+        ))
+    # end def from_buffer
+# end class CNRL
+
+class ExtraDataBlock(ActiveStructuple):
+    """Base class for :class:`ExtraDataBlock` subclasses.
+
+    .. attribute:: size
+
+        The size of the structure in bytes.
+
+    .. attribute:: sig
+
+        The signature field.
+
+    .. attribute:: data
+
+        An optional field that describes the data in the structure.
 
         .. note::
 
@@ -1098,6 +1575,31 @@ class ExtraDataBlock(ActiveStructuple):
 
         return cls((header.size, header.sig, data))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`ExtraDataBlock` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`ExtraDataBlock`
+        :returns: The corresponding :class:`ExtraDataBlock` object.
+
+        """
+        header = data_block_header.from_buffer_copy(buf, offset)
+
+        if header.size >= 8:
+            data = bytes(buf[offset + 8:offset + header.size])
+        else:
+            data = None
+        # end if
+
+        return cls((header.size, header.sig, data))
+    # end def from_buffer
 # end class ExtraDataBlock
 
 class ConsoleProps(ExtraDataBlock):
@@ -1240,6 +1742,43 @@ class ConsoleProps(ExtraDataBlock):
             list(cdb.color_table), None
         ))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`ConsoleProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`ConsoleProps`
+        :returns: The corresponding :class:`ConsoleProps` object.
+
+        """
+        cdb = console_data_block.from_buffer_copy(buf, offset)
+        face_name = bytes(cdb.face_name)
+
+        new_face_name = _utf16_le_decoder(face_name, "ignore")[0]
+        if new_face_name:
+            face_name = new_face_name.split("\x00", 1)[0]
+        # end if
+
+        screen_buffer_size = COORD.from_ctype(cdb.screen_buffer_size)
+        window_size = COORD.from_ctype(cdb.window_size)
+        window_origin = COORD.from_ctype(cdb.window_origin)
+
+        return cls((
+            cdb.size, cdb.sig, cdb.fill_attributes, cdb.popup_fill_attributes,
+            screen_buffer_size, window_size, window_origin, cdb.font,
+            cdb.input_buf_size, cdb.font_size, cdb.font_family,
+            cdb.font_weight, face_name, cdb.cursor_size, cdb.full_screen,
+            cdb.quick_edit, cdb.insert_mode, cdb.auto_position,
+            cdb.history_buf_size, cdb.history_buf_count, cdb.history_no_dup,
+            list(cdb.color_table), None
+        ))
+    # end def from_buffer
 # end class ConsoleProps
 
 class ConsoleFEProps(ExtraDataBlock):
@@ -1276,6 +1815,25 @@ class ConsoleFEProps(ExtraDataBlock):
 
         return cls((blk.size, blk.sig, LCID.from_ctype(blk.code_page), None))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`ConsoleFEProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`ConsoleFEProps`
+        :returns: The corresponding :class:`ConsoleFEProps` object.
+
+        """
+        blk = console_fe_data_block.from_buffer_copy(buf, offset)
+
+        return cls((blk.size, blk.sig, LCID.from_ctype(blk.code_page), None))
+    # end def from_buffer
 # end class ConsoleFEProps
 
 class DarwinProps(ExtraDataBlock):
@@ -1327,6 +1885,36 @@ class DarwinProps(ExtraDataBlock):
             ddb.size, ddb.sig, darwin_data_ansi, darwin_data_uni, None
         ))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`DarwinProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`DarwinProps`
+        :returns: The corresponding :class:`DarwinProps` object.
+
+        """
+        ddb = darwin_data_block.from_buffer_copy(buf, offset)
+        darwin_data_ansi = bytes(ddb.darwin_data_ansi)
+        darwin_data_ansi = darwin_data_ansi.split(b"\x00", 1)[0]
+
+        darwin_data_uni = bytes(ddb.darwin_data_uni)
+
+        new_darwin_data_uni = _utf16_le_decoder(darwin_data_uni, "ignore")[0]
+        if new_darwin_data_uni:
+            darwin_data_uni = new_darwin_data_uni.split("\x00", 1)[0]
+        # end if
+
+        return cls((
+            ddb.size, ddb.sig, darwin_data_ansi, darwin_data_uni, None
+        ))
+    # end def from_buffer
 # end class DarwinProps
 
 class ExpandableStringsDataBlock(ExtraDataBlock):
@@ -1375,6 +1963,33 @@ class ExpandableStringsDataBlock(ExtraDataBlock):
 
         return cls((edb.size, edb.sig, target_ansi, target_uni, None))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`ExpandableStringsDataBlock` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`ExpandableStringsDataBlock`
+        :returns: The corresponding :class:`ExpandableStringsDataBlock` object.
+
+        """
+        edb = expandable_strings_data_block.from_buffer_copy(buf, offset)
+        target_ansi = bytes(edb.target_ansi)
+        target_ansi = target_ansi.split(b"\x00", 1)[0]
+
+        target_uni = bytes(edb.target_uni)
+        new_target_uni = _utf16_le_decoder(target_uni, "ignore")[0]
+        if new_target_uni:
+            target_uni = new_target_uni.split("\x00", 1)[0]
+        # end if
+
+        return cls((edb.size, edb.sig, target_ansi, target_uni, None))
+    # end def from_buffer
 # end class ExpandableStringsDataBlock
 
 class EnvironmentProps(ExpandableStringsDataBlock):
@@ -1428,6 +2043,25 @@ class KnownFolderProps(ExtraDataBlock):
 
         return cls((kfb.size, kfb.sig, kf_id, kfb.offset, None))
     # end class from_stream
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`KnownFolderProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`KnownFolderProps`
+        :returns: The corresponding :class:`KnownFolderProps` object.
+
+        """
+        kfb = known_folder_data_block.from_buffer_copy(buf, offset)
+        kf_id = GUIDToUUID.from_ctype(kfb.kf_id)
+
+        return cls((kfb.size, kfb.sig, kf_id, kfb.offset, None))
+    # end def from_buffer
 # end class KnownFolderProps
 
 class PropertyStoreProps(ExtraDataBlock):
@@ -1460,6 +2094,24 @@ class PropertyStoreProps(ExtraDataBlock):
 
         return cls((edb.size, edb.sig, edb.data, None))
     # end class from_stream
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`PropertyStoreProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`PropertyStoreProps`
+        :returns: The corresponding :class:`PropertyStoreProps` object.
+
+        """
+        edb = ExtraDataBlock.from_buffer(buf, offset)
+
+        return cls((edb.size, edb.sig, edb.data, None))
+    # end def from_buffer
 # end class PropertyStoreProps
 
 class ShimProps(ExtraDataBlock):
@@ -1498,6 +2150,31 @@ class ShimProps(ExtraDataBlock):
 
         return cls((edb.size, edb.sig, layer_name, None))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`ShimProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`ShimProps`
+        :returns: The corresponding :class:`ShimProps` object.
+
+        """
+        edb = ExtraDataBlock.from_buffer(buf, offset)
+        layer_name = edb.data
+
+        new_layer_name = _utf16_le_decoder(layer_name, "ignore")[0]
+        if new_layer_name:
+            layer_name = new_layer_name.split("\x00", 1)[0]
+        # end if
+
+        return cls((edb.size, edb.sig, layer_name, None))
+    # end def from_buffer
 # end class ShimProps
 
 class SpecialFolderProps(ExtraDataBlock):
@@ -1539,6 +2216,25 @@ class SpecialFolderProps(ExtraDataBlock):
 
         return cls((sfdb.size, sfdb.sig, sfdb.sf_id, sfdb.offset, None))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`SpecialFolderProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`SpecialFolderProps`
+        :returns: The corresponding :class:`SpecialFolderProps` object.
+
+        """
+        sfdb = special_folder_data_block.from_buffer_copy(buf, offset)
+
+        return cls((sfdb.size, sfdb.sig, sfdb.sf_id, sfdb.offset, None))
+    # end def from_buffer
 # end class SpecialFolderProps
 
 class DomainRelativeObjId(ActiveStructuple):
@@ -1571,12 +2267,13 @@ class DomainRelativeObjId(ActiveStructuple):
         :returns: The corresponding :class:`DomainRelativeObjId` object.
 
         """
-        if offset is None:
-            offset = stream.tell()
+        if offset is not None:
+            stream.seek(offset, SEEK_SET)
         # end if
 
-        volume = GUIDToUUID.from_stream(stream, offset, LITTLE_ENDIAN)
-        object = GUIDToUUID.from_stream(stream, offset + 16, LITTLE_ENDIAN)
+        data = stream.read(32)
+        volume = GUIDToUUID.from_buffer(data, 0, LITTLE_ENDIAN)
+        object = GUIDToUUID.from_buffer(data, 16, LITTLE_ENDIAN)
 
         return DomainRelativeObjId((volume, object))
     # end def from_stream
@@ -1597,6 +2294,26 @@ class DomainRelativeObjId(ActiveStructuple):
             GUIDToUUID.from_ctype(ctype.object)
         ))
     # end def from_ctype
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`DomainRelativeObjId` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`DomainRelativeObjId`
+        :returns: The corresponding :class:`DomainRelativeObjId` object.
+
+        """
+        volume = GUIDToUUID.from_buffer(buf, offset, LITTLE_ENDIAN)
+        object = GUIDToUUID.from_buffer(buf, offset + 16, LITTLE_ENDIAN)
+
+        return DomainRelativeObjId((volume, object))
+    # end def from_buffer
 # end class DomainRelativeObjId
 
 class TrackerProps(ExtraDataBlock):
@@ -1659,6 +2376,38 @@ class TrackerProps(ExtraDataBlock):
             droid_birth, None
         ))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`TrackerProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`TrackerProps`
+        :returns: The corresponding :class:`TrackerProps` object.
+
+        """
+        tdb = tracker_data_block.from_buffer_copy(buf, offset)
+        length = tdb.length
+        offset += 16
+
+        machine_id = _read_buffer(buf, offset, length - 72)
+        offset += len(machine_id)
+        machine_id = machine_id.split(b"\x00", 1)[0]
+
+        tdbf = tracker_data_block_footer.from_buffer_copy(buf, offset)
+        droid = DomainRelativeObjId.from_ctype(tdbf.droid)
+        droid_birth = DomainRelativeObjId.from_ctype(tdbf.droid_birth)
+
+        return cls((
+            tdb.size, tdb.sig, length, tdb.version, machine_id, droid,
+            droid_birth, None
+        ))
+    # end def from_buffer
 # end class TrackerProps
 
 class VistaAndAboveIDListProps(ExtraDataBlock):
@@ -1701,6 +2450,28 @@ class VistaAndAboveIDListProps(ExtraDataBlock):
 
         return cls((header.size, header.sig, idlist, None))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`VistaAndAboveIDListProps` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`VistaAndAboveIDListProps`
+        :returns: The corresponding :class:`VistaAndAboveIDListProps` object.
+
+        """
+        header = data_block_header.from_buffer_copy(buf, offset)
+
+        list_size = header.size - 8
+        idlist = ITEMIDLIST.from_buffer(buf, offset + 8, list_size)
+
+        return cls((header.size, header.sig, idlist, None))
+    # end def from_buffer
 # end class VistaAndAboveIDListProps
 
 class TerminalBlock(ExtraDataBlock):
@@ -1709,6 +2480,103 @@ class TerminalBlock(ExtraDataBlock):
     pass
 # end class TerminalBlock
 
+class LazyExtraDataBlock():
+    """An extra data block that is decoded when it is first used.
+
+    The size and signature are known without decoding the block.  Accessing
+    any other attribute (or indexing, iterating, or comparing the block)
+    decodes it, and the result is cached.
+
+    .. attribute:: size
+
+        The size of the structure in bytes.
+
+    .. attribute:: sig
+
+        The signature field.
+
+    .. attribute:: block
+
+        The decoded :class:`ExtraDataBlock` (or subclass) object.
+
+    """
+
+    def __init__(self, size, sig, make_block):
+        """Initializes a :class:`LazyExtraDataBlock` object.
+
+        :type size: ``int``
+        :param size: The size of the structure in bytes.
+
+        :type sig: ``int``
+        :param sig: The signature field.
+
+        :type make_block: ``callable``
+        :param make_block: A callable with no arguments that decodes the
+                           block.
+
+        """
+        self.size = size
+        self.sig = sig
+        self._make_block = make_block
+        self._block = None
+    # end def __init__
+
+    @property
+    def block(self):
+        block = self._block
+
+        if block is None:
+            block = self._make_block()
+            self._block = block
+            self._make_block = None
+        # end if
+
+        return block
+    # end def block
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # end if
+
+        return getattr(self.block, name)
+    # end def __getattr__
+
+    def __getitem__(self, index):
+        return self.block[index]
+    # end def __getitem__
+
+    def __iter__(self):
+        return iter(self.block)
+    # end def __iter__
+
+    def __len__(self):
+        return len(self.block)
+    # end def __len__
+
+    def __eq__(self, other):
+        if isinstance(other, LazyExtraDataBlock):
+            other = other.block
+        # end if
+
+        return self.block == other
+    # end def __eq__
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+    # end def __ne__
+
+    def __hash__(self):
+        return hash(self.block)
+    # end def __hash__
+
+    def __repr__(self):
+        return "{0}(size={1!r}, sig={2!r})".format(
+            self.__class__.__name__, self.size, self.sig
+        )
+    # end def __repr__
+# end class LazyExtraDataBlock
+
 class ExtraDataBlockFactory():
     """Makes :class:`ExtraDataBlock` (and subclass) objects.
 
@@ -1717,6 +2585,11 @@ class ExtraDataBlockFactory():
         A dictionary mapping variosu signature values to their corresponding
         object factories.  Used by :meth:`make_blocks`.
 
+    .. attribute:: buffer_props_map
+
+        Like :attr:`props_map`, but maps to factories that take a buffer.
+        Used by :meth:`make_blocks_from_buffer`.
+
     """
 
     props_map = {
@@ -1733,9 +2606,23 @@ class ExtraDataBlockFactory():
         VISTA_AND_ABOVE_IDLIST_PROPS_SIG: VistaAndAboveIDListProps.from_stream
     }
 
+    buffer_props_map = {
+        CONSOLE_PROPS_SIG: ConsoleProps.from_buffer,
+        CONSOLE_FE_PROPS_SIG: ConsoleFEProps.from_buffer,
+        DARWIN_PROPS_SIG: DarwinProps.from_buffer,
+        ENVIRONMENT_PROPS_SIG: EnvironmentProps.from_buffer,
+        ICON_ENVIRONMENT_PROPS_SIG: IconEnvironmentProps.from_buffer,
+        KNOWN_FOLDER_PROPS_SIG: KnownFolderProps.from_buffer,
+        PROPERTY_STORE_PROPS_SIG: PropertyStoreProps.from_buffer,
+        SHIM_PROPS_SIG: ShimProps.from_buffer,
+        SPECIAL_FOLDER_PROPS_SIG: SpecialFolderProps.from_buffer,
+        TRACKER_PROPS_SIG: TrackerProps.from_buffer,
+        VISTA_AND_ABOVE_IDLIST_PROPS_SIG: VistaAndAboveIDListProps.from_buffer
+    }
+
     @classmethod
-    def make_blocks(cls, stream, offset=None):
-        """reates a series of :class:`ExtraDataBlock` (or subclass) objects.
+    def make_blocks(cls, stream, offset=None, wanted_sigs=None, lazy=False):
+        """Creates a series of :class:`ExtraDataBlock` (or subclass) objects.
 
         :type stream: :class:`~lf.dec.IStream`
         :param stream: A stream that contains the structures.
@@ -1743,6 +2630,16 @@ class ExtraDataBlockFactory():
         :type offset: ``int``
         :param offset: The start of the structures in the stream.
 
+        :type wanted_sigs: ``set``
+        :param wanted_sigs: If not ``None``, only blocks with these signatures
+                            are made.  Other blocks are skipped by their size,
+                            without being read.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, :class:`LazyExtraDataBlock` objects are made
+                     instead, and :attr:`stream` must stay open until they
+                     are decoded.
+
         :rtype: ``iterator``
         :returns: An iterator of the corresponding objects.
 
@@ -1751,65 +2648,106 @@ class ExtraDataBlockFactory():
             offset = stream.tell()
         # end if
 
-        props_map = ExtraDataBlockFactory.props_map
+        props_map = cls.props_map
+        first = True
 
-        stream.seek(offset, SEEK_SET)
-        data = stream.read(4)
-        if len(data) != 4:
-            return
-        # end if
-
-        size = uint32_le.from_buffer_copy(data).value
-        if size < 4:
-            return
-        # end if
+        while True:
+            stream.seek(offset, SEEK_SET)
 
-        data = stream.read(4)
-        if len(data) != 4:
-            return
-        # end if
+            data = stream.read(8)
+            if len(data) < 4:
+                break
+            # end if
 
-        sig = uint32_le.from_buffer_copy(data).value
-        if sig == 0:
-            return
-        # end if
+            size = uint32_le.from_buffer_copy(data).value
+            if (size < 4) or (len(data) != 8):
+                break
+            # end if
 
-        if sig in props_map:
-            block = props_map[sig](stream, offset)
-        else:
-            block = ExtraDataBlock.from_stream
-        # end if
+            sig = uint32_le.from_buffer_copy(data, 4).value
+            if first and (sig == 0):
+                break
+            # end if
 
-        yield block
-        offset += size
+            if (wanted_sigs is None) or (sig in wanted_sigs):
+                factory = props_map.get(sig, ExtraDataBlock.from_stream)
 
-        while block.sig != 0:
-            stream.seek(offset, SEEK_SET)
+                if lazy:
+                    yield LazyExtraDataBlock(
+                        size, sig, partial(factory, stream, offset)
+                    )
+                else:
+                    yield factory(stream, offset)
+                # end if
+            # end if
 
-            data = stream.read(4)
-            if len(data) != 4:
+            if sig == 0:
                 break
             # end if
 
-            size = uint32_le.from_buffer_copy(data).value
+            offset += size
+            first = False
+        # end while
+    # end def make_blocks
+
+    @classmethod
+    def make_blocks_from_buffer(
+        cls, buf, offset=0, wanted_sigs=None, lazy=False
+    ):
+        """Creates a series of :class:`ExtraDataBlock` objects from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structures.
+
+        :type offset: ``int``
+        :param offset: The start of the structures in :attr:`buf`.
+
+        :type wanted_sigs: ``set``
+        :param wanted_sigs: If not ``None``, only blocks with these signatures
+                            are made.  Other blocks are skipped by their size,
+                            without being decoded.
+
+        :type lazy: ``bool``
+        :param lazy: If ``True``, :class:`LazyExtraDataBlock` objects are made
+                     instead.
+
+        :rtype: ``iterator``
+        :returns: An iterator of the corresponding objects.
+
+        """
+        props_map = cls.buffer_props_map
+        buf_size = len(buf)
+        first = True
+
+        while (offset + 8) <= buf_size:
+            size = uint32_le.from_buffer_copy(buf, offset).value
             if size < 4:
                 break
             # end if
 
-            data = stream.read(4)
-            if len(data) != 4:
+            sig = uint32_le.from_buffer_copy(buf, offset + 4).value
+            if first and (sig == 0):
                 break
             # end if
 
-            sig = uint32_le.from_buffer_copy(data).value
-            if sig in props_map:
-                block = props_map[sig](stream, offset)
-            else:
-                block = ExtraDataBlock.from_stream(stream, offset)
+            if (wanted_sigs is None) or (sig in wanted_sigs):
+                factory = props_map.get(sig, ExtraDataBlock.from_buffer)
+
+                if lazy:
+                    yield LazyExtraDataBlock(
+                        size, sig, partial(factory, buf, offset)
+                    )
+                else:
+                    yield factory(buf, offset)
+                # end if
+            # end if
+
+            if sig == 0:
+                break
             # end if
 
-            yield block
             offset += size
+            first = False
         # end while
-    # end def make_blocks
+    # end def make_blocks_from_buffer
 # end class ExtraDataBlockFactory
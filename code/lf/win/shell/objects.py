@@ -17,15 +17,22 @@
 
 """Objects for working with shell data types"""
 
+# stdlib imports
+from collections.abc import Sequence
+from codecs import utf_16_le_decode as _utf16_le_decoder
 
 # local imports
 from lf.dec import SEEK_SET
-from lf.dtypes import ActiveStructuple
-from lf.dtypes.ctypes import uint16_le
+from lf.dtypes import LITTLE_ENDIAN, ActiveStructuple
+from lf.dtypes.ctypes import uint16_le, uint32_le, uint64_le
+from lf.time import DOSDateTimeTodatetime
+from lf.win.objects import GUIDToUUID
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "SHITEMID", "ITEMIDLIST"
+    "SHITEMID", "ITEMIDLIST", "ShellItem", "RootFolderItem", "VolumeItem",
+    "FileEntryItem", "ExtensionBlock", "FileEntryExtension",
+    "ExtensionBlocks", "ShellItemFactory"
 ]
 
 class SHITEMID(ActiveStructuple):
@@ -89,6 +96,35 @@ class SHITEMID(ActiveStructuple):
 
         return cls((len(data) + 2, size, data))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`SHITEMID` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`
+
+        :rtype: :class:`SHITEMID`
+        :returns: The corresponding :class:`SHITEMID` object.
+
+        """
+        data = buf[offset:offset + 2]
+        if len(data) < 2:
+            return cls((len(data), 0, None))
+        # end if
+
+        size = data[0] | (data[1] << 8)
+        if size <= 2:
+            return cls((2, size, None))
+        # end if
+
+        data = bytes(buf[offset + 2:offset + size])
+
+        return cls((len(data) + 2, size, data))
+    # end def from_buffer
 # end class SHITEMID
 
 class ITEMIDLIST(ActiveStructuple):
@@ -97,11 +133,22 @@ class ITEMIDLIST(ActiveStructuple):
     .. attribute:: mkid
 
         A list of :class:`SHITEMID` structures.
+
+    .. attribute:: items
+
+        A list of typed shell items (:class:`ShellItem` or subclass) for
+        :attr:`mkid`, without the terminal item.  These are made by
+        :class:`ShellItemFactory`, so they are interned.
     """
 
     _fields_ = ("mkid",)
     _takes_stream = True
 
+    @property
+    def items(self):
+        return ShellItemFactory.make_items(self)
+    # end def items
+
     @classmethod
     def from_stream(cls, stream, offset=None, max_bytes=None):
         """Creates an :class:`ITEMIDLIST` from a stream.
@@ -154,4 +201,653 @@ class ITEMIDLIST(ActiveStructuple):
 
         return cls((mkid,))
     # end def from_stream
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0, max_bytes=None):
+        """Creates an :class:`ITEMIDLIST` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`
+
+        :type max_bytes: ``int``
+        :param max_bytes: The maximum number of bytes to read from the buffer.
+                          If this is ``None`` then it is ignored.
+
+        :rtype: :class:`ITEMIDLIST`
+        :returns: The corresponding :class:`ITEMIDLIST` object.
+
+        """
+        mkid = list()
+        from_buffer = SHITEMID.from_buffer
+
+        itemid = from_buffer(buf, offset)
+        mkid.append(itemid)
+
+        if max_bytes is None:
+            while itemid.cb >= 2:
+                offset += itemid.size
+                itemid = from_buffer(buf, offset)
+                mkid.append(itemid)
+            # end while
+        else:
+            offset += itemid.size
+            bytes_read = itemid.size
+
+            while (itemid.cb >= 2) and (bytes_read < max_bytes):
+                itemid = from_buffer(buf, offset)
+                offset += itemid.cb
+                bytes_read += itemid.cb
+
+                if bytes_read <= max_bytes:
+                    mkid.append(itemid)
+                else:
+                    break
+                # end if
+            # end while
+        # end if
+
+        return cls((mkid,))
+    # end def from_buffer
 # end class ITEMIDLIST
+
+def _dos_datetime(buf, offset):
+    """Converts a DOS date and time (in that order) in a buffer.
+
+    :rtype: ``datetime`` or ``tuple``
+    :returns: The corresponding ``datetime``, or a ``(dos_date, dos_time)``
+              tuple if it is not valid.
+
+    """
+    dos_date = buf[offset] | (buf[offset + 1] << 8)
+    dos_time = buf[offset + 2] | (buf[offset + 3] << 8)
+
+    try:
+        return DOSDateTimeTodatetime.from_ints(dos_date, dos_time)
+    except ValueError:
+        return (dos_date, dos_time)
+    # end try
+# end def _dos_datetime
+
+def _read_cstring(buf, offset, end, is_unicode):
+    """Reads a NUL terminated string from a buffer.
+
+    ASCII strings are decoded as latin-1, since the code page is not known.
+
+    :rtype: ``tuple``
+    :returns: The string, and the offset just past the terminator (or
+              :attr:`end` if there is no terminator).
+
+    """
+    if is_unicode:
+        terminator = offset
+        while terminator < (end - 1):
+            if (buf[terminator] == 0) and (buf[terminator + 1] == 0):
+                break
+            # end if
+
+            terminator += 2
+        else:
+            terminator = end
+        # end while
+
+        string = _utf16_le_decoder(bytes(buf[offset:terminator]), "ignore")[0]
+        return (string, min(terminator + 2, end))
+    # end if
+
+    terminator = bytes(buf[offset:end]).find(b"\x00")
+    if terminator == -1:
+        terminator = end
+    else:
+        terminator += offset
+    # end if
+
+    string = bytes(buf[offset:terminator]).decode("latin_1")
+    return (string, min(terminator + 1, end))
+# end def _read_cstring
+
+class ShellItem(ActiveStructuple):
+    """Base class for typed shell items (decoded :class:`SHITEMID`\ s).
+
+    This class is also used for shell items whose type is not decoded.
+
+    .. attribute:: size
+
+        The size of the shell item in bytes (the :attr:`SHITEMID.cb` field).
+
+    .. attribute:: class_type
+
+        The class type indicator (the first byte of the item data).
+
+    .. attribute:: data
+
+        The item data (the :attr:`SHITEMID.abID` field).
+
+    """
+
+    _fields_ = ("size", "class_type", "data")
+
+    @classmethod
+    def from_shitemid(cls, itemid):
+        """Creates a :class:`ShellItem` from a :class:`SHITEMID`.
+
+        :type itemid: :class:`SHITEMID`
+        :param itemid: The shell item to decode.
+
+        :rtype: :class:`ShellItem`
+        :returns: The corresponding :class:`ShellItem` object.
+
+        """
+        return ShellItem((itemid.cb, itemid.abID[0], itemid.abID))
+    # end def from_shitemid
+# end class ShellItem
+
+class RootFolderItem(ShellItem):
+    """Represents a root folder shell item (e.g. My Computer).
+
+    .. attribute:: sort_index
+
+        The order the item is sorted in.
+
+    .. attribute:: clsid
+
+        A ``UUID`` of the shell folder.
+
+    """
+
+    _fields_ = ("size", "class_type", "data", "sort_index", "clsid")
+
+    @classmethod
+    def from_shitemid(cls, itemid):
+        """Creates a :class:`RootFolderItem` from a :class:`SHITEMID`.
+
+        :type itemid: :class:`SHITEMID`
+        :param itemid: The shell item to decode.
+
+        :raises ValueError: If the item is too small.
+
+        :rtype: :class:`RootFolderItem`
+        :returns: The corresponding :class:`RootFolderItem` object.
+
+        """
+        data = itemid.abID
+        if len(data) < 18:
+            raise ValueError("root folder item is too small")
+        # end if
+
+        clsid = GUIDToUUID.from_buffer(data, 2, LITTLE_ENDIAN)
+
+        return RootFolderItem((itemid.cb, data[0], data, data[1], clsid))
+    # end def from_shitemid
+# end class RootFolderItem
+
+class VolumeItem(ShellItem):
+    """Represents a volume shell item (e.g. a drive letter).
+
+    .. attribute:: name
+
+        The name of the volume (e.g. ``"C:\\"``), or ``None`` if the item
+        does not have a name.
+
+    """
+
+    _fields_ = ("size", "class_type", "data", "name")
+
+    @classmethod
+    def from_shitemid(cls, itemid):
+        """Creates a :class:`VolumeItem` from a :class:`SHITEMID`.
+
+        :type itemid: :class:`SHITEMID`
+        :param itemid: The shell item to decode.
+
+        :rtype: :class:`VolumeItem`
+        :returns: The corresponding :class:`VolumeItem` object.
+
+        """
+        data = itemid.abID
+        class_type = data[0]
+
+        if class_type & 0x01:
+            name = _read_cstring(data, 1, len(data), False)[0]
+        else:
+            name = None
+        # end if
+
+        return VolumeItem((itemid.cb, class_type, data, name))
+    # end def from_shitemid
+# end class VolumeItem
+
+class FileEntryItem(ShellItem):
+    """Represents a file entry shell item (a file or directory).
+
+    .. attribute:: file_size
+
+        The size of the file (in bytes).
+
+    .. attribute:: mtime
+
+        The last modification time, as a ``datetime``, or a ``(dos_date,
+        dos_time)`` tuple if it is not valid.
+
+    .. attribute:: attrs
+
+        The file attributes.
+
+    .. attribute:: name
+
+        The primary (short) name of the entry.
+
+    .. attribute:: extension_blocks
+
+        An :class:`ExtensionBlocks` object, which decodes the extension
+        blocks the first time it is used.
+
+    """
+
+    _fields_ = (
+        "size", "class_type", "data", "file_size", "mtime", "attrs", "name",
+        "extension_blocks"
+    )
+
+    @classmethod
+    def from_shitemid(cls, itemid):
+        """Creates a :class:`FileEntryItem` from a :class:`SHITEMID`.
+
+        :type itemid: :class:`SHITEMID`
+        :param itemid: The shell item to decode.
+
+        :raises ValueError: If the item is too small.
+
+        :rtype: :class:`FileEntryItem`
+        :returns: The corresponding :class:`FileEntryItem` object.
+
+        """
+        data = itemid.abID
+        data_size = len(data)
+        if data_size < 12:
+            raise ValueError("file entry item is too small")
+        # end if
+
+        class_type = data[0]
+        file_size = uint32_le.from_buffer_copy(data, 2).value
+        mtime = _dos_datetime(data, 6)
+        attrs = data[10] | (data[11] << 8)
+
+        # The last 2 bytes are the offset (from the start of the SHITEMID)
+        # of the first extension block, which is also where the name ends.
+        ext_offset = (data[-2] | (data[-1] << 8)) - 2
+        if (ext_offset < 12) or ((ext_offset + 8) > data_size):
+            ext_offset = data_size
+        # end if
+
+        name = _read_cstring(data, 12, ext_offset, class_type & 0x04)[0]
+        extension_blocks = ExtensionBlocks(data, ext_offset)
+
+        return FileEntryItem((
+            itemid.cb, class_type, data, file_size, mtime, attrs, name,
+            extension_blocks
+        ))
+    # end def from_shitemid
+# end class FileEntryItem
+
+class ExtensionBlock(ActiveStructuple):
+    """Represents an extension block in a shell item.
+
+    .. attribute:: size
+
+        The size of the extension block in bytes.
+
+    .. attribute:: version
+
+        The version of the extension block.
+
+    .. attribute:: sig
+
+        The signature of the extension block (e.g. 0xBEEF0004).
+
+    .. attribute:: data
+
+        The data after the signature.  Subclasses set this to ``None``.
+
+    """
+
+    _fields_ = ("size", "version", "sig", "data")
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates an :class:`ExtensionBlock` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :rtype: :class:`ExtensionBlock`
+        :returns: The corresponding :class:`ExtensionBlock` object.
+
+        """
+        size = uint16_le.from_buffer_copy(buf, offset).value
+        version = uint16_le.from_buffer_copy(buf, offset + 2).value
+        sig = uint32_le.from_buffer_copy(buf, offset + 4).value
+        data = bytes(buf[offset + 8:offset + size])
+
+        return ExtensionBlock((size, version, sig, data))
+    # end def from_buffer
+# end class ExtensionBlock
+
+class FileEntryExtension(ExtensionBlock):
+    """Represents a file entry extension block (0xBEEF0004).
+
+    .. attribute:: ctime
+
+        The creation time, as a ``datetime``, or a ``(dos_date, dos_time)``
+        tuple if it is not valid.
+
+    .. attribute:: atime
+
+        The last access time, as a ``datetime``, or a ``(dos_date,
+        dos_time)`` tuple if it is not valid.
+
+    .. attribute:: mft_entry
+
+        The MFT entry number of the file, or ``None`` if the extension block
+        is older than version 7.
+
+    .. attribute:: mft_sequence
+
+        The sequence number of the MFT entry, or ``None`` if the extension
+        block is older than version 7.
+
+    .. attribute:: long_name
+
+        The long name of the file.
+
+    .. attribute:: localized_name
+
+        The localized name of the file, or ``None`` if not present.
+
+    """
+
+    _fields_ = (
+        "size", "version", "sig", "data", "ctime", "atime", "mft_entry",
+        "mft_sequence", "long_name", "localized_name"
+    )
+
+    @classmethod
+    def from_buffer(cls, buf, offset=0):
+        """Creates a :class:`FileEntryExtension` from a buffer.
+
+        :type buf: ``bytes`` or ``memoryview``
+        :param buf: A buffer that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`buf`.
+
+        :raises ValueError: If the extension block is too small.
+
+        :rtype: :class:`FileEntryExtension`
+        :returns: The corresponding :class:`FileEntryExtension` object.
+
+        """
+        size = uint16_le.from_buffer_copy(buf, offset).value
+        version = uint16_le.from_buffer_copy(buf, offset + 2).value
+        sig = uint32_le.from_buffer_copy(buf, offset + 4).value
+
+        # The last 2 bytes are the offset of the extension block.
+        end = offset + size - 2
+        if (offset + 18) > end:
+            raise ValueError("file entry extension block is too small")
+        # end if
+
+        ctime = _dos_datetime(buf, offset + 8)
+        atime = _dos_datetime(buf, offset + 12)
+        position = offset + 18
+
+        if version >= 7:
+            file_ref = uint64_le.from_buffer_copy(buf, position + 2).value
+            mft_entry = file_ref & 0xFFFFFFFFFFFF
+            mft_sequence = file_ref >> 48
+            position += 18
+        else:
+            mft_entry = None
+            mft_sequence = None
+        # end if
+
+        if version >= 3:
+            localized_size = uint16_le.from_buffer_copy(buf, position).value
+            position += 2
+        else:
+            localized_size = 0
+        # end if
+
+        if version >= 9:
+            position += 4
+        # end if
+
+        if version >= 8:
+            position += 4
+        # end if
+
+        if position > end:
+            raise ValueError("file entry extension block is too small")
+        # end if
+
+        (long_name, position) = _read_cstring(buf, position, end, True)
+
+        if localized_size and (position < end):
+            localized_name = \
+                _read_cstring(buf, position, end, version >= 7)[0]
+        else:
+            localized_name = None
+        # end if
+
+        return FileEntryExtension((
+            size, version, sig, None, ctime, atime, mft_entry, mft_sequence,
+            long_name, localized_name
+        ))
+    # end def from_buffer
+# end class FileEntryExtension
+
+class ExtensionBlocks(Sequence):
+    """A read-only list of the extension blocks in a shell item.
+
+    The blocks are decoded the first time the list is used, and the result
+    is cached.
+
+    .. attribute:: blocks
+
+        A list of :class:`ExtensionBlock` (or subclass) objects.
+
+    """
+
+    ext_map = {
+        0xBEEF0004: FileEntryExtension.from_buffer
+    }
+
+    def __init__(self, data, offset):
+        """Initializes an :class:`ExtensionBlocks` object.
+
+        :type data: ``bytes``
+        :param data: The data of the shell item.
+
+        :type offset: ``int``
+        :param offset: The start of the first extension block in
+                       :attr:`data`.
+
+        """
+        self._data = data
+        self._offset = offset
+        self._blocks = None
+    # end def __init__
+
+    @property
+    def blocks(self):
+        blocks = self._blocks
+        if blocks is not None:
+            return blocks
+        # end if
+
+        ext_map = self.ext_map
+        data = self._data
+        data_size = len(data)
+        offset = self._offset
+        blocks = list()
+
+        while (offset + 8) <= data_size:
+            size = data[offset] | (data[offset + 1] << 8)
+            if (size < 8) or ((offset + size) > data_size):
+                break
+            # end if
+
+            sig = uint32_le.from_buffer_copy(data, offset + 4).value
+            if (sig & 0xFFFF0000) != 0xBEEF0000:
+                break
+            # end if
+
+            try:
+                block = ext_map[sig](data, offset)
+            except (KeyError, ValueError):
+                block = ExtensionBlock.from_buffer(data, offset)
+            # end try
+
+            blocks.append(block)
+            offset += size
+        # end while
+
+        self._blocks = blocks
+        return blocks
+    # end def blocks
+
+    def __getitem__(self, index):
+        return self.blocks[index]
+    # end def __getitem__
+
+    def __len__(self):
+        return len(self.blocks)
+    # end def __len__
+
+    def __eq__(self, other):
+        if isinstance(other, ExtensionBlocks):
+            other = other.blocks
+        # end if
+
+        return self.blocks == other
+    # end def __eq__
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+    # end def __ne__
+
+    def __hash__(self):
+        return hash(tuple(self.blocks))
+    # end def __hash__
+
+    def __repr__(self):
+        return "{0}({1!r})".format(self.__class__.__name__, self.blocks)
+    # end def __repr__
+# end class ExtensionBlocks
+
+class ShellItemFactory():
+    """Makes typed :class:`ShellItem` objects from :class:`SHITEMID` objects.
+
+    Decoded items are interned by their data, so an item that appears in
+    many ID lists (e.g. the My Computer root folder) is only decoded once,
+    and the same object is returned each time.
+
+    .. attribute:: class_map
+
+        A dictionary mapping class type indicators to their corresponding
+        object factories.  Used by :meth:`make_item`.
+
+    .. attribute:: max_cache_size
+
+        The maximum number of interned items.  The cache is cleared when it
+        is full.
+
+    """
+
+    class_map = dict(
+        [(0x1F, RootFolderItem.from_shitemid)] +
+        [
+            (class_type, VolumeItem.from_shitemid)
+            for class_type in range(0x20, 0x30) if class_type != 0x2E
+        ] +
+        [
+            (class_type, FileEntryItem.from_shitemid)
+            for class_type in range(0x30, 0x40)
+        ]
+    )
+
+    max_cache_size = 65536
+
+    _cache = dict()
+
+    @classmethod
+    def make_item(cls, itemid):
+        """Creates a typed shell item from a :class:`SHITEMID`.
+
+        Items that can not be decoded (or have an unknown class type) are
+        returned as :class:`ShellItem` objects.
+
+        :type itemid: :class:`SHITEMID`
+        :param itemid: The shell item to decode.
+
+        :rtype: :class:`ShellItem` (or subclass)
+        :returns: The corresponding object, or ``None`` if :attr:`itemid` is
+                  the terminal item.
+
+        """
+        data = itemid.abID
+        if not data:
+            return None
+        # end if
+
+        cache = cls._cache
+        if data in cache:
+            return cache[data]
+        # end if
+
+        factory = cls.class_map.get(data[0], ShellItem.from_shitemid)
+        try:
+            item = factory(itemid)
+        except ValueError:
+            item = ShellItem.from_shitemid(itemid)
+        # end try
+
+        if len(cache) >= cls.max_cache_size:
+            cache.clear()
+        # end if
+
+        cache[data] = item
+        return item
+    # end def make_item
+
+    @classmethod
+    def make_items(cls, idlist):
+        """Creates typed shell items from an :class:`ITEMIDLIST`.
+
+        :type idlist: :class:`ITEMIDLIST`
+        :param idlist: The ID list to decode.
+
+        :rtype: ``list``
+        :returns: A list of :class:`ShellItem` (or subclass) objects, one
+                  for each :class:`SHITEMID` except the terminal item.
+
+        """
+        make_item = cls.make_item
+
+        return [
+            make_item(itemid) for itemid in idlist.mkid if itemid.abID
+        ]
+    # end def make_items
+
+    @classmethod
+    def clear_cache(cls):
+        """Removes all of the interned items."""
+
+        cls._cache.clear()
+    # end def clear_cache
+# end class ShellItemFactory
@@ -16,9 +16,11 @@
 # along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
 
 # local imports
-from lf.win.shell.recyclebin.objects import INFO2, INFO2Header, INFO2Item
+from lf.win.shell.recyclebin.objects import (
+    INFO2, INFO2Header, INFO2Item, IFile
+)
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "INFO2" "INFO2Header", "INFO2Item"
+    "INFO2", "INFO2Header", "INFO2Item", "IFile"
 ]
@@ -0,0 +1,281 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batch reading of the $I files in many Windows recycle bins.
+
+Each $I file is turned into a row with the same fields as an
+:class:`~lf.win.shell.recyclebin.objects.INFO2Item`, so rows from $I files
+and INFO2 files can be put in the same table.  Rows are written as JSON
+lines.
+
+"""
+
+# stdlib imports
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from time import perf_counter
+
+# local imports
+from lf.utils.batch import BatchStats, batches, iter_bounded
+from lf.win.shell.recyclebin.objects import INFO2Item, IFile
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "COLUMNS", "find_files", "iter_rows", "ingest"
+]
+
+#: The columns of a row, in order.
+COLUMNS = ("path", "error", "version") + INFO2Item._fields_
+
+# The number of paths given to a worker at once.
+_BATCH_SIZE = 256
+
+def find_files(paths):
+    """Generates the names of $I files, walking any directories.
+
+    :type paths: iterable of ``str``
+    :param paths: Names of files and/or directories.  Directories are walked
+                  recursively, and only files with names that start with
+                  ``$I`` are generated.  Names of files are generated as is.
+
+    :rtype: iterator
+    :returns: An iterator of file names.
+
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for (dir_path, dir_names, file_names) in os.walk(path):
+                dir_names.sort()
+                file_names.sort()
+
+                for file_name in file_names:
+                    if file_name.startswith("$I"):
+                        yield os.path.join(dir_path, file_name)
+                    # end if
+                # end for
+            # end for
+        else:
+            yield path
+        # end if
+    # end for
+# end def find_files
+
+def _error(err):
+    """Describes an exception for the ``"error"`` column."""
+
+    return "{0}: {1}".format(err.__class__.__name__, err)
+# end def _error
+
+def _read_batch(paths):
+    """Reads a list of $I files (in a worker).
+
+    :rtype: ``list``
+    :returns: A list of ``(path, data, exists, error)`` tuples, where
+              ``exists`` is ``True`` if the matching $R file exists.
+
+    """
+    results = list()
+    for path in paths:
+        (dir_name, base_name) = os.path.split(path)
+        r_path = os.path.join(dir_name, "".join(["$R", base_name[2:]]))
+
+        try:
+            with open(path, "rb") as ifile:
+                data = ifile.read()
+            # end with
+        except (IOError, OSError) as err:
+            results.append((path, None, None, _error(err)))
+            continue
+        # end try
+
+        results.append((path, data, os.path.exists(r_path), None))
+    # end for
+
+    return results
+# end def _read_batch
+
+def _decode_batch(results):
+    """Turns the results of :func:`_read_batch` into rows.
+
+    The $I files in the batch are decoded together, with
+    :meth:`IFile.from_bytes_list`.
+
+    """
+    ifiles = iter(IFile.from_bytes_list([
+        data for (path, data, exists, error) in results if error is None
+    ]))
+
+    rows = list()
+    for (path, data, exists, error) in results:
+        row = dict.fromkeys(COLUMNS)
+        row["path"] = path
+
+        if error is not None:
+            row["error"] = error
+            rows.append(row)
+            continue
+        # end if
+
+        ifile = next(ifiles)
+        if isinstance(ifile, ValueError):
+            row["error"] = _error(ifile)
+            rows.append(row)
+            continue
+        # end if
+
+        name = ifile.name_uni
+        if (name[1:2] == ":") and ("A" <= name[:1].upper() <= "Z"):
+            drive_num = ord(name[:1].upper()) - ord("A")
+        else:
+            drive_num = None
+        # end if
+
+        dtime = ifile.dtime
+        if isinstance(dtime, datetime):
+            dtime = dtime.isoformat()
+        # end if
+
+        row["version"] = ifile.version
+        row["id"] = os.path.basename(path)[2:]
+        row["drive_num"] = drive_num
+        row["dtime"] = dtime
+        row["file_size"] = ifile.file_size
+        row["name_uni"] = name
+        row["exists"] = exists
+        rows.append(row)
+    # end for
+
+    return rows
+# end def _decode_batch
+
+def iter_rows(paths, workers=None, max_pending=None, batch_size=None):
+    """Reads many $I files, using a pool of threads.
+
+    The files are read by the threads in batches, and each batch is decoded
+    at once.  Rows are generated in the same order as :attr:`paths`.  At
+    most :attr:`max_pending` batches are in flight at once, so memory use is
+    bounded no matter how many files there are.
+
+    Each row is a dictionary with a key for each column in
+    :const:`COLUMNS`.  The ``"id"`` column is the name of the $I file
+    without the ``$I``, ``"drive_num"`` comes from the name of the deleted
+    file (0 is A, 2 is C, ...), ``"exists"`` is ``True`` if the matching $R
+    file exists, and ``"name_asc"`` is always ``None``.  If the file could
+    not be read, the ``"error"`` column describes the error.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the $I files.
+
+    :type workers: ``int``
+    :param workers: The number of worker threads.  If this is ``None``, the
+                    same default as :class:`ThreadPoolExecutor` is used,
+                    since the workers mostly wait on I/O.  If this is 0, the
+                    files are read in the current thread.
+
+    :type max_pending: ``int``
+    :param max_pending: The maximum number of batches in flight.  Defaults
+                        to 4 times the number of workers.
+
+    :type batch_size: ``int``
+    :param batch_size: The number of paths sent to a worker at once.
+                       Defaults to 256.
+
+    :rtype: iterator
+    :returns: An iterator of rows.
+
+    """
+    if batch_size is None:
+        batch_size = _BATCH_SIZE
+    # end if
+
+    if workers == 0:
+        for batch in batches(paths, batch_size):
+            for row in _decode_batch(_read_batch(batch)):
+                yield row
+            # end for
+        # end for
+
+        return
+    # end if
+
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    # end if
+
+    if max_pending is None:
+        max_pending = workers * 4
+    # end if
+
+    with ThreadPoolExecutor(workers) as executor:
+        arg_lists = ((batch,) for batch in batches(paths, batch_size))
+        results = iter_bounded(executor, _read_batch, arg_lists, max_pending)
+
+        for result in results:
+            for row in _decode_batch(result):
+                yield row
+            # end for
+        # end for
+    # end with
+# end def iter_rows
+
+def ingest(paths, ofile, workers=None, max_pending=None, batch_size=None):
+    """Reads many $I files, and writes them as JSON lines.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the $I files (see :func:`find_files`).
+
+    :type ofile: file object
+    :param ofile: A text file to write the rows to.
+
+    :type workers: ``int``
+    :param workers: Passed on to :func:`iter_rows`.
+
+    :type max_pending: ``int``
+    :param max_pending: Passed on to :func:`iter_rows`.
+
+    :type batch_size: ``int``
+    :param batch_size: Passed on to :func:`iter_rows`.
+
+    :rtype: :class:`~lf.utils.batch.BatchStats`
+    :returns: Statistics about the batch.
+
+    """
+    start_time = perf_counter()
+    file_count = 0
+    error_count = 0
+
+    for row in iter_rows(paths, workers, max_pending, batch_size):
+        file_count += 1
+        if row["error"] is not None:
+            error_count += 1
+        # end if
+
+        ofile.write(json.dumps(row, sort_keys=True))
+        ofile.write("\n")
+    # end for
+
+    elapsed = perf_counter() - start_time
+    if elapsed > 0:
+        rate = file_count / elapsed
+    else:
+        rate = 0.0
+    # end if
+
+    return BatchStats((file_count, error_count, elapsed, rate))
+# end def ingest
@@ -18,12 +18,15 @@
 """Ctypes for the data types in lf.win.shell.recyclebin.dtypes"""
 
 # local imports
-from lf.win.shell.recyclebin.dtypes import INFO2Header, INFO2Item
+from lf.win.shell.recyclebin.dtypes import (
+    INFO2Header, INFO2Item, IFileHeader
+)
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "info2_header", "info2_item"
+    "info2_header", "info2_item", "ifile_header"
 ]
 
 info2_header = INFO2Header._ctype_
 info2_item = INFO2Item._ctype_
+ifile_header = IFileHeader._ctype_
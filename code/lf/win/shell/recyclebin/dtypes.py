@@ -15,15 +15,15 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
 
-"""Data structures to read recycle bin INFO2 files."""
+"""Data structures to read recycle bin INFO2 and $I files."""
 
 # local imports
 from lf.dtypes import raw, LERecord
-from lf.win.dtypes import DWORD, FILETIME_LE
+from lf.win.dtypes import DWORD, QWORD, FILETIME_LE
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "INFO2Header", "INFO2Item"
+    "INFO2Header", "INFO2Item", "IFileHeader"
 ]
 
 class INFO2Header(LERecord):
@@ -42,3 +42,12 @@ class INFO2Item(LERecord):
     file_size = DWORD
     name_uni = raw(520)
 # end class Item
+
+# $I files (Windows Vista and later).  The header is followed by the name of
+# the deleted file: 520 bytes for version 1, or a DWORD count of characters
+# and then the characters for version 2.
+class IFileHeader(LERecord):
+    version = QWORD
+    file_size = QWORD
+    dtime = FILETIME_LE
+# end class IFileHeader
@@ -15,24 +15,46 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
 
-"""Read recycle bin INFO2 files."""
+"""Read recycle bin INFO2 and $I files."""
 
 # stdlib imports
 from ctypes import sizeof
 from codecs import getdecoder
+from struct import Struct
 
 # local imports
 from lf.dec import SEEK_SET
-from lf.dtypes import CtypesWrapper
+from lf.dtypes import ActiveStructuple, CtypesWrapper
+from lf.dtypes.ctypes import struct_format
 from lf.time import FILETIMETodatetime
-from lf.win.shell.recyclebin.ctypes import info2_header, info2_item
+from lf.win.shell.recyclebin.ctypes import (
+    info2_header, info2_item, ifile_header
+)
 
 # module globals
 _utf16_le_decoder = getdecoder("utf_16_le")
 
+# The size of an INFO2 header.
+_header_size = sizeof(info2_header)
+
+# The size of an INFO2 item, and of the fields before name_uni.
+_item_size = sizeof(info2_item)
+_item_prefix_size = _item_size - 520
+
+# The default number of items read at once by INFO2.iter_items.
+_batch_size = 4096
+
+# The header of a $I file, and the DWORD after it in version 2 files.
+_ifile_header = Struct(struct_format(ifile_header))
+_ifile_name_size = Struct("<I")
+_ifile_header_size = sizeof(ifile_header)
+
+# The size of the name in a version 1 $I file.
+_ifile_v1_name_size = 520
+
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "INFO2", "INFO2Header", "INFO2Item"
+    "INFO2", "INFO2Header", "INFO2Item", "IFile"
 ]
 
 class INFO2():
@@ -51,6 +73,8 @@ class INFO2():
     def __init__(self, stream, offset=None):
         """Initializes an INFO2 file.
 
+        The items are read with a single read, and decoded in batches.
+
         :type stream: :class:`~lf.dec.IStream`.
         :param stream: A stream that contains the INFO2 file.
 
@@ -63,33 +87,176 @@ class INFO2():
         # end if
 
         header = INFO2Header.from_stream(stream, offset)
-        offset += 20
 
         item_size = header.item_size
-        if item_size < 800:
-            pad = b"\x00" * (800 - item_size)
-        else:
-            pad = b""
-        # end if
-
         items = list()
-        stream.seek(offset, SEEK_SET)
-        data = stream.read(item_size)
 
-        while data:
-            data = b"".join([data, pad])
-            items.append(INFO2Item.from_bytes(data[:800]))
+        if item_size:
+            stream.seek(offset + _header_size, SEEK_SET)
+            view = memoryview(stream.read())
+            step = item_size * _batch_size
 
-            offset += item_size
-            stream.seek(offset, SEEK_SET)
-            data = stream.read(item_size)
-        # end while
+            for start in range(0, len(view), step):
+                batch = view[start:start + step]
+                items.extend(_decode_items(batch, item_size))
+                batch.release()
+            # end for
+
+            view.release()
+        # end if
 
         self.header = header
         self.items = items
     # end def __init__
+
+    @classmethod
+    def iter_items(cls, stream, offset=None, batch_size=_batch_size):
+        """Iterates over the items in an INFO2 file.
+
+        The items are read (and decoded) :attr:`batch_size` at a time, so the
+        whole file is never in memory at once.
+
+        :type stream: :class:`~lf.dec.IStream`.
+        :param stream: A stream that contains the INFO2 file.
+
+        :type offset: ``int``
+        :param offset: The start of the INFO2 file in :attr:`stream`.
+
+        :type batch_size: ``int``
+        :param batch_size: The number of items to read at once.
+
+        :rtype: iterator
+        :returns: An iterator of :class:`INFO2Item` objects, in order.
+
+        """
+        if offset is None:
+            offset = stream.tell()
+        # end if
+
+        item_size = INFO2Header.from_stream(stream, offset).item_size
+        if not item_size:
+            return
+        # end if
+
+        offset += _header_size
+        read_size = item_size * max(batch_size, 1)
+
+        while True:
+            stream.seek(offset, SEEK_SET)
+            data = stream.read(read_size)
+            if not data:
+                break
+            # end if
+
+            yield from _decode_items(data, item_size)
+
+            if len(data) < read_size:
+                break
+            # end if
+
+            offset += read_size
+        # end while
+    # end def iter_items
 # end class INFO2
 
+def _get_item_struct(item_size):
+    """Creates a struct to decode INFO2 items of a given size.
+
+    Items larger than an :class:`INFO2Item` have the extra bytes skipped,
+    and smaller ones have a short (or empty) ``name_uni`` field.  Items that
+    do not even have the fields before ``name_uni`` return ``None``.
+
+    :type item_size: ``int``
+    :param item_size: The size of an item (from the header).
+
+    :rtype: :class:`struct.Struct`
+    :returns: A struct that unpacks ``(name_asc, id, drive_num, dtime,
+              file_size, name_uni)`` from :attr:`item_size` bytes.
+
+    """
+    if item_size >= _item_size:
+        return Struct("<260sIIQI520s{0}x".format(item_size - _item_size))
+    elif item_size >= _item_prefix_size:
+        return Struct("<260sIIQI{0}s".format(item_size - _item_prefix_size))
+    # end if
+
+    return None
+# end def _get_item_struct
+
+def _decode_items(data, item_size):
+    """Decodes a table of INFO2 items.
+
+    Only the last item is padded, if it is short.
+
+    :type data: ``bytes`` or ``memoryview``
+    :param data: The items, one after another.
+
+    :type item_size: ``int``
+    :param item_size: The size of an item (from the header).
+
+    :rtype: ``list``
+    :returns: A list of :class:`INFO2Item` objects.
+
+    """
+    if not data:
+        return list()
+    # end if
+
+    item_struct = _get_item_struct(item_size)
+    if item_struct is None:
+        # Too small for even the fixed size fields, so pad every item.
+        item_struct = _get_item_struct(_item_size)
+        values = [
+            item_struct.unpack(
+                bytes(data[offset:offset + item_size]).ljust(
+                    _item_size, b"\x00"
+                )
+            )
+            for offset in range(0, len(data), item_size)
+        ]
+    else:
+        view = memoryview(data)
+        whole_size = len(data) - (len(data) % item_size)
+        values = list(item_struct.iter_unpack(view[:whole_size]))
+
+        if whole_size < len(data):
+            tail = bytes(view[whole_size:]).ljust(item_size, b"\x00")
+            values.append(item_struct.unpack(tail))
+        # end if
+
+    # end if
+
+    dtimes = [value[3] for value in values]
+    try:
+        dtimes = FILETIMETodatetime.from_ints(dtimes)
+    except ValueError:
+        dtimes = FILETIMETodatetime.from_ints(dtimes, strict=False)
+    # end try
+
+    items = list()
+    append = items.append
+    for (value, dtime) in zip(values, dtimes):
+        (name_asc, id, drive_num, unused, file_size, name_uni) = value
+
+        exists = name_asc[0] != 0
+        null_term = name_asc.find(b"\x00", 0 if exists else 1)
+        if null_term != -1:
+            name_asc = name_asc[:null_term]
+        # end if
+
+        if len(name_uni) & 1:
+            name_uni = b"".join([name_uni, b"\x00"])
+        # end if
+        name_uni = _utf16_le_decoder(name_uni, "ignore")[0].split("\x00", 1)[0]
+
+        append(INFO2Item((
+            name_asc, id, drive_num, dtime, file_size, name_uni, exists
+        )))
+    # end for
+
+    return items
+# end def _decode_items
+
 class INFO2Header(CtypesWrapper):
     """Represents the header from an INFO2 file.
 
@@ -206,3 +373,143 @@ class INFO2Item(CtypesWrapper):
         ))
     # end def from_ctype
 # end class INFO2Item
+
+class IFile(ActiveStructuple):
+    """Represents a $I file, from a Windows Vista (or later) recycle bin.
+
+    Each deleted file has a $I file (with the information below) and a $R
+    file (with the contents), with the same name after the first two
+    characters.
+
+    .. attribute:: version
+
+        The version of the $I file (1 before Windows 10, 2 after).
+
+    .. attribute:: file_size
+
+        The size of the deleted file.
+
+    .. attribute:: dtime
+
+        The time the file was deleted.
+
+    .. attribute:: name_uni
+
+        The (full) name of the deleted file.
+
+    """
+
+    _takes_stream = True
+    _fields_ = ("version", "file_size", "dtime", "name_uni")
+
+    @classmethod
+    def from_stream(cls, stream, offset=None):
+        """Creates an :class:`IFile` object from a stream.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the $I file.
+
+        :type offset: ``int``
+        :param offset: The start of the $I file in :attr:`stream`.
+
+        :raises ValueError: If the $I file is invalid.
+
+        :rtype: :class:`IFile`
+        :returns: The corresponding :class:`IFile` object.
+
+        """
+        if offset is not None:
+            stream.seek(offset, SEEK_SET)
+        # end if
+
+        return cls.from_bytes(stream.read())
+    # end def from_stream
+
+    @classmethod
+    def from_bytes(cls, bytes_):
+        """Creates an :class:`IFile` object from a ``bytes`` object.
+
+        :type bytes_: ``bytes``
+        :param bytes_: The contents of the $I file.
+
+        :raises ValueError: If the $I file is invalid.
+
+        :rtype: :class:`IFile`
+        :returns: The corresponding :class:`IFile` object.
+
+        """
+        ifile = cls.from_bytes_list([bytes_])[0]
+        if isinstance(ifile, ValueError):
+            raise ifile
+        # end if
+
+        return ifile
+    # end def from_bytes
+
+    @classmethod
+    def from_bytes_list(cls, bytes_list):
+        """Creates :class:`IFile` objects from the contents of many $I files.
+
+        The headers are unpacked with a precompiled struct, and the deletion
+        times are converted together.  Errors are returned instead of
+        raised, so one bad file does not stop the others.
+
+        :type bytes_list: iterable of ``bytes``
+        :param bytes_list: The contents of the $I files.
+
+        :rtype: ``list``
+        :returns: A list with an :class:`IFile` object for each $I file, or
+                  a ``ValueError`` describing why it is invalid, in the same
+                  order as :attr:`bytes_list`.
+
+        """
+        unpack_header = _ifile_header.unpack_from
+        unpack_name_size = _ifile_name_size.unpack_from
+        header_size = _ifile_header_size
+        name_offset = header_size + _ifile_name_size.size
+
+        values = list()
+        for bytes_ in bytes_list:
+            if len(bytes_) < header_size:
+                values.append(ValueError("$I file is too small"))
+                continue
+            # end if
+
+            (version, file_size, dtime) = unpack_header(bytes_)
+
+            if version == 1:
+                name = bytes_[header_size:header_size + _ifile_v1_name_size]
+            elif version == 2:
+                if len(bytes_) < name_offset:
+                    values.append(ValueError("$I file is too small"))
+                    continue
+                # end if
+
+                name_size = unpack_name_size(bytes_, header_size)[0] * 2
+                name = bytes_[name_offset:name_offset + name_size]
+            else:
+                values.append(ValueError(
+                    "unsupported $I file version {0}".format(version)
+                ))
+                continue
+            # end if
+
+            name = _utf16_le_decoder(name, "ignore")[0].split("\x00", 1)[0]
+            values.append((version, file_size, dtime, name))
+        # end for
+
+        dtimes = [value[2] for value in values if type(value) is tuple]
+        try:
+            dtimes = FILETIMETodatetime.from_ints(dtimes)
+        except ValueError:
+            dtimes = FILETIMETodatetime.from_ints(dtimes, strict=False)
+        # end try
+        dtimes = iter(dtimes)
+
+        return [
+            cls((value[0], value[1], next(dtimes), value[3]))
+            if type(value) is tuple else value
+            for value in values
+        ]
+    # end def from_bytes_list
+# end class IFile
@@ -0,0 +1,63 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Constants for working with thumbnail cache (thumbcache_*.db) files."""
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "CACHE_FILE_SIG", "INDEX_FILE_SIG", "VERSION_VISTA", "VERSION_7",
+    "VERSION_8", "VERSION_8V2", "VERSION_8V3", "VERSION_81", "VERSION_10",
+    "NO_ENTRY", "CACHE_TYPE_NAMES"
+]
+
+CACHE_FILE_SIG = b"CMMM"
+INDEX_FILE_SIG = b"IMMM"
+
+VERSION_VISTA = 0x14
+VERSION_7 = 0x15
+VERSION_8 = 0x1A
+VERSION_8V2 = 0x1C
+VERSION_8V3 = 0x1E
+VERSION_81 = 0x1F
+VERSION_10 = 0x20
+
+# The offset in an index entry for a cache file without the thumbnail.
+NO_ENTRY = 0xFFFFFFFF
+
+#: The names of the cache types (e.g. ``"96"`` for thumbcache_96.db), in
+#: order, for each version.  Later versions use the last entry.
+CACHE_TYPE_NAMES = {
+    VERSION_VISTA: ("32", "96", "256", "1024", "sr"),
+    VERSION_7: ("32", "96", "256", "1024", "sr"),
+    VERSION_8: (
+        "16", "32", "48", "96", "256", "1024", "sr", "wide", "exif"
+    ),
+    VERSION_8V2: (
+        "16", "32", "48", "96", "256", "1024", "sr", "wide", "exif"
+    ),
+    VERSION_8V3: (
+        "16", "32", "48", "96", "256", "1024", "sr", "wide", "exif"
+    ),
+    VERSION_81: (
+        "16", "32", "48", "96", "256", "1024", "1600", "sr", "wide", "exif",
+        "wide_alternate"
+    ),
+    VERSION_10: (
+        "16", "32", "48", "96", "256", "768", "1280", "1920", "2560", "sr",
+        "wide", "exif", "wide_alternate", "custom_stream"
+    )
+}
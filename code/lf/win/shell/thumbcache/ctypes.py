@@ -0,0 +1,44 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Thumbnail cache ctypes"""
+
+# local imports
+from lf.win.shell.thumbcache.dtypes import (
+    CacheFileHeader, CacheFileInfo, CacheFileInfoV8, CacheEntryHeaderVista,
+    CacheEntryHeader7, CacheEntryHeader8, IndexFileHeader,
+    IndexEntryHeaderVista, IndexEntryHeader7, IndexEntryHeader8
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "cache_file_header", "cache_file_info", "cache_file_info_v8",
+    "cache_entry_header_vista", "cache_entry_header_7",
+    "cache_entry_header_8", "index_file_header", "index_entry_header_vista",
+    "index_entry_header_7", "index_entry_header_8"
+]
+
+cache_file_header = CacheFileHeader._ctype_
+cache_file_info = CacheFileInfo._ctype_
+cache_file_info_v8 = CacheFileInfoV8._ctype_
+cache_entry_header_vista = CacheEntryHeaderVista._ctype_
+cache_entry_header_7 = CacheEntryHeader7._ctype_
+cache_entry_header_8 = CacheEntryHeader8._ctype_
+index_file_header = IndexFileHeader._ctype_
+index_entry_header_vista = IndexEntryHeaderVista._ctype_
+index_entry_header_7 = IndexEntryHeader7._ctype_
+index_entry_header_8 = IndexEntryHeader8._ctype_
@@ -0,0 +1,117 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Data types to read thumbnail cache (thumbcache_*.db) files."""
+
+# local imports
+from lf.dtypes import raw, LERecord
+from lf.win.dtypes import UINT32, UINT64
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "CacheFileHeader", "CacheFileInfo", "CacheFileInfoV8",
+    "CacheEntryHeaderVista", "CacheEntryHeader7", "CacheEntryHeader8",
+    "IndexFileHeader", "IndexEntryHeaderVista", "IndexEntryHeader7",
+    "IndexEntryHeader8"
+]
+
+class CacheFileHeader(LERecord):
+    sig = raw(4)
+    version = UINT32
+    cache_type = UINT32
+# end class CacheFileHeader
+
+# Windows Vista and 7 cache files
+class CacheFileInfo(LERecord):
+    first_entry = UINT32
+    available_entry = UINT32
+    entry_count = UINT32
+# end class CacheFileInfo
+
+# Windows 8 and later cache files
+class CacheFileInfoV8(LERecord):
+    unknown1 = raw(4)
+    first_entry = UINT32
+    available_entry = UINT32
+# end class CacheFileInfoV8
+
+class CacheEntryHeaderVista(LERecord):
+    sig = raw(4)
+    size = UINT32
+    hash = UINT64
+    extension = raw(8)
+    identifier_size = UINT32
+    padding_size = UINT32
+    data_size = UINT32
+    unknown1 = raw(4)
+    data_checksum = UINT64
+    header_checksum = UINT64
+# end class CacheEntryHeaderVista
+
+class CacheEntryHeader7(LERecord):
+    sig = raw(4)
+    size = UINT32
+    hash = UINT64
+    identifier_size = UINT32
+    padding_size = UINT32
+    data_size = UINT32
+    unknown1 = raw(4)
+    data_checksum = UINT64
+    header_checksum = UINT64
+# end class CacheEntryHeader7
+
+class CacheEntryHeader8(LERecord):
+    sig = raw(4)
+    size = UINT32
+    hash = UINT64
+    identifier_size = UINT32
+    padding_size = UINT32
+    data_size = UINT32
+    width = UINT32
+    height = UINT32
+    unknown1 = raw(4)
+    data_checksum = UINT64
+    header_checksum = UINT64
+# end class CacheEntryHeader8
+
+class IndexFileHeader(LERecord):
+    sig = raw(4)
+    version = UINT32
+    unknown1 = raw(4)
+    used_count = UINT32
+    entry_count = UINT32
+    unknown2 = raw(4)
+# end class IndexFileHeader
+
+# The headers of index entries are followed by one offset (UINT32) for each
+# cache type.
+class IndexEntryHeaderVista(LERecord):
+    hash = UINT64
+    mtime = UINT64
+    flags = UINT32
+# end class IndexEntryHeaderVista
+
+class IndexEntryHeader7(LERecord):
+    hash = UINT64
+    flags = UINT32
+# end class IndexEntryHeader7
+
+class IndexEntryHeader8(LERecord):
+    hash = UINT64
+    flags = UINT32
+    unknown1 = raw(4)
+# end class IndexEntryHeader8
@@ -0,0 +1,601 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Objects to work with thumbnail cache (thumbcache_*.db) files."""
+
+# stdlib imports
+from codecs import getdecoder
+from ctypes import sizeof
+from struct import Struct
+
+# local imports
+from lf.dtypes import ActiveStructuple, Structuple
+from lf.dtypes.ctypes import struct_format
+from lf.dec import SEEK_SET
+from lf.time import FILETIMETodatetime
+from lf.win.ole.ps import Payload
+
+from lf.win.shell.thumbcache.consts import (
+    CACHE_FILE_SIG, INDEX_FILE_SIG, VERSION_VISTA, VERSION_7, VERSION_8,
+    VERSION_10, NO_ENTRY, CACHE_TYPE_NAMES
+)
+from lf.win.shell.thumbcache.ctypes import (
+    cache_file_header, cache_file_info, cache_file_info_v8,
+    cache_entry_header_vista, cache_entry_header_7, cache_entry_header_8,
+    index_file_header, index_entry_header_vista, index_entry_header_7,
+    index_entry_header_8
+)
+
+# module globals
+_utf16_le_decoder = getdecoder("utf_16_le")
+
+# The signature, size and hash at the start of every cache entry.
+_entry_prefix = Struct("<4sIQ")
+
+# The fixed part of an index entry, for each version.
+_index_entry_formats = {
+    VERSION_VISTA: struct_format(index_entry_header_vista),
+    VERSION_7: struct_format(index_entry_header_7)
+}
+_index_entry_format_v8 = struct_format(index_entry_header_8)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "CacheFile", "CacheEntry", "IndexFile", "IndexEntry"
+]
+
+def _get_cache_type_names(version):
+    """Finds the names of the cache types for a version.
+
+    :raises ValueError: If :attr:`version` is not supported.
+
+    :rtype: ``tuple``
+    :returns: The names of the cache types, in order.
+
+    """
+    names = CACHE_TYPE_NAMES.get(version)
+    if names is not None:
+        return names
+    elif version > VERSION_10:
+        return CACHE_TYPE_NAMES[VERSION_10]
+    # end if
+
+    raise ValueError("unsupported version {0:#x}".format(version))
+# end def _get_cache_type_names
+
+def _read(stream, offset, size):
+    """Reads exactly :attr:`size` bytes from a stream.
+
+    :raises ValueError: If the stream is too short.
+
+    :rtype: ``bytes``
+    :returns: The bytes read.
+
+    """
+    stream.seek(offset, SEEK_SET)
+    data = stream.read(size)
+    if len(data) != size:
+        raise ValueError("unexpected end of stream at {0}".format(offset))
+    # end if
+
+    return data
+# end def _read
+
+class CacheFile():
+    """Represents a thumbnail cache (thumbcache_*.db) file.
+
+    The cache entries are a flat sequence, and are only read when they are
+    needed.  Entries can be found by their hash with :meth:`get_entry`.  For
+    very large cache files, use a :class:`~lf.dec.MappedIStream`.
+
+    .. attribute:: stream
+
+        The stream that contains the cache file.
+
+    .. attribute:: version
+
+        The format version (e.g. :const:`VERSION_7`).
+
+    .. attribute:: cache_type
+
+        The cache type (the index of the cache file in an index entry).
+
+    .. attribute:: cache_type_name
+
+        The name of the cache type (e.g. ``"96"``), or ``None`` if it is not
+        known.
+
+    .. attribute:: first_entry
+
+        The offset of the first cache entry.
+
+    .. attribute:: available_entry
+
+        The offset of the first available (unused) cache entry.
+
+    .. attribute:: entry_count
+
+        The number of cache entries (from the header), or ``None`` for
+        Windows 8 and later.
+
+    """
+
+    def __init__(self, stream):
+        """Initializes a :class:`CacheFile` object.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the cache file.
+
+        :raises ValueError: If the stream is not a supported cache file.
+
+        """
+        data = _read(stream, 0, 24)
+        header = cache_file_header.from_buffer_copy(data)
+
+        if bytes(header.sig) != CACHE_FILE_SIG:
+            raise ValueError("invalid cache file signature")
+        # end if
+
+        version = header.version
+        names = _get_cache_type_names(version)
+
+        if version >= VERSION_8:
+            info = cache_file_info_v8.from_buffer_copy(data, 12)
+            entry_count = None
+        else:
+            info = cache_file_info.from_buffer_copy(data, 12)
+            entry_count = info.entry_count
+        # end if
+
+        cache_type = header.cache_type
+        if cache_type < len(names):
+            cache_type_name = names[cache_type]
+        else:
+            cache_type_name = None
+        # end if
+
+        if version == VERSION_VISTA:
+            self._entry_header_size = sizeof(cache_entry_header_vista)
+        elif version == VERSION_7:
+            self._entry_header_size = sizeof(cache_entry_header_7)
+        else:
+            self._entry_header_size = sizeof(cache_entry_header_8)
+        # end if
+
+        self.stream = stream
+        self.version = version
+        self.cache_type = cache_type
+        self.cache_type_name = cache_type_name
+        self.first_entry = info.first_entry
+        self.available_entry = info.available_entry
+        self.entry_count = entry_count
+        self._hash_index = None
+    # end def __init__
+
+    @property
+    def _end(self):
+        """The end of the cache entries."""
+
+        size = self.stream.size
+        available_entry = self.available_entry
+
+        if (size is None) or (self.first_entry < available_entry <= size):
+            return available_entry
+        # end if
+
+        return size
+    # end def _end
+
+    @property
+    def hash_index(self):
+        """A dictionary mapping entry hashes to the offsets of the entries.
+
+        Unless it was set by :meth:`use_index`, this is built the first time
+        it is used, by reading the first 16 bytes of each entry.
+
+        """
+        hash_index = self._hash_index
+        if hash_index is not None:
+            return hash_index
+        # end if
+
+        stream = self.stream
+        unpack_from = _entry_prefix.unpack_from
+        header_size = self._entry_header_size
+        offset = self.first_entry
+        end = self._end
+        hash_index = dict()
+
+        while (offset + header_size) <= end:
+            stream.seek(offset, SEEK_SET)
+            data = stream.read(16)
+            if len(data) != 16:
+                break
+            # end if
+
+            (sig, size, entry_hash) = unpack_from(data)
+            if (sig != CACHE_FILE_SIG) or (size < header_size):
+                break
+            # end if
+
+            hash_index.setdefault(entry_hash, offset)
+            offset += size
+        # end while
+
+        self._hash_index = hash_index
+        return hash_index
+    # end def hash_index
+
+    def use_index(self, index_file):
+        """Uses an index file to find entries, instead of reading them.
+
+        :type index_file: :class:`IndexFile`
+        :param index_file: The index (thumbcache_idx.db) file for the cache
+                           file.
+
+        """
+        self._hash_index = index_file.get_offsets(self.cache_type)
+    # end def use_index
+
+    def entry_at(self, offset):
+        """Reads the cache entry at an offset.
+
+        :type offset: ``int``
+        :param offset: The start of the cache entry.
+
+        :raises ValueError: If there is not a valid cache entry at
+                            :attr:`offset`.
+
+        :rtype: :class:`CacheEntry`
+        :returns: The corresponding :class:`CacheEntry` object.
+
+        """
+        return CacheEntry.from_stream(self.stream, offset, self.version)
+    # end def entry_at
+
+    def get_entry(self, entry_hash):
+        """Finds a cache entry by its hash.
+
+        :type entry_hash: ``int``
+        :param entry_hash: The hash of the cache entry.
+
+        :raises KeyError: If there is no entry with :attr:`entry_hash`.
+
+        :rtype: :class:`CacheEntry`
+        :returns: The corresponding :class:`CacheEntry` object.
+
+        """
+        return self.entry_at(self.hash_index[entry_hash])
+    # end def get_entry
+
+    def iter_entries(self):
+        """Iterates over the cache entries, in order.
+
+        Iteration stops at the first invalid entry.
+
+        :rtype: iterator
+        :returns: An iterator of :class:`CacheEntry` objects.
+
+        """
+        header_size = self._entry_header_size
+        offset = self.first_entry
+        end = self._end
+
+        while (offset + header_size) <= end:
+            try:
+                entry = self.entry_at(offset)
+            except ValueError:
+                break
+            # end try
+
+            yield entry
+            offset += entry.size
+        # end while
+    # end def iter_entries
+# end class CacheFile
+
+class CacheEntry(ActiveStructuple):
+    """Represents an entry in a thumbnail cache file.
+
+    .. attribute:: offset
+
+        The start of the entry in the cache file.
+
+    .. attribute:: size
+
+        The size of the entry (in bytes).
+
+    .. attribute:: hash
+
+        The hash of the entry (also used by the index file).
+
+    .. attribute:: extension
+
+        The file extension of the thumbnail (Windows Vista only), or
+        ``None``.
+
+    .. attribute:: identifier
+
+        The identifier string of the entry.
+
+    .. attribute:: width
+
+        The width of the thumbnail (Windows 8 and later), or ``None``.
+
+    .. attribute:: height
+
+        The height of the thumbnail (Windows 8 and later), or ``None``.
+
+    .. attribute:: data_checksum
+
+        The checksum of the thumbnail data.
+
+    .. attribute:: header_checksum
+
+        The checksum of the entry header.
+
+    .. attribute:: data
+
+        A :class:`~lf.win.ole.ps.Payload` over the thumbnail data, which is
+        only read when it is used.
+
+    """
+
+    _takes_stream = True
+    _fields_ = (
+        "offset", "size", "hash", "extension", "identifier", "width",
+        "height", "data_checksum", "header_checksum", "data"
+    )
+
+    @classmethod
+    def from_stream(cls, stream, offset=None, version=VERSION_7):
+        """Creates a :class:`CacheEntry` object from a stream.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`stream`.
+
+        :type version: ``int``
+        :param version: The format version of the cache file.
+
+        :raises ValueError: If the entry is not valid.
+
+        :rtype: :class:`CacheEntry`
+        :returns: The corresponding :class:`CacheEntry` object.
+
+        """
+        if offset is None:
+            offset = stream.tell()
+        # end if
+
+        if version == VERSION_VISTA:
+            header_ctype = cache_entry_header_vista
+        elif version == VERSION_7:
+            header_ctype = cache_entry_header_7
+        elif version >= VERSION_8:
+            header_ctype = cache_entry_header_8
+        else:
+            raise ValueError("unsupported version {0:#x}".format(version))
+        # end if
+
+        header_size = sizeof(header_ctype)
+        header = header_ctype.from_buffer_copy(
+            _read(stream, offset, header_size)
+        )
+
+        if bytes(header.sig) != CACHE_FILE_SIG:
+            raise ValueError("invalid cache entry signature")
+        elif header.size < header_size:
+            raise ValueError("cache entry is too small")
+        # end if
+
+        size = header.size
+        end = offset + size
+        identifier_offset = offset + header_size
+        identifier_size = min(header.identifier_size, size - header_size)
+
+        if identifier_size:
+            stream.seek(identifier_offset, SEEK_SET)
+            identifier = stream.read(identifier_size)
+            identifier = _utf16_le_decoder(identifier, "ignore")[0]
+            identifier = identifier.split("\x00", 1)[0]
+        else:
+            identifier = ""
+        # end if
+
+        data_offset = \
+            identifier_offset + header.identifier_size + header.padding_size
+        data_size = max(min(header.data_size, end - data_offset), 0)
+        data = Payload(stream, data_offset, data_size)
+
+        if version == VERSION_VISTA:
+            extension = _utf16_le_decoder(bytes(header.extension), "ignore")[0]
+            extension = extension.split("\x00", 1)[0]
+        else:
+            extension = None
+        # end if
+
+        if version >= VERSION_8:
+            width = header.width
+            height = header.height
+        else:
+            width = None
+            height = None
+        # end if
+
+        return cls((
+            offset, size, header.hash, extension, identifier, width, height,
+            header.data_checksum, header.header_checksum, data
+        ))
+    # end def from_stream
+# end class CacheEntry
+
+class IndexEntry(Structuple):
+    """Represents an entry in a thumbnail cache index file.
+
+    .. attribute:: hash
+
+        The hash of the cache entries.
+
+    .. attribute:: mtime
+
+        The last modification time (Windows Vista only), or ``None``.
+
+    .. attribute:: flags
+
+        The flags of the entry.
+
+    .. attribute:: offsets
+
+        A tuple with the offset of the cache entry in each cache file (in
+        the order of the cache types), or :const:`NO_ENTRY` if a cache file
+        does not have the thumbnail.
+
+    """
+
+    _fields_ = ("hash", "mtime", "flags", "offsets")
+    __slots__ = ()
+# end class IndexEntry
+
+class IndexFile():
+    """Represents a thumbnail cache index (thumbcache_idx.db) file.
+
+    The index is a hash table of :class:`IndexEntry` objects, which is read
+    (and decoded) all at once.  Empty slots are skipped.
+
+    .. attribute:: version
+
+        The format version (e.g. :const:`VERSION_7`).
+
+    .. attribute:: used_count
+
+        The number of used entries (from the header).
+
+    .. attribute:: entry_count
+
+        The number of entries (from the header).
+
+    .. attribute:: cache_type_names
+
+        The names of the cache types, in the order of the offsets of each
+        entry.
+
+    .. attribute:: entries
+
+        A list of the (non empty) :class:`IndexEntry` objects.
+
+    """
+
+    def __init__(self, stream):
+        """Initializes an :class:`IndexFile` object.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the index file.
+
+        :raises ValueError: If the stream is not a supported index file.
+
+        """
+        header_size = sizeof(index_file_header)
+        header = index_file_header.from_buffer_copy(
+            _read(stream, 0, header_size)
+        )
+
+        if bytes(header.sig) != INDEX_FILE_SIG:
+            raise ValueError("invalid index file signature")
+        # end if
+
+        version = header.version
+        names = _get_cache_type_names(version)
+
+        entry_format = _index_entry_formats.get(
+            version, _index_entry_format_v8
+        )
+        entry_struct = Struct(
+            "{0}{1}I".format(entry_format, len(names))
+        )
+        entry_size = entry_struct.size
+
+        entry_count = header.entry_count
+        if stream.size is not None:
+            available = max(stream.size - header_size, 0) // entry_size
+            entry_count = min(entry_count, available)
+        # end if
+
+        data = _read(stream, header_size, entry_count * entry_size)
+        values = [
+            value for value in entry_struct.iter_unpack(data) if value[0]
+        ]
+
+        if version == VERSION_VISTA:
+            mtimes = FILETIMETodatetime.from_ints(
+                [value[1] for value in values], strict=False
+            )
+            entries = [
+                IndexEntry((value[0], mtime, value[2], value[3:]))
+                for (value, mtime) in zip(values, mtimes)
+            ]
+        else:
+            entries = [
+                IndexEntry((value[0], None, value[1], value[2:]))
+                for value in values
+            ]
+        # end if
+
+        self.version = version
+        self.used_count = header.used_count
+        self.entry_count = header.entry_count
+        self.cache_type_names = names
+        self.entries = entries
+        self._offsets = dict()
+    # end def __init__
+
+    def get_offsets(self, cache_type):
+        """Maps entry hashes to offsets in a cache file.
+
+        The result is cached, so finding an entry is a single dictionary
+        lookup.
+
+        :type cache_type: ``int``
+        :param cache_type: The cache type of the cache file (see
+                           :attr:`CacheFile.cache_type`).
+
+        :rtype: ``dict``
+        :returns: A dictionary mapping entry hashes to offsets, for the
+                  entries the cache file has.
+
+        """
+        offsets = self._offsets.get(cache_type)
+        if offsets is not None:
+            return offsets
+        # end if
+
+        offsets = dict()
+        if cache_type < len(self.cache_type_names):
+            for entry in self.entries:
+                offset = entry.offsets[cache_type]
+                if offset != NO_ENTRY:
+                    offsets.setdefault(entry.hash, offset)
+                # end if
+            # end for
+        # end if
+
+        self._offsets[cache_type] = offsets
+        return offsets
+    # end def get_offsets
+# end class IndexFile
@@ -17,9 +17,9 @@
 
 # local imports
 from lf.win.shell.thumbsdb.objects import (
-    ThumbsDb, Thumbnail, Catalog, CatalogEntry
+    ThumbsDb, Thumbnail, LazyThumbnail, Catalog, CatalogEntry
 )
 
 __all__ = [
-    "ThumbsDb", "Thumbnail", "Catalog", "CatalogEntry"
+    "ThumbsDb", "Thumbnail", "LazyThumbnail", "Catalog", "CatalogEntry"
 ]
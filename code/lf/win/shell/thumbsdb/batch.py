@@ -0,0 +1,291 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batch export of the thumbnails in many thumbs.db files."""
+
+# stdlib imports
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+# local imports
+from lf.dec import RawIStream
+from lf.dtypes import Structuple
+from lf.utils.batch import iter_bounded
+from lf.win.ole.cfb.objects import CompoundFile
+from lf.win.ole.cfb.batch import find_files
+from lf.win.shell.thumbsdb.objects import ThumbsDb
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "ExportStats", "find_files", "export_file", "iter_exports", "export"
+]
+
+class ExportStats(Structuple):
+    """Statistics from :func:`export`.
+
+    .. attribute:: file_count
+
+        The number of thumbs.db files that were processed.
+
+    .. attribute:: error_count
+
+        The number of thumbs.db files that could not be processed.
+
+    .. attribute:: image_count
+
+        The number of thumbnails that were exported.
+
+    .. attribute:: unique_count
+
+        The number of unique images (by hash) among the thumbnails.
+
+    .. attribute:: byte_count
+
+        The total size (in bytes) of the thumbnails.
+
+    .. attribute:: elapsed
+
+        The time (in seconds) the batch took.
+
+    .. attribute:: image_rate
+
+        The throughput of the batch, in thumbnails per second.
+
+    .. attribute:: byte_rate
+
+        The throughput of the batch, in bytes per second.
+
+    """
+    _fields_ = (
+        "file_count", "error_count", "image_count", "unique_count",
+        "byte_count", "elapsed", "image_rate", "byte_rate"
+    )
+    __slots__ = ()
+# end class ExportStats
+
+def export_file(
+    path, directory, threads=0, catalog_name="Catalog", algorithm="sha256"
+):
+    """Exports the thumbnails in a thumbs.db file.
+
+    Any error while parsing the file is caught, and reported in the result,
+    so one bad file does not stop a batch.
+
+    :type path: ``str``
+    :param path: The name of the thumbs.db file.
+
+    :type directory: ``str``
+    :param directory: The (existing) directory to write the images to.
+
+    :type threads: ``int``
+    :param threads: Passed on to :meth:`ThumbsDb.export` (as ``workers``).
+
+    :type catalog_name: ``str``
+    :param catalog_name: Passed on to :class:`ThumbsDb`.
+
+    :type algorithm: ``str``
+    :param algorithm: Passed on to :meth:`ThumbsDb.export`.
+
+    :rtype: ``dict``
+    :returns: A dictionary with the keys ``"path"`` and ``"thumbnails"`` (the
+              manifest from :meth:`ThumbsDb.export`), or ``"path"`` and
+              ``"error"`` if the file could not be exported.
+
+    """
+    try:
+        stream = RawIStream(path)
+    except (IOError, OSError) as err:
+        return {"path": path, "error": "{0}: {1}".format(
+            err.__class__.__name__, err
+        )}
+    # end try
+
+    try:
+        tdb = ThumbsDb(CompoundFile(stream), catalog_name)
+        thumbnails = tdb.export(directory, threads, algorithm=algorithm)
+
+        return {"path": path, "thumbnails": thumbnails}
+    except Exception as err:
+        return {"path": path, "error": "{0}: {1}".format(
+            err.__class__.__name__, err
+        )}
+    finally:
+        stream.close()
+    # end try
+# end def export_file
+
+def iter_exports(
+    paths, directory, workers=None, threads=0, max_pending=None,
+    catalog_name="Catalog", algorithm="sha256"
+):
+    """Exports the thumbnails in many thumbs.db files, using a process pool.
+
+    Results are generated in the same order as :attr:`paths`.  At most
+    :attr:`max_pending` files are in flight at once, so memory use is bounded
+    no matter how many files there are.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the thumbs.db files.
+
+    :type directory: ``str``
+    :param directory: The (existing) directory to write the images to.
+
+    :type workers: ``int``
+    :param workers: The number of worker processes.  If this is ``None`` the
+                    number of CPUs is used.  If this is 0, the files are
+                    processed in the current process.
+
+    :type threads: ``int``
+    :param threads: The number of threads each file is exported with.
+
+    :type max_pending: ``int``
+    :param max_pending: The maximum number of files in flight.  Defaults to 4
+                        times the number of workers.
+
+    :type catalog_name: ``str``
+    :param catalog_name: Passed on to :func:`export_file`.
+
+    :type algorithm: ``str``
+    :param algorithm: Passed on to :func:`export_file`.
+
+    :rtype: iterator
+    :returns: An iterator of results (see :func:`export_file`).
+
+    """
+    if workers == 0:
+        for path in paths:
+            yield export_file(
+                path, directory, threads, catalog_name, algorithm
+            )
+        # end for
+
+        return
+    # end if
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # end if
+
+    if max_pending is None:
+        max_pending = workers * 4
+    # end if
+
+    with ProcessPoolExecutor(workers) as executor:
+        arg_lists = (
+            (path, directory, threads, catalog_name, algorithm)
+            for path in paths
+        )
+        results = iter_bounded(executor, export_file, arg_lists, max_pending)
+
+        for result in results:
+            yield result
+        # end for
+    # end with
+# end def iter_exports
+
+def export(
+    paths, directory, ofile, workers=None, threads=0, max_pending=None,
+    catalog_name="Catalog", algorithm="sha256"
+):
+    """Exports the thumbnails in many thumbs.db files, with a manifest.
+
+    Each unique image is written to :attr:`directory` once (see
+    :meth:`ThumbsDb.export`).  The manifest is written to :attr:`ofile` as
+    JSON lines, one per catalog entry, with the name of the thumbs.db file
+    under the ``"path"`` key.  Files that could not be exported have a single
+    line with the keys ``"path"`` and ``"error"``.
+
+    :type paths: iterable of ``str``
+    :param paths: The names of the thumbs.db files (see :func:`find_files`).
+
+    :type directory: ``str``
+    :param directory: The directory to write the images to.  It is created
+                      if it does not exist.
+
+    :type ofile: file object
+    :param ofile: A text file to write the manifest to.
+
+    :type workers: ``int``
+    :param workers: Passed on to :func:`iter_exports`.
+
+    :type threads: ``int``
+    :param threads: Passed on to :func:`iter_exports`.
+
+    :type max_pending: ``int``
+    :param max_pending: Passed on to :func:`iter_exports`.
+
+    :type catalog_name: ``str``
+    :param catalog_name: Passed on to :func:`iter_exports`.
+
+    :type algorithm: ``str``
+    :param algorithm: Passed on to :func:`iter_exports`.
+
+    :rtype: :class:`ExportStats`
+    :returns: Statistics about the batch.
+
+    """
+    start_time = perf_counter()
+    file_count = 0
+    error_count = 0
+    image_count = 0
+    byte_count = 0
+    hashes = set()
+
+    os.makedirs(directory, exist_ok=True)
+
+    results = iter_exports(
+        paths, directory, workers, threads, max_pending, catalog_name,
+        algorithm
+    )
+
+    for result in results:
+        file_count += 1
+        if "error" in result:
+            error_count += 1
+            ofile.write(json.dumps(result, sort_keys=True))
+            ofile.write("\n")
+            continue
+        # end if
+
+        path = result["path"]
+        for row in result["thumbnails"]:
+            image_count += 1
+            byte_count += row["size"]
+            hashes.add(row["hash"])
+
+            row["path"] = path
+            ofile.write(json.dumps(row, sort_keys=True))
+            ofile.write("\n")
+        # end for
+    # end for
+
+    elapsed = perf_counter() - start_time
+    if elapsed > 0:
+        image_rate = image_count / elapsed
+        byte_rate = byte_count / elapsed
+    else:
+        image_rate = 0.0
+        byte_rate = 0.0
+    # end if
+
+    return ExportStats((
+        file_count, error_count, image_count, len(hashes), byte_count,
+        elapsed, image_rate, byte_rate
+    ))
+# end def export
@@ -18,12 +18,19 @@
 """Objects to work with thumbnail cache (thumbs.db) files."""
 
 # stdlib imports
+import os
+import hashlib
 from codecs import getdecoder
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from tempfile import mkstemp
+from threading import Event, Lock
 
 # local imports
 from lf.dec import SEEK_SET
 from lf.dtypes import ActiveStructuple
 from lf.time import FILETIMETodatetime
+from lf.win.ole.ps import Payload
 
 from lf.win.shell.thumbsdb.ctypes import (
     catalog_header, catalog_entry_header, entry_header, entry_header_old
@@ -32,11 +39,156 @@ from lf.win.shell.thumbsdb.ctypes import (
 # module globals
 _utf16_le_decoder = getdecoder("utf_16_le")
 
+# The maximum number of bytes read at once when exporting a thumbnail.
+_export_chunk_size = 65536
+
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "ThumbsDb", "Thumbnail", "Catalog", "CatalogEntry"
+    "ThumbsDb", "Thumbnail", "LazyThumbnail", "Catalog", "CatalogEntry"
 ]
 
+def _read_entry_header(stream, offset):
+    """Reads the header of a thumbnail entry.
+
+    :rtype: ``tuple``
+    :returns: The size of the thumbnail data, and the offset of the data in
+              :attr:`stream`.
+
+    """
+    stream.seek(offset, SEEK_SET)
+    data = stream.read(16)
+
+    if data[12:14] != b"\xFF\xD8":  # Old style header?
+        header = entry_header_old.from_buffer_copy(data)
+        return (header.size, offset + 16)
+    # end if
+
+    header = entry_header.from_buffer_copy(data)
+    return (header.size, offset + 12)
+# end def _read_entry_header
+
+def _iter_thumbnail_chunks(thumbnail, lock, chunk_size):
+    """Reads a thumbnail in chunks.
+
+    Reads are done while holding :attr:`lock`, since the streams in a
+    compound file share a file object.
+
+    :rtype: iterator
+    :returns: An iterator of ``bytes`` objects.
+
+    """
+    stream = thumbnail.stream
+    offset = thumbnail.offset
+    end = offset + thumbnail.size
+
+    while offset < end:
+        with lock:
+            stream.seek(offset, SEEK_SET)
+            chunk = stream.read(min(end - offset, chunk_size))
+        # end with
+
+        if not chunk:
+            break
+        # end if
+
+        yield chunk
+        offset += len(chunk)
+    # end while
+# end def _iter_thumbnail_chunks
+
+def _export_thumbnail(
+    thumbnail, directory, lock, claimed, pending, chunk_size, algorithm
+):
+    """Streams a thumbnail to a file named after its hash.
+
+    The thumbnail is hashed first, so a duplicate is never written.  A new
+    image is written to a temporary file, which is then renamed, so a
+    partially written image is never seen under its final name.  If another
+    thread is writing the same image, this waits for it to finish, and
+    writes the image itself if the other thread failed.
+
+    :type claimed: ``set``
+    :param claimed: The names of the images that were written.  Only used
+                    while holding :attr:`lock`.
+
+    :type pending: ``dict``
+    :param pending: The names of the images being written, and an
+                    :class:`~threading.Event` that is set when the write is
+                    done.  Only used while holding :attr:`lock`.
+
+    :rtype: ``tuple``
+    :returns: The hex digest, the name of the file (relative to
+              :attr:`directory`), and ``True`` if the file was written.
+
+    """
+    hasher = hashlib.new(algorithm)
+    chunks = _iter_thumbnail_chunks(thumbnail, lock, chunk_size)
+
+    first = next(chunks, b"")
+    hasher.update(first)
+    for chunk in chunks:
+        hasher.update(chunk)
+    # end for
+
+    digest = hasher.hexdigest()
+    if first.startswith(b"\xFF\xD8"):
+        name = "".join([digest, ".jpg"])
+    else:
+        name = "".join([digest, ".bin"])
+    # end if
+
+    path = os.path.join(directory, name)
+    while True:
+        with lock:
+            if (name in claimed) or os.path.exists(path):
+                return (digest, name, False)
+            # end if
+
+            done = pending.get(name)
+            if done is None:
+                done = Event()
+                pending[name] = done
+                break
+            # end if
+        # end with
+
+        done.wait()
+    # end while
+
+    try:
+        (fd, temp_name) = mkstemp(suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as ofile:
+                for chunk in _iter_thumbnail_chunks(
+                    thumbnail, lock, chunk_size
+                ):
+                    ofile.write(chunk)
+                # end for
+            # end with
+
+            os.replace(temp_name, path)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            # end if
+
+            raise
+        # end try
+
+        with lock:
+            claimed.add(name)
+        # end with
+    finally:
+        with lock:
+            del pending[name]
+        # end with
+
+        done.set()
+    # end try
+
+    return (digest, name, True)
+# end def _export_thumbnail
+
 class ThumbsDb():
     """Represents a thumbs.db file.
 
@@ -46,8 +198,8 @@ class ThumbsDb():
 
     .. attribute:: thumbnails
 
-        A dictionary of :class:`Thumbnail` objects.  The keys are the numeric
-        indices.
+        A dictionary of :class:`LazyThumbnail` objects.  The keys are the
+        numeric indices.  The thumbnail data is only read when it is used.
 
     """
 
@@ -63,33 +215,106 @@ class ThumbsDb():
         :raises KeyError: If :attr:`catalog_name` is not found in :attr:`cfb`.
 
         """
-        catalog_sid = None
-        entry_map = dict()
+        name_index = cfb.name_index
         thumbnails = dict()
 
-        for (sid, entry) in cfb.dir_entries.items():
-            if entry.name == catalog_name:
-                catalog_sid = sid
-            else:
-                entry_map[entry.name] = sid
-            # end if
-        # end for
-
-        if catalog_sid is None:
+        if catalog_name not in name_index:
             raise KeyError("Catalog {0} not found".format(catalog_name))
-        # end for
+        # end if
 
-        catalog = Catalog.from_stream(cfb.get_stream(catalog_sid))
+        catalog = Catalog.from_stream(cfb.get_stream(name_index[catalog_name]))
 
         for catalog_entry in catalog.entries:
-            sid = entry_map[catalog_entry.stream_name]
-            thumbnail = Thumbnail.from_stream(cfb.get_stream(sid))
+            sid = name_index[catalog_entry.stream_name]
+            thumbnail = LazyThumbnail.from_stream(cfb.get_stream(sid))
             thumbnails[catalog_entry.id] = thumbnail
         # end for
 
         self.catalog = catalog
         self.thumbnails = thumbnails
     # end def __init__
+
+    def export(
+        self, directory, workers=0, chunk_size=_export_chunk_size,
+        algorithm="sha256"
+    ):
+        """Writes the thumbnails to a directory, once per unique image.
+
+        Each thumbnail is read (and written) in chunks, and the file is named
+        after the hash of the thumbnail (e.g. ``<sha256>.jpg``).  Identical
+        images (in this or an earlier export to :attr:`directory`) are only
+        written once.
+
+        :type directory: ``str``
+        :param directory: The (existing) directory to write the images to.
+
+        :type workers: ``int``
+        :param workers: The number of threads to export with.  If this is
+                        ``None`` the number of CPUs is used.  If this is 0,
+                        the thumbnails are exported in the current thread.
+
+        :type chunk_size: ``int``
+        :param chunk_size: The maximum number of bytes to read at once.
+
+        :type algorithm: ``str``
+        :param algorithm: The name of the hash algorithm (as accepted by
+                          :func:`hashlib.new`).
+
+        :raises ValueError: If :attr:`algorithm` is not supported by
+                            :mod:`hashlib`.
+
+        :rtype: ``list``
+        :returns: A manifest, with a dictionary for each catalog entry.  The
+                  keys are ``"id"``, ``"stream_name"``, ``"file_name"``,
+                  ``"mtime"``, ``"size"``, ``"hash"``, ``"output"`` (the name
+                  of the image in :attr:`directory`) and ``"written"``
+                  (``False`` if the image was a duplicate).
+
+        """
+        hashlib.new(algorithm)  # Fail early if the algorithm is unknown
+
+        lock = Lock()
+        claimed = set()
+        pending = dict()
+        thumbnails = self.thumbnails
+
+        def export_entry(entry):
+            (digest, name, written) = _export_thumbnail(
+                thumbnails[entry.id], directory, lock, claimed, pending,
+                chunk_size, algorithm
+            )
+
+            mtime = entry.mtime
+            if isinstance(mtime, datetime):
+                mtime = mtime.isoformat()
+            # end if
+
+            return {
+                "id": entry.id,
+                "stream_name": entry.stream_name,
+                "file_name": entry.file_name,
+                "mtime": mtime,
+                "size": thumbnails[entry.id].size,
+                "hash": digest,
+                "output": name,
+                "written": written
+            }
+        # end def export_entry
+
+        entries = self.catalog.entries
+
+        if workers == 0:
+            return [export_entry(entry) for entry in entries]
+        # end if
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        # end if
+
+        with ThreadPoolExecutor(workers) as executor:
+            return list(executor.map(export_entry, entries))
+        # end with
+    # end def export
 # end class ThumbsDb
 
 class Thumbnail(ActiveStructuple):
@@ -121,28 +346,129 @@ class Thumbnail(ActiveStructuple):
         :returns: The corresponding :class:`Thumbnail` object.
 
         """
-        if offset is not None:
-            stream.seek(offset, SEEK_SET)
-        else:
+        if offset is None:
             offset = stream.tell()
         # end if
 
-        stream.seek(offset + 12, SEEK_SET)
-        if stream.read(2) != b"\xFF\xD8":  # Old style header?
-            stream.seek(offset, SEEK_SET)
-            header = entry_header_old.from_buffer_copy(stream.read(16))
-            offset += 16
-        else:
-            stream.seek(offset, SEEK_SET)
-            header = entry_header.from_buffer_copy(stream.read(12))
-            offset += 12
+        (size, offset) = _read_entry_header(stream, offset)
+        stream.seek(offset, SEEK_SET)
+        data = stream.read(size)
+
+        return cls((size, data))
+    # end def from_stream
+# end class Thumbnail
+
+class LazyThumbnail():
+    """A lazy handle to a thumbnail in a thumbs.db file.
+
+    Only the header of the thumbnail is read when the handle is created.  The
+    thumbnail data is read each time :attr:`data` is used.
+
+    .. attribute:: size
+
+        The size of the thumbnail data (from the header).
+
+    .. attribute:: stream
+
+        The stream (:class:`~lf.dec.IStream`) that contains the thumbnail.
+
+    .. attribute:: offset
+
+        The start of the thumbnail data in :attr:`stream`.
+
+    """
+
+    __slots__ = ("size", "stream", "offset")
+
+    def __init__(self, size, stream, offset):
+        """Initializes a :class:`LazyThumbnail` object.
+
+        :type size: ``int``
+        :param size: The size of the thumbnail data.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: The stream that contains the thumbnail.
+
+        :type offset: ``int``
+        :param offset: The start of the thumbnail data in :attr:`stream`.
+
+        """
+        self.size = size
+        self.stream = stream
+        self.offset = offset
+    # end def __init__
+
+    @classmethod
+    def from_stream(cls, stream, offset=None):
+        """Creates a :class:`LazyThumbnail` object from a stream.
+
+        :type stream: :class:`~lf.dec.IStream`
+        :param stream: A stream that contains the structure.
+
+        :type offset: ``int``
+        :param offset: The start of the structure in :attr:`stream`.
+
+        :rtype: :class:`LazyThumbnail`
+        :returns: The corresponding :class:`LazyThumbnail` object.
+
+        """
+        if offset is None:
+            offset = stream.tell()
         # end if
 
-        data = stream.read(header.size)
+        (size, offset) = _read_entry_header(stream, offset)
 
-        return cls((header.size, data))
+        return cls(size, stream, offset)
     # end def from_stream
-# end class Thumbnail
+
+    @property
+    def data(self):
+        """The raw thumbnail data, as ``bytes``."""
+
+        stream = self.stream
+        stream.seek(self.offset, SEEK_SET)
+        return stream.read(self.size)
+    # end def data
+
+    @property
+    def payload(self):
+        """A :class:`~lf.win.ole.ps.Payload` over the thumbnail data.
+
+        This can hash or copy the thumbnail without reading all of it at
+        once.
+
+        """
+        return Payload(self.stream, self.offset, self.size)
+    # end def payload
+
+    def load(self):
+        """Reads the thumbnail data.
+
+        :rtype: :class:`Thumbnail`
+        :returns: The corresponding :class:`Thumbnail` object.
+
+        """
+        return Thumbnail((self.size, self.data))
+    # end def load
+
+    def __eq__(self, other):
+        if isinstance(other, (LazyThumbnail, Thumbnail)):
+            return (self.size, self.data) == (other.size, other.data)
+        # end if
+
+        return NotImplemented
+    # end def __eq__
+
+    def __hash__(self):
+        return hash((self.size, self.data))
+    # end def __hash__
+
+    def __repr__(self):
+        return "{0}(size={1!r}, offset={2!r})".format(
+            self.__class__.__name__, self.size, self.offset
+        )
+    # end def __repr__
+# end class LazyThumbnail
 
 class Catalog(ActiveStructuple):
     """ Represents the catalog of information in a thumbs.db file.
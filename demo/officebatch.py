@@ -0,0 +1,140 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tool to demonstrate some of the capabilities in LibForensics"""
+
+# stdlib imports
+import sys
+from optparse import OptionParser
+
+# local imports
+from lf.apps.msoffice.shared.batch import find_files, ingest
+
+# module constants
+VER_MAJOR = 1
+VER_MINOR = 0
+VERSION_STR = "%prog {ver_major}.{ver_minor} (c) 2010 Code Forensics".format(
+    ver_major=VER_MAJOR, ver_minor=VER_MINOR
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "main", "VER_MAJOR", "VER_MINOR"
+]
+
+def main():
+    usage = "%prog [options] path [path ...]"
+    description = "\n".join([
+        "Extracts metadata from many Microsoft Office documents as a table "
+        "(one row per file).",
+        "",
+        "Directories are walked recursively.  If path is '-', then the names "
+        "of files are read from stdin (one per line).",
+    ])
+
+    parser = OptionParser(
+        usage=usage, description=description, version=VERSION_STR
+    )
+
+    parser.add_option(
+        "-o",
+        dest="output",
+        action="store",
+        metavar="FILE",
+        help="Write the rows to FILE (default is stdout)",
+        default=None
+    )
+
+    parser.add_option(
+        "-f",
+        dest="output_format",
+        action="store",
+        choices=["csv", "jsonl"],
+        metavar="FORMAT",
+        help="Write the rows as FORMAT (csv or jsonl, default is csv)",
+        default="csv"
+    )
+
+    parser.add_option(
+        "-w",
+        dest="workers",
+        action="store",
+        type="int",
+        metavar="COUNT",
+        help="Use COUNT worker processes (default is the number of CPUs)",
+        default=None
+    )
+
+    parser.add_option(
+        "-b",
+        dest="batch_size",
+        action="store",
+        type="int",
+        metavar="SIZE",
+        help="Send SIZE files to a worker at once (default is 64)",
+        default=None
+    )
+
+    parser.add_option(
+        "-q",
+        dest="quiet",
+        action="store_true",
+        help="Don't display throughput statistics",
+        default=False
+    )
+
+    (options, args) = parser.parse_args()
+
+    if len(args) < 1:
+        parser.error("Must specify at least one path")
+    # end if
+
+    if args == ["-"]:
+        paths = (line.rstrip("\r\n") for line in sys.stdin)
+        paths = (path for path in paths if path)
+    else:
+        paths = find_files(args)
+    # end if
+
+    if options.output is None:
+        stats = ingest(
+            paths, sys.stdout, options.output_format, options.workers,
+            batch_size=options.batch_size
+        )
+    else:
+        with open(options.output, "w", encoding="utf_8", newline="") as ofile:
+            stats = ingest(
+                paths, ofile, options.output_format, options.workers,
+                batch_size=options.batch_size
+            )
+        # end with
+    # end if
+
+    if not options.quiet:
+        format_str = \
+            "{0} files ({1} errors) in {2:.3f} seconds ({3:.1f} files/s)"
+
+        print(
+            format_str.format(
+                stats.file_count, stats.error_count, stats.elapsed, stats.rate
+            ),
+            file=sys.stderr
+        )
+    # end if
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tool to demonstrate some of the capabilities in LibForensics"""
+
+# stdlib imports
+import sys
+import os
+from optparse import OptionParser
+
+# local imports
+from lf.dec import RawIStream, ByteIStream
+from lf.win.ole.cfb import CompoundFile
+
+# module constants
+VER_MAJOR = 1
+VER_MINOR = 0
+VERSION_STR = "%prog {ver_major}.{ver_minor} (c) 2010 Code Forensics".format(
+    ver_major=VER_MAJOR, ver_minor=VER_MINOR
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "main", "VER_MAJOR", "VER_MINOR"
+]
+
+def main():
+    usage = "%prog [options] olefile directory"
+    description = "\n".join([
+        "Extracts the contents of all OLE streams to a directory.",
+        "",
+        "Each stream is written to a file named after its stream identifier.",
+        "If file is '-', then stdin is read.",
+    ])
+
+    parser = OptionParser(
+        usage=usage, description=description, version=VERSION_STR
+    )
+
+    parser.add_option(
+        "-s",
+        dest="include_slack",
+        action="store_true",
+        help="Include slack space",
+        default=False
+    )
+
+    parser.add_option(
+        "-b",
+        dest="buffer_size",
+        action="store",
+        type="int",
+        metavar="SIZE",
+        help="Read at most SIZE bytes at once (default 1048576)",
+        default=1048576
+    )
+
+    parser.add_option(
+        "-q",
+        dest="quiet",
+        action="store_true",
+        help="Don't display throughput statistics",
+        default=False
+    )
+
+    (options, args) = parser.parse_args()
+
+    if len(args) < 2:
+        parser.error("Must specify both olefile and directory")
+    # end if
+
+    if not os.path.isdir(args[1]):
+        print("Can't find directory {0}".format(args[1]), file=sys.stderr)
+        sys.exit(-2)
+    # end if
+
+    if args[0] == "-":
+        cfb = CompoundFile(ByteIStream(sys.stdin.buffer.read()))
+    else:
+        cfb = CompoundFile(RawIStream(args[0]))
+    # end if
+
+    stats = cfb.extract_all(
+        args[1], options.include_slack, buffer_size=options.buffer_size
+    )
+
+    if not options.quiet:
+        print(
+            "{0} streams, {1} bytes in {2:.3f} seconds ({3:.2f} MB/s)".format(
+                stats.stream_count, stats.byte_count, stats.elapsed,
+                stats.rate
+            ),
+            file=sys.stderr
+        )
+    # end if
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Tool to demonstrate some of the capabilities in lf.win.shell.thumbsdb"""
+
+# stdlib imports
+import sys
+from optparse import OptionParser
+
+# local imports
+from lf.win.shell.thumbsdb.batch import find_files, export
+
+# module constants
+VER_MAJOR = 1
+VER_MINOR = 0
+VERSION_STR = "%prog {ver_major}.{ver_minor} (c) 2010 Code Forensics".format(
+    ver_major=VER_MAJOR, ver_minor=VER_MINOR
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "main", "VER_MAJOR", "VER_MINOR"
+]
+
+def main():
+    usage = "%prog [options] directory path [path ...]"
+    description = "\n".join([
+        "Exports the thumbnails from many thumbs.db files into a directory.",
+        "",
+        "Each unique image is written once, named after its hash.  A "
+        "manifest mapping catalog entries to images is written as JSON "
+        "lines.  Paths that are directories are walked recursively.  If "
+        "path is '-', then the names of files are read from stdin (one per "
+        "line).",
+    ])
+
+    parser = OptionParser(
+        usage=usage, description=description, version=VERSION_STR
+    )
+
+    parser.add_option(
+        "-o",
+        dest="output",
+        action="store",
+        metavar="FILE",
+        help="Write the manifest to FILE (default is stdout)",
+        default=None
+    )
+
+    parser.add_option(
+        "-w",
+        dest="workers",
+        action="store",
+        type="int",
+        metavar="COUNT",
+        help="Use COUNT worker processes (default is the number of CPUs)",
+        default=None
+    )
+
+    parser.add_option(
+        "-t",
+        dest="threads",
+        action="store",
+        type="int",
+        metavar="COUNT",
+        help="Use COUNT threads per thumbs.db file (default %default)",
+        default=0
+    )
+
+    parser.add_option(
+        "-c",
+        dest="catalog_name",
+        action="store",
+        help="The name of the catalog stream (def: %default)",
+        default="Catalog"
+    )
+
+    parser.add_option(
+        "-a",
+        dest="algorithm",
+        action="store",
+        help="The hash algorithm used to name images (def: %default)",
+        default="sha256"
+    )
+
+    parser.add_option(
+        "-q",
+        dest="quiet",
+        action="store_true",
+        help="Don't display throughput statistics",
+        default=False
+    )
+
+    (options, args) = parser.parse_args()
+
+    if len(args) < 2:
+        parser.error("Must specify a directory and at least one path")
+    # end if
+
+    directory = args[0]
+    if args[1:] == ["-"]:
+        paths = (line.rstrip("\r\n") for line in sys.stdin)
+        paths = (path for path in paths if path)
+    else:
+        paths = find_files(args[1:])
+    # end if
+
+    export_args = (
+        options.workers, options.threads, None, options.catalog_name,
+        options.algorithm
+    )
+
+    if options.output is None:
+        stats = export(paths, directory, sys.stdout, *export_args)
+    else:
+        with open(options.output, "w", encoding="utf_8") as ofile:
+            stats = export(paths, directory, ofile, *export_args)
+        # end with
+    # end if
+
+    if not options.quiet:
+        format_str = "".join([
+            "{0} files ({1} errors), {2} images ({3} unique) in {4:.3f} ",
+            "seconds ({5:.1f} images/s, {6:.2f} MB/s)"
+        ])
+
+        print(
+            format_str.format(
+                stats.file_count, stats.error_count, stats.image_count,
+                stats.unique_count, stats.elapsed, stats.image_rate,
+                stats.byte_rate / 1000000
+            ),
+            file=sys.stderr
+        )
+    # end if
+# end def main
+
+if __name__ == "__main__":
+    main()
+# end if
@@ -20,20 +20,25 @@ import tests
 
 names = [
     "dec.base", "dec.byte", "dec.raw", "dec.subset", "dec.composite",
-    "dec.splitraw",
+    "dec.splitraw", "dec.mapped",
 
     "dtypes.basic", "dtypes.native", "dtypes.bits", "dtypes.composite",
-    "dtypes.dal", "dtypes.reader",
+    "dtypes.dal", "dtypes.reader", "dtypes.ctypes",
 
-    "win.objects", "win.con.objects", "time", "utils.time",
+    "win.objects", "win.con.objects", "win.codepage.codepage", "time",
+    "utils.time", "utils.batch",
 
-    "win.ole.cfb.objects", "win.ole.ps.objects", "win.ole.ps.metadata",
+    "win.ole.cfb.objects", "win.ole.cfb.batch", "win.ole.ps.objects",
+    "win.ole.ps.metadata",
 
-    "win.shell.objects", "win.shell.link.objects",
+    "win.shell.objects", "win.shell.link.objects", "win.shell.link.carver",
 
-    "win.shell.recyclebin.objects", "win.shell.thumbsdb.objects",
+    "win.shell.recyclebin.objects", "win.shell.recyclebin.batch",
+    "win.shell.thumbsdb.objects", "win.shell.thumbsdb.batch",
+    "win.shell.jumplist.objects", "win.shell.thumbcache.objects",
 
-    "apps.msoffice.shared.objects", "apps.msoffice.shared.metadata"
+    "apps.msoffice.shared.objects", "apps.msoffice.shared.metadata",
+    "apps.msoffice.shared.batch"
 ]
 
 for index in range(len(names)):
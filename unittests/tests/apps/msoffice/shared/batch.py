@@ -0,0 +1,156 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.apps.msoffice.shared.batch module."""
+
+# stdlib imports
+import csv
+import json
+from io import StringIO
+from os.path import join
+from unittest import TestCase
+
+# local imports
+from lf.dec import RawIStream
+from lf.win.ole.cfb import CompoundFile
+from lf.apps.msoffice.shared import (
+    Builder, SummaryInfo, DocSummaryInfo, UserDefinedProperties
+)
+from lf.apps.msoffice.shared.batch import COLUMNS, extract, iter_rows, ingest
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "BatchTestCase"
+]
+
+class BatchTestCase(TestCase):
+    def setUp(self):
+        self.blair_doc_path = join("data", "doc", "blair.doc")
+        self.thumbs_db_path = join("data", "thumbsdb", "thumbs.db")
+        self.txt_path = join("data", "txt", "alpha.txt")
+    # end def setUp
+
+    def test_columns(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        ae(COLUMNS[:2], ("path", "error"))
+        at("si_title" in COLUMNS)
+        at("dsi_heading_pair" in COLUMNS)
+        at("udp_guid" in COLUMNS)
+        at("si_thumbnail" not in COLUMNS)
+        at("dsi_dig_sig" not in COLUMNS)
+        at("dsi_hlinks" not in COLUMNS)
+        at("udp_hlinks" in COLUMNS)
+        ae(len(COLUMNS), len(set(COLUMNS)))
+    # end def test_columns
+
+    def test_extract(self):
+        ae = self.assertEqual
+        ai = self.assertIsNone
+        at = self.assertTrue
+
+        cfb = CompoundFile(RawIStream(self.blair_doc_path))
+        dsi_stream = Builder.build(cfb.get_stream(4))
+        si = SummaryInfo.from_properties(
+            Builder.build(cfb.get_stream(3)).property_set_0.properties
+        )
+        dsi = DocSummaryInfo.from_properties(
+            dsi_stream.property_set_0.properties
+        )
+        udp = UserDefinedProperties.from_properties(
+            dsi_stream.property_set_1.properties
+        )
+
+        row = extract(self.blair_doc_path)
+        ae(sorted(row.keys()), sorted(COLUMNS))
+        ae(row["path"], self.blair_doc_path)
+        ai(row["error"])
+        ae(row["si_title"], si.title)
+        ae(row["si_author"], "default")
+        ae(row["si_mtime"], si.mtime.isoformat())
+        ae(row["si_attr_exists"], sorted(si.attr_exists))
+        ae(row["dsi_heading_pair"], [["Title", 1]])
+        ae(row["dsi_doc_parts"], dsi.doc_parts)
+        ae(row["dsi_ver_major"], 8)
+        ae(row["udp_guid"], str(udp.guid))
+        ae(row["udp_dictionary"], {"2": "_PID_GUID"})
+
+        # Make sure the row is JSON serializable
+        ae(json.loads(json.dumps(row)), row)
+
+        # A compound file without any property set streams
+        row = extract(self.thumbs_db_path)
+        ai(row["error"])
+        ai(row["si_title"])
+        ai(row["dsi_code_page"])
+
+        row = extract(self.txt_path)
+        ae(row["path"], self.txt_path)
+        ae(sorted(row.keys()), sorted(COLUMNS))
+        ai(row["si_title"])
+        at(row["error"])
+
+        row = extract(join("data", "does_not_exist"))
+        at(row["error"])
+    # end def test_extract
+
+    def test_iter_rows(self):
+        ae = self.assertEqual
+
+        paths = [self.blair_doc_path, self.txt_path, self.thumbs_db_path] * 2
+        expected = [extract(path) for path in paths]
+
+        ae(list(iter_rows(paths, workers=0)), expected)
+        ae(list(iter_rows(paths, 2, 1, 2)), expected)
+    # end def test_iter_rows
+
+    def test_ingest(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        paths = [self.blair_doc_path, self.txt_path, self.thumbs_db_path]
+
+        ofile = StringIO()
+        stats = ingest(paths, ofile, workers=0)
+        ae(stats.file_count, 3)
+        ae(stats.error_count, 1)
+
+        lines = ofile.getvalue().splitlines()
+        ae([json.loads(line)["path"] for line in lines], paths)
+        ae(json.loads(lines[0]), extract(self.blair_doc_path))
+
+        ofile = StringIO(newline="")
+        stats = ingest(paths, ofile, "csv", workers=0)
+        ae(stats.file_count, 3)
+        ae(stats.error_count, 1)
+
+        ofile.seek(0)
+        rows = list(csv.reader(ofile))
+        ae(len(rows), 4)
+        ae(tuple(rows[0]), COLUMNS)
+        ae([row[0] for row in rows[1:]], paths)
+
+        row = dict(zip(COLUMNS, rows[1]))
+        ae(row["error"], "")
+        ae(row["si_author"], "default")
+        ae(row["si_page_count"], "1")
+        ae(json.loads(row["dsi_heading_pair"]), [["Title", 1]])
+
+        ar(ValueError, ingest, paths, StringIO(), "xml", 0)
+    # end def test_ingest
+# end class BatchTestCase
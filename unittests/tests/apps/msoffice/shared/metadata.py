@@ -19,6 +19,7 @@
 
 # stdlib imports
 import codecs
+from datetime import datetime
 from os.path import join
 from itertools import chain
 from uuid import UUID
@@ -43,11 +44,12 @@ from lf.apps.msoffice.shared import (
 
     SummaryInfo, DocSummaryInfo, UserDefinedProperties
 )
+from lf.apps.msoffice.shared.consts import PIDSI, PIDDSI
 
 __docformat__ = "restructuredtext en"
 __all__ = [
     "SummaryInfoTestCase", "DocSummaryInfoTestCase",
-    "UserDefinedPropertiesTestCase"
+    "UserDefinedPropertiesTestCase", "SelectivePropertiesTestCase"
 ]
 
 class CommonSetup():
@@ -493,3 +495,58 @@ class UserDefinedPropertiesTestCase(CommonSetup, TestCase):
         ae(metadata, control_metadata)
     # end def test_from_properties
 # end class UserDefinedPropertiesTestCase
+
+class SelectivePropertiesTestCase(TestCase):
+    def test_from_properties(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        blair_path = join("data", "doc", "blair.doc")
+        blair_cfb = CompoundFile(RawIStream(blair_path))
+
+        for (sid, cls) in ((3, SummaryInfo), (4, DocSummaryInfo)):
+            stream = blair_cfb.get_stream(sid)
+
+            pss = Builder.build(stream, 0)
+            control = cls.from_properties(pss.property_set_0.properties)
+
+            pss = Builder.build(stream, 0, pids=cls.pids)
+            properties = pss.property_set_0.properties
+            at(set(properties).issubset(cls.pids))
+            ae(cls.from_properties(properties), control)
+
+            pss = Builder.build(stream, 0, lazy=True)
+            properties = pss.property_set_0.properties
+            ae(cls.from_properties(properties), control)
+            at(set(properties._properties).issubset(cls.pids))
+        # end for
+
+        stream = blair_cfb.get_stream(3)
+        pss = Builder.build(stream, 0, pids=[PIDSI.AUTHOR, PIDSI.SAVE_TIME])
+        metadata = SummaryInfo.from_properties(pss.property_set_0.properties)
+
+        ae(metadata.author, "default")
+        ae(metadata.mtime, datetime(2003, 2, 3, 11, 18))
+        ae(metadata.title, None)
+        ae(metadata.attr_exists, set(["author", "mtime"]))
+    # end def test_from_properties
+
+    def test_metadata_pids(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+        af = self.assertFalse
+
+        at(SummaryInfo.metadata_pids < SummaryInfo.pids)
+        af(PIDSI.THUMBNAIL in SummaryInfo.metadata_pids)
+        ae(SummaryInfo.pids - SummaryInfo.metadata_pids, {PIDSI.THUMBNAIL})
+
+        at(DocSummaryInfo.metadata_pids < DocSummaryInfo.pids)
+        ae(
+            DocSummaryInfo.pids - DocSummaryInfo.metadata_pids,
+            {PIDDSI.DIGSIG, PIDDSI.HLINKS}
+        )
+        at(PIDDSI.VERSION in DocSummaryInfo.metadata_pids)
+
+        ae(UserDefinedProperties.metadata_pids, None)
+    # end def test_metadata_pids
+# end class SelectivePropertiesTestCase
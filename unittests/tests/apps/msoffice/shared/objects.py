@@ -33,7 +33,7 @@ from lf.win.ole.ps.consts import (
 )
 from lf.win.ole.ps import (
     VT_I2, VT_FILETIME, VT_I4, VT_BOOL, VT_VECTOR, CodePageString, VT_EMPTY,
-    Dictionary, VT_BLOB, VT_CF, VT_LPSTR, VT_R8
+    Dictionary, VT_BLOB, VT_CF, VT_LPSTR, VT_R8, Payload
 )
 from lf.apps.msoffice.shared.ctypes import (
     property_set_system_identifier
@@ -114,6 +114,41 @@ class VtThumbnailValueTestCase(TestCase):
             ae(vttv.format, vttv.tag)
         # end for
     # end def test_from_stream
+
+    def test_lazy(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        data = bytearray()
+        data.extend(b"\x0D\x00\x00\x00")  # cb
+        data.extend(b"\x01\x02\x03\x04")  # cftag
+        data.extend(b"\x05\x06\x07\x08")  # formatId (exists)
+        data.extend(b"\x09\x0A\x0B\x0C\x0D")  # cfDataBytes
+
+        for tag in (b"\x01\x02\x03\x04", b"\x00\x00\x00\x00"):
+            data[4:8] = tag
+            stream = ByteIStream(data)
+
+            control = VtThumbnailValue.from_stream(stream, 0)
+            vttv0 = VtThumbnailValue.from_stream(stream, 0, lazy=True)
+            vttv1 = VtThumbnailValue.from_buffer(bytes(data), 0, lazy=True)
+
+            for vttv in (vttv0, vttv1):
+                at(isinstance(vttv.data, Payload))
+                ae(vttv, control)
+                ae(vttv.data.size, len(control.data))
+            # end for
+
+            vt_data = b"\x47\x00\x00\x00" + data  # wType (VT_CF), padding
+            vtt0 = VtThumbnail.from_stream(ByteIStream(vt_data), 0, lazy=True)
+            vtt1 = VtThumbnail.from_buffer(vt_data, 0, lazy=True)
+
+            for vtt in (vtt0, vtt1):
+                at(isinstance(vtt.value.data, Payload))
+                ae(vtt.value, control)
+            # end for
+        # end for
+    # end def test_lazy
 # end class VtThumbnailValueTestCase
 
 class VtThumbnailTestCase(TestCase):
@@ -369,6 +404,47 @@ class VtVecLpwstrValueTestCase(TestCase):
             ae(vtvlv.value, ["ab", "abc", "a"])
         # end for
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+
+        data = bytearray()
+        data.extend(b"\x03\x00\x00\x00")  # count
+
+        data.extend(b"\x02\x00\x00\x00")  # lpwstr 0 - character count
+        data.extend(b"a\x00b\x00")  # lpwstr 0 - value
+
+        data.extend(b"\x03\x00\x00\x00")  # lpwstr 1 - character count
+        data.extend(b"a\x00b\x00c\x00")  # lpwstr 1 - value
+        data.extend(b"\x64\x53")  # lpwstr 1 - pad
+
+        data.extend(b"\x01\x00\x00\x00")  # lpwstr 2 - character count
+        data.extend(b"a\x00")  # lpwstr 2 - value
+        data.extend(b"\x64\x53")  # lpwstr 2 - pad
+
+        vtvlv = VtVecLpwstrValue.from_buffer(data)
+        ae(vtvlv.size, 32)
+        ae(vtvlv.scalar_count, 3)
+        ae(vtvlv.value, ["ab", "abc", "a"])
+
+        vtvlv = VtVecLpwstrValue.from_buffer(b"\xFF" + data, 1, False)
+        ae(vtvlv.size, 32)
+        ae(vtvlv.value, [b"a\x00b\x00", b"a\x00b\x00c\x00", b"a\x00"])
+
+        # A large vector, with a lone surrogate and a truncated string.
+        data = bytearray(b"\xEA\x03\x00\x00")
+        data.extend(b"\x02\x00\x00\x00a\x00b\x00" * 1000)
+        data.extend(b"\x02\x00\x00\x00\x00\xDCc\x00")
+        data.extend(b"\x02\x00\x00\x00d\x00")
+        data = memoryview(bytes(data))
+
+        vtvlv = VtVecLpwstrValue.from_buffer(data)
+        ae(vtvlv, VtVecLpwstrValue.from_stream(ByteIStream(data)))
+        ae(vtvlv.size, 8020)
+        ae(vtvlv.scalar_count, 1002)
+        ae(len(vtvlv.value), 1002)
+        ae(vtvlv.value[-3:], ["ab", "c", "d"])
+    # end def test_from_buffer
 # end class VtVecLpwstrValueTestCase
 
 class VtVecLpwstrTestCase(TestCase):
@@ -838,6 +914,67 @@ class VtVecHeadingPairValueTestCase(TestCase):
         ae(vtvhpv.value[1].heading_str, heading_str1)
         ae(vtvhpv.value[1].header_parts, header_parts)
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+        decoder = codecs.getdecoder("cp1252")
+
+        data = bytearray()
+        data.extend(b"\x07\x00\x00\x00")  # count
+
+        # VT_LPSTR heading
+        data.extend(b"\x1E\x00\x64\x53")  # VT_LPSTR, pad
+        data.extend(b"\x03\x00\x00\x00")  # size
+        data.extend(b"a\x00b")  # value
+        data.extend(b"\x03\x00\x64\x53\x04\x03\x02\x01")  # VT_I4
+
+        # VT_LPWSTR heading
+        data.extend(b"\x1F\x00\x64\x53")  # VT_LPWSTR, pad
+        data.extend(b"\x03\x00\x00\x00")  # char count
+        data.extend(b"a\x00b\x00c\x00")  # value
+        data.extend(b"\x00\x00")  # pad
+        data.extend(b"\x03\x00\x64\x53\x04\x03\x02\x01")
+
+        # Heading of some other type
+        data.extend(b"\x01\x00\x64\x53")  # VT_NULL, pad
+        data.extend(b"\x03\x00\x64\x53\x04\x03\x02\x01")
+
+        # Truncated heading
+        data.extend(b"\x1E\x00\x64\x53\x03\x00\x00\x00ab")
+
+        header_parts = VT_I4((3, 8, 0x01020304))
+        heading_strs = [
+            VtUnalignedString((0x1E, 0xB, "a")),
+            VtUnalignedString((0x1F, 0x10, "a\x00b\x00c\x00")),
+            VtUnalignedString((0x01, 4, None))
+        ]
+
+        for offset in (0, 1):
+            buf = memoryview(bytes(b"\xFF" * offset + data))
+            vtvhpv = VtVecHeadingPairValue.from_buffer(buf, offset, decoder)
+            stream = ByteIStream(buf)
+            stream_vtvhpv = \
+                VtVecHeadingPairValue.from_stream(stream, offset, decoder)
+
+            ae(vtvhpv, stream_vtvhpv)
+            ae(vtvhpv.size, 59)
+            ae(vtvhpv.scalar_count, 7)
+            ae(len(vtvhpv.value), 3)
+            ae([pair.size for pair in vtvhpv.value], [19, 24, 12])
+            ae([pair.heading_str for pair in vtvhpv.value], heading_strs)
+            for pair in vtvhpv.value:
+                ae(pair.header_parts, header_parts)
+            # end for
+        # end for
+
+        vtvhpv = VtVecHeadingPairValue.from_buffer(data)
+        heading_strs = [
+            VtUnalignedString((0x1E, 0xB, b"a\x00b")),
+            VtUnalignedString((0x1F, 0x10, "abc"))
+        ]
+        ae(vtvhpv.value[0].heading_str, heading_strs[0])
+        ae(vtvhpv.value[1].heading_str, heading_strs[1])
+    # end def test_from_buffer
 # end class VtVecHeadingPairValueTestCase
 
 class VtVecHeadingPairTestCase(TestCase):
@@ -1190,6 +1327,33 @@ class VecVtHyperlinkTestCase(TestCase):
         ae(vvth.hyperlinks[0], vth)
         ae(vvth.value, vvth.hyperlinks)
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+
+        data = bytearray(b"\xFF\xFF")  # padding
+        data.extend(b"\x0C\x00\x00\x00")  # count
+
+        for counter in range(2):
+            data.extend(b"\x03\x00\x64\x53\x01\x02\x03\x04")  # VT_I4
+            data.extend(b"\x03\x00\x64\x53\x05\x06\x07\x08")  # VT_I4
+            data.extend(b"\x03\x00\x64\x53\x09\x0A\x0B\x0C")  # VT_I4
+            data.extend(b"\x03\x00\x64\x53\x0D\x0E\x0F\x00")  # VT_I4
+            data.extend(b"\x1F\x00\x64\x53\x02\x00\x00\x00a\x00b\x00")
+            data.extend(b"\x1F\x00\x64\x53\x02\x00\x00\x00c\x00d\x00")
+        # end for
+        data.extend(b"\xEE" * 8)  # trailing data
+
+        vvth = VecVtHyperlink.from_buffer(bytes(data), 2)
+
+        ae(vvth.size, 116)
+        ae(vvth.scalar_count, 12)
+        ae(len(vvth.hyperlinks), 2)
+        ae(vvth.hyperlinks[0], vvth.hyperlinks[1])
+        ae(vvth.hyperlinks[1].hlink1, VtString((0x1F, 12, "ab")))
+        ae(vvth.hyperlinks[1].hlink2, VtString((0x1F, 12, "cd")))
+        ae(vvth, VecVtHyperlink.from_stream(ByteIStream(data[2:])))
+    # end def test_from_buffer
 # end class VecVtHyperlinkTestCase
 
 class VtHyperlinkValueTestCase(TestCase):
@@ -1506,6 +1670,64 @@ class PropertyFactoryTestCase(TestCase):
         ae(vts.size, 16)
         ae(vts.value, "a\x00b")
     # end def test_make
+
+    def test_make_from_buffer(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+        make_from_buffer = PropertyFactory.make_from_buffer
+        decoder = codecs.getdecoder("cp1252")
+
+        data = b"\x1E\x00\x00\x00\x05\x00\x00\x00abc\x00d\x00\x00\x00"
+        vts = make_from_buffer(data, 0, decoder)
+        at(isinstance(vts, VtString))
+        ae(vts, VtString((0x1E, 16, "abc")))
+
+        data = b"\x1F\x00\x00\x00\x02\x00\x00\x00a\x00\x00\x00"
+        vts = make_from_buffer(data)
+        at(isinstance(vts, VtString))
+        ae(vts, VtString((0x1F, 12, "a\x00")))
+
+        # Thumbnails are only VtThumbnail objects in the SummaryInformation
+        # property set.
+        data = b"\x47\x00\x00\x00\x0C\x00\x00\x00\xFF\xFF\xFF\xFF"
+        data = b"".join([data, b"\x03\x00\x00\x00abcd"])
+
+        vtt = make_from_buffer(data, 0, None, FMTID_SummaryInformation, 0x11)
+        at(isinstance(vtt, VtThumbnail))
+        ae(vtt.value.tag, 0xFFFFFFFF)
+        ae(vtt.value.format_id, 3)
+        ae(vtt.value.data, b"abcd")
+
+        vtt = make_from_buffer(data, 0, None, FMTID_DocSummaryInformation, 0x11)
+        at(isinstance(vtt, VT_CF))
+        at(not isinstance(vtt, VtThumbnail))
+
+        # DOCPARTS and HEADINGPAIR properties
+        data = bytearray(b"\x1E\x10\x00\x00\x02\x00\x00\x00")
+        data.extend(b"\x02\x00\x00\x00a\x00\x03\x00\x00\x00bc\x00")
+        data = bytes(data)
+
+        vvul = make_from_buffer(
+            data, 0, decoder, FMTID_DocSummaryInformation, 0xD
+        )
+        at(isinstance(vvul, VtVecUnalignedLpstr))
+        ae(vvul.value.value[0].value, "a")
+        ae(vvul.value.value[1].value, "bc")
+        ae(vvul, VtVecUnalignedLpstr.from_stream(ByteIStream(data), 0, decoder))
+
+        data = bytearray(b"\x0C\x10\x00\x00\x02\x00\x00\x00")
+        data.extend(b"\x1E\x00\x00\x00\x02\x00\x00\x00a\x00")
+        data.extend(b"\x03\x00\x00\x00\x01\x00\x00\x00")
+        data = bytes(data)
+
+        vvhp = make_from_buffer(
+            data, 0, decoder, FMTID_DocSummaryInformation, 0xC
+        )
+        at(isinstance(vvhp, VtVecHeadingPair))
+        ae(vvhp, VtVecHeadingPair.from_stream(ByteIStream(data), 0, decoder))
+        ae(vvhp.value.value[0].heading_str.value, "a")
+        ae(vvhp.value.value[0].header_parts.value, 1)
+    # end def test_make_from_buffer
 # end class PropertyFactoryTestCase
 
 class BuilderTestCase(TestCase):
@@ -16,5 +16,5 @@
 # along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
 
 __all__ = [
-    "base", "byte", "raw", "subset", "composite", "splitraw"
+    "base", "byte", "raw", "subset", "composite", "splitraw", "mapped"
 ]
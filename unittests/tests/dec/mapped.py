@@ -0,0 +1,156 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.dec.mapped module."""
+
+# stdlib imports
+import os.path
+from unittest import TestCase
+
+# local imports
+from lf.dec.consts import SEEK_SET, SEEK_CUR, SEEK_END
+from lf.dec.base import StreamInfo
+from lf.dec.mapped import Mapped, MappedIStream
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "MappedTestCase", "MappedIStreamTestCase"
+]
+
+class MappedTestCase(TestCase):
+    def setUp(self):
+        name = os.path.join("data", "txt", "alpha.txt")
+        self.mapped = Mapped(name)
+    # end def setUp
+
+    def tearDown(self):
+        self.mapped.stream.close()
+    # end def tearDown
+
+    def test_list(self):
+        ae = self.assertEqual
+        ae(self.mapped.list(), [StreamInfo(0)])
+    # end def test_list
+
+    def test_open(self):
+        ae = self.assertEqual
+        ae(self.mapped.open(), self.mapped.stream)
+    # end def test_open
+# end class MappedTestCase
+
+class MappedIStreamTestCase(TestCase):
+    def setUp(self):
+        name = os.path.join("data", "txt", "alpha.txt")
+        self.mis = MappedIStream(name)
+    # end def setUp
+
+    def tearDown(self):
+        self.mis.close()
+    # end def tearDown
+
+    def test__init__(self):
+        ae = self.assertEqual
+
+        ae(self.mis.size, 26)
+        ae(self.mis.buffer[:3], b"abc")
+        ae(self.mis.name, os.path.join("data", "txt", "alpha.txt"))
+    # end def test__init__
+
+    def test_seek(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+        mis = self.mis
+
+        ae(mis.seek(10, SEEK_SET), 10)
+        ae(mis.tell(), 10)
+        ar(ValueError, mis.seek, -10, SEEK_SET)
+
+        mis.seek(3, SEEK_SET)
+        ae(mis.seek(5, SEEK_CUR), 8)
+        ae(mis.seek(-2, SEEK_CUR), 6)
+        ae(mis.seek(-3, SEEK_END), 23)
+        ae(mis.seek(3, SEEK_END), 29)
+    # end def test_seek
+
+    def test_read(self):
+        ae = self.assertEqual
+        mis = self.mis
+
+        mis.seek(0, SEEK_SET)
+        ae(mis.read(0), b"")
+        ae(mis.read(1), b"a")
+        ae(mis.read(2), b"bc")
+        ae(mis.read(), b"defghijklmnopqrstuvwxyz")
+
+        mis.seek(-3, SEEK_END)
+        ae(mis.read(5), b"xyz")
+
+        mis.seek(30, SEEK_SET)
+        ae(mis.read(), b"")
+    # end def test_read
+
+    def test_readall(self):
+        ae = self.assertEqual
+        mis = self.mis
+
+        mis.seek(0, SEEK_SET)
+        ae(mis.readall(), b"abcdefghijklmnopqrstuvwxyz")
+        mis.seek(3, SEEK_SET)
+        ae(mis.readall(), b"defghijklmnopqrstuvwxyz")
+    # end def test_readall
+
+    def test_readinto(self):
+        ae = self.assertEqual
+        mis = self.mis
+
+        barray0 = bytearray(5)
+        barray1 = bytearray(10)
+        barray2 = bytearray(26)
+        barray3 = bytearray(1)
+
+        mis.seek(-12, SEEK_END)
+        retval0 = mis.readinto(barray0)
+        retval1 = mis.readinto(barray1)
+
+        mis.seek(0, SEEK_SET)
+        retval2 = mis.readinto(barray2)
+
+        mis.seek(30, SEEK_SET)
+        retval3 = mis.readinto(barray3)
+
+        ae(retval0, 5)
+        ae(retval1, 7)
+        ae(retval2, 26)
+        ae(retval3, 0)
+
+        ae(barray0, b"opqrs")
+        ae(barray1, b"tuvwxyz\x00\x00\x00")
+        ae(barray2, b"abcdefghijklmnopqrstuvwxyz")
+        ae(barray3, b"\x00")
+    # end def test_readinto
+
+    def test_close(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+        mis = self.mis
+
+        mis.close()
+        ae(mis.closed, True)
+        ar(ValueError, mis.read, 1)
+        ar(ValueError, mis.readinto, bytearray(1))
+    # end def test_close
+# end class MappedIStreamTestCase
@@ -0,0 +1,55 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.dtypes.ctypes module."""
+
+# stdlib imports
+from struct import calcsize
+from unittest import TestCase
+
+# local imports
+from lf.dtypes import raw, uint8, uint16, uint32, uint64, LERecord
+from lf.dtypes.ctypes import struct_format
+from lf.win.dtypes import FILETIME_LE
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "StructFormatTestCase"
+]
+
+class StructFormatTestCase(TestCase):
+    def test_struct_format(self):
+        ae = self.assertEqual
+
+        class Header(LERecord):
+            version = uint64
+            file_size = uint64
+            dtime = FILETIME_LE
+        # end class Header
+
+        class Entry(LERecord):
+            sig = raw(4)
+            flags = uint8
+            size = uint16
+            offset = uint32
+        # end class Entry
+
+        ae(struct_format(Header._ctype_), "<QQQ")
+        ae(struct_format(Entry._ctype_), "<4xBHI")
+        ae(calcsize(struct_format(Entry._ctype_)), Entry._size_)
+    # end def test_struct_format
+# end class StructFormatTestCase
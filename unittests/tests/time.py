@@ -19,7 +19,10 @@
 
 # stdlib imports
 from unittest import TestCase, main
-from datetime import datetime, timedelta
+from datetime import datetime, date, time, timedelta
+from array import array
+from random import Random
+from calendar import isleap
 
 # local imports
 from lf.dec import ByteIStream
@@ -28,7 +31,9 @@ from lf.win.ctypes import filetime_le
 from lf.time import (
     FILETIMEToPOSIXTime, FILETIMEToUnixTime, POSIXTimeToFILETIME,
     UnixTimeToFILETIME, POSIXTimeTodatetime, UnixTimeTodatetime,
-    FILETIMETodatetime, DOSDateTimeTodatetime, VariantTimeTodatetime
+    FILETIMETodatetime, DOSDateTimeTodatetime, VariantTimeTodatetime,
+    TICKS_PER_SEC, TICKS_PER_MSEC, SECS_PER_DAY, SECS_PER_HOUR, SECS_PER_MIN,
+    EPOCH_YEAR, DAYS_PER_NORMAL_YEAR, DAYS_PER_LEAP_YEAR
 )
 
 __docformat__ = "restructuredtext en"
@@ -40,6 +45,95 @@ __all__ = [
     "VariantTimeTodatetimeTestCase"
 ]
 
+_year_lengths = [DAYS_PER_NORMAL_YEAR, DAYS_PER_LEAP_YEAR]
+_month_lengths = [
+    [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31],
+    [31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
+]
+
+def _rtl_time_to_datetime(timestamp):
+    """Converts a FILETIME timestamp field by field.
+
+    This is a port of ReactOS's ``FileTimeToSystemTime``, and is the
+    reference that :meth:`FILETIMETodatetime.from_int` is checked against.
+
+    :type timestamp: ``int``
+    :param timestamp: The timestamp as a 64 bit integer.
+
+    :raises ValueError: If :attr:`timestamp` is an invalid value.
+
+    :rtype: ``datetime``
+    :returns: The corresponding ``datetime`` object.
+
+    """
+    if timestamp & 0x8000000000000000:
+        raise ValueError("invalid timestamp {0}".format(timestamp))
+    # end if
+
+    # RtlTimeToFileFields
+    milli_secs =  0xFFFF & ((timestamp % TICKS_PER_SEC) // TICKS_PER_MSEC)
+    timestamp = timestamp // TICKS_PER_SEC
+
+    days = timestamp // SECS_PER_DAY
+    seconds_in_day = timestamp % SECS_PER_DAY
+
+    while seconds_in_day < 0:
+        seconds_in_day += SECS_PER_DAY
+        days -= 1
+    # end while
+
+    while seconds_in_day >= SECS_PER_DAY:
+        seconds_in_day -= SECS_PER_DAY
+        days += 1
+    # end while
+
+    hours = 0xFFFF & (seconds_in_day // SECS_PER_HOUR)
+    seconds_in_day = seconds_in_day % SECS_PER_HOUR
+    mins = 0xFFFF & (seconds_in_day // SECS_PER_MIN)
+    secs = 0xFF & (seconds_in_day % SECS_PER_MIN)
+
+    year = EPOCH_YEAR
+    year += days // DAYS_PER_LEAP_YEAR
+
+    year_temp = year - 1
+    days_since_epoch = (
+        (year_temp * DAYS_PER_NORMAL_YEAR) + (year_temp // 4) -
+        (year_temp // 100) + (year_temp // 400)
+    )
+
+    epoch_temp = EPOCH_YEAR - 1
+    days_since_epoch -= (
+        (epoch_temp * DAYS_PER_NORMAL_YEAR) + (epoch_temp // 4) -
+        (epoch_temp // 100) + (epoch_temp // 400)
+    )
+
+    days -= days_since_epoch
+    while 1:
+        leap_year = isleap(year)
+        if days < _year_lengths[leap_year]:
+            break
+        # end if
+
+        year += 1
+        days -= _year_lengths[leap_year]
+    # end while
+
+    leap_year = isleap(year)
+    months = _month_lengths[leap_year]
+    month = 0
+    while days >= months[month]:
+        days -= months[month]
+        month += 1
+    # end while
+
+    month += 1
+    days += 1
+
+    return datetime(
+        year, month, days, hours, mins, secs, milli_secs * 1000
+    )
+# end def _rtl_time_to_datetime
+
 class FILETIMEToPOSIXTimeTestCase(TestCase):
     def test_from_int(self):
         ae = self.assertEqual
@@ -144,7 +238,69 @@ class FILETIMETodatetimeTestCase(TestCase):
         filetime = FILETIMETodatetime.from_int(0x01C295C491150E00)
         ae(filetime, datetime(2002, 11, 27, 3, 25, 0))
         ar(ValueError, FILETIMETodatetime.from_int, 0xFFFFFFFFFFFFFFFF)
+        ar(ValueError, FILETIMETodatetime.from_int, 0x7FFFFFFFFFFFFFFF)
+        ar(ValueError, FILETIMETodatetime.from_int, -1)
+
+        filetime = FILETIMETodatetime.from_int(0x01C295C491150E00 + 19999)
+        ae(filetime, datetime(2002, 11, 27, 3, 25, 0, 1000))
     # end def test_from_int
+
+    def test_from_int_reference(self):
+        ae = self.assertEqual
+        random = Random(0x1601)
+
+        timestamps = [
+            0, 1, 9999, 10000, 0x01C295C491150E00, 0x7FFFFFFFFFFFFFFF,
+            0x8000000000000000, 0xFFFFFFFFFFFFFFFF,
+            2650467743999999999, 2650467744000000000
+        ]
+        timestamps.extend(
+            random.randrange(2650467744000000000) for x in range(10000)
+        )
+
+        for timestamp in timestamps:
+            try:
+                expected = _rtl_time_to_datetime(timestamp)
+            except ValueError:
+                expected = None
+            # end try
+
+            try:
+                value = FILETIMETodatetime.from_int(timestamp)
+            except ValueError:
+                value = None
+            # end try
+
+            ae(value, expected)
+        # end for
+    # end def test_from_int_reference
+
+    def test_from_ints(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        good = [0x01C295C491150E00 + (x * 10000) for x in range(100)]
+        expected = [FILETIMETodatetime.from_int(x) for x in good]
+
+        ae(FILETIMETodatetime.from_ints(good), expected)
+        ae(FILETIMETodatetime.from_ints(array("Q", good)), expected)
+        ae(FILETIMETodatetime.from_ints(iter(good[:3])), expected[:3])
+        ae(FILETIMETodatetime.from_ints([]), [])
+
+        bad = good + [0xFFFFFFFFFFFFFFFF]
+        ar(ValueError, FILETIMETodatetime.from_ints, bad)
+        ar(ValueError, FILETIMETodatetime.from_ints, [-1])
+
+        values = FILETIMETodatetime.from_ints(bad, strict=False)
+        ae(values, expected + [0xFFFFFFFFFFFFFFFF])
+
+        # Negative values are returned untouched, not wrapped to unsigned.
+        bad = good + [-1, -0x7FFFFFFFFFFFFFFF]
+        ar(ValueError, FILETIMETodatetime.from_ints, bad)
+
+        values = FILETIMETodatetime.from_ints(bad, strict=False)
+        ae(values, expected + [-1, -0x7FFFFFFFFFFFFFFF])
+    # end def test_from_ints
 # end class FILETIMETodatetimeTestCase
 
 class DOSDateTimeTodatetimeTestCase(TestCase):
@@ -162,7 +318,95 @@ class DOSDateTimeTodatetimeTestCase(TestCase):
         ae(value, datetime(2002, 11, 26, 0, 0, 0))
 
         ar(ValueError, DOSDateTimeTodatetime.from_ints)
+        ar(ValueError, DOSDateTimeTodatetime.from_ints, 0x2D60, 0x9B20)
+        ar(ValueError, DOSDateTimeTodatetime.from_ints, 0x2D7A, 0xC000)
     # end def test_from_ints
+
+    def test_tables(self):
+        ae = self.assertEqual
+
+        for word in range(0x10000):
+            day = word & 0x1F
+            month = (word & 0x1E0) >> 5
+            year = ((word & 0xFE00) >> 9) + 1980
+            try:
+                expected = date(year, month, day)
+            except ValueError:
+                expected = None
+            # end try
+
+            try:
+                value = DOSDateTimeTodatetime.date_from_int(word)
+            except ValueError:
+                value = None
+            # end try
+
+            ae(value, expected)
+
+            secs = (word & 0x1F) * 2
+            mins = (word & 0x7E0) >> 5
+            hours = (word & 0xF800) >> 11
+            try:
+                expected = time(hours, mins, secs)
+            except ValueError:
+                expected = None
+            # end try
+
+            try:
+                value = DOSDateTimeTodatetime.time_from_int(word)
+            except ValueError:
+                value = None
+            # end try
+
+            ae(value, expected)
+        # end for
+    # end def test_tables
+
+    def test_dates_from_ints(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        values = DOSDateTimeTodatetime.dates_from_ints([0x2D7A, 0x21])
+        ae(values, [date(2002, 11, 26), date(1980, 1, 1)])
+
+        values = DOSDateTimeTodatetime.dates_from_ints(iter([0x21, 0]), False)
+        ae(values, [date(1980, 1, 1), 0])
+
+        ar(ValueError, DOSDateTimeTodatetime.dates_from_ints, [0x21, 0])
+    # end def test_dates_from_ints
+
+    def test_times_from_ints(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        values = DOSDateTimeTodatetime.times_from_ints([0x9B20, 0])
+        ae(values, [time(19, 25, 0), time(0, 0, 0)])
+
+        values = DOSDateTimeTodatetime.times_from_ints([0x9B20, 0x1E], False)
+        ae(values, [time(19, 25, 0), 0x1E])
+
+        ar(ValueError, DOSDateTimeTodatetime.times_from_ints, [0x1E])
+    # end def test_times_from_ints
+
+    def test_from_int_pairs(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        values = DOSDateTimeTodatetime.from_int_pairs(
+            [0x2D7A, 0x21], [0x9B20, 0]
+        )
+        ae(values, [datetime(2002, 11, 26, 19, 25, 0), datetime(1980, 1, 1)])
+
+        values = DOSDateTimeTodatetime.from_int_pairs(
+            [0x2D7A, 0], [0x9B20, 0], False
+        )
+        ae(values, [datetime(2002, 11, 26, 19, 25, 0), (0, 0)])
+
+        ar(
+            ValueError, DOSDateTimeTodatetime.from_int_pairs,
+            [0x2D7A], [0x1E]
+        )
+    # end def test_from_int_pairs
 # end class DOSDateTimeTodatetimeTestCase
 
 class VariantTimeTodatetimeTestCase(TestCase):
@@ -0,0 +1,79 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.utils.batch module."""
+
+# stdlib imports
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+# local imports
+from lf.utils.batch import batches, iter_bounded
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "BatchesTestCase", "IterBoundedTestCase"
+]
+
+class BatchesTestCase(TestCase):
+    def test_batches(self):
+        ae = self.assertEqual
+
+        ae(list(batches(range(7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+        ae(list(batches(range(6), 3)), [[0, 1, 2], [3, 4, 5]])
+        ae(list(batches(range(2), 3)), [[0, 1]])
+        ae(list(batches([], 3)), [])
+    # end def test_batches
+# end class BatchesTestCase
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """A thread pool that counts how many calls are submitted."""
+
+    def __init__(self, max_workers):
+        super(_CountingExecutor, self).__init__(max_workers)
+        self.submitted = 0
+    # end def __init__
+
+    def submit(self, func, *args):
+        self.submitted += 1
+        return super(_CountingExecutor, self).submit(func, *args)
+    # end def submit
+# end class _CountingExecutor
+
+class IterBoundedTestCase(TestCase):
+    def test_iter_bounded(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        arg_lists = [(index, 2) for index in range(20)]
+        results = list()
+
+        with _CountingExecutor(4) as executor:
+            for result in iter_bounded(executor, pow, arg_lists, 3):
+                results.append(result)
+                at(executor.submitted - len(results) <= 3)
+            # end for
+        # end with
+
+        ae(results, [index ** 2 for index in range(20)])
+
+        with _CountingExecutor(1) as executor:
+            ae(list(iter_bounded(executor, pow, [], 3)), [])
+            ae(executor.submitted, 0)
+        # end with
+    # end def test_iter_bounded
+# end class IterBoundedTestCase
@@ -24,7 +24,8 @@ from datetime import datetime, timedelta
 # local imports
 from lf.utils.time import (
     filetime_to_unix_time, unix_time_to_filetime, variant_time_to_datetime,
-    filetime_to_datetime, dos_date_time_to_datetime
+    filetime_to_datetime, dos_date_time_to_datetime, dos_datetime_to_datetime,
+    dos_date_to_date, dos_time_to_time
 )
 
 __docformat__ = "restructuredtext en"
@@ -45,6 +46,19 @@ class TimeTestCase(TestCase):
         )
     # end def test_dos_date_time_to_datetime
 
+    def test_dos_datetime_to_datetime(self):
+        value = dos_datetime_to_datetime(0x2D7A9B20)
+        self.assertEqual(value, self.control)
+    # end def test_dos_datetime_to_datetime
+
+    def test_dos_date_to_date(self):
+        self.assertEqual(dos_date_to_date(0x2D7A), self.control.date())
+    # end def test_dos_date_to_date
+
+    def test_dos_time_to_time(self):
+        self.assertEqual(dos_time_to_time(0x9B20), self.control.time())
+    # end def test_dos_time_to_time
+
     def test_variant_time_to_datetime(self):
         datetime_3_25 = datetime(1900, 1, 2, 6, 0, 0)
         self.assertEqual(variant_time_to_datetime(3.25), datetime_3_25)
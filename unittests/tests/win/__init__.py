@@ -16,5 +16,5 @@
 # along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
 
 __all__ = [
-    "objects", "ole", "shell", "con"
+    "objects", "ole", "shell", "con", "codepage"
 ]
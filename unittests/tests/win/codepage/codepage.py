@@ -0,0 +1,90 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.win.codepage package."""
+
+# stdlib imports
+import codecs
+from unittest import TestCase
+
+# local imports
+from lf.win.codepage import get_decoder, search_function
+from lf.win.codepage.consts import (
+    CP_WINUNICODE, CP_OEM_720, CP_OEM_858, CP_WINDOWS_932, CP_WINDOWS_1252,
+    CP_ISO_8859_1, code_page_names
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "search_functionTestCase", "get_decoderTestCase"
+]
+
+class search_functionTestCase(TestCase):
+    def test_search_function(self):
+        ae = self.assertEqual
+        ai = self.assertIs
+
+        codec_info = search_function("cp720")
+        ae(codec_info.name, "cp720")
+        ai(search_function("cp720"), codec_info)
+
+        ae(search_function("cp858").name, "cp858")
+        ai(search_function("cp1252"), None)
+    # end def test_search_function
+# end class search_functionTestCase
+
+class get_decoderTestCase(TestCase):
+    def test_get_decoder(self):
+        ae = self.assertEqual
+        ai = self.assertIs
+        ar = self.assertRaises
+
+        ai(get_decoder(CP_WINDOWS_1252), get_decoder(CP_WINDOWS_1252))
+        ai(get_decoder(CP_WINUNICODE), codecs.getdecoder("utf_16_le"))
+        ai(get_decoder(CP_ISO_8859_1), codecs.latin_1_decode)
+
+        ar(LookupError, get_decoder, 0xFFFF)
+        ar(LookupError, get_decoder, None)
+    # end def test_get_decoder
+
+    def test_decode(self):
+        ae = self.assertEqual
+
+        data = [
+            b"", b"abc", b"abc\x00", bytes(range(0x80)), b"\x80\x81\xFF",
+            b"ab\x82\xA0c", "été".encode("utf_8")
+        ]
+
+        for (code_page, name) in code_page_names.items():
+            decoder = get_decoder(code_page)
+            codec_decoder = codecs.getdecoder(name)
+
+            for value in data:
+                ae(decoder(value, "ignore"), codec_decoder(value, "ignore"))
+            # end for
+        # end for
+
+        decoder = get_decoder(CP_WINDOWS_1252)
+        ae(decoder(bytearray(b"abc")), ("abc", 3))
+        ae(decoder(memoryview(b"ab\x80")), ("ab€", 3))
+        ae(decoder(b"\x81", "ignore"), ("", 1))
+
+        ae(get_decoder(CP_OEM_720)(b"a\x82", "ignore"), ("aé", 2))
+        ae(get_decoder(CP_OEM_858)(b"a\xD5"), ("a€", 2))
+        ae(get_decoder(CP_WINDOWS_932)(b"a\x82\xA0"), ("aあ", 3))
+    # end def test_decode
+# end class get_decoderTestCase
@@ -28,7 +28,7 @@ from lf.dec import ByteIStream
 from lf.dec.consts import SEEK_SET
 from lf.dtypes import BIG_ENDIAN, LITTLE_ENDIAN
 from lf.win.ctypes import (
-    guid_be, filetime_le, lcid_le, hresult_le, decimal_le, decimal_be
+    guid_le, guid_be, filetime_le, lcid_le, hresult_le, decimal_le, decimal_be
 )
 from lf.win.objects import (
     GUIDToUUID, CLSIDToUUID, LCID, HRESULT, DECIMALToDecimal, CURRENCYToDecimal
@@ -66,8 +66,47 @@ class GUIDToUUIDTestCase(TestCase):
         uuid1 = GUIDToUUID.from_ctype(uuid1)
 
         ae(uuid1, UUID(bytes=bytes([x for x in range(16)])))
+
+        uuid2 = guid_le.from_buffer_copy(bytes([x for x in range(16)]))
+        uuid2 = GUIDToUUID.from_ctype(uuid2)
+
+        ae(uuid2, UUID(bytes_le=bytes([x for x in range(16)])))
     # end def test_from_ctype
 
+    def test_from_buffer(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        data = bytes([x for x in range(17)])
+        uuid1 = GUIDToUUID.from_buffer(data)
+        uuid2 = GUIDToUUID.from_buffer(memoryview(data), 1)
+        uuid3 = GUIDToUUID.from_buffer(data, byte_order=BIG_ENDIAN)
+        uuid4 = GUIDToUUID.from_buffer(bytearray(data), 1, BIG_ENDIAN)
+
+        ae(uuid1, UUID(bytes_le=data[:16]))
+        ae(uuid2, UUID(bytes_le=data[1:]))
+        ae(uuid3, UUID(bytes=data[:16]))
+        ae(uuid4, UUID(bytes=data[1:]))
+
+        ar(ValueError, GUIDToUUID.from_buffer, data, 2)
+        ar(ValueError, GUIDToUUID.from_buffer, data, 2, BIG_ENDIAN)
+    # end def test_from_buffer
+
+    def test_cache(self):
+        at = self.assertTrue
+
+        data = bytes([x for x in range(16)])
+        uuid = GUIDToUUID.from_buffer(data)
+
+        at(GUIDToUUID.from_buffer(bytearray(data)) is uuid)
+        at(GUIDToUUID.from_stream(ByteIStream(data)) is uuid)
+        at(GUIDToUUID.from_ctype(guid_le.from_buffer_copy(data)) is uuid)
+        at(CLSIDToUUID.from_buffer(data) is uuid)
+
+        uuid = GUIDToUUID.from_buffer(data, byte_order=BIG_ENDIAN)
+        at(GUIDToUUID.from_ctype(guid_be.from_buffer_copy(data)) is uuid)
+    # end def test_cache
+
     def test_from_guid(self):
         ae = self.assertEqual
 
@@ -0,0 +1,114 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.win.ole.cfb.batch module."""
+
+# stdlib imports
+import json
+from io import StringIO
+from os.path import join
+from unittest import TestCase
+
+# local imports
+from lf.dec import RawIStream
+from lf.win.ole.cfb import CompoundFile
+from lf.win.ole.cfb.batch import (
+    find_files, describe, iter_descriptions, ingest
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "BatchTestCase"
+]
+
+class BatchTestCase(TestCase):
+    def setUp(self):
+        self.blair_doc_path = join("data", "doc", "blair.doc")
+        self.thumbs_db_path = join("data", "thumbsdb", "thumbs.db")
+        self.txt_path = join("data", "txt", "alpha.txt")
+    # end def setUp
+
+    def test_find_files(self):
+        ae = self.assertEqual
+
+        files = list(find_files([join("data", "INFO2"), self.blair_doc_path]))
+        ae(files, [
+            join("data", "INFO2", "INFO2_1.bin"),
+            join("data", "INFO2", "INFO2_2.bin"),
+            self.blair_doc_path
+        ])
+    # end def test_find_files
+
+    def test_describe(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        desc = describe(self.blair_doc_path)
+        cfb = CompoundFile(RawIStream(self.blair_doc_path))
+
+        ae(desc["path"], self.blair_doc_path)
+        ae(desc["header"]["ver_major"], 3)
+        ae(desc["header"]["sig"], "d0cf11e0a1b11ae1")
+        ae(desc["header"]["clsid"], "00000000-0000-0000-0000-000000000000")
+        at("di_fat" not in desc["header"])
+
+        entries = desc["entries"]
+        ae([entry["sid"] for entry in entries], [0, 1, 2, 3, 4, 5, 6])
+        ae(entries[0]["path"], "")
+        ae(entries[2]["path"], "WordDocument")
+        ae(entries[2]["size"], 39996)
+        ae(entries[2]["type"], 2)
+        ae(entries[0]["mtime"], cfb.root_dir_entry.mtime.isoformat())
+
+        # Make sure the description is JSON serializable
+        ae(json.loads(json.dumps(desc)), desc)
+
+        desc = describe(self.txt_path)
+        ae(desc["path"], self.txt_path)
+        at("error" in desc)
+        at("entries" not in desc)
+
+        desc = describe(join("data", "does_not_exist"))
+        at("error" in desc)
+    # end def test_describe
+
+    def test_iter_descriptions(self):
+        ae = self.assertEqual
+
+        paths = [self.blair_doc_path, self.txt_path, self.thumbs_db_path]
+        expected = [describe(path) for path in paths]
+
+        ae(list(iter_descriptions(paths, workers=0)), expected)
+        ae(list(iter_descriptions(paths, workers=2, max_pending=1)), expected)
+    # end def test_iter_descriptions
+
+    def test_ingest(self):
+        ae = self.assertEqual
+
+        paths = [self.blair_doc_path, self.txt_path, self.thumbs_db_path]
+        ofile = StringIO()
+
+        stats = ingest(paths, ofile, workers=0)
+
+        ae(stats.file_count, 3)
+        ae(stats.error_count, 1)
+
+        lines = ofile.getvalue().splitlines()
+        ae(len(lines), 3)
+        ae([json.loads(line)["path"] for line in lines], paths)
+    # end def test_ingest
+# end class BatchTestCase
@@ -24,6 +24,9 @@ from time import ctime
 from datetime import datetime
 from os.path import join
 from struct import pack, unpack
+from tempfile import mkdtemp
+from shutil import rmtree
+from hashlib import md5, sha1, sha256
 
 # local imports
 from lf.dec import (
@@ -32,7 +35,7 @@ from lf.dec import (
 from lf.time import FILETIMETodatetime
 
 from lf.win.ole.cfb.objects import (
-    CompoundFile, DirEntry, Header
+    CompoundFile, DirEntry, Header, LazyFAT, Limits, DEFAULT_LIMITS
 )
 from lf.win.ole.cfb.consts import (
     HEADER_SIG, STREAM_ID_NONE, FAT_EOC
@@ -42,7 +45,9 @@ utcfromtimestamp = datetime.utcfromtimestamp
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "HeaderTestCase", "DirEntryTestCase", "CompoundFileTestCase"
+    "HeaderTestCase", "DirEntryTestCase", "CompoundFileTestCase",
+    "ExtractAllTestCase", "HashStreamsTestCase", "LazyFATTestCase",
+    "TolerantParsingTestCase", "NameIndexTestCase"
 ]
 
 class HeaderTestCase(TestCase):
@@ -767,3 +772,308 @@ class CompoundFileTestCase(TestCase):
         # end for
     # end def test_get_stream
 ## end class CompoundFileTestCase
+
+class ExtractAllTestCase(TestCase):
+    def setUp(self):
+        blair_doc_path = ["data", "doc", "blair.doc"]
+        self.blair_doc = CompoundFile(RawIStream(join(*blair_doc_path)))
+    # end def setUp
+
+    def test_extract_all(self):
+        ae = self.assertEqual
+
+        blair_doc = self.blair_doc
+        stream_sids = [1, 2, 3, 4, 5]
+
+        for slack in (False, True):
+            contents = dict()
+
+            def callback(sid, offset, data):
+                buf = contents.setdefault(sid, bytearray())
+                if len(buf) < (offset + len(data)):
+                    buf.extend(bytes(offset + len(data) - len(buf)))
+                # end if
+                buf[offset:offset + len(data)] = data
+            # end def callback
+
+            stats = blair_doc.extract_all(callback, slack, buffer_size=700)
+
+            ae(sorted(contents.keys()), stream_sids)
+            ae(stats.stream_count, 5)
+
+            byte_count = 0
+            for sid in stream_sids:
+                stream = blair_doc.get_stream(sid, slack)
+                stream.seek(0, SEEK_SET)
+                data = stream.read()
+                byte_count += len(data)
+
+                ae(bytes(contents[sid]), data)
+            # end for
+
+            ae(stats.byte_count, byte_count)
+        # end for
+
+        contents = dict()
+        def callback(sid, offset, data):
+            contents[sid] = data
+        # end def callback
+
+        stats = blair_doc.extract_all(callback, sids=[5])
+        ae(list(contents.keys()), [5])
+        ae(contents[5], blair_doc.get_stream(5).read())
+        ae(stats.stream_count, 1)
+        ae(stats.byte_count, 106)
+
+        output_dir = mkdtemp()
+        try:
+            blair_doc.extract_all(output_dir)
+
+            for sid in stream_sids:
+                with open(join(output_dir, str(sid)), "rb") as ifile:
+                    data = ifile.read()
+                # end with
+
+                stream = blair_doc.get_stream(sid)
+                stream.seek(0, SEEK_SET)
+                ae(data, stream.read())
+            # end for
+        finally:
+            rmtree(output_dir)
+        # end try
+    # end def test_extract_all
+# end class ExtractAllTestCase
+
+class HashStreamsTestCase(TestCase):
+    def setUp(self):
+        blair_doc_path = ["data", "doc", "blair.doc"]
+        self.blair_doc = CompoundFile(RawIStream(join(*blair_doc_path)))
+    # end def setUp
+
+    def test_get_paths(self):
+        ae = self.assertEqual
+
+        paths = {
+            1: "1Table",
+            2: "WordDocument",
+            3: "\x05SummaryInformation",
+            4: "\x05DocumentSummaryInformation",
+            5: "\x01CompObj",
+            6: "ObjectPool"
+        }
+
+        ae(self.blair_doc.get_paths(), paths)
+    # end def test_get_paths
+
+    def test_hash_streams(self):
+        ae = self.assertEqual
+
+        blair_doc = self.blair_doc
+        paths = blair_doc.get_paths()
+
+        for slack in (False, True):
+            manifest = blair_doc.hash_streams(slack=slack, chunk_size=100)
+
+            # ObjectPool is a storage, not a stream
+            ae(len(manifest), 5)
+
+            for sid in (1, 2, 3, 4, 5):
+                stream = blair_doc.get_stream(sid, slack)
+                stream.seek(0, SEEK_SET)
+                data = stream.read()
+
+                hashes = {
+                    "md5": md5(data).hexdigest(),
+                    "sha1": sha1(data).hexdigest(),
+                    "sha256": sha256(data).hexdigest()
+                }
+
+                ae(manifest[paths[sid]], hashes)
+            # end for
+        # end for
+
+        manifest = blair_doc.hash_streams(["md5"])
+        ae(manifest["\x01CompObj"].keys(), {"md5"})
+
+        self.assertRaises(ValueError, blair_doc.hash_streams, ["bogus"])
+    # end def test_hash_streams
+# end class HashStreamsTestCase
+
+class LazyFATTestCase(TestCase):
+    def setUp(self):
+        blair_doc_path = ["data", "doc", "blair.doc"]
+
+        self.blair_doc = CompoundFile(RawIStream(join(*blair_doc_path)))
+        self.lazy_blair_doc = CompoundFile(
+            RawIStream(join(*blair_doc_path)), lazy_fat=True, fat_cache_size=1
+        )
+    # end def setUp
+
+    def test_lazy_fat(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        blair_doc = self.blair_doc
+        lazy_blair_doc = self.lazy_blair_doc
+
+        self.assertTrue(isinstance(lazy_blair_doc.fat, LazyFAT))
+        self.assertTrue(isinstance(lazy_blair_doc.mini_fat, LazyFAT))
+
+        ae(len(lazy_blair_doc.fat), len(blair_doc.fat))
+        ae(list(lazy_blair_doc.fat), blair_doc.fat)
+        ae(list(lazy_blair_doc.mini_fat), blair_doc.mini_fat)
+        ae(lazy_blair_doc.fat[-1], blair_doc.fat[-1])
+
+        ar(IndexError, lazy_blair_doc.fat.__getitem__, len(blair_doc.fat))
+        ar(IndexError, lazy_blair_doc.get_fat_chain, len(blair_doc.fat) + 1)
+
+        ae(lazy_blair_doc.dir_entries, blair_doc.dir_entries)
+
+        for sid in blair_doc.dir_entries:
+            ae(lazy_blair_doc.get_fat_chain(sid), blair_doc.get_fat_chain(sid))
+
+            for slack in (False, True):
+                stream1 = blair_doc.get_stream(sid, slack)
+                stream2 = lazy_blair_doc.get_stream(sid, slack)
+                stream1.seek(0, SEEK_SET)
+                stream2.seek(0, SEEK_SET)
+
+                ae(stream2.read(), stream1.read())
+            # end for
+        # end for
+    # end def test_lazy_fat
+# end class LazyFATTestCase
+
+class TolerantParsingTestCase(TestCase):
+    def setUp(self):
+        blair_doc_path = ["data", "doc", "blair.doc"]
+
+        with open(join(*blair_doc_path), "rb") as blair_doc_file:
+            self.data = blair_doc_file.read()
+        # end with
+
+        self.blair_doc = CompoundFile(ByteIStream(self.data))
+    # end def setUp
+
+    def test__init__(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        data = self.data
+        blair_doc = self.blair_doc
+
+        ae(blair_doc.strict, True)
+        ae(blair_doc.truncated, [])
+
+        cfb = CompoundFile(ByteIStream(data), strict=False)
+        ae(cfb.limits, DEFAULT_LIMITS)
+        ae(cfb.truncated, [])
+        ae(cfb.dir_entries, blair_doc.dir_entries)
+
+        # The directory chain (sector 0x7A) points back to itself.
+        cyclic = bytearray(data)
+        cyclic[(122 * 512) + (4 * 0x7A):(122 * 512) + (4 * 0x7B)] = \
+            pack("<I", 0x7A)
+        cyclic = bytes(cyclic)
+
+        ar(ValueError, CompoundFile, ByteIStream(cyclic))
+
+        cfb = CompoundFile(ByteIStream(cyclic), strict=False)
+        ae(cfb.truncated, [("fat_chain", "cycle")])
+        ae(cfb.dir_entries[0], blair_doc.dir_entries[0])
+
+        # Truncated file
+        short = data[:30000]
+        ar(ValueError, CompoundFile, ByteIStream(short))
+
+        cfb = CompoundFile(ByteIStream(short), strict=False)
+        ae(("fat", "short_read") in cfb.truncated, True)
+        ae(("dir_entries", "short_read") in cfb.truncated, True)
+        ae(cfb.root_dir_entry, None)
+        ae(cfb.get_paths(), dict())
+    # end def test__init__
+
+    def test_limits(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        data = self.data
+        blair_doc = self.blair_doc
+
+        limits = Limits(max_dir_entries=3)
+        ar(ValueError, CompoundFile, ByteIStream(data), limits=limits)
+
+        cfb = CompoundFile(ByteIStream(data), strict=False, limits=limits)
+        ae(cfb.truncated, [("dir_entries", "max_dir_entries")])
+        ae(sorted(cfb.dir_entries.keys()), [0, 1, 2])
+
+        limits = Limits(max_sectors=1)
+        cfb = CompoundFile(ByteIStream(data), strict=False, limits=limits)
+        ae(cfb.fat, blair_doc.fat)
+        ae(cfb.dir_entries, dict())
+        ae(("dir_entries", "max_sectors") in cfb.truncated, True)
+
+        limits = Limits(max_chain_length=5)
+        cfb = CompoundFile(ByteIStream(data), strict=False, limits=limits)
+        ae(cfb.truncated, [])
+        ae(cfb.get_fat_chain(0x2), blair_doc.get_fat_chain(0x2)[:5])
+        ae(cfb.truncated, [("fat_chain", "max_chain_length")])
+
+        cfb = CompoundFile(ByteIStream(data), limits=limits)
+        ar(ValueError, cfb.get_fat_chain, 0x2)
+    # end def test_limits
+# end class TolerantParsingTestCase
+
+class NameIndexTestCase(TestCase):
+    def test_name_index(self):
+        ae = self.assertEqual
+
+        blair_doc_path = ["data", "doc", "blair.doc"]
+        blair_doc = CompoundFile(RawIStream(join(*blair_doc_path)))
+
+        name_index = {
+            "Root Entry": 0,
+            "1Table": 1,
+            "WordDocument": 2,
+            "\x05SummaryInformation": 3,
+            "\x05DocumentSummaryInformation": 4,
+            "\x01CompObj": 5,
+            "ObjectPool": 6
+        }
+
+        # The unused directory entry (sid 7) is not indexed.
+        ae(blair_doc.name_index, name_index)
+
+        for (name, sid) in name_index.items():
+            ae(blair_doc.dir_entries[sid].name, name)
+        # end for
+    # end def test_name_index
+
+    def test_duplicate_names(self):
+        ae = self.assertEqual
+
+        with open(join("data", "thumbsdb", "thumbs.db"), "rb") as ifile:
+            data = bytearray(ifile.read())
+        # end with
+
+        cfb = CompoundFile(ByteIStream(bytes(data)))
+        chain = cfb.get_fat_chain(cfb.header.dir_sect_offset)
+        offsets = [
+            cfb.byte_offset(chain[sid // 4]) + ((sid % 4) * 128)
+            for sid in (4, 17)
+        ]
+
+        # Copy the entry named "3" (sid 4) to the unused sid 17, as "2".
+        entry = data[offsets[0]:offsets[0] + 128]
+        entry[0:2] = "2".encode("utf_16_le")
+        data[offsets[1]:offsets[1] + 128] = entry
+
+        cfb = CompoundFile(ByteIStream(bytes(data)))
+        ae(cfb.dir_entries[3].name, "2")
+        ae(cfb.dir_entries[17].name, "2")
+
+        # The last directory entry with a name is used.
+        ae(cfb.name_index["2"], 17)
+        ae(cfb.name_index["3"], 4)
+    # end def test_duplicate_names
+# end class NameIndexTestCase
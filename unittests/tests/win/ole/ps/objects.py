@@ -20,6 +20,7 @@
 # stdlib imports
 import codecs
 import os.path
+from io import BytesIO
 from unittest import TestCase, main
 from uuid import UUID
 from decimal import Decimal
@@ -27,7 +28,7 @@ from datetime import datetime
 from itertools import chain
 
 # local imports
-from lf.dec import RawIStream, ByteIStream, SEEK_SET
+from lf.dec import RawIStream, ByteIStream, SubsetIStream, SEEK_SET
 from lf.time import FILETIMETodatetime
 from lf.win import ctypes as win_ctypes
 from lf.win.codepage.consts import CP_WINUNICODE
@@ -48,7 +49,7 @@ from lf.win.ole.ps.objects import (
     PropertySetStreamHeader, DictionaryEntry, PropertySetHeader, Dictionary,
     CURRENCY, DATE, CodePageString, DECIMAL, UnicodeString, FILETIME, BLOB,
     IndirectPropertyName, ClipboardData, GUID, VersionedStream, HRESULT, Array,
-    Vector,
+    Vector, Payload,
 
     VT_EMPTY, VT_NULL, VT_I2, VT_I4, VT_R4, VT_R8, VT_CY, VT_DATE, VT_LPSTR,
     VT_ERROR, VT_BOOL, VT_UI2, VT_DECIMAL, VT_I1, VT_UI1, VT_UI4, VT_I8,
@@ -57,7 +58,7 @@ from lf.win.ole.ps.objects import (
     VT_BLOB_OBJECT, VT_CF, VT_CLSID, VT_VERSIONED_STREAM,
 
     Sequence, VT_ARRAY, VT_VECTOR, PropertyFactory,
-    Builder
+    Builder, TypedPropertyValue, LazyProperties
 )
 
 __docformat__ = "restructuredtexten"
@@ -78,7 +79,8 @@ __all__ = [
     "VT_STORAGETestCase", "VT_STREAMED_OBJECTTestCase",
     "VT_STORED_OBJECTTestCase", "VT_BLOB_OBJECTTestCase", "VT_CFTestCase",
     "VT_CLSIDTestCase", "VT_VERSIONED_STREAMTestCase", "VT_ARRAYTestCase",
-    "VT_VECTORTestCase", "PropertyFactoryTestCase", "BuilderTestCase"
+    "VT_VECTORTestCase", "PropertyFactoryTestCase", "LazyPropertiesTestCase",
+    "BuilderTestCase"
 ]
 
 class PropertySetStreamHeaderTestCase(TestCase):
@@ -135,6 +137,25 @@ class PropertySetStreamHeaderTestCase(TestCase):
         ae(pss0.offset1, None)
         ae(pss1.offset1, 0x43424140)
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+        from_buffer = PropertySetStreamHeader.from_buffer
+        from_stream = PropertySetStreamHeader.from_stream
+
+        data0 = bytearray([x for x in range(48)])
+        data1 = bytes([x for x in range(68)])
+
+        data0[24:28] = b"\x01\x00\x00\x00"
+
+        ae(from_buffer(data0), from_stream(ByteIStream(data0)))
+        ae(from_buffer(data1), from_stream(ByteIStream(data1)))
+        ae(from_buffer(b"XY" + data1, 2), from_stream(ByteIStream(data1)))
+        ae(from_buffer(memoryview(data1)), from_stream(ByteIStream(data1)))
+
+        self.assertRaises(ValueError, from_buffer, data0[:47])
+        self.assertRaises(ValueError, from_buffer, data1[:67])
+    # end def test_from_buffer
 # end class PropertySetStreamHeaderTestCase
 
 class PropertySetHeaderTestCase(TestCase):
@@ -160,6 +181,23 @@ class PropertySetHeaderTestCase(TestCase):
             ae(psh.pids_offsets[0x2B2A2928], 0x2F2E2D2C)
         # end for
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+
+        data = bytearray()
+        data.extend([x for x in range(48)])
+        data[4:8] = b"\x05\x00\x00\x00"
+
+        psh0 = PropertySetHeader.from_buffer(data)
+        psh1 = PropertySetHeader.from_buffer(b"XY" + data, 2)
+
+        for psh in (psh0, psh1):
+            ae(psh, PropertySetHeader.from_stream(ByteIStream(data)))
+        # end for
+
+        self.assertRaises(ValueError, PropertySetHeader.from_buffer, data[:47])
+    # end def test_from_buffer
 # end class PropertySetHeaderTestCase
 
 class DictionaryEntryTestCase(TestCase):
@@ -200,6 +238,31 @@ class DictionaryEntryTestCase(TestCase):
         ae(de.pid, 0x03020100)
         ae(de.name, "\u0908")
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+        decoder = codecs.getdecoder("utf_16_le")
+
+        data = bytearray([x for x in range(64)])
+        data[4:8] = b"\x13\x00\x00\x00"
+        stream = ByteIStream(data)
+
+        for (code_page, dec) in [
+            (None, None), (CP_WINUNICODE, None), (None, decoder),
+            (CP_WINUNICODE, decoder)
+        ]:
+            de = DictionaryEntry.from_buffer(data, 0, code_page, dec)
+            ae(de, DictionaryEntry.from_stream(stream, 0, code_page, dec))
+
+            de = DictionaryEntry.from_buffer(memoryview(data), 0, code_page, dec)
+            ae(de, DictionaryEntry.from_stream(stream, 0, code_page, dec))
+        # end for
+
+        de = DictionaryEntry.from_buffer(data[:16], 0)
+        ae(de.name, data[8:16])
+
+        self.assertRaises(ValueError, DictionaryEntry.from_buffer, data[:7])
+    # end def test_from_buffer
 # end class DictionaryEntryTestCase
 
 class DictionaryTestCase(TestCase):
@@ -311,6 +374,38 @@ class DictionaryTestCase(TestCase):
         ae(mapping[0x03030303], "abc")
         ae(mapping[0x04040404], "abcd")
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+        decoder = codecs.getdecoder("utf_16_le")
+
+        data = bytearray()
+        data.extend(b"\x03\x00\x00\x00")  # count
+        data.extend(b"\x00\x00\x00\x00\x03\x00\x00\x00a\x00b")
+        data.extend(b"\x01\x01\x01\x01\x02\x00\x00\x00a\x00")
+        data.extend(b"\x02\x02\x02\x02\x01\x00\x00\x00\xFF")
+        stream = ByteIStream(data)
+
+        for (code_page, dec) in [
+            (None, None), (None, decoder), (CP_WINUNICODE, None),
+            (CP_WINUNICODE, decoder)
+        ]:
+            dictionary = Dictionary.from_buffer(data, 0, code_page, dec)
+            ae(dictionary, Dictionary.from_stream(stream, 0, code_page, dec))
+        # end for
+
+        dictionary = Dictionary.from_buffer(b"XYZ" + data, 3, None, decoder)
+        ae(dictionary.size, 36)
+        ae(dictionary.property_count, 3)
+        ae(dictionary.mapping, {0: "a", 0x01010101: "a", 0x02020202: b"\xFF"})
+
+        # The count is larger than the number of entries in the buffer.
+        dictionary = Dictionary.from_buffer(data[:15])
+        ae(dictionary.property_count, 3)
+        ae(dictionary.mapping, {0: b"a\x00b"})
+
+        self.assertRaises(ValueError, Dictionary.from_buffer, data[:3])
+    # end def test_from_buffer
 # end class DictionaryTestCase
 
 class CURRENCYTestCase(TestCase):
@@ -490,8 +585,84 @@ class BLOBTestCase(TestCase):
             ae(blob.value, b"\x01\x02\x03")
         # end for
     # end def test_from_stream
+
+    def test_lazy(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        data = bytearray()
+        data.extend(b"\xAA")  # padding
+        data.extend(b"\x03\x00\x00\x00")  # size
+        data.extend(b"\x01\x02\x03\x04")  # bytes
+        stream = ByteIStream(data)
+
+        blob0 = BLOB.from_stream(stream, 1, lazy=True)
+        blob1 = BLOB.from_buffer(bytes(data), 1, lazy=True)
+
+        for blob in (blob0, blob1):
+            at(isinstance(blob.value, Payload))
+            ae(blob.size, 8)
+            ae(blob.value.offset, 5)
+            ae(blob.value.size, 3)
+            ae(blob.value, b"\x01\x02\x03")
+        # end for
+
+        ae(blob0.value.source, stream)
+        ae(blob0, BLOB.from_stream(stream, 1))
+        ae(blob1, BLOB.from_buffer(bytes(data), 1))
+
+        # Truncated payloads
+        data[1:5] = b"\xFF\x00\x00\x00"
+        blob0 = BLOB.from_stream(ByteIStream(data), 1, lazy=True)
+        blob1 = BLOB.from_buffer(bytes(data), 1, lazy=True)
+
+        for blob in (blob0, blob1):
+            ae(blob.value.size, 4)
+            ae(blob.value, b"\x01\x02\x03\x04")
+        # end for
+    # end def test_lazy
 # end class BLOBTestCase
 
+class PayloadTestCase(TestCase):
+    def test_payload(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        data = bytes(range(256)) * 4
+        md5 = "9b0d648800f1cbea8ac98048752292e3"  # Of data[24:]
+
+        for source in (data, memoryview(data), ByteIStream(data)):
+            payload = Payload(source, 24, 2000)
+
+            ae(payload.size, 1000)
+            ae(len(payload), 1000)
+            ae(payload.data, data[24:])
+            ae(bytes(payload), data[24:])
+            ae(payload.stream.read(), data[24:])
+            ae(payload, data[24:])
+            ae(payload, Payload(data, 24, 1000))
+            ae(hash(payload), hash(data[24:]))
+            ae(b"".join(payload.iter_chunks(7)), data[24:])
+            ae(max(map(len, payload.iter_chunks(7))), 7)
+
+            hashes = payload.hashes(("md5", "sha1"), 100)
+            ae(sorted(hashes), ["md5", "sha1"])
+            ae(hashes["md5"], md5)
+            ar(ValueError, payload.hashes, ["fake algorithm"])
+
+            ofile = BytesIO()
+            ae(payload.copy_to(ofile, 100), 1000)
+            ae(ofile.getvalue(), data[24:])
+
+            ae(Payload(source, 2000, 10).size, 0)
+            ae(Payload(source, 0, 10).data, data[:10])
+        # end for
+
+        self.assertNotEqual(Payload(data, 0, 10), data[1:11])
+        self.assertNotEqual(Payload(data, 0, 10), "not bytes")
+    # end def test_payload
+# end class PayloadTestCase
+
 class IndirectPropertyNameTestCase(TestCase):
     def test_from_stream(self):
         ae = self.assertEqual
@@ -549,6 +720,40 @@ class ClipboardDataTestCase(TestCase):
             ae(cd.data, b"\x05\x06\x07")
         # end for
     # end def test_from_stream
+
+    def test_lazy(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        data = bytearray()
+        data.extend(b"\x07\x00\x00\x00")  # size
+        data.extend(b"\x01\x02\x03\x04")  # format
+        data.extend(b"\x05\x06\x07\x08")  # data
+        stream = ByteIStream(data)
+
+        cd0 = ClipboardData.from_stream(stream, 0, lazy=True)
+        cd1 = ClipboardData.from_buffer(bytes(data), 0, lazy=True)
+
+        for cd in (cd0, cd1):
+            at(isinstance(cd.data, Payload))
+            ae(cd.size, 12)
+            ae(cd.format, b"\x01\x02\x03\x04")
+            ae(cd.data.offset, 8)
+            ae(cd.data, b"\x05\x06\x07")
+        # end for
+
+        ae(cd0, ClipboardData.from_stream(stream, 0))
+        ae(cd1, ClipboardData.from_buffer(bytes(data)))
+
+        # A size smaller than the format field
+        data[0:4] = b"\x02\x00\x00\x00"
+        cd0 = ClipboardData.from_stream(ByteIStream(data), 0, lazy=True)
+        cd1 = ClipboardData.from_buffer(bytes(data), 0, lazy=True)
+
+        for cd in (cd0, cd1):
+            ae(cd.data, b"\x05\x06\x07\x08")
+        # end for
+    # end def test_lazy
 # end class ClipboardDataTestCase
 
 class GUIDTestCase(TestCase):
@@ -1152,6 +1357,101 @@ class SequenceTestCase(TestCase):
 
         ar(ValueError, from_stream, ByteIStream(b""), 0xFFFF, 3)
     # end def test_from_stream
+
+    def test_from_buffer_strings(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+        from_buffer = Sequence.from_buffer
+        from_buffer_strings = Sequence.from_buffer_strings
+
+        pt = varenum
+        decoder = codecs.getdecoder("cp1252")
+
+        data = bytearray()
+        data.extend(b"\x04\x00\x00\x00abc\x00")  # "abc"
+        data.extend(b"\x00\x00\x00\x00")  # empty string
+        data.extend(b"\x02\x00\x00\x00\x81\x00\x64\x53")  # undefined char
+        data.extend(b"\x03\x00\x00\x00d\x00e\x64")  # embedded NUL
+        data = bytes(data * 50)
+
+        values = [
+            CodePageString((8, "abc")),
+            CodePageString((4, b"")),
+            CodePageString((8, "")),
+            CodePageString((8, "d"))
+        ] * 50
+        for seq in (
+            from_buffer(data, pt.VT_LPSTR, 200, 0, decoder),
+            from_buffer_strings(data, pt.VT_LPSTR, 200, 0, decoder)
+        ):
+            ae(seq.size, 1400)
+            ae(seq.value, values)
+        # end for
+
+        seq = from_buffer(data, pt.VT_BSTR, 4, 0, decoder)
+        ae(seq.size, 28)
+        ae(seq.value, [
+            CodePageString((8, "abc\x00")),
+            CodePageString((4, b"")),
+            CodePageString((8, "\x00")),
+            CodePageString((8, "d\x00e"))
+        ])
+
+        seq = from_buffer(data, pt.VT_BSTR, 2, 0)
+        ae(seq.value, [
+            CodePageString((8, b"abc\x00")), CodePageString((4, b""))
+        ])
+
+        # Truncated data stops the sequence early.
+        seq = from_buffer(data[:22], pt.VT_LPSTR, 4, 0, decoder)
+        ae(seq.size, 20)
+        ae(seq.value, values[:3])
+
+
+        data = bytearray()
+        data.extend(b"\x02\x00\x00\x00a\x00b\x00")
+        data.extend(b"\x03\x00\x00\x00\x3D\xD8\x00\xDEc\x00\x64\x53")
+        data = bytes(data * 50)
+
+        values = [
+            UnicodeString((8, "ab")), UnicodeString((12, "\U0001F600c"))
+        ] * 50
+        for decoder in (None, False):
+            seq = from_buffer(data, pt.VT_LPWSTR, 100, 0, decoder)
+            ae(seq.size, 1000)
+            ae(seq.value, values)
+
+            stream_seq = \
+                Sequence.from_stream(ByteIStream(data), pt.VT_LPWSTR, 100)
+            ae(seq, stream_seq)
+        # end for
+
+        ar(ValueError, from_buffer_strings, data, pt.VT_I4, 3)
+    # end def test_from_buffer_strings
+
+    def test_from_buffer_simple(self):
+        ae = self.assertEqual
+        from_buffer = Sequence.from_buffer
+
+        pt = varenum
+        data = bytes(range(64))
+        for ptype in (
+            pt.VT_I2, pt.VT_I4, pt.VT_R4, pt.VT_R8, pt.VT_BOOL, pt.VT_I1,
+            pt.VT_UI1, pt.VT_UI2, pt.VT_UI4, pt.VT_I8, pt.VT_UI8, pt.VT_INT,
+            pt.VT_UINT
+        ):
+            stream_seq = Sequence.from_stream(ByteIStream(data), ptype, 5)
+            ae(from_buffer(data, ptype, 5), stream_seq)
+
+            # The count is clamped to the size of the buffer.
+            seq = from_buffer(data, ptype, 100, 60)
+            ae(seq, Sequence.from_stream(ByteIStream(data), ptype, 100, 60))
+        # end for
+
+        seq = from_buffer(b"\x01\x00\xFF\xFF\x03\x00", pt.VT_I2, 3)
+        ae(seq.size, 8)
+        ae(seq.value, [1, -1, 3])
+    # end def test_from_buffer_simple
 # end class SequenceTestCase
 
 class TPVMixin():
@@ -3158,8 +3458,155 @@ class PropertyFactoryTestCase(TestCase):
             ae(property.value.scalar_count, 3)
         # end for
     # end def test_make
+
+    def test_make_from_buffer(self):
+        ae = self.assertEqual
+        make = PropertyFactory.make
+        make_from_buffer = PropertyFactory.make_from_buffer
+        decoder = codecs.getdecoder("cp1252")
+
+        samples = [
+            b"\x00\x00\xFF\xFF",
+            b"\x02\x00\x64\x53\xFF\xFF\x64\x53",
+            b"\x03\x00\x64\x53\xFF\xFF\xFF\xFF",
+            b"\x1E\x00\x00\x00\x05\x00\x00\x00abc\x00d\x00\x00\x00",
+            b"\x1F\x00\x00\x00\x03\x00\x00\x00a\x00b\x00\x00\x00\x00\x00",
+            b"\x40\x00\x00\x00\x00\x0E\x15\x91\xC4\x95\xC2\x01",
+            b"\x41\x00\x00\x00\x03\x00\x00\x00abc\x00",
+            b"\x47\x00\x00\x00\x08\x00\x00\x00\xFF\xFF\xFF\xFFabcd",
+            b"\x02\x10\x00\x00\x03\x00\x00\x00\x01\x00\x02\x00\x03\x00\x00\x00",
+            b"".join([
+                b"\x0C\x10\x00\x00\x02\x00\x00\x00",
+                b"\x03\x00\x00\x00\x05\x00\x00\x00",
+                b"\x1E\x00\x00\x00\x02\x00\x00\x00a\x00\x00\x00"
+            ]),
+            b"".join([
+                b"\x03\x20\x00\x00\x03\x00\x00\x00\x01\x00\x00\x00",
+                b"\x02\x00\x00\x00\x00\x00\x00\x00",
+                b"\x01\x00\x00\x00\x02\x00\x00\x00"
+            ]),
+            b"\x77\x00\x00\x00\x00\x00\x00\x00"
+        ]
+
+        for data in samples:
+            for dec in (None, decoder):
+                property = make(ByteIStream(data), 0, dec)
+                ae(make_from_buffer(data, 0, dec), property)
+                ae(make_from_buffer(b"XYZ" + data, 3, dec), property)
+                ae(make_from_buffer(memoryview(data), 0, dec), property)
+                ae(type(make_from_buffer(data, 0, dec)), type(property))
+            # end for
+        # end for
+
+        self.assertRaises(ValueError, make_from_buffer, b"\x03\x00", 0)
+    # end def test_make_from_buffer
+
+    def test_make_reads(self):
+        ae = self.assertEqual
+
+        class CountingIStream(ByteIStream):
+            def read(self, size=-1):
+                data = super(CountingIStream, self).read(size)
+                self.bytes_read += len(data)
+                return data
+            # end def read
+        # end class CountingIStream
+
+        data = b"".join([
+            b"\x03\x00\x00\x00\x05\x00\x00\x00",
+            b"\x1E\x00\x00\x00\x04\x00\x00\x00abc\x00",
+            b"\x00" * 65536
+        ])
+
+        stream = CountingIStream(data)
+        stream.bytes_read = 0
+        ae(PropertyFactory.make(stream, 0), VT_I4((3, 8, 5)))
+        ae(PropertyFactory.make(stream, 8).value, b"abc\x00")
+        self.assertTrue(stream.bytes_read < 64)
+
+        # Registered parsers decode a buffer.
+        class Factory(PropertyFactory):
+            pass
+        # end class Factory
+
+        def parser(buf, offset=0, decoder=None, ptype=None):
+            return VT_EMPTY((ptype, len(buf) - offset, "parsed"))
+        # end def parser
+
+        Factory.register(varenum.VT_I4, parser)
+        ae(Factory.make(stream, 0), VT_EMPTY((3, len(data), "parsed")))
+        ae(Factory.make(stream, 8).value, b"abc\x00")
+    # end def test_make_reads
+
+    def test_register(self):
+        ae = self.assertEqual
+        fmtid = UUID(int=5)
+
+        class Factory(PropertyFactory):
+            pass
+        # end class Factory
+
+        def parser(buf, offset=0, decoder=None, ptype=None):
+            return VT_EMPTY((ptype, 8, "parsed"))
+        # end def parser
+
+        data = b"\x03\x00\x00\x00\x05\x00\x00\x00"
+
+        Factory.register(varenum.VT_I4, parser, fmtid, 2)
+        ae(Factory.make_from_buffer(data), VT_I4((3, 8, 5)))
+        ae(Factory.make_from_buffer(data, 0, None, fmtid, 3), VT_I4((3, 8, 5)))
+        ae(Factory.make_from_buffer(data, 0, None, fmtid, 2),
+            VT_EMPTY((3, 8, "parsed")))
+
+        Factory.register(varenum.VT_I4, parser)
+        ae(Factory.make_from_buffer(data), VT_EMPTY((3, 8, "parsed")))
+        ae(Factory.get_parser(varenum.VT_I4), parser)
+
+        # The parent class is left unchanged.
+        ae(PropertyFactory.make_from_buffer(data), VT_I4((3, 8, 5)))
+        ae(PropertyFactory.make_from_buffer(data, 0, None, fmtid, 2),
+            VT_I4((3, 8, 5)))
+
+        ae(PropertyFactory.get_parser(0x1013), VT_VECTOR.from_buffer)
+        ae(PropertyFactory.get_parser(0x2013), VT_ARRAY.from_buffer)
+        ae(PropertyFactory.get_parser(0x77), TypedPropertyValue.from_buffer)
+    # end def test_register
 # end class PropertyFactoryTestCase
 
+class LazyPropertiesTestCase(TestCase):
+    def test_lazy_properties(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+        calls = list()
+
+        def make_property(pid, offset):
+            calls.append(pid)
+            return VT_I4((3, 8, offset))
+        # end def make_property
+
+        properties = LazyProperties({1: 10, 2: 20, 3: 30}, make_property)
+
+        ae(len(properties), 3)
+        ae(sorted(properties), [1, 2, 3])
+        at(2 in properties)
+        at(4 not in properties)
+        ae(calls, [])
+
+        ae(properties[2], VT_I4((3, 8, 20)))
+        ae(properties[2], VT_I4((3, 8, 20)))
+        ae(calls, [2])
+
+        ae(properties.get(4), None)
+        self.assertRaises(KeyError, properties.__getitem__, 4)
+        ae(calls, [2])
+
+        ae(dict(properties), {
+            1: VT_I4((3, 8, 10)), 2: VT_I4((3, 8, 20)), 3: VT_I4((3, 8, 30))
+        })
+        ae(sorted(calls), [1, 2, 3])
+    # end def test_lazy_properties
+# end class LazyPropertiesTestCase
+
 class BuilderTestCase(TestCase):
     def test_build(self):
         ae = self.assertEqual
@@ -4002,4 +4449,167 @@ class BuilderTestCase(TestCase):
 
         ae(sample_properties, control_properties)
     # end def test_build_properties
+
+    def test_build_properties_from_buffer(self):
+        ae = self.assertEqual
+
+        blair_path = os.path.join("data", "doc", "blair.doc")
+        blair_cfb = CompoundFile(RawIStream(blair_path))
+
+        for sid in (3, 4):
+            stream = blair_cfb.get_stream(sid)
+            stream.seek(0, SEEK_SET)
+            data = stream.read()
+
+            pss_header = Builder.build_property_set_stream_header(stream, 0)
+            offset = pss_header.offset0
+
+            property_set_header = \
+                Builder.build_property_set_header(stream, offset)
+
+            properties = Builder.build_properties(
+                stream, property_set_header, offset
+            )
+
+            ae(Builder.build_properties_from_buffer(
+                data, property_set_header, offset
+            ), properties)
+
+            ae(Builder.build_properties_from_buffer(
+                memoryview(data)[offset:], property_set_header
+            ), properties)
+
+            ae(Builder.build(stream, 0).property_set_0.properties, properties)
+        # end for
+    # end def test_build_properties_from_buffer
+
+    def test_build_pids_lazy(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        blair_path = os.path.join("data", "doc", "blair.doc")
+        blair_cfb = CompoundFile(RawIStream(blair_path))
+
+        for sid in (3, 4):
+            stream = blair_cfb.get_stream(sid)
+            pss = Builder.build(stream, 0)
+            properties = pss.property_set_0.properties
+
+            pids = [2, 4, 0x13, 0x99]
+            control = dict([
+                (pid, properties[pid]) for pid in pids if pid in properties
+            ])
+
+            pss = Builder.build(stream, 0, pids=pids)
+            ae(pss.property_set_0.properties, control)
+
+            pss = Builder.build(stream, 0, lazy=True)
+            lazy_properties = pss.property_set_0.properties
+            at(isinstance(lazy_properties, LazyProperties))
+            ae(len(lazy_properties), len(properties))
+            ae(lazy_properties, properties)
+
+            pss = Builder.build(stream, 0, pids=pids, lazy=True)
+            lazy_properties = pss.property_set_0.properties
+            at(isinstance(lazy_properties, LazyProperties))
+            ae(sorted(lazy_properties), sorted(control))
+            ae(dict(lazy_properties), control)
+        # end for
+    # end def test_build_pids_lazy
+
+    def test_build_lazy_payloads(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        data = bytearray()
+        data.extend(b"\xFE\xFF\x00\x00")  # byte order, version
+        data.extend(b"\x00" * 20)  # system identifier, clsid
+        data.extend(b"\x01\x00\x00\x00")  # property set count
+        data.extend(b"\x11" * 16)  # fmtid0
+        data.extend(b"\x30\x00\x00\x00")  # offset0
+
+        data.extend(b"\x40\x00\x00\x00")  # property set size
+        data.extend(b"\x02\x00\x00\x00")  # property count
+        data.extend(b"\x02\x00\x00\x00\x18\x00\x00\x00")  # pid 2
+        data.extend(b"\x03\x00\x00\x00\x28\x00\x00\x00")  # pid 3
+
+        data.extend(b"\x41\x00\x00\x00")  # VT_BLOB
+        data.extend(b"\x05\x00\x00\x00hello\x00\x00\x00")
+
+        data.extend(b"\x47\x00\x00\x00")  # VT_CF
+        data.extend(b"\x08\x00\x00\x00\xFF\xFF\xFF\xFFabcd")
+
+        stream = ByteIStream(b"\xAA" + data)
+        control = Builder.build(stream, 1)
+
+        for lazy in (False, True):
+            pss = Builder.build(stream, 1, lazy=lazy, lazy_payloads=True)
+            properties = pss.property_set_0.properties
+            ae(dict(properties), control.property_set_0.properties)
+
+            blob = properties[2].value
+            cd = properties[3].value.data
+
+            at(isinstance(blob, Payload))
+            at(isinstance(cd, Payload))
+            ae(blob.data, b"hello")
+            ae(cd.data, b"abcd")
+
+            # The payloads read from the stream, not a copy of the data.
+            at(isinstance(blob.source, SubsetIStream))
+            at(cd.source is blob.source)
+            ae(blob.hashes(["sha1"]), {
+                "sha1": "aaf4c61ddcc5e8a2dabede0f3b482cd9aea9434d"
+            })
+        # end for
+    # end def test_build_lazy_payloads
+
+    def test_build_lazy_payloads_skips_payloads(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        class CountingIStream(ByteIStream):
+            def read(self, size=-1):
+                data = super(CountingIStream, self).read(size)
+                self.bytes_read += len(data)
+                return data
+            # end def read
+        # end class CountingIStream
+
+        payload = bytes(range(256)) * 256
+
+        data = bytearray()
+        data.extend(b"\xFE\xFF\x00\x00")  # byte order, version
+        data.extend(b"\x00" * 20)  # system identifier, clsid
+        data.extend(b"\x01\x00\x00\x00")  # property set count
+        data.extend(b"\x11" * 16)  # fmtid0
+        data.extend(b"\x30\x00\x00\x00")  # offset0
+
+        data.extend((0x28 + len(payload)).to_bytes(4, "little"))  # size
+        data.extend(b"\x02\x00\x00\x00")  # property count
+        data.extend(b"\x02\x00\x00\x00\x18\x00\x00\x00")  # pid 2
+        data.extend(b"\x03\x00\x00\x00\x20\x00\x00\x00")  # pid 3
+
+        data.extend(b"\x03\x00\x00\x00\x2A\x00\x00\x00")  # VT_I4
+        data.extend(b"\x41\x00\x00\x00")  # VT_BLOB
+        data.extend(len(payload).to_bytes(4, "little"))
+        data.extend(payload)
+
+        control = Builder.build(ByteIStream(data), 0)
+
+        for lazy in (False, True):
+            stream = CountingIStream(bytes(data))
+            stream.bytes_read = 0
+
+            pss = Builder.build(stream, 0, lazy=lazy, lazy_payloads=True)
+            properties = pss.property_set_0.properties
+
+            ae(properties[2].value, 0x2A)
+            ae(properties[3].size, control.property_set_0.properties[3].size)
+            at(stream.bytes_read < 256)
+
+            ae(properties[3].value.size, len(payload))
+            ae(properties[3].value.data, payload)
+        # end for
+    # end def test_build_lazy_payloads_skips_payloads
 # end class BuilderTestCase
@@ -16,5 +16,6 @@
 # along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
 
 __all__ = [
-    "recyclebin", "link", "objects", "thumbsdb"
+    "recyclebin", "link", "objects", "thumbsdb", "jumplist",
+    "thumbcache"
 ]
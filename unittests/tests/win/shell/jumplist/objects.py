@@ -0,0 +1,248 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.win.shell.jumplist.objects module."""
+
+# stdlib imports
+from unittest import TestCase
+from os.path import join
+from datetime import datetime
+from struct import pack
+from uuid import UUID
+
+# local imports
+from lf.dec import RawIStream, ByteIStream
+from lf.win.ole.cfb import CompoundFile
+from lf.win.shell.link.objects import ShellLink
+from lf.win.shell.jumplist.objects import (
+    DestList, DestListEntry, JumpList, iter_timeline
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "DestListTestCase", "JumpListTestCase", "IterTimelineTestCase"
+]
+
+class DestListTestCase(TestCase):
+    def setUp(self):
+        self.volume = UUID("01234567-89ab-cdef-0123-456789abcdef")
+        self.object = UUID("fedcba98-7654-3210-fedc-ba9876543210")
+
+        entry = bytearray()
+        entry.extend(pack("<Q", 0x1122334455667788))  # checksum
+        entry.extend(self.volume.bytes_le)  # droid volume
+        entry.extend(self.object.bytes_le)  # droid object
+        entry.extend(self.object.bytes_le)  # birth droid volume
+        entry.extend(self.volume.bytes_le)  # birth droid object
+        entry.extend(b"host\x00\x00garbage\x00\x00\x00")  # hostname
+        entry.extend(pack("<I", 0x1A))  # entry number
+        entry.extend(b"\x00\x00\x00\x00")  # unknown
+        entry.extend(pack("<f", 2.5))  # access score
+        entry.extend(b"\x00\x68\x67\x4F\xB7\xA3\xCA\x01")  # mtime
+        entry.extend(pack("<i", -1))  # pin status
+        self.entry = bytes(entry)
+        self.path = "C:\\a.txt".encode("utf_16_le")
+    # end def setUp
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+
+        header = pack("<IIIfIIII", 1, 2, 0, 1.5, 0x1A, 0, 5, 0)
+        entry = b"".join([self.entry, pack("<H", 8), self.path])
+        bad_mtime = bytearray(entry)
+        bad_mtime[100:108] = b"\xFF" * 8
+        data = b"".join([b"junk", header, entry, bad_mtime])
+
+        dest_list0 = DestList.from_buffer(data, 4)
+        dest_list1 = DestList.from_stream(ByteIStream(data), 4)
+        dest_list2 = DestList.from_buffer(memoryview(data), 4)
+
+        for dest_list in (dest_list0, dest_list1, dest_list2):
+            ae(dest_list.version, 1)
+            ae(dest_list.entry_count, 2)
+            ae(dest_list.pinned_count, 0)
+            ae(dest_list.counter, 1.5)
+            ae(dest_list.last_entry_number, 0x1A)
+            ae(dest_list.action_count, 5)
+            ae(len(dest_list.entries), 2)
+
+            entry = dest_list.entries[0]
+            ae(entry.size, 130)
+            ae(entry.checksum, 0x1122334455667788)
+            ae(entry.droid, (self.volume, self.object))
+            ae(entry.droid_birth, (self.object, self.volume))
+            ae(entry.hostname, "host")
+            ae(entry.entry_number, 0x1A)
+            ae(entry.access_score, 2.5)
+            ae(entry.mtime, datetime(2010, 2, 2, 3, 25, 4))
+            ae(entry.pin_status, -1)
+            ae(entry.access_count, None)
+            ae(entry.path, "C:\\a.txt")
+            ae(entry.stream_name, "1a")
+
+            ae(dest_list.entries[1].mtime, 0xFFFFFFFFFFFFFFFF)
+        # end for
+    # end def test_from_buffer
+
+    def test_from_buffer_v3(self):
+        ae = self.assertEqual
+
+        header = pack("<IIIfIIII", 4, 1, 1, 1.0, 0x1A, 0, 1, 0)
+        footer = pack("<IIQH", 0, 7, 0, 8)
+        entry = b"".join([self.entry, footer, self.path, bytes(4)])
+
+        dest_list = DestList.from_buffer(header + entry)
+        ae(dest_list.version, 4)
+        ae(len(dest_list.entries), 1)
+
+        entry = dest_list.entries[0]
+        ae(entry.size, 150)
+        ae(entry.access_count, 7)
+        ae(entry.path, "C:\\a.txt")
+        ae(entry.stream_name, "1a")
+    # end def test_from_buffer_v3
+
+    def test_truncated(self):
+        ae = self.assertEqual
+
+        header = pack("<IIIfIIII", 1, 3, 0, 1.0, 0x1A, 0, 3, 0)
+        entry = b"".join([self.entry, pack("<H", 8), self.path])
+
+        dest_list = DestList.from_buffer(header + entry + entry[:-2])
+        ae(dest_list.entry_count, 3)
+        ae(len(dest_list.entries), 1)
+
+        self.assertRaises(ValueError, DestList.from_buffer, header[:-1])
+    # end def test_truncated
+# end class DestListTestCase
+
+class JumpListTestCase(TestCase):
+    def setUp(self):
+        self.win7_path = join(
+            "data", "jumplist", "win7.automaticDestinations-ms"
+        )
+        self.win10_path = join(
+            "data", "jumplist", "win10.automaticDestinations-ms"
+        )
+
+        names = ("shortcut_to_local_exe.lnk", "shortcut_to_mapped_exe.lnk")
+        self.links = list()
+        for name in names:
+            with open(join("data", "lnk", name), "rb") as ifile:
+                self.links.append(ShellLink(ByteIStream(ifile.read())))
+            # end with
+        # end for
+    # end def setUp
+
+    def test__init__(self):
+        ae = self.assertEqual
+
+        jump_list = JumpList(CompoundFile(RawIStream(self.win7_path)))
+        dest_list = jump_list.dest_list
+        ae(dest_list.version, 1)
+        ae(dest_list.entry_count, 3)
+        ae(dest_list.pinned_count, 2)
+        ae([entry.stream_name for entry in dest_list.entries], ["1", "2", "3"])
+        ae([entry.pin_status for entry in dest_list.entries], [0, 1, -1])
+        ae(dest_list.entries[2].path,
+            "C:\\Users\\user\\Documents\\file1_2.txt")
+        ae(dest_list.entries[0].hostname, "workstation")
+
+        jump_list = JumpList(CompoundFile(RawIStream(self.win10_path)))
+        dest_list = jump_list.dest_list
+        ae(dest_list.version, 4)
+        ae([entry.access_count for entry in dest_list.entries], [1, 2])
+
+        cfb = CompoundFile(RawIStream(self.win10_path))
+        self.assertRaises(KeyError, JumpList, cfb, "NoSuchStream")
+    # end def test__init__
+
+    def test_get_link(self):
+        ae = self.assertEqual
+
+        jump_list = JumpList(CompoundFile(RawIStream(self.win7_path)))
+        entries = jump_list.dest_list.entries
+
+        for (entry, expected) in zip(entries, self.links + self.links[:1]):
+            link = jump_list.get_link(entry)
+            ae(link.header, expected.header)
+            ae(link.string_data, expected.string_data)
+        # end for
+
+        missing = DestListEntry(entries[0][:-1] + ("ff",))
+        self.assertRaises(KeyError, jump_list.get_link, missing)
+    # end def test_get_link
+
+    def test_iter_links(self):
+        ae = self.assertEqual
+
+        jump_list = JumpList(CompoundFile(RawIStream(self.win10_path)))
+        results = list(jump_list.iter_links())
+
+        ae([entry for (entry, link) in results], jump_list.dest_list.entries)
+        ae([link.header for (entry, link) in results],
+            [link.header for link in self.links])
+
+        entries = jump_list.dest_list.entries
+        entries.append(DestListEntry(entries[0][:-1] + ("ff",)))
+        ae(list(jump_list.iter_links())[-1], (entries[-1], None))
+    # end def test_iter_links
+
+    def test_iter_items(self):
+        ae = self.assertEqual
+
+        jump_list = JumpList(CompoundFile(RawIStream(self.win10_path)))
+        results = list(jump_list.iter_items())
+
+        ae([entry for (entry, items) in results], jump_list.dest_list.entries)
+        ae([items for (entry, items) in results],
+            [link.items for link in self.links])
+
+        entries = jump_list.dest_list.entries
+        entries.append(DestListEntry(entries[0][:-1] + ("ff",)))
+        ae(list(jump_list.iter_items())[-1], (entries[-1], None))
+    # end def test_iter_items
+# end class JumpListTestCase
+
+class IterTimelineTestCase(TestCase):
+    def test_iter_timeline(self):
+        ae = self.assertEqual
+
+        win7_path = join("data", "jumplist", "win7.automaticDestinations-ms")
+        win10_path = join(
+            "data", "jumplist", "win10.automaticDestinations-ms"
+        )
+        txt_path = join("data", "txt", "alpha.txt")
+        paths = [win7_path, txt_path, win10_path]
+
+        results = list(iter_timeline(paths, strict=False))
+        ae([(path, entry.stream_name) for (path, entry, link) in results], [
+            (win7_path, "1"), (win7_path, "2"), (win7_path, "3"),
+            (win10_path, "1"), (win10_path, "2")
+        ])
+        ae([link is not None for (path, entry, link) in results], [True] * 5)
+
+        results = list(iter_timeline([win10_path], with_links=False))
+        ae([link for (path, entry, link) in results], [None, None])
+
+        self.assertRaises(ValueError, list, iter_timeline(paths))
+        self.assertRaises(
+            IOError, list, iter_timeline(["no_such_file"], strict=True)
+        )
+        ae(list(iter_timeline(["no_such_file"], strict=False)), [])
+    # end def test_iter_timeline
+# end class IterTimelineTestCase
@@ -0,0 +1,141 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.win.shell.link.carver module."""
+
+# stdlib imports
+from functools import partial
+from unittest import TestCase
+from os.path import join
+
+# local imports
+from lf.dec import ByteIStream
+from lf.win.shell.link.objects import ShellLink
+from lf.win.shell.link.carver import (
+    is_link_header, link_size, scan, scan_chunk, carve, carve_parallel
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "CarverTestCase"
+]
+
+class CarverTestCase(TestCase):
+    def setUp(self):
+        links = list()
+        names = ("shortcut_to_local_exe.lnk", "shortcut_to_mapped_exe.lnk")
+        for name in names:
+            with open(join("data", "lnk", name), "rb") as ifile:
+                links.append(ifile.read())
+            # end with
+        # end for
+
+        # A header with a non-zero reserved field.
+        bad_reserved = bytearray(links[0][:76])
+        bad_reserved[70] = 1
+
+        # A link that is cut off before the terminal block.
+        truncated = links[1][:-8]
+
+        # The offsets straddle the block (4096) and chunk (8192) boundaries.
+        self.offsets = [0, 4000, 8100, 13000]
+        self.links = [links[0], links[1], links[0], links[1]]
+
+        image = bytearray(20000)
+        for (offset, data) in zip(self.offsets, self.links):
+            image[offset:offset + len(data)] = data
+        # end for
+
+        image[2000:2076] = bad_reserved
+        image[19000:19000 + len(truncated)] = truncated
+
+        self.image = bytes(image)
+        self.expected = list(zip(self.offsets, self.links))
+    # end def setUp
+
+    def test_is_link_header(self):
+        ae = self.assertEqual
+        image = self.image
+
+        ae(is_link_header(image, 0), True)
+        ae(is_link_header(image, 4000), True)
+        ae(is_link_header(image, 2000), False)
+        ae(is_link_header(image, 1), False)
+        ae(is_link_header(image, 19990), False)
+    # end def test_is_link_header
+
+    def test_link_size(self):
+        ae = self.assertEqual
+        image = self.image
+
+        ae(link_size(image, 0), len(self.links[0]))
+        ae(link_size(image, 4000), len(self.links[1]))
+        ae(link_size(image, 19000), None)
+        ae(link_size(self.links[1][:-4]), None)
+        ae(link_size(memoryview(image), 13000), len(self.links[3]))
+    # end def test_link_size
+
+    def test_scan(self):
+        ae = self.assertEqual
+        stream = ByteIStream(self.image)
+
+        ae(list(scan(stream, block_size=4096, max_link_size=4096)),
+            self.expected)
+        ae(list(scan(stream)), self.expected)
+        ae(list(scan(stream, 1, 13000)), self.expected[1:3])
+        ae(list(scan(stream, max_link_size=1000)), [])
+    # end def test_scan
+
+    def test_scan_chunk(self):
+        ae = self.assertEqual
+        opener = partial(ByteIStream, self.image)
+
+        ae(scan_chunk(opener, 0, 8192, 4096, 4096), self.expected[:3])
+        ae(scan_chunk(opener, 8192, 16384, 4096, 4096), self.expected[3:])
+        ae(scan_chunk(opener, 8100, 8101, 4096, 4096), self.expected[2:3])
+    # end def test_scan_chunk
+
+    def test_carve(self):
+        ae = self.assertEqual
+        stream = ByteIStream(self.image)
+
+        results = list(carve(stream, block_size=4096))
+        ae([offset for (offset, link) in results], self.offsets)
+
+        for ((offset, link), data) in zip(results, self.links):
+            expected = ShellLink(ByteIStream(data))
+            ae(link.header, expected.header)
+            ae(link.string_data, expected.string_data)
+        # end for
+    # end def test_carve
+
+    def test_carve_parallel(self):
+        ae = self.assertEqual
+        opener = partial(ByteIStream, self.image)
+
+        for workers in (0, 2):
+            results = carve_parallel(
+                opener, chunk_size=4096, workers=workers, max_pending=1,
+                block_size=1024, max_link_size=4096
+            )
+            ae([offset for (offset, link) in results], self.offsets)
+        # end for
+
+        results = carve_parallel(opener, 4001, workers=0)
+        ae([offset for (offset, link) in results], self.offsets[2:])
+    # end def test_carve_parallel
+# end class CarverTestCase
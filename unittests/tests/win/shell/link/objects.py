@@ -29,7 +29,7 @@ from lf.dec import ByteIStream, RawIStream
 from lf.time import FILETIMETodatetime
 from lf.win.objects import LCID, GUIDToUUID
 from lf.win.con.objects import COORD
-from lf.win.shell.objects import SHITEMID, ITEMIDLIST
+from lf.win.shell.objects import SHITEMID, ITEMIDLIST, ShellItemFactory
 from lf.win.shell.link.ctypes import (
     file_attributes, link_flags, shell_link_header, domain_relative_obj_id
 )
@@ -39,8 +39,8 @@ from lf.win.shell.link.objects import (
     DarwinProps, ExpandableStringsDataBlock, EnvironmentProps,
     IconEnvironmentProps, KnownFolderProps, PropertyStoreProps, ShimProps,
     SpecialFolderProps, DomainRelativeObjId, TrackerProps,
-    VistaAndAboveIDListProps, TerminalBlock, ExtraDataBlockFactory,
-    StringDataSet
+    VistaAndAboveIDListProps, TerminalBlock, LazyExtraDataBlock,
+    ExtraDataBlockFactory, StringDataSet
 )
 
 __docformat__ = "restructuredtext en"
@@ -58,6 +58,18 @@ __all__ = [
 ]
 
 class StringDataTestCase(TestCase):
+    def test_from_buffer(self):
+        ae = self.assertEqual
+
+        sd1 = StringData.from_buffer(b"\x04\x00a\x00b\x00c\x00d\x00")
+        sd2 = StringData.from_buffer(b"xy\x04\x00a\x01cd", 2, False)
+        sd3 = StringData.from_buffer(b"\x04\x00a\x00", 0, True)
+
+        ae(sd1, StringData((10, 4, "abcd")))
+        ae(sd2, StringData((6, 4, b"a\x01cd")))
+        ae(sd3, StringData((10, 4, "a")))
+    # end def test_from_buffer
+
     def test_from_stream(self):
         ae = self.assertEqual
 
@@ -1081,6 +1093,82 @@ class ExtraDataBlockFactoryTestCase(TestCase):
         ]
         test_properties = list(ExtraDataBlockFactory.make_blocks(stream))
         ae(test_properties, ref_properties)
+
+        test_properties = \
+            list(ExtraDataBlockFactory.make_blocks_from_buffer(data))
+        ae(test_properties, ref_properties)
+
+        test_properties = list(ExtraDataBlockFactory.make_blocks_from_buffer(
+            memoryview(b"ab" + data), 2
+        ))
+        ae(test_properties, ref_properties)
+
+        # Only some of the blocks.
+        wanted_sigs = set([0xA0000003, 0xA000000B])
+        ref_wanted = [known_folder_props, tracker_props]
+
+        test_properties = list(ExtraDataBlockFactory.make_blocks(
+            stream, 0, wanted_sigs
+        ))
+        ae(test_properties, ref_wanted)
+
+        test_properties = list(ExtraDataBlockFactory.make_blocks_from_buffer(
+            data, 0, wanted_sigs
+        ))
+        ae(test_properties, ref_wanted)
+
+        # Lazy blocks
+        for test_properties in (
+            list(ExtraDataBlockFactory.make_blocks(stream, 0, lazy=True)),
+            list(ExtraDataBlockFactory.make_blocks_from_buffer(
+                data, 0, lazy=True
+            ))
+        ):
+            ae([block.sig for block in test_properties],
+                [block.sig for block in ref_properties])
+            ae([block.size for block in test_properties],
+                [block.size for block in ref_properties])
+            ae([block._block for block in test_properties],
+                [None] * len(ref_properties))
+
+            ae(test_properties[9].machine_id, tracker_props.machine_id)
+            ae(test_properties[9]._block, tracker_props)
+            ae(test_properties[0]._block, None)
+            ae(test_properties, ref_properties)
+            ae(list(test_properties[1]), list(console_fe_props))
+            ae(test_properties[1][2], console_fe_props[2])
+        # end for
+
+        test_properties = list(ExtraDataBlockFactory.make_blocks_from_buffer(
+            data, 0, wanted_sigs, True
+        ))
+        ae([type(block) for block in test_properties],
+            [LazyExtraDataBlock, LazyExtraDataBlock])
+        ae(test_properties, ref_wanted)
+
+        # An unknown first block, followed by a terminal block.
+        data = b"\x0C\x00\x00\x00\x64\x53\x00\x00abcd\x00\x00\x00\x00"
+        ref_properties = [ExtraDataBlock((12, 0x5364, b"abcd"))]
+
+        test_properties = \
+            list(ExtraDataBlockFactory.make_blocks(ByteIStream(data)))
+        ae(test_properties, ref_properties)
+
+        test_properties = \
+            list(ExtraDataBlockFactory.make_blocks_from_buffer(data))
+        ae(test_properties, ref_properties)
+
+        # Subclasses can add factories for other blocks.
+        class Factory(ExtraDataBlockFactory):
+            props_map = dict(ExtraDataBlockFactory.props_map)
+            props_map[0x5364] = lambda stream, offset: "stream block"
+
+            buffer_props_map = dict(ExtraDataBlockFactory.buffer_props_map)
+            buffer_props_map[0x5364] = lambda buf, offset: "buffer block"
+        # end class Factory
+
+        ae(list(Factory.make_blocks(ByteIStream(data))), ["stream block"])
+        ae(list(Factory.make_blocks_from_buffer(data)), ["buffer block"])
     # end def test_make_blocks
 # end class ExtraDataBlockFactoryTestCase
 
@@ -1147,7 +1235,86 @@ class ShellLinkTestCase(TestCase):
         ae(sl1.extra_data, edbs0)
         ae(sl2.extra_data, edbs1)
         ae(sl3.extra_data, edbs1)
+
+        ae(sl0.items, ShellItemFactory.make_items(idlist0))
+        ae(sl1.items[0] is sl0.items[0], True)
+        ae(sl2.items, [])
     # end def test__init__
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+
+        class StreamShellLink(ShellLink):
+            max_buffer_size = 0
+        # end class StreamShellLink
+
+        class SmallShellLink(ShellLink):
+            max_buffer_size = 100
+        # end class SmallShellLink
+
+        names = ("shortcut_to_local_exe.lnk", "shortcut_to_mapped_exe.lnk")
+        for name in names:
+            with open(join("data", "lnk", name), "rb") as ifile:
+                data = ifile.read()
+            # end with
+
+            ref = StreamShellLink(ByteIStream(data))
+
+            for shell_link in (
+                ShellLink.from_buffer(data),
+                ShellLink.from_buffer(memoryview(b"abc" + data), 3),
+                ShellLink(ByteIStream(data)),
+                ShellLink(ByteIStream(b"abc" + data), 3),
+                SmallShellLink(ByteIStream(data))
+            ):
+                ae(shell_link.header, ref.header)
+                ae(shell_link.idlist, ref.idlist)
+                ae(shell_link.link_info, ref.link_info)
+                ae(shell_link.string_data, ref.string_data)
+                ae(shell_link.extra_data, ref.extra_data)
+            # end for
+        # end for
+    # end def test_from_buffer
+
+    def test_wanted_sigs(self):
+        ae = self.assertEqual
+
+        class StreamShellLink(ShellLink):
+            max_buffer_size = 0
+        # end class StreamShellLink
+
+        names = ("shortcut_to_local_exe.lnk", "shortcut_to_mapped_exe.lnk")
+        wanted_sigs = set([0xA0000003])
+        for name in names:
+            with open(join("data", "lnk", name), "rb") as ifile:
+                data = ifile.read()
+            # end with
+
+            ref = StreamShellLink(ByteIStream(data))
+            ref_tracker = [
+                block for block in ref.extra_data if block.sig == 0xA0000003
+            ]
+            ae(len(ref_tracker), 1)
+
+            for shell_link in (
+                ShellLink.from_buffer(data, wanted_sigs=wanted_sigs),
+                ShellLink(ByteIStream(data), wanted_sigs=wanted_sigs),
+                StreamShellLink(ByteIStream(data), wanted_sigs=wanted_sigs)
+            ):
+                ae(shell_link.string_data, ref.string_data)
+                ae(shell_link.extra_data, ref_tracker)
+            # end for
+
+            for shell_link in (
+                ShellLink.from_buffer(data, lazy_blocks=True),
+                StreamShellLink(ByteIStream(data), lazy_blocks=True)
+            ):
+                ae([type(block) for block in shell_link.extra_data],
+                    [LazyExtraDataBlock] * len(ref.extra_data))
+                ae(shell_link.extra_data, ref.extra_data)
+            # end for
+        # end for
+    # end def test_wanted_sigs
 # end class ShellLinkTestCase
 
 class LinkInfoTestCase(TestCase):
@@ -21,14 +21,20 @@
 # stdlib imports
 from io import BytesIO
 from unittest import TestCase
+from datetime import datetime
+from uuid import UUID
 
 # local imports
 from lf.dec import ByteIStream
-from lf.win.shell.objects import SHITEMID, ITEMIDLIST
+from lf.win.shell.objects import (
+    SHITEMID, ITEMIDLIST, ShellItem, RootFolderItem, VolumeItem,
+    FileEntryItem, ExtensionBlock, FileEntryExtension, ExtensionBlocks,
+    ShellItemFactory
+)
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "SHITEMIDTestCase", "ITEMIDLISTTestcase"
+    "SHITEMIDTestCase", "ITEMIDLISTTestcase", "ShellItemFactoryTestCase"
 ]
 
 class SHITEMIDTestCase(TestCase):
@@ -81,6 +87,16 @@ class SHITEMIDTestCase(TestCase):
         ae(item2.abID, b"ab")
         ae(item2.id, item2.abID)
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+
+        ae(SHITEMID.from_buffer(b"\x06\x00abcd"), SHITEMID((6, 6, b"abcd")))
+        ae(SHITEMID.from_buffer(b"xy\x06\x00ab", 2), SHITEMID((4, 6, b"ab")))
+        ae(SHITEMID.from_buffer(b"\x01\x00"), SHITEMID((2, 1, None)))
+        ae(SHITEMID.from_buffer(b"\x01"), SHITEMID((1, 0, None)))
+        ae(SHITEMID.from_buffer(b""), SHITEMID((0, 0, None)))
+    # end def test_from_buffer
 # end class SHITEMIDTestCase
 
 class ITEMIDLISTTestCase(TestCase):
@@ -130,4 +146,189 @@ class ITEMIDLISTTestCase(TestCase):
         ae(list1.mkid, [itemid1, itemid2])
         ae(list2.mkid, [itemid1, itemid2])
     # end def test_from_stream
+
+    def test_from_buffer(self):
+        ae = self.assertEqual
+
+        items = [
+            b"\x06\x00\x01\x02\x03\x04", b"\x05\x00\x05\x06\x07",
+            b"\x04\x00\x08\x09", b"\x01\x00", b"\xFF\x00\x64\x53",
+            b"\x00\x00"
+        ]
+
+        for data in (
+            b"".join([items[0], items[1], items[2], items[5]]),
+            b"".join([items[0], items[1], items[2], items[4]]),
+            b"".join([items[0], items[3], items[1]]),
+            b"".join([items[0], items[1], items[2]])
+        ):
+            for max_bytes in (None, 13, 14, len(data)):
+                ref = ITEMIDLIST.from_stream(ByteIStream(data), 0, max_bytes)
+
+                ae(ITEMIDLIST.from_buffer(data, 0, max_bytes), ref)
+                ae(ITEMIDLIST.from_buffer(
+                    memoryview(b"ab" + data), 2, max_bytes
+                ), ref)
+            # end for
+        # end for
+    # end def test_from_buffer
 # end class ITEMIDLISTTestCase
+
+class ShellItemFactoryTestCase(TestCase):
+    def setUp(self):
+        # From the ID list of shortcut_to_local_exe.lnk
+        self.root = b"".join([
+            b"\x14\x00\x1F\x50\xE0\x4F\xD0\x20\xEA\x3A\x69\x10\xA2\xD8",
+            b"\x08\x00\x2B\x30\x30\x9D"
+        ])
+        self.volume = b"\x19\x00\x2FC:\\" + bytes(19)
+
+        file_entry = bytearray()
+        file_entry.extend(b"\x4E\x00\x31\x00")  # size, class type
+        file_entry.extend(b"\x00\x00\x00\x00")  # file size
+        file_entry.extend(b"\x71\x3C\x4A\x4F")  # mtime
+        file_entry.extend(b"\x10\x00Windows\x00")  # attributes, name
+        file_entry.extend(b"\x38\x00\x07\x00\x04\x00\xEF\xBE")  # ext header
+        file_entry.extend(b"\x62\x35\x52\x5A")  # ctime
+        file_entry.extend(b"\x71\x3C\x4A\x4F")  # atime
+        file_entry.extend(b"\x26\x00\x00\x00")  # identifier, unknown
+        file_entry.extend(b"\xC5\x01\x00\x00\x00\x00\x01\x00")  # file ref
+        file_entry.extend(bytes(10))  # unknown, localized name size
+        file_entry.extend("Windows\x00".encode("utf_16_le"))  # long name
+        file_entry.extend(b"\x16\x00")  # first ext offset
+        self.file_entry = bytes(file_entry)
+
+        ShellItemFactory.clear_cache()
+    # end def setUp
+
+    def test_make_item(self):
+        ae = self.assertEqual
+        make_item = ShellItemFactory.make_item
+
+        root = make_item(SHITEMID.from_buffer(self.root))
+        ae(type(root), RootFolderItem)
+        ae(root.size, 20)
+        ae(root.class_type, 0x1F)
+        ae(root.sort_index, 0x50)
+        ae(root.clsid, UUID("20d04fe0-3aea-1069-a2d8-08002b30309d"))
+
+        volume = make_item(SHITEMID.from_buffer(self.volume))
+        ae(type(volume), VolumeItem)
+        ae(volume.class_type, 0x2F)
+        ae(volume.name, "C:\\")
+
+        volume = make_item(SHITEMID.from_buffer(b"\x05\x00\x22ab"))
+        ae(volume.name, None)
+
+        file_entry = make_item(SHITEMID.from_buffer(self.file_entry))
+        ae(type(file_entry), FileEntryItem)
+        ae(file_entry.size, 0x4E)
+        ae(file_entry.class_type, 0x31)
+        ae(file_entry.file_size, 0)
+        ae(file_entry.mtime, datetime(2010, 3, 17, 9, 58, 20))
+        ae(file_entry.attrs, 0x10)
+        ae(file_entry.name, "Windows")
+
+        ext_blocks = file_entry.extension_blocks
+        ae(ext_blocks._blocks, None)
+        ae(len(ext_blocks), 1)
+
+        ext = ext_blocks[0]
+        ae(type(ext), FileEntryExtension)
+        ae(ext.size, 0x38)
+        ae(ext.version, 7)
+        ae(ext.sig, 0xBEEF0004)
+        ae(ext.ctime, datetime(2006, 11, 2, 11, 18, 36))
+        ae(ext.atime, datetime(2010, 3, 17, 9, 58, 20))
+        ae(ext.mft_entry, 0x1C5)
+        ae(ext.mft_sequence, 1)
+        ae(ext.long_name, "Windows")
+        ae(ext.localized_name, None)
+
+        # Unknown class type
+        item = make_item(SHITEMID.from_buffer(b"\x06\x00\x71abc"))
+        ae(type(item), ShellItem)
+        ae(item, (6, 0x71, b"\x71abc"))
+
+        # Too small to be a root folder item
+        item = make_item(SHITEMID.from_buffer(b"\x06\x00\x1Fabc"))
+        ae(type(item), ShellItem)
+
+        ae(make_item(SHITEMID.from_buffer(b"\x00\x00")), None)
+    # end def test_make_item
+
+    def test_extension_blocks(self):
+        ae = self.assertEqual
+
+        # A version 3 file entry extension, and an unknown extension.
+        data = bytearray()
+        data.extend(b"\x1F\x00\x03\x00\x04\x00\xEF\xBE")  # header
+        data.extend(b"\x00\x00\x00\x00")  # ctime (invalid)
+        data.extend(b"\x71\x3C\x4A\x4F")  # atime
+        data.extend(b"\x14\x00")  # identifier
+        data.extend(b"\x03\x00")  # localized name size
+        data.extend("ab\x00".encode("utf_16_le"))  # long name
+        data.extend(b"cd\x00")  # localized name
+        data.extend(b"\x00\x00")  # ext version offset
+        data.extend(b"\x0A\x00\x01\x00\x99\x00\xEF\xBExy")
+        data.extend(b"\x00\x00")
+
+        blocks = ExtensionBlocks(bytes(data), 0)
+        ae(len(blocks), 2)
+
+        ext = blocks[0]
+        ae(ext.version, 3)
+        ae(ext.ctime, (0, 0))
+        ae(ext.atime, datetime(2010, 3, 17, 9, 58, 20))
+        ae(ext.mft_entry, None)
+        ae(ext.mft_sequence, None)
+        ae(ext.long_name, "ab")
+        ae(ext.localized_name, "cd")
+
+        ae(blocks[1], ExtensionBlock((10, 1, 0xBEEF0099, b"xy")))
+        ae(list(blocks), [ext, blocks[1]])
+        ae(blocks, ExtensionBlocks(bytes(data), 0))
+
+        # Equal blocks hash the same, wherever their data came from.
+        moved = ExtensionBlocks(b"xyz" + bytes(data), 3)
+        ae(moved, blocks)
+        ae(hash(moved), hash(blocks))
+
+        ae(len(ExtensionBlocks(bytes(data), 40)), 0)
+        ae(len(ExtensionBlocks(b"\x08\x00\x00\x00abcd", 0)), 0)
+    # end def test_extension_blocks
+
+    def test_make_items(self):
+        ae = self.assertEqual
+
+        data = b"".join([self.root, self.volume, self.file_entry, b"\x00\x00"])
+        idlist = ITEMIDLIST.from_buffer(data)
+
+        items = ShellItemFactory.make_items(idlist)
+        ae([type(item) for item in items],
+            [RootFolderItem, VolumeItem, FileEntryItem])
+
+        # Repeated items are interned.
+        items2 = ShellItemFactory.make_items(ITEMIDLIST.from_buffer(data))
+        ae([item1 is item2 for (item1, item2) in zip(items, items2)],
+            [True, True, True])
+
+        ShellItemFactory.clear_cache()
+        items3 = ShellItemFactory.make_items(ITEMIDLIST.from_buffer(data))
+        ae(items3, items)
+        ae(items3[0] is items[0], False)
+    # end def test_make_items
+
+    def test_items(self):
+        ae = self.assertEqual
+
+        data = b"".join([self.root, self.volume, self.file_entry, b"\x00\x00"])
+        idlist = ITEMIDLIST.from_buffer(data)
+
+        ShellItemFactory.clear_cache()
+        items = idlist.items
+        ae(items, ShellItemFactory.make_items(idlist))
+        ae([item1 is item2 for (item1, item2) in zip(items, idlist.items)],
+            [True, True, True])
+    # end def test_items
+# end class ShellItemFactoryTestCase
@@ -0,0 +1,150 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.win.shell.recyclebin.batch module."""
+
+# stdlib imports
+import os
+import json
+from io import StringIO
+from os.path import join
+from tempfile import mkdtemp
+from shutil import rmtree
+from unittest import TestCase
+
+# local imports
+from lf.win.shell.recyclebin.batch import (
+    COLUMNS, find_files, iter_rows, ingest
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "BatchTestCase"
+]
+
+def make_ifile(version, name, file_size=100, dtime=0x01C295C491150E00):
+    name = "".join([name, "\x00"]).encode("utf_16_le")
+    data = [
+        version.to_bytes(8, "little"),
+        file_size.to_bytes(8, "little"),
+        dtime.to_bytes(8, "little")
+    ]
+
+    if version == 1:
+        data.append(name.ljust(520, b"\x00"))
+    else:
+        data.append((len(name) // 2).to_bytes(4, "little"))
+        data.append(name)
+    # end if
+
+    return b"".join(data)
+# end def make_ifile
+
+class BatchTestCase(TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        sid_dir = join(self.directory, "$Recycle.Bin", "S-1-5-21-1")
+        os.makedirs(sid_dir)
+
+        files = [
+            ("$IAAAAAA.txt", make_ifile(1, "C:\\Users\\a\\one.txt", 1)),
+            ("$RAAAAAA.txt", b"one"),
+            ("$IBBBBBB.doc", make_ifile(2, "D:\\two.doc", 2)),
+            ("$ICCCCCC", make_ifile(2, "\\\\server\\share\\x", 3, 2 ** 63)),
+            ("$IDDDDDD.bad", b"\x03" + bytes(30)),
+            ("desktop.ini", b"[.ShellClassInfo]")
+        ]
+
+        for (name, data) in files:
+            with open(join(sid_dir, name), "wb") as ofile:
+                ofile.write(data)
+            # end with
+        # end for
+
+        self.sid_dir = sid_dir
+    # end def setUp
+
+    def tearDown(self):
+        rmtree(self.directory)
+    # end def tearDown
+
+    def test_find_files(self):
+        ae = self.assertEqual
+
+        sid_dir = self.sid_dir
+        missing = join(sid_dir, "$IZZZZZZ")
+
+        ae(list(find_files([self.directory, missing])), [
+            join(sid_dir, "$IAAAAAA.txt"), join(sid_dir, "$IBBBBBB.doc"),
+            join(sid_dir, "$ICCCCCC"), join(sid_dir, "$IDDDDDD.bad"), missing
+        ])
+    # end def test_find_files
+
+    def test_iter_rows(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        paths = list(find_files([self.directory]))
+        paths.append(join(self.sid_dir, "$IZZZZZZ"))
+
+        rows = list(iter_rows(paths, 0))
+        ae([row["path"] for row in rows], paths)
+        ae([list(row.keys()) for row in rows], [list(COLUMNS)] * 5)
+
+        ae(rows[0]["error"], None)
+        ae(rows[0]["version"], 1)
+        ae(rows[0]["name_asc"], None)
+        ae(rows[0]["id"], "AAAAAA.txt")
+        ae(rows[0]["drive_num"], 2)
+        ae(rows[0]["dtime"], "2002-11-27T03:25:00")
+        ae(rows[0]["file_size"], 1)
+        ae(rows[0]["name_uni"], "C:\\Users\\a\\one.txt")
+        ae(rows[0]["exists"], True)
+
+        ae(rows[1]["version"], 2)
+        ae(rows[1]["drive_num"], 3)
+        ae(rows[1]["name_uni"], "D:\\two.doc")
+        ae(rows[1]["exists"], False)
+
+        ae(rows[2]["drive_num"], None)
+        ae(rows[2]["dtime"], 2 ** 63)
+        ae(rows[2]["file_size"], 3)
+
+        at(rows[3]["error"].startswith("ValueError"))
+        ae(rows[3]["name_uni"], None)
+        at(rows[4]["error"] is not None)
+
+        # Make sure the rows are JSON serializable
+        ae(json.loads(json.dumps(rows)), rows)
+
+        ae(list(iter_rows(paths, 2, batch_size=2)), rows)
+        ae(list(iter_rows(paths, 1, max_pending=1, batch_size=1)), rows)
+        ae(list(iter_rows(paths)), rows)
+    # end def test_iter_rows
+
+    def test_ingest(self):
+        ae = self.assertEqual
+
+        ofile = StringIO()
+        stats = ingest(find_files([self.directory]), ofile, 2)
+        ae(stats.file_count, 4)
+        ae(stats.error_count, 1)
+
+        rows = [json.loads(line) for line in ofile.getvalue().splitlines()]
+        ae(rows, list(iter_rows(find_files([self.directory]), 0)))
+    # end def test_ingest
+# end class BatchTestCase
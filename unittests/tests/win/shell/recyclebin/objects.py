@@ -26,12 +26,15 @@ from os.path import join
 
 # local imports
 from lf.dec import RawIStream, ByteIStream
-from lf.win.shell.recyclebin.objects import INFO2, INFO2Header, INFO2Item
+from lf.win.shell.recyclebin.objects import (
+    INFO2, INFO2Header, INFO2Item, IFile
+)
 from lf.win.shell.recyclebin.ctypes import info2_header, info2_item
 
 __docformat__ = "restructuredtext en"
 __all__ = [
-    "INFO2TestCase", "INFO2HeaderTestCase", "INFO2ItemTestCase"
+    "INFO2TestCase", "INFO2HeaderTestCase", "INFO2ItemTestCase",
+    "IFileTestCase"
 ]
 
 class INFO2TestCase(TestCase):
@@ -61,7 +64,68 @@ class INFO2TestCase(TestCase):
         ae(info2_1.header, header1)
         ae(info2_2.header, header2)
         ae(info2_1.items, items1)
+
+        # A short last item is padded.
+        stream1.seek(0)
+        data = stream1.read()
+        info2 = INFO2(ByteIStream(data[:-500]))
+        ae(info2.items[:3], items1[:3])
+        ae(info2.items[3].name_asc, items1[3].name_asc)
+        ae(info2.items[3].dtime, items1[3].dtime)
+        ae(info2.items[3].file_size, items1[3].file_size)
+        ae(info2.items[3].name_uni, items1[3].name_uni[:10])
+
+        # Items smaller and larger than an INFO2Item.
+        header = bytearray(data[:20])
+        header[12:16] = b"\x18\x01\x00\x00"
+        data280 = b"".join([header, data[0x14:0x14 + 280]])
+        item = INFO2(ByteIStream(data280)).items[0]
+        ae(item.name_asc, items1[0].name_asc)
+        ae(item.file_size, items1[0].file_size)
+        ae(item.name_uni, "")
+
+        # Items too small for the fixed size fields, with a short last item.
+        header[12:16] = b"\x64\x00\x00\x00"
+        data150 = b"".join([header, data[0x14:0x14 + 150]])
+        items = INFO2(ByteIStream(data150)).items
+        ae(len(items), 2)
+        ae(items[0].name_asc, items1[0].name_asc[:100])
+        ae(items[0].file_size, 0)
+        ae(items[1].exists, False)
+        ae(items[1].file_size, 0)
+        ae(list(INFO2.iter_items(ByteIStream(data150))), items)
+
+        header[12:16] = b"\x24\x03\x00\x00"
+        data804 = b"".join([
+            header, data[0x14:0x334], b"\xFF" * 4, data[0x334:0x654]
+        ])
+        ae(INFO2(ByteIStream(data804)).items, items1[:2])
+
+        header[12:16] = b"\x00\x00\x00\x00"
+        ae(INFO2(ByteIStream(bytes(header))).items, [])
+
+        # Enough items to be decoded in more than one batch.
+        data = b"".join([data[:0x14], data[0x14:] * 1100])
+        ae(INFO2(ByteIStream(data)).items, items1 * 1100)
     # end def test__init__
+
+    def test_iter_items(self):
+        ae = self.assertEqual
+
+        stream = RawIStream(join("data", "INFO2", "INFO2_1.bin"))
+        items = INFO2(stream, 0).items
+
+        ae(list(INFO2.iter_items(stream, 0)), items)
+        ae(list(INFO2.iter_items(stream, 0, 1)), items)
+        ae(list(INFO2.iter_items(stream, 0, 3)), items)
+        ae(list(INFO2.iter_items(stream, 0, 4)), items)
+
+        stream.seek(0)
+        data = stream.read()
+        ae(list(INFO2.iter_items(ByteIStream(data[:20]))), [])
+        ae(list(INFO2.iter_items(ByteIStream(data[:-500]), 0, 2))[:3],
+            items[:3])
+    # end def test_iter_items
 # end class INFO2TestCase
 
 class INFO2HeaderTestCase(TestCase):
@@ -118,3 +182,72 @@ class INFO2ItemTestCase(TestCase):
         ae(item.exists, False)
     # end def test_from_ctype
 # end class INFO2ItemTestCase
+
+class IFileTestCase(TestCase):
+    def setUp(self):
+        name = "C:\\Users\\lftest\\file1.txt".encode("utf_16_le")
+
+        data = bytearray()
+        data.extend(b"\x01\x00\x00\x00\x00\x00\x00\x00")  # version
+        data.extend(b"\x00\x01\x02\x03\x04\x05\x06\x07")  # file_size
+        data.extend(b"\x00\x0E\x15\x91\xC4\x95\xC2\x01")  # dtime
+        data.extend(name.ljust(520, b"\x00"))  # name
+        self.data_v1 = bytes(data)
+
+        data[0] = 2
+        data[24:] = b"\x1B\x00\x00\x00"  # name size (in characters)
+        data.extend(name)
+        data.extend(b"\x00\x00")
+        self.data_v2 = bytes(data)
+    # end def setUp
+
+    def test_from_stream(self):
+        ae = self.assertEqual
+
+        stream = ByteIStream(b"".join([b"abc", self.data_v1]))
+        ifile = IFile.from_stream(stream, 3)
+        ae(ifile.version, 1)
+        ae(ifile.file_size, 0x0706050403020100)
+        ae(ifile.dtime, datetime(2002, 11, 27, 3, 25))
+        ae(ifile.name_uni, "C:\\Users\\lftest\\file1.txt")
+
+        stream = ByteIStream(self.data_v2)
+        ifile = IFile.from_stream(stream)
+        ae(ifile.version, 2)
+        ae(ifile.file_size, 0x0706050403020100)
+        ae(ifile.dtime, datetime(2002, 11, 27, 3, 25))
+        ae(ifile.name_uni, "C:\\Users\\lftest\\file1.txt")
+    # end def test_from_stream
+
+    def test_from_bytes(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        ifile1 = IFile.from_bytes(self.data_v1)
+        ifile2 = IFile.from_bytes(self.data_v2)
+        ae(ifile1[1:], ifile2[1:])
+
+        ar(ValueError, IFile.from_bytes, self.data_v1[:20])
+        ar(ValueError, IFile.from_bytes, self.data_v2[:26])
+        ar(ValueError, IFile.from_bytes, b"\x03" + self.data_v1[1:])
+    # end def test_from_bytes
+
+    def test_from_bytes_list(self):
+        ae = self.assertEqual
+        ai = self.assertIsInstance
+
+        data = bytearray(self.data_v2)
+        data[16:24] = b"\xFF" * 8
+        ifiles = IFile.from_bytes_list([
+            self.data_v1, b"", bytes(data), self.data_v2[:-20]
+        ])
+
+        ae(len(ifiles), 4)
+        ae(ifiles[0], IFile.from_bytes(self.data_v1))
+        ai(ifiles[1], ValueError)
+        ae(ifiles[2].dtime, 0xFFFFFFFFFFFFFFFF)
+        ae(ifiles[2].name_uni, "C:\\Users\\lftest\\file1.txt")
+        ae(ifiles[3].name_uni, "C:\\Users\\lftest\\")
+        ae(IFile.from_bytes_list([]), [])
+    # end def test_from_bytes_list
+# end class IFileTestCase
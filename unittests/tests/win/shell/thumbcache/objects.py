@@ -0,0 +1,308 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.win.shell.thumbcache.objects module."""
+
+# stdlib imports
+import os
+from unittest import TestCase
+from struct import pack
+from datetime import datetime
+from tempfile import mkstemp
+
+# local imports
+from lf.dec import ByteIStream, MappedIStream
+from lf.win.shell.thumbcache.consts import (
+    VERSION_VISTA, VERSION_7, VERSION_10, NO_ENTRY
+)
+from lf.win.shell.thumbcache.objects import (
+    CacheFile, CacheEntry, IndexFile, IndexEntry
+)
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "CacheEntryTestCase", "CacheFileTestCase", "IndexFileTestCase"
+]
+
+def make_entry(version, entry_hash, identifier, data, padding=0):
+    identifier = identifier.encode("utf_16_le")
+    if version == VERSION_VISTA:
+        header_size = 56
+    elif version == VERSION_7:
+        header_size = 48
+    else:
+        header_size = 56
+    # end if
+
+    size = header_size + len(identifier) + padding + len(data)
+    header = [pack("<4sIQ", b"CMMM", size, entry_hash)]
+    if version == VERSION_VISTA:
+        header.append("jpg".encode("utf_16_le").ljust(8, b"\x00"))
+    # end if
+
+    header.append(pack("<III", len(identifier), padding, len(data)))
+    if version >= 0x1A:
+        header.append(pack("<II", 32, 24))
+    # end if
+
+    header.append(pack("<4sQQ", bytes(4), 0x1122, 0x3344))
+
+    return b"".join(header) + identifier + (b"\x00" * padding) + data
+# end def make_entry
+
+def make_cache(version, cache_type, entries):
+    first_entry = 24
+    available_entry = first_entry + sum(len(entry) for entry in entries)
+    if version >= 0x1A:
+        info = pack("<4sII", bytes(4), first_entry, available_entry)
+    else:
+        info = pack("<III", first_entry, available_entry, len(entries))
+    # end if
+
+    header = pack("<4sII", b"CMMM", version, cache_type) + info
+    return header + b"".join(entries)
+# end def make_cache
+
+def make_index(version, entries, empty_count=1):
+    data = [pack(
+        "<4sI4sII4s", b"IMMM", version, bytes(4), len(entries),
+        len(entries) + empty_count, bytes(4)
+    )]
+
+    for (entry_hash, mtime, offsets) in entries:
+        if version == VERSION_VISTA:
+            data.append(pack("<QQI", entry_hash, mtime, 1))
+        elif version == VERSION_7:
+            data.append(pack("<QI", entry_hash, 1))
+        else:
+            data.append(pack("<QI4x", entry_hash, 1))
+        # end if
+        data.append(pack("<{0}I".format(len(offsets)), *offsets))
+    # end for
+
+    slot_size = len(data[1]) if entries else 0
+    data.extend([bytes(slot_size)] * empty_count)
+
+    return b"".join(data)
+# end def make_index
+
+class CacheEntryTestCase(TestCase):
+    def test_from_stream(self):
+        ae = self.assertEqual
+
+        data = make_entry(VERSION_7, 0x1234, "abcd", b"\xFF\xD8xyz", 4)
+        stream = ByteIStream(b"\x00" * 10 + data)
+        entry = CacheEntry.from_stream(stream, 10)
+
+        ae(entry.offset, 10)
+        ae(entry.size, len(data))
+        ae(entry.hash, 0x1234)
+        ae(entry.extension, None)
+        ae(entry.identifier, "abcd")
+        ae(entry.width, None)
+        ae(entry.height, None)
+        ae(entry.data_checksum, 0x1122)
+        ae(entry.header_checksum, 0x3344)
+        ae(entry.data, b"\xFF\xD8xyz")
+        ae(entry.data.offset, 10 + 48 + 8 + 4)
+
+        data = make_entry(VERSION_VISTA, 0x5678, "ef", b"abc")
+        entry = CacheEntry.from_stream(ByteIStream(data), 0, VERSION_VISTA)
+        ae(entry.extension, "jpg")
+        ae(entry.identifier, "ef")
+        ae(entry.data, b"abc")
+
+        data = make_entry(VERSION_10, 0x9ABC, "gh", b"defg")
+        entry = CacheEntry.from_stream(ByteIStream(data), 0, VERSION_10)
+        ae(entry.extension, None)
+        ae(entry.width, 32)
+        ae(entry.height, 24)
+        ae(entry.data, b"defg")
+    # end def test_from_stream
+
+    def test_truncated(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        data = make_entry(VERSION_7, 0x1234, "abcd", b"0123456789")
+        entry = CacheEntry.from_stream(ByteIStream(data[:-4]), 0)
+        ae(entry.data, b"012345")
+
+        ar(ValueError, CacheEntry.from_stream, ByteIStream(data[:20]), 0)
+        ar(ValueError, CacheEntry.from_stream, ByteIStream(bytes(64)), 0)
+    # end def test_truncated
+# end class CacheEntryTestCase
+
+class CacheFileTestCase(TestCase):
+    def setUp(self):
+        self.entries = [
+            make_entry(VERSION_7, 0x10, "a", b"first"),
+            make_entry(VERSION_7, 0x20, "bb", b"second"),
+            make_entry(VERSION_7, 0x30, "ccc", b"third")
+        ]
+        self.data = make_cache(VERSION_7, 1, self.entries)
+    # end def setUp
+
+    def test__init__(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        cache = CacheFile(ByteIStream(self.data))
+        ae(cache.version, VERSION_7)
+        ae(cache.cache_type, 1)
+        ae(cache.cache_type_name, "96")
+        ae(cache.first_entry, 24)
+        ae(cache.available_entry, len(self.data))
+        ae(cache.entry_count, 3)
+
+        data = make_cache(VERSION_10, 4, [])
+        cache = CacheFile(ByteIStream(data))
+        ae(cache.cache_type_name, "256")
+        ae(cache.entry_count, None)
+
+        ar(ValueError, CacheFile, ByteIStream(b"IMMM" + self.data[4:]))
+        ar(ValueError, CacheFile, ByteIStream(self.data[:20]))
+
+        data = b"CMMM" + pack("<I", 0x10) + self.data[8:]
+        ar(ValueError, CacheFile, ByteIStream(data))
+    # end def test__init__
+
+    def test_hash_index(self):
+        ae = self.assertEqual
+
+        cache = CacheFile(ByteIStream(self.data))
+        offset1 = 24
+        offset2 = offset1 + len(self.entries[0])
+        offset3 = offset2 + len(self.entries[1])
+        ae(cache.hash_index, {0x10: offset1, 0x20: offset2, 0x30: offset3})
+
+        # Stops at the first invalid entry.
+        data = self.data[:offset3] + b"XXXX" + self.data[offset3 + 4:]
+        cache = CacheFile(ByteIStream(data))
+        ae(cache.hash_index, {0x10: offset1, 0x20: offset2})
+    # end def test_hash_index
+
+    def test_get_entry(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        cache = CacheFile(ByteIStream(self.data))
+        ae(cache.get_entry(0x20).identifier, "bb")
+        ae(cache.get_entry(0x20).data, b"second")
+        ae(cache.get_entry(0x30).data, b"third")
+        ar(KeyError, cache.get_entry, 0x40)
+    # end def test_get_entry
+
+    def test_use_index(self):
+        ae = self.assertEqual
+
+        offset2 = 24 + len(self.entries[0])
+        index = IndexFile(ByteIStream(make_index(VERSION_7, [
+            (0x20, 0, (NO_ENTRY, offset2, NO_ENTRY, NO_ENTRY, NO_ENTRY)),
+            (0x30, 0, (24, NO_ENTRY, NO_ENTRY, NO_ENTRY, NO_ENTRY))
+        ])))
+
+        cache = CacheFile(ByteIStream(self.data))
+        cache.use_index(index)
+        ae(cache.hash_index, {0x20: offset2})
+        ae(cache.get_entry(0x20).data, b"second")
+        self.assertRaises(KeyError, cache.get_entry, 0x10)
+    # end def test_use_index
+
+    def test_iter_entries(self):
+        ae = self.assertEqual
+
+        cache = CacheFile(ByteIStream(self.data))
+        entries = list(cache.iter_entries())
+        ae([entry.hash for entry in entries], [0x10, 0x20, 0x30])
+        ae([entry.data for entry in entries], [b"first", b"second", b"third"])
+        ae(entries[1], cache.get_entry(0x20))
+    # end def test_iter_entries
+
+    def test_mapped(self):
+        ae = self.assertEqual
+
+        (fd, name) = mkstemp()
+        try:
+            with os.fdopen(fd, "wb") as ofile:
+                ofile.write(self.data)
+            # end with
+
+            stream = MappedIStream(name)
+            try:
+                cache = CacheFile(stream)
+                ae(cache.get_entry(0x30).data, b"third")
+                ae(list(cache.get_entry(0x10).data.iter_chunks(2)), [
+                    b"fi", b"rs", b"t"
+                ])
+            finally:
+                stream.close()
+            # end try
+        finally:
+            os.remove(name)
+        # end try
+    # end def test_mapped
+# end class CacheFileTestCase
+
+class IndexFileTestCase(TestCase):
+    def test__init__(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        offsets = (24, NO_ENTRY, NO_ENTRY, NO_ENTRY, 100)
+        data = make_index(VERSION_7, [(0x10, 0, offsets)], 2)
+        index = IndexFile(ByteIStream(data))
+        ae(index.version, VERSION_7)
+        ae(index.used_count, 1)
+        ae(index.entry_count, 3)
+        ae(len(index.cache_type_names), 5)
+        ae(index.entries, [IndexEntry((0x10, None, 1, offsets))])
+
+        mtime = 0x01CAB1D2E3F40000
+        data = make_index(VERSION_VISTA, [(0x20, mtime, offsets)])
+        index = IndexFile(ByteIStream(data))
+        ae(index.entries[0].hash, 0x20)
+        ae(index.entries[0].mtime, datetime(2010, 2, 20, 2, 17, 45, 914000))
+        ae(index.entries[0].offsets, offsets)
+
+        offsets = tuple(range(14))
+        data = make_index(VERSION_10, [(0x30, 0, offsets)])
+        index = IndexFile(ByteIStream(data))
+        ae(index.entries, [IndexEntry((0x30, None, 1, offsets))])
+
+        # A truncated hash table is read as far as it goes.
+        index = IndexFile(ByteIStream(data[:-10]))
+        ae(index.entries, [IndexEntry((0x30, None, 1, offsets))])
+
+        ar(ValueError, IndexFile, ByteIStream(b"CMMM" + data[4:]))
+    # end def test__init__
+
+    def test_get_offsets(self):
+        ae = self.assertEqual
+
+        data = make_index(VERSION_7, [
+            (0x10, 0, (24, NO_ENTRY, NO_ENTRY, NO_ENTRY, 100)),
+            (0x20, 0, (NO_ENTRY, NO_ENTRY, NO_ENTRY, NO_ENTRY, 200))
+        ])
+        index = IndexFile(ByteIStream(data))
+        ae(index.get_offsets(0), {0x10: 24})
+        ae(index.get_offsets(4), {0x10: 100, 0x20: 200})
+        ae(index.get_offsets(1), {})
+        ae(index.get_offsets(9), {})
+        self.assertIs(index.get_offsets(4), index.get_offsets(4))
+    # end def test_get_offsets
+# end class IndexFileTestCase
@@ -0,0 +1,127 @@
+# Copyright 2010 Michael Murr
+#
+# This file is part of LibForensics.
+#
+# LibForensics is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LibForensics is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with LibForensics.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Unit tests for the lf.win.shell.thumbsdb.batch module."""
+
+# stdlib imports
+import os
+import json
+from io import StringIO
+from os.path import join
+from tempfile import mkdtemp
+from shutil import rmtree
+from hashlib import sha256
+from unittest import TestCase
+
+# local imports
+from lf.win.shell.thumbsdb.batch import export_file, iter_exports, export
+
+__docformat__ = "restructuredtext en"
+__all__ = [
+    "BatchTestCase"
+]
+
+class BatchTestCase(TestCase):
+    def setUp(self):
+        self.thumbs_db_path = join("data", "thumbsdb", "thumbs.db")
+        self.txt_path = join("data", "txt", "alpha.txt")
+        self.directory = mkdtemp()
+    # end def setUp
+
+    def tearDown(self):
+        rmtree(self.directory)
+    # end def tearDown
+
+    def test_export_file(self):
+        ae = self.assertEqual
+        at = self.assertTrue
+
+        directory = self.directory
+
+        result = export_file(self.thumbs_db_path, directory)
+        ae(result["path"], self.thumbs_db_path)
+
+        rows = result["thumbnails"]
+        ae([row["id"] for row in rows], list(range(1, 16)))
+        ae(len(set([row["hash"] for row in rows])), 5)
+        ae(len([row for row in rows if row["written"]]), 5)
+        ae(sorted(os.listdir(directory)), sorted(set(
+            [row["output"] for row in rows]
+        )))
+
+        for row in rows:
+            with open(join(directory, row["output"]), "rb") as ifile:
+                data = ifile.read()
+            # end with
+
+            ae(len(data), row["size"])
+            ae(sha256(data).hexdigest(), row["hash"])
+        # end for
+
+        # Make sure the result is JSON serializable
+        ae(json.loads(json.dumps(result)), result)
+
+        result = export_file(self.txt_path, directory)
+        at("error" in result)
+        at("thumbnails" not in result)
+
+        result = export_file(join("data", "does_not_exist"), directory)
+        at("error" in result)
+    # end def test_export_file
+
+    def test_iter_exports(self):
+        ae = self.assertEqual
+
+        paths = [self.thumbs_db_path, self.txt_path]
+        expected = [export_file(path, self.directory) for path in paths]
+
+        for row in expected[0]["thumbnails"]:
+            row["written"] = False
+        # end for
+
+        ae(list(iter_exports(paths, self.directory, workers=0)), expected)
+        ae(list(iter_exports(
+            paths, self.directory, workers=2, threads=2, max_pending=1
+        )), expected)
+    # end def test_iter_exports
+
+    def test_export(self):
+        ae = self.assertEqual
+
+        directory = join(self.directory, "images")
+        paths = [self.thumbs_db_path, self.txt_path, self.thumbs_db_path]
+        ofile = StringIO()
+
+        stats = export(paths, directory, ofile, workers=0, threads=2)
+
+        ae(stats.file_count, 3)
+        ae(stats.error_count, 1)
+        ae(stats.image_count, 30)
+        ae(stats.unique_count, 5)
+        ae(stats.byte_count, 2 * 54648)
+        ae(len(os.listdir(directory)), 5)
+
+        lines = [json.loads(line) for line in ofile.getvalue().splitlines()]
+        ae(len(lines), 31)
+        ae(lines[15], {"path": self.txt_path, "error": lines[15]["error"]})
+        ae(
+            set([line["path"] for line in lines]),
+            set([self.thumbs_db_path, self.txt_path])
+        )
+        ae(len([line for line in lines if line.get("written")]), 5)
+    # end def test_export
+# end class BatchTestCase
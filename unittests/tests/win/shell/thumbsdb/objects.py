@@ -18,23 +18,28 @@
 """Unit tests for the lf.win.shell.thumbsdb.objects module."""
 
 # stdlib imports
+import os
 from unittest import TestCase
 from os.path import join
 from datetime import datetime
 from hashlib import md5
+from tempfile import mkdtemp
+from shutil import rmtree
+from threading import Lock
 
 # local imports
 from lf.dec import RawIStream, ByteIStream, SEEK_SET
 from lf.time import FILETIMETodatetime
 from lf.win.ole.cfb import CompoundFile
 from lf.win.shell.thumbsdb.objects import (
-    CatalogEntry, Catalog, Thumbnail, ThumbsDb
+    CatalogEntry, Catalog, Thumbnail, LazyThumbnail, ThumbsDb,
+    _export_thumbnail
 )
 
 __docformat__ = "restructuredtext en"
 __all__ = [
     "CatalogEntryTestCase", "CatalogTestCase", "ThumbnailTestCase",
-    "ThumbsDbTestCase"
+    "LazyThumbnailTestCase", "ThumbsDbTestCase"
 ]
 
 class CatalogEntryTestCase(TestCase):
@@ -145,6 +150,52 @@ class ThumbnailTestCase(TestCase):
     # end def test_from_stream
 # end class ThumbnailTestCase
 
+class LazyThumbnailTestCase(TestCase):
+    def test_from_stream(self):
+        ae = self.assertEqual
+
+        data = bytearray()
+        data.extend(b"\x00\x01\x02\x03")  # unknown1
+        data.extend(b"\x04\x05\x06\x07")  # unknown2
+        data.extend(b"\x05\x00\x00\x00")  # size
+        data.extend(b"\xFF\xD8\x08\x09\x0A")  # data
+        stream = ByteIStream(data)
+
+        thumb0 = Thumbnail.from_stream(ByteIStream(data))
+        thumb1 = LazyThumbnail.from_stream(stream)
+        thumb2 = LazyThumbnail.from_stream(stream, 0)
+
+        for thumb in (thumb1, thumb2):
+            ae(thumb.size, 0x5)
+            ae(thumb.offset, 12)
+            ae(thumb.stream, stream)
+            ae(thumb.data, b"\xFF\xD8\x08\x09\x0A")
+            ae(thumb.payload, b"\xFF\xD8\x08\x09\x0A")
+            ae(thumb.load(), thumb0)
+            ae(thumb, thumb0)
+        # end for
+
+
+        data = bytearray()
+        data.extend(b"\x00\x01\x02\x03")  # unknown1
+        data.extend(b"\x05\x00\x00\x00")  # size
+        data.extend(b"\x04\x05\x06\x07")  # unknown2
+        data.extend(b"\x08\x09\x0A\x0B")  # unknown3
+        data.extend(b"\xFF\xD8\x0C\x0D\x0E")  # data
+        stream = ByteIStream(data)
+
+        thumb1 = LazyThumbnail.from_stream(stream)
+        thumb2 = LazyThumbnail.from_stream(stream, 0)
+
+        for thumb in (thumb1, thumb2):
+            ae(thumb.size, 0x5)
+            ae(thumb.offset, 16)
+            ae(thumb.data, b"\xFF\xD8\x0C\x0D\x0E")
+            ae(thumb, Thumbnail.from_stream(stream, 0))
+        # end for
+    # end def test_from_stream
+# end class LazyThumbnailTestCase
+
 class ThumbsDbTestCase(TestCase):
     def setUp(self):
         input_file = join("data", "thumbsdb", "thumbs.db")
@@ -287,7 +338,10 @@ class ThumbsDbTestCase(TestCase):
         ae(tdb.catalog, catalog)
         ae(tdb.thumbnails.keys(), md5_hashes.keys())
         for (key, hash) in md5_hashes.items():
-            ae(md5(tdb.thumbnails[key].data).hexdigest(), hash)
+            thumbnail = tdb.thumbnails[key]
+            ae(type(thumbnail), LazyThumbnail)
+            ae(md5(thumbnail.data).hexdigest(), hash)
+            ae(thumbnail.payload.hashes(("md5",)), {"md5": hash})
         # end for
 
         ar(
@@ -295,4 +349,137 @@ class ThumbsDbTestCase(TestCase):
             ThumbsDb, self.cfb,"thisisnotthecatalogyouarelookingfor"
         )
     # end def test__init__
+
+    def test_export(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+        tdb = self.tdb
+
+        directory = mkdtemp()
+        try:
+            manifest = tdb.export(directory, algorithm="md5")
+            ae(len(manifest), 15)
+
+            entry = tdb.catalog.entries[0]
+            row = manifest[0]
+            ae(row["id"], entry.id)
+            ae(row["stream_name"], entry.stream_name)
+            ae(row["file_name"], entry.file_name)
+            ae(row["mtime"], entry.mtime.isoformat())
+            ae(row["size"], tdb.thumbnails[entry.id].size)
+            ae(row["hash"], "925405772966a6c3bbcedec92c2cb29a")
+            ae(row["output"], "925405772966a6c3bbcedec92c2cb29a.jpg")
+            ae(row["written"], True)
+
+            outputs = set([row["output"] for row in manifest])
+            ae(len(outputs), 5)
+            ae(set(os.listdir(directory)), outputs)
+            ae(len([row for row in manifest if row["written"]]), 5)
+
+            for row in manifest:
+                with open(join(directory, row["output"]), "rb") as ifile:
+                    data = ifile.read()
+                # end with
+
+                ae(data, tdb.thumbnails[row["id"]].data)
+            # end for
+
+            # Everything was already exported.
+            again = tdb.export(directory, 4, 100, "md5")
+            ae(
+                [row["hash"] for row in again],
+                [row["hash"] for row in manifest]
+            )
+            ae(len([row for row in again if row["written"]]), 0)
+            ae(set(os.listdir(directory)), outputs)
+
+            ar(ValueError, tdb.export, directory, algorithm="nosuchhash")
+        finally:
+            rmtree(directory)
+        # end try
+    # end def test_export
+
+    def test_export_failed_write(self):
+        ae = self.assertEqual
+        ar = self.assertRaises
+
+        class FailingIStream(ByteIStream):
+            # The first read (to hash the image) works, the rest fail.
+            reads = 0
+
+            def read(self, size=-1):
+                self.reads += 1
+                if self.reads > 1:
+                    raise IOError("read failed")
+                # end if
+
+                return super(FailingIStream, self).read(size)
+            # end def read
+        # end class FailingIStream
+
+        class FakeThumbnail():
+            def __init__(self, stream, size):
+                self.stream = stream
+                self.offset = 0
+                self.size = size
+            # end def __init__
+        # end class FakeThumbnail
+
+        data = b"\xFF\xD8" + b"thumbnail" * 10
+        name = "".join([md5(data).hexdigest(), ".jpg"])
+        lock = Lock()
+        claimed = set()
+        pending = dict()
+
+        directory = mkdtemp()
+        try:
+            bad = FakeThumbnail(FailingIStream(data), len(data))
+            ar(
+                IOError, _export_thumbnail, bad, directory, lock, claimed,
+                pending, 4096, "md5"
+            )
+            ae(claimed, set())
+            ae(pending, dict())
+            ae(os.listdir(directory), [])
+
+            # A duplicate of the failed image is still written.
+            good = FakeThumbnail(ByteIStream(data), len(data))
+            result = _export_thumbnail(
+                good, directory, lock, claimed, pending, 4096, "md5"
+            )
+            ae(result, (md5(data).hexdigest(), name, True))
+            ae(claimed, set([name]))
+            ae(os.listdir(directory), [name])
+        finally:
+            rmtree(directory)
+        # end try
+    # end def test_export_failed_write
+
+    def test_duplicate_names(self):
+        ae = self.assertEqual
+        tdb = self.tdb
+        cfb = self.cfb
+
+        cfb.cfb_stream.seek(0, SEEK_SET)
+        data = bytearray(cfb.cfb_stream.read())
+
+        chain = cfb.get_fat_chain(cfb.header.dir_sect_offset)
+        offsets = [
+            cfb.byte_offset(chain[sid // 4]) + ((sid % 4) * 128)
+            for sid in (4, 17)
+        ]
+
+        # Copy the entry for thumbnail 3 (sid 4) to the unused sid 17, and
+        # name it after thumbnail 2.
+        entry = data[offsets[0]:offsets[0] + 128]
+        entry[0:2] = "2".encode("utf_16_le")
+        data[offsets[1]:offsets[1] + 128] = entry
+
+        # The last stream with a name is used.
+        dup_tdb = ThumbsDb(CompoundFile(ByteIStream(bytes(data))))
+        ae(dup_tdb.catalog, tdb.catalog)
+        ae(dup_tdb.thumbnails[2].data, tdb.thumbnails[3].data)
+        ae(dup_tdb.thumbnails[3].data, tdb.thumbnails[3].data)
+        ae(dup_tdb.thumbnails[1].data, tdb.thumbnails[1].data)
+    # end def test_duplicate_names
 # end class ThumbsDbTestCase